@@ -5,7 +5,12 @@ from tkinter import filedialog, messagebox, ttk
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from rcg.runner import generate_subcatchment
+import pandas as pd
+
+from rcg.fuzzy.categories import LandCover, LandForm
+from rcg.fuzzy.lookup import load_lookup_table
+from rcg.inp_manage.inp import get_subarea_values, validate_subcatchments
+from rcg.runner import generate_subcatchment, generate_subcatchments
 
 
 def get_help_file_path():
@@ -21,8 +26,10 @@ class RcgApp:
         self.root = root
         self.file_path = None
         self.root.title("Rapid Catchment Generator")
-        self.set_window_size(width=340, height=300)
+        self.set_window_size(width=340, height=520)
+        self.lookup_table = load_lookup_table()
         self.create_widgets()
+        self.create_preview()
 
     def set_window_size(self, width, height):
         self.root.geometry(f"{width}x{height}")
@@ -111,6 +118,59 @@ class RcgApp:
         )
         help_button.grid(row=6, column=1, padx=10, pady=10, sticky="w")
 
+        batch_button = tk.Button(
+            self.root, text="Batch entry", command=self.show_batch_entry, width=23
+        )
+        batch_button.grid(row=6, column=0, padx=10, pady=10, sticky="w")
+
+    def create_preview(self):
+        preview_frame = tk.LabelFrame(self.root, text="Preview")
+        preview_frame.grid(row=7, column=0, columnspan=2, padx=10, pady=10, sticky="we")
+
+        self.preview_vars = {}
+        fields = [
+            ("slope", "Slope [%]:"),
+            ("impervious", "Impervious [%]:"),
+            ("catchment_class", "Catchment class:"),
+            ("mannings", "Manning's n (imperv/perv):"),
+            ("depression", "Depression storage [mm]:"),
+            ("pct_zero", "PctZero [%]:"),
+        ]
+        for row, (key, text) in enumerate(fields):
+            label = tk.Label(preview_frame, text=text)
+            label.grid(row=row, column=0, padx=5, pady=2, sticky="w")
+            self.preview_vars[key] = tk.StringVar(value="-")
+            value_label = tk.Label(preview_frame, textvariable=self.preview_vars[key])
+            value_label.grid(row=row, column=1, padx=5, pady=2, sticky="w")
+
+        self.land_cover_var.trace_add("write", self.update_preview)
+        self.land_form_var.trace_add("write", self.update_preview)
+
+    def update_preview(self, *args):
+        land_cover = self.land_cover_var.get().replace(" ", "_")
+        land_form = self.land_form_var.get().replace(" ", "_")
+
+        if (land_form, land_cover) not in self.lookup_table.index:
+            for var in self.preview_vars.values():
+                var.set("-")
+            return
+
+        result = self.lookup_table.loc[(land_form, land_cover)]
+        subarea = get_subarea_values(result["catchment_class"])
+        self.preview_vars["slope"].set(f"{result['slope']:.2f}")
+        self.preview_vars["impervious"].set(f"{result['impervious']:.2f}")
+        self.preview_vars["catchment_class"].set(result["catchment_class"])
+        self.preview_vars["mannings"].set(
+            f"{subarea['N-Imperv']} / {subarea['N-Perv']}"
+        )
+        self.preview_vars["depression"].set(
+            f"{subarea['S-Imperv']:.2f} / {subarea['S-Perv']:.2f}"
+        )
+        self.preview_vars["pct_zero"].set(f"{subarea['PctZero']}")
+
+    def show_batch_entry(self):
+        BatchEntryWindow(self)
+
     def show_help(self):
         help_window = tk.Toplevel(self.root)
         help_window.title("Help - Categories and Instructions")
@@ -190,6 +250,169 @@ class RcgApp:
         )
 
 
+class BatchEntryWindow:
+    columns = ("area", "land_form", "land_cover")
+
+    def __init__(self, app):
+        self.app = app
+        self.window = tk.Toplevel(app.root)
+        self.window.title("Batch entry")
+        self.window.geometry("820x460")
+        self.create_widgets()
+
+    def create_widgets(self):
+        table_frame = tk.Frame(self.window)
+        table_frame.grid(row=0, column=0, columnspan=5, padx=10, pady=10, sticky="nsew")
+        self.window.grid_rowconfigure(0, weight=1)
+        self.window.grid_columnconfigure(4, weight=1)
+
+        self.table = ttk.Treeview(
+            table_frame, columns=self.columns, show="headings", height=12
+        )
+        for column, width in zip(self.columns, (100, 330, 330)):
+            self.table.heading(column, text=column)
+            self.table.column(column, width=width)
+        scrollbar = ttk.Scrollbar(
+            table_frame, orient="vertical", command=self.table.yview
+        )
+        self.table.configure(yscrollcommand=scrollbar.set)
+        self.table.pack(side=tk.LEFT, expand=True, fill=tk.BOTH)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.table.tag_configure("invalid", background="#ffc9c9")
+
+        self.area_var = tk.StringVar()
+        area_entry = tk.Entry(self.window, textvariable=self.area_var, width=12)
+        area_entry.grid(row=1, column=0, padx=10, pady=5, sticky="w")
+
+        self.land_form_var = tk.StringVar()
+        land_form_combobox = ttk.Combobox(
+            self.window,
+            textvariable=self.land_form_var,
+            values=LandForm.get_all_categories(),
+            width=40,
+        )
+        land_form_combobox.grid(row=1, column=1, padx=10, pady=5, sticky="w")
+
+        self.land_cover_var = tk.StringVar()
+        land_cover_combobox = ttk.Combobox(
+            self.window,
+            textvariable=self.land_cover_var,
+            values=LandCover.get_all_categories(),
+            width=30,
+        )
+        land_cover_combobox.grid(row=1, column=2, padx=10, pady=5, sticky="w")
+
+        add_button = tk.Button(self.window, text="Add row", command=self.add_row, width=12)
+        add_button.grid(row=1, column=3, padx=10, pady=5, sticky="w")
+
+        paste_button = tk.Button(
+            self.window, text="Paste rows", command=self.paste_rows, width=12
+        )
+        paste_button.grid(row=2, column=0, padx=10, pady=5, sticky="w")
+
+        remove_button = tk.Button(
+            self.window, text="Remove selected", command=self.remove_rows, width=16
+        )
+        remove_button.grid(row=2, column=1, padx=10, pady=5, sticky="w")
+
+        validate_button = tk.Button(
+            self.window, text="Validate", command=self.validate, width=12
+        )
+        validate_button.grid(row=2, column=2, padx=10, pady=5, sticky="w")
+
+        commit_button = tk.Button(
+            self.window, text="Commit", command=self.commit, width=12, bg="#36D7B7"
+        )
+        commit_button.grid(row=2, column=3, padx=10, pady=5, sticky="w")
+
+        self.status_var = tk.StringVar(value="Rows: 0")
+        status_label = tk.Label(self.window, textvariable=self.status_var)
+        status_label.grid(row=3, column=0, columnspan=4, padx=10, pady=5, sticky="w")
+
+    def update_status(self):
+        self.status_var.set(f"Rows: {len(self.table.get_children())}")
+
+    def add_row(self):
+        self.table.insert(
+            "",
+            tk.END,
+            values=(
+                self.area_var.get(),
+                self.land_form_var.get(),
+                self.land_cover_var.get(),
+            ),
+        )
+        self.area_var.set("")
+        self.update_status()
+
+    def paste_rows(self):
+        try:
+            text = self.window.clipboard_get()
+        except tk.TclError:
+            messagebox.showerror("Error", "Clipboard is empty.", parent=self.window)
+            return
+
+        for line in text.splitlines():
+            if not line.strip():
+                continue
+            separator = "\t" if "\t" in line else ";" if ";" in line else ","
+            values = [value.strip() for value in line.split(separator)]
+            values = (values + ["", "", ""])[:3]
+            self.table.insert("", tk.END, values=values)
+        self.update_status()
+
+    def remove_rows(self):
+        for item in self.table.selection():
+            self.table.delete(item)
+        self.update_status()
+
+    def get_data(self):
+        items = self.table.get_children()
+        data = pd.DataFrame(
+            [self.table.item(item, "values") for item in items],
+            columns=list(self.columns),
+            index=range(1, len(items) + 1),
+        )
+        return items, data
+
+    def validate(self):
+        items, data = self.get_data()
+        for item in items:
+            self.table.item(item, tags=())
+
+        try:
+            data = validate_subcatchments(data)
+        except ValueError as error:
+            for line in str(error).splitlines():
+                if line.startswith("Row "):
+                    row = int(line.split(":")[0].split()[1])
+                    self.table.item(items[row - 1], tags=("invalid",))
+            messagebox.showerror("Error", str(error), parent=self.window)
+            return None
+        return data
+
+    def commit(self):
+        if not self.app.file_path:
+            messagebox.showerror("Error", "Please select a file.", parent=self.window)
+            return
+
+        data = self.validate()
+        if data is None:
+            return
+        if data.empty:
+            messagebox.showerror("Error", "Please add at least one row.", parent=self.window)
+            return
+
+        ids = generate_subcatchments(self.app.file_path, data)
+        self.table.delete(*self.table.get_children())
+        self.update_status()
+        messagebox.showinfo(
+            "Information",
+            f"{len(ids)} subcatchments have been added to the file: {self.app.file_path}",
+            parent=self.window,
+        )
+
+
 if __name__ == "__main__":
     root = tk.Tk()
     app = RcgApp(root)
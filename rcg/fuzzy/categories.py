@@ -1,6 +1,197 @@
 """The module contains classes specified in the RCG divided into categories. """
 from abc import ABC
-from typing import List
+from enum import IntEnum
+from typing import Iterable, List, Union
+
+import numpy as np
+import pandas as pd
+
+
+class CategoryEnum(IntEnum):
+    """
+    CategoryEnum is the base class of the category types. The member names are the category
+    names used in the memberships and rules, the member values are the numeric codes.
+
+    The class methods encode and decode whole columns at once, so bulk inputs don't need
+    a per-row getattr lookup.
+    """
+
+    @classmethod
+    def names(cls) -> List[str]:
+        """Return the category names in the order of their codes."""
+        return [member.name for member in cls]
+
+    @classmethod
+    def codes(cls) -> np.ndarray:
+        """Return the category codes in the order of their definition."""
+        return np.array([member.value for member in cls], dtype=np.int64)
+
+    @classmethod
+    def encode(cls, values: Union[Iterable, pd.Series, pd.Categorical]) -> np.ndarray:
+        """
+        Encode category names (or already encoded codes) into an array of codes in one pass.
+
+        Parameters
+        ----------
+        values : Union[Iterable, pd.Series, pd.Categorical]
+            Category names, members of the enum or integer codes.
+
+        Returns
+        -------
+        np.ndarray
+            Array of int64 codes.
+
+        Raises
+        ------
+        ValueError
+            If any value is not a valid category, the message lists all distinct invalid values.
+        """
+        if isinstance(values, (pd.Series, pd.Index, pd.Categorical, np.ndarray)):
+            array = values
+        else:
+            array = np.asarray(list(values))
+
+        if pd.api.types.is_numeric_dtype(array.dtype) and not pd.api.types.is_bool_dtype(array.dtype):
+            numeric = np.asarray(array, dtype=np.float64)
+            invalid = ~np.isin(numeric, cls.codes())
+            if invalid.any():
+                cls._raise_invalid(np.asarray(array)[invalid])
+            return numeric.astype(np.int64)
+
+        positions = pd.Index(cls.names()).get_indexer(array)
+        invalid = positions < 0
+        if invalid.any():
+            cls._raise_invalid(np.asarray(array, dtype=object)[invalid])
+        return cls.codes()[positions]
+
+    @classmethod
+    def decode(cls, codes: Union[Iterable, np.ndarray]) -> pd.Categorical:
+        """
+        Decode an array of codes into a pandas Categorical of category names.
+
+        Parameters
+        ----------
+        codes : Union[Iterable, np.ndarray]
+            Integer category codes.
+
+        Returns
+        -------
+        pd.Categorical
+            Categorical with all category names as categories.
+
+        Raises
+        ------
+        ValueError
+            If any code is not a valid category code.
+        """
+        codes = np.asarray(codes)
+        valid_codes = cls.codes()
+        positions = np.full(valid_codes.max() + 1, -1, dtype=np.int64)
+        positions[valid_codes] = np.arange(len(valid_codes))
+
+        in_range = np.zeros(codes.shape, dtype=bool)
+        if codes.size and pd.api.types.is_numeric_dtype(codes.dtype):
+            in_range = (codes >= 0) & (codes <= valid_codes.max()) & (codes == np.floor(codes))
+        result = np.full(codes.shape, -1, dtype=np.int64)
+        result[in_range] = positions[codes[in_range].astype(np.int64)]
+        invalid = result < 0
+        if invalid.any():
+            cls._raise_invalid(codes[invalid])
+        return pd.Categorical.from_codes(result, categories=cls.names())
+
+    @classmethod
+    def _raise_invalid(cls, invalid: np.ndarray) -> None:
+        """Raise a ValueError listing all distinct invalid values."""
+        distinct = pd.unique(pd.Series(invalid, dtype=object).astype(str))
+        shown = ", ".join(f"'{value}'" for value in distinct[:10])
+        if len(distinct) > 10:
+            shown += f" and {len(distinct) - 10} more"
+        raise ValueError(
+            f"{len(invalid)} invalid {cls.__name__} values: {shown}. "
+            f"Valid values are: {', '.join(cls.names())}"
+        )
+
+
+class LandFormType(CategoryEnum):
+    """Codes of the land form categories."""
+
+    marshes_and_lowlands = 1
+    flats_and_plateaus = 2
+    flats_and_plateaus_in_combination_with_hills = 3
+    hills_with_gentle_slopes = 4
+    steeper_hills_and_foothills = 5
+    hills_and_outcrops_of_mountain_ranges = 6
+    higher_hills = 7
+    mountains = 8
+    highest_mountains = 9
+
+
+class LandCoverType(CategoryEnum):
+    """Codes of the land cover categories."""
+
+    permeable_areas = 1
+    permeable_terrain_on_plains = 2
+    mountains_vegetated = 3
+    mountains_rocky = 4
+    urban_weakly_impervious = 5
+    urban_moderately_impervious = 6
+    urban_highly_impervious = 7
+    suburban_weakly_impervious = 8
+    suburban_highly_impervious = 9
+    rural = 10
+    forests = 11
+    meadows = 12
+    arable = 13
+    marshes = 14
+
+
+class SlopeType(CategoryEnum):
+    """Codes of the slope terms."""
+
+    marshes_and_lowlands = 1
+    flats_and_plateaus = 2
+    flats_and_plateaus_in_combination_with_hills = 3
+    hills_with_gentle_slopes = 4
+    steeper_hills_and_foothills = 5
+    hills_and_outcrops_of_mountain_ranges = 6
+    higher_hills = 7
+    mountains = 8
+    highest_mountains = 9
+
+
+class ImperviousType(CategoryEnum):
+    """Codes of the impervious terms."""
+
+    marshes = 1
+    arable = 2
+    meadows = 3
+    forests = 4
+    rural = 5
+    suburban_weakly_impervious = 6
+    suburban_highly_impervious = 7
+    urban_weakly_impervious = 8
+    urban_moderately_impervious = 9
+    urban_highly_impervious = 10
+    mountains_rocky = 11
+    mountains_vegetated = 12
+
+
+class CatchmentType(CategoryEnum):
+    """Codes of the catchment classes."""
+
+    urban = 1
+    suburban = 2
+    rural = 3
+    forests = 4
+    meadows = 5
+    arable = 6
+    mountains = 7
+
+
+def _set_names(instance: object, category: type) -> None:
+    """Set every category name of the enum as a string attribute of the instance."""
+    for name in category.names():
+        setattr(instance, name, name)
 
 
 class Categories(ABC):
@@ -10,19 +201,7 @@ class Categories(ABC):
 
     def __init__(self) -> None:
         """Initialize a Categories object with predefined category attributes as strings."""
-        self.marshes_and_lowlands = "marshes_and_lowlands"
-        self.flats_and_plateaus = "flats_and_plateaus"
-        self.flats_and_plateaus_in_combination_with_hills = (
-            "flats_and_plateaus_in_combination_with_hills"
-        )
-        self.hills_with_gentle_slopes = "hills_with_gentle_slopes"
-        self.steeper_hills_and_foothills = "steeper_hills_and_foothills"
-        self.hills_and_outcrops_of_mountain_ranges = (
-            "hills_and_outcrops_of_mountain_ranges"
-        )
-        self.higher_hills = "higher_hills"
-        self.mountains = "mountains"
-        self.highest_mountains = "highest_mountains"
+        _set_names(self, LandFormType)
 
 
 class LandForm:
@@ -43,31 +222,19 @@ class LandForm:
         - mountains (int): Numeric value for mountains land use type.
         - highest_mountains (int): Numeric value for highest mountains land use type.
     """
-    marshes_and_lowlands = 1
-    flats_and_plateaus = 2
-    flats_and_plateaus_in_combination_with_hills = 3
-    hills_with_gentle_slopes = 4
-    steeper_hills_and_foothills = 5
-    hills_and_outcrops_of_mountain_ranges = 6
-    higher_hills = 7
-    mountains = 8
-    highest_mountains = 9
+    marshes_and_lowlands = LandFormType.marshes_and_lowlands
+    flats_and_plateaus = LandFormType.flats_and_plateaus
+    flats_and_plateaus_in_combination_with_hills = LandFormType.flats_and_plateaus_in_combination_with_hills
+    hills_with_gentle_slopes = LandFormType.hills_with_gentle_slopes
+    steeper_hills_and_foothills = LandFormType.steeper_hills_and_foothills
+    hills_and_outcrops_of_mountain_ranges = LandFormType.hills_and_outcrops_of_mountain_ranges
+    higher_hills = LandFormType.higher_hills
+    mountains = LandFormType.mountains
+    highest_mountains = LandFormType.highest_mountains
 
     def __init__(self) -> None:
         """Initialize a LandForm object with predefined land use types as string attributes."""
-        self.marshes_and_lowlands = "marshes_and_lowlands"
-        self.flats_and_plateaus = "flats_and_plateaus"
-        self.flats_and_plateaus_in_combination_with_hills = (
-            "flats_and_plateaus_in_combination_with_hills"
-        )
-        self.hills_with_gentle_slopes = "hills_with_gentle_slopes"
-        self.steeper_hills_and_foothills = "steeper_hills_and_foothills"
-        self.hills_and_outcrops_of_mountain_ranges = (
-            "hills_and_outcrops_of_mountain_ranges"
-        )
-        self.higher_hills = "higher_hills"
-        self.mountains = "mountains"
-        self.highest_mountains = "highest_mountains"
+        _set_names(self, LandFormType)
 
     def __str__(self) -> str:
         """
@@ -88,17 +255,7 @@ class LandForm:
         Returns:
             - List[str]: A list of strings representing all land form types.
         """
-        return [
-            "marshes_and_lowlands",
-            "flats_and_plateaus",
-            "flats_and_plateaus_in_combination_with_hills",
-            "hills_with_gentle_slopes",
-            "steeper_hills_and_foothills",
-            "hills_and_outcrops_of_mountain_ranges",
-            "higher_hills",
-            "mountains",
-            "highest_mountains",
-        ]
+        return LandFormType.names()
 
 
 class LandCover:
@@ -140,37 +297,24 @@ class LandCover:
         - arable (str): Arable land cover type.
         - marshes (str): Marshes land cover type.
     """
-    permeable_areas = 1
-    permeable_terrain_on_plains = 2
-    mountains_vegetated = 3
-    mountains_rocky = 4
-    urban_weakly_impervious = 5
-    urban_moderately_impervious = 6
-    urban_highly_impervious = 7
-    suburban_weakly_impervious = 8
-    suburban_highly_impervious = 9
-    rural = 10
-    forests = 11
-    meadows = 12
-    arable = 13
-    marshes = 14
+    permeable_areas = LandCoverType.permeable_areas
+    permeable_terrain_on_plains = LandCoverType.permeable_terrain_on_plains
+    mountains_vegetated = LandCoverType.mountains_vegetated
+    mountains_rocky = LandCoverType.mountains_rocky
+    urban_weakly_impervious = LandCoverType.urban_weakly_impervious
+    urban_moderately_impervious = LandCoverType.urban_moderately_impervious
+    urban_highly_impervious = LandCoverType.urban_highly_impervious
+    suburban_weakly_impervious = LandCoverType.suburban_weakly_impervious
+    suburban_highly_impervious = LandCoverType.suburban_highly_impervious
+    rural = LandCoverType.rural
+    forests = LandCoverType.forests
+    meadows = LandCoverType.meadows
+    arable = LandCoverType.arable
+    marshes = LandCoverType.marshes
 
     def __init__(self) -> None:
         """Initialize a LandCover object with predefined land cover types as string attributes."""
-        self.permeable_areas = "permeable_areas"
-        self.permeable_terrain_on_plains = "permeable_terrain_on_plains"
-        self.mountains_vegetated = "mountains_vegetated"
-        self.mountains_rocky = "mountains_rocky"
-        self.urban_weakly_impervious = "urban_weakly_impervious"
-        self.urban_moderately_impervious = "urban_moderately_impervious"
-        self.urban_highly_impervious = "urban_highly_impervious"
-        self.suburban_weakly_impervious = "suburban_weakly_impervious"
-        self.suburban_highly_impervious = "suburban_highly_impervious"
-        self.rural = "rural"
-        self.forests = "forests"
-        self.meadows = "meadows"
-        self.arable = "arable"
-        self.marshes = "marshes"
+        _set_names(self, LandCoverType)
 
     def __str__(self) -> str:
         """Return a string representation of the LandCover object."""
@@ -199,22 +343,7 @@ class LandCover:
         Returns:
             - List[str]: A list of strings representing all land cover types.
         """
-        return [
-            "permeable_areas",
-            "permeable_terrain_on_plains",
-            "mountains_vegetated",
-            "mountains_rocky",
-            "urban_weakly_impervious",
-            "urban_moderately_impervious",
-            "urban_highly_impervious",
-            "suburban_weakly_impervious",
-            "suburban_highly_impervious",
-            "rural",
-            "forests",
-            "meadows",
-            "arable",
-            "marshes",
-        ]
+        return LandCoverType.names()
 
 
 class Slope:
@@ -237,19 +366,7 @@ class Slope:
         """
         Initializes a Slope object with predefined land slope types as string attributes.
         """
-        self.marshes_and_lowlands = "marshes_and_lowlands"
-        self.flats_and_plateaus = "flats_and_plateaus"
-        self.flats_and_plateaus_in_combination_with_hills = (
-            "flats_and_plateaus_in_combination_with_hills"
-        )
-        self.hills_with_gentle_slopes = "hills_with_gentle_slopes"
-        self.steeper_hills_and_foothills = "steeper_hills_and_foothills"
-        self.hills_and_outcrops_of_mountain_ranges = (
-            "hills_and_outcrops_of_mountain_ranges"
-        )
-        self.higher_hills = "higher_hills"
-        self.mountains = "mountains"
-        self.highest_mountains = "highest_mountains"
+        _set_names(self, SlopeType)
 
     def __str__(self) -> str:
         """
@@ -264,17 +381,7 @@ class Slope:
         Returns:
             - List[str]: A list of strings representing all land slope types.
         """
-        return [
-            self.marshes_and_lowlands,
-            self.flats_and_plateaus,
-            self.flats_and_plateaus_in_combination_with_hills,
-            self.hills_with_gentle_slopes,
-            self.steeper_hills_and_foothills,
-            self.hills_and_outcrops_of_mountain_ranges,
-            self.higher_hills,
-            self.mountains,
-            self.highest_mountains,
-        ]
+        return SlopeType.names()
 
 
 class Impervious:
@@ -301,18 +408,7 @@ class Impervious:
         """
         Initializes an Impervious object with predefined land impervious types as string attributes.
         """
-        self.marshes = "marshes"
-        self.arable = "arable"
-        self.meadows = "meadows"
-        self.forests = "forests"
-        self.rural = "rural"
-        self.suburban_weakly_impervious = "suburban_weakly_impervious"
-        self.suburban_highly_impervious = "suburban_highly_impervious"
-        self.urban_weakly_impervious = "urban_weakly_impervious"
-        self.urban_moderately_impervious = "urban_moderately_impervious"
-        self.urban_highly_impervious = "urban_highly_impervious"
-        self.mountains_rocky = "mountains_rocky"
-        self.mountains_vegetated = "mountains_vegetated"
+        _set_names(self, ImperviousType)
 
     def __str__(self) -> str:
         """
@@ -327,20 +423,7 @@ class Impervious:
         Returns:
             - List[str]: A list of strings representing all Impervious types.
         """
-        return [
-            self.marshes,
-            self.arable,
-            self.meadows,
-            self.forests,
-            self.rural,
-            self.suburban_weakly_impervious,
-            self.suburban_highly_impervious,
-            self.urban_weakly_impervious,
-            self.urban_moderately_impervious,
-            self.urban_highly_impervious,
-            self.mountains_rocky,
-            self.mountains_vegetated,
-        ]
+        return ImperviousType.names()
 
 
 class Catchments:
@@ -362,13 +445,7 @@ class Catchments:
         """
         Initializes a Catchments object with predefined catchment types as string attributes.
         """
-        self.urban = "urban"
-        self.suburban = "suburban"
-        self.rural = "rural"
-        self.forests = "forests"
-        self.meadows = "meadows"
-        self.arable = "arable"
-        self.mountains = "mountains"
+        _set_names(self, CatchmentType)
 
     def __str__(self) -> str:
         return f"{self.urban}, {self.suburban}, {self.rural}, {self.forests}, {self.meadows}, {self.arable}, {self.mountains}"
@@ -380,15 +457,7 @@ class Catchments:
         Returns:
             - List[str]: A list of strings representing all catchment types.
         """
-        return [
-            self.urban,
-            self.suburban,
-            self.rural,
-            self.forests,
-            self.meadows,
-            self.arable,
-            self.mountains,
-        ]
+        return CatchmentType.names()
 
 
 land_form = LandForm()
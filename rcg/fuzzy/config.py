@@ -0,0 +1,296 @@
+"""
+The module contains fuzzy engines built from alternative membership and rule configurations.
+
+A configuration overrides the limits of the triangular membership functions and the consequent
+terms of chosen rules, e.g. a regional variant with a different impervious range of urban areas.
+Everything that isn't overridden keeps the defaults of the memberships and rules modules. The engines
+are built on private copies of the memberships, so they don't interfere with the module engine or
+with each other.
+
+Building the control systems is much slower than evaluating them, so the engines are kept in an
+in-process LRU cache keyed by the configuration, which lets a service reuse the engine of every
+region it has seen recently. The size of the cache can be set with the RCG_ENGINE_CACHE_SIZE
+environment variable.
+
+Example of a configuration file (both sections are optional)::
+
+    {
+        "memberships": {
+            "impervious": {"urban_weakly_impervious": [35, 50, 65]}
+        },
+        "consequents": {
+            "catchment": {"rule22": "suburban"}
+        }
+    }
+"""
+import hashlib
+import json
+import os
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Sequence
+
+import numpy as np
+
+from rcg.fuzzy.batch import BatchEngine, compile_rule_sets
+from rcg.fuzzy.engine import FuzzyEngine, engine
+from rcg.fuzzy.memberships import Memberships, membership
+from rcg.fuzzy.rules import CatchmentsRule, ImperviousRule, RulesSet, SlopeRule
+from rcg.fuzzy.surface import get_fingerprint
+
+ENGINE_CACHE_SIZE = int(os.environ.get("RCG_ENGINE_CACHE_SIZE", "16"))
+RULE_SETS = {"slope": SlopeRule, "impervious": ImperviousRule, "catchment": CatchmentsRule}
+RULE_NAMES = list(vars(RulesSet()))
+
+
+class EngineConfig:
+    """
+    EngineConfig holds the overrides of the default memberships and rules.
+
+    The configuration is immutable and hashable, equal configurations have equal fingerprints.
+
+    Attributes
+    ----------
+    memberships : Mapping[str, Mapping[str, tuple]]
+        Limits (a, b, c) of the triangular membership functions by variable label and term.
+    consequents : Mapping[str, Mapping[str, str]]
+        Consequent terms by output (slope, impervious, catchment) and rule name.
+    fingerprint : str
+        Hash of the configuration.
+    """
+
+    def __init__(
+        self,
+        memberships: Optional[Mapping[str, Mapping[str, Sequence[float]]]] = None,
+        consequents: Optional[Mapping[str, Mapping[str, str]]] = None,
+    ) -> None:
+        """
+        Validate the overrides.
+
+        Parameters
+        ----------
+        memberships : Mapping[str, Mapping[str, Sequence[float]]], optional
+            Limits of the membership functions by variable label and term.
+        consequents : Mapping[str, Mapping[str, str]], optional
+            Consequent terms by output and rule name.
+
+        Raises
+        ------
+        ValueError
+            If any variable, term, output or rule is unknown or any limits are invalid,
+            all errors are listed in the message.
+        """
+        memberships = memberships or {}
+        consequents = consequents or {}
+        errors = self._validate(memberships, consequents)
+        if errors:
+            raise ValueError("\n".join(errors))
+
+        self.memberships = MappingProxyType(
+            {
+                label: MappingProxyType({term: tuple(map(float, limits)) for term, limits in terms.items()})
+                for label, terms in memberships.items()
+            }
+        )
+        self.consequents = MappingProxyType(
+            {output: MappingProxyType(dict(rules)) for output, rules in consequents.items()}
+        )
+        self.fingerprint = hashlib.sha256(
+            json.dumps(self.to_dict(), sort_keys=True).encode()
+        ).hexdigest()
+
+    @staticmethod
+    def _validate(
+        memberships: Mapping[str, Mapping[str, Sequence[float]]],
+        consequents: Mapping[str, Mapping[str, str]],
+    ) -> List[str]:
+        """Return the messages of all invalid overrides."""
+        return EngineConfig._validate_memberships(memberships) + EngineConfig._validate_consequents(consequents)
+
+    @staticmethod
+    def _validate_memberships(memberships: Mapping[str, Mapping[str, Sequence[float]]]) -> List[str]:
+        """Return the messages of all invalid membership limits."""
+        errors = []
+        for label, terms in memberships.items():
+            try:
+                variable = membership.get_variable(label)
+            except KeyError:
+                errors.append(f"Unknown fuzzy variable: {label}")
+                continue
+            for term, limits in terms.items():
+                if term not in variable.terms:
+                    errors.append(f"Unknown term of {label}: {term}")
+                    continue
+                try:
+                    limits = np.asarray(limits, dtype=float)
+                except (TypeError, ValueError):
+                    limits = np.array([])
+                if limits.shape != (3,) or not np.isfinite(limits).all() or (np.diff(limits) < 0).any():
+                    errors.append(f"Limits of {label}.{term} must be three non-decreasing numbers")
+        return errors
+
+    @staticmethod
+    def _validate_consequents(consequents: Mapping[str, Mapping[str, str]]) -> List[str]:
+        """Return the messages of all invalid consequent overrides."""
+        errors = []
+        for output, rules in consequents.items():
+            if output not in RULE_SETS:
+                errors.append(f"Unknown output: {output}")
+                continue
+            terms = membership.get_variable(output).terms
+            for rule, term in rules.items():
+                if rule not in RULE_NAMES:
+                    errors.append(f"Unknown rule: {rule}")
+                elif term not in terms:
+                    errors.append(f"Unknown term of {output}: {term}")
+        return errors
+
+    @classmethod
+    def from_dict(cls, config: dict) -> "EngineConfig":
+        """
+        Create a configuration from a dictionary with the memberships and consequents sections.
+
+        Parameters
+        ----------
+        config : dict
+            Configuration, see the module documentation.
+
+        Returns
+        -------
+        EngineConfig
+            The validated configuration.
+
+        Raises
+        ------
+        ValueError
+            If there is an unknown section or any override is invalid.
+        """
+        unknown = set(config) - {"memberships", "consequents"}
+        if unknown:
+            raise ValueError(f"Unknown sections: {', '.join(sorted(unknown))}")
+        return cls(config.get("memberships"), config.get("consequents"))
+
+    @classmethod
+    def from_file(cls, path: str) -> "EngineConfig":
+        """
+        Load a configuration from a JSON file.
+
+        Parameters
+        ----------
+        path : str
+            Path of the JSON file.
+
+        Returns
+        -------
+        EngineConfig
+            The validated configuration.
+        """
+        with open(path, "r") as file:
+            return cls.from_dict(json.load(file))
+
+    def to_dict(self) -> dict:
+        """Return the configuration as a dictionary which can be saved as JSON."""
+        return {
+            "memberships": {
+                label: {term: list(limits) for term, limits in terms.items()}
+                for label, terms in self.memberships.items()
+            },
+            "consequents": {output: dict(rules) for output, rules in self.consequents.items()},
+        }
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, EngineConfig) and self.fingerprint == other.fingerprint
+
+    def __hash__(self) -> int:
+        return hash(self.fingerprint)
+
+    def __repr__(self) -> str:
+        return f"EngineConfig(fingerprint={self.fingerprint[:16]!r})"
+
+    @property
+    def is_default(self) -> bool:
+        """True if the configuration doesn't override anything."""
+        return not any(self.memberships.values()) and not any(self.consequents.values())
+
+    def build_memberships(self) -> Memberships:
+        """Return new memberships with the overridden limits."""
+        member = Memberships()
+        member.populate()
+        for label, terms in self.memberships.items():
+            for term, limits in terms.items():
+                member.set_limits(label, term, limits)
+        return member
+
+    def build_rule_sets(self, member: Optional[Memberships] = None) -> Dict[str, RulesSet]:
+        """
+        Return new slope, impervious and catchment rule sets with the overridden consequents.
+
+        Parameters
+        ----------
+        member : Memberships, optional
+            Memberships the rules are built from, by default new ones from `build_memberships`.
+        """
+        if member is None:
+            member = self.build_memberships()
+        rule_sets = {output: rule_set(member) for output, rule_set in RULE_SETS.items()}
+        for output, rules in self.consequents.items():
+            variable = member.get_variable(output)
+            for rule, term in rules.items():
+                getattr(rule_sets[output], rule).consequent = variable[term]
+        return rule_sets
+
+
+@lru_cache(maxsize=ENGINE_CACHE_SIZE)
+def get_engine(config: Optional[EngineConfig] = None) -> FuzzyEngine:
+    """
+    Return the fuzzy engine of the configuration, built once and then taken from the cache.
+
+    Parameters
+    ----------
+    config : EngineConfig, optional
+        Configuration of the engine. If None or default, the module engine is returned.
+
+    Returns
+    -------
+    FuzzyEngine
+        Engine with the control systems of the configuration, to be used e.g. with
+        `Prototype(land_form, land_cover, fuzzy_engine=...)`.
+    """
+    if config is None or config.is_default:
+        return engine
+    member = config.build_memberships()
+    return FuzzyEngine(config.build_rule_sets(member), member)
+
+
+def get_batch_engine(config: Optional[EngineConfig] = None) -> BatchEngine:
+    """
+    Return the batch engine of the configuration, built once and then taken from the cache.
+
+    The engine of the default configuration is cached by the fingerprint of the module rules
+    and memberships, so it follows their changes in the same process.
+
+    Parameters
+    ----------
+    config : EngineConfig, optional
+        Configuration of the engine, by default the default memberships and rules.
+
+    Returns
+    -------
+    BatchEngine
+        Engine with the compiled rule sets of the configuration.
+    """
+    if config is None or config.is_default:
+        return _get_default_batch_engine(get_fingerprint())
+    return _get_batch_engine(config)
+
+
+@lru_cache(maxsize=1)
+def _get_default_batch_engine(fingerprint: str) -> BatchEngine:
+    """Return the batch engine of the module rules with the given fingerprint, see `get_batch_engine`."""
+    return BatchEngine()
+
+
+@lru_cache(maxsize=ENGINE_CACHE_SIZE)
+def _get_batch_engine(config: EngineConfig) -> BatchEngine:
+    """Return the batch engine of a configuration which isn't default, see `get_batch_engine`."""
+    return BatchEngine(compile_rule_sets(config.build_rule_sets()))
@@ -0,0 +1,178 @@
+"""
+The module contains the coverage of the land form and land cover pairs by the rules.
+
+Every rule of SlopeRule, ImperviousRule and CatchmentsRule is an alternative of land cover and land form
+pairs. The coverage matrix tells for every pair of categories which rules fire for it, evaluated on the
+compiled rules with each input fully belonging to a single term, so it follows the rule definitions
+only. From the matrix the pairs not covered by any rule, the pairs covered by more than one rule and
+the pairs whose rules point to different consequent terms (conflicts) are reported.
+
+Fast paths such as the lookup table assume that every pair is covered by exactly one rule, or at least
+that all rules of a pair agree, which `coverage_report` shows at a glance::
+
+    coverage_report()
+    get_coverage()["slope"].conflicts()
+"""
+from functools import lru_cache
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from rcg.fuzzy.batch import BatchSystem
+from rcg.fuzzy.categories import LandCoverType, LandFormType
+from rcg.fuzzy.config import EngineConfig, get_batch_engine
+
+
+class RuleCoverage:
+    """
+    RuleCoverage holds the coverage of all land form and land cover pairs by a rule set.
+
+    Attributes
+    ----------
+    output : str
+        Label of the consequent of the rule set.
+    matrix : pd.DataFrame
+        Boolean matrix indexed by land_form and land_cover, one column per rule, True where
+        the rule fires for the pair.
+    rule_terms : pd.Series
+        Consequent term of every rule.
+    table : pd.DataFrame
+        Table indexed by land_form and land_cover with the columns: rules (tuple of the rules
+        firing for the pair), terms (tuple of their distinct consequent terms), count (number
+        of rules) and conflict (True if the rules point to different terms).
+    """
+
+    def __init__(self, system: BatchSystem) -> None:
+        """
+        Build the coverage of a compiled rule set.
+
+        Parameters
+        ----------
+        system : BatchSystem
+            Compiled rule set with the land_form and land_cover antecedents.
+        """
+        pairs = pd.MultiIndex.from_product(
+            [LandFormType.names(), LandCoverType.names()], names=["land_form", "land_cover"]
+        )
+        firing = system.term_firing(
+            {"land_form": pairs.get_level_values(0), "land_cover": pairs.get_level_values(1)}
+        )
+        self.output = system.output
+        self.matrix = pd.DataFrame(firing > 0, index=pairs, columns=system.rule_names)
+        self.rule_terms = pd.Series(
+            [system.terms[term] for term in system.rule_terms], index=system.rule_names, name="term"
+        )
+
+        rule_names = np.array(system.rule_names, dtype=object)
+        term_names = self.rule_terms.to_numpy()
+        rules = [tuple(rule_names[row]) for row in self.matrix.to_numpy()]
+        terms = [tuple(dict.fromkeys(term_names[row])) for row in self.matrix.to_numpy()]
+        self.table = pd.DataFrame(
+            {
+                "rules": rules,
+                "terms": terms,
+                "count": self.matrix.sum(axis=1).to_numpy(),
+                "conflict": [len(term) > 1 for term in terms],
+            },
+            index=pairs,
+        )
+
+    def uncovered(self) -> pd.MultiIndex:
+        """Return the pairs not covered by any rule."""
+        return self.table.index[self.table["count"] == 0]
+
+    def duplicated(self) -> pd.DataFrame:
+        """Return the rows of the table of the pairs covered by more than one rule."""
+        return self.table[self.table["count"] > 1]
+
+    def conflicts(self) -> pd.DataFrame:
+        """Return the rows of the table of the pairs whose rules point to different terms."""
+        return self.table[self.table["conflict"]]
+
+    def unused_rules(self) -> list:
+        """Return the names of the rules which don't cover any pair."""
+        return list(self.matrix.columns[~self.matrix.any(axis=0)])
+
+    def lookup(self, land_form: Iterable, land_cover: Iterable) -> pd.DataFrame:
+        """
+        Return the rows of the table for the given pairs.
+
+        Parameters
+        ----------
+        land_form : Iterable
+            Land form names or LandFormType codes.
+        land_cover : Iterable
+            Land cover names or LandCoverType codes, same length as land_form.
+
+        Returns
+        -------
+        pd.DataFrame
+            Rows of the table in the order of the inputs.
+
+        Raises
+        ------
+        ValueError
+            If any value is invalid or the inputs have different lengths.
+        """
+        land_form = LandFormType.encode(land_form)
+        land_cover = LandCoverType.encode(land_cover)
+        if land_form.shape != land_cover.shape:
+            raise ValueError("land_form and land_cover must have the same length")
+        # the pairs are ordered by the land form and then the land cover codes
+        form_codes, cover_codes = LandFormType.codes(), LandCoverType.codes()
+        positions = np.searchsorted(form_codes, land_form) * len(cover_codes) + np.searchsorted(
+            cover_codes, land_cover
+        )
+        return self.table.iloc[positions]
+
+    def summary(self) -> Dict[str, int]:
+        """Return the number of pairs, covered, uncovered, duplicated and conflicting pairs and unused rules."""
+        count = self.table["count"]
+        return {
+            "pairs": len(self.table),
+            "covered": int((count > 0).sum()),
+            "uncovered": int((count == 0).sum()),
+            "duplicated": int((count > 1).sum()),
+            "conflicting": int(self.table["conflict"].sum()),
+            "unused_rules": len(self.unused_rules()),
+        }
+
+
+@lru_cache(maxsize=None)
+def get_coverage(config: Optional[EngineConfig] = None) -> Dict[str, RuleCoverage]:
+    """
+    Return the coverage of the slope, impervious and catchment rule sets, built once per configuration.
+
+    Parameters
+    ----------
+    config : EngineConfig, optional
+        Configuration of the rules, by default the default rules.
+
+    Returns
+    -------
+    Dict[str, RuleCoverage]
+        Coverage by output name.
+    """
+    systems = get_batch_engine(config).systems
+    return {output: RuleCoverage(system) for output, system in systems.items()}
+
+
+def coverage_report(config: Optional[EngineConfig] = None) -> pd.DataFrame:
+    """
+    Return the summary of the coverage of every rule set.
+
+    Parameters
+    ----------
+    config : EngineConfig, optional
+        Configuration of the rules, by default the default rules.
+
+    Returns
+    -------
+    pd.DataFrame
+        Table indexed by output with the columns of `RuleCoverage.summary`.
+    """
+    coverage = get_coverage(config)
+    report = pd.DataFrame({output: item.summary() for output, item in coverage.items()}).T
+    report.index.name = "output"
+    return report
@@ -0,0 +1,197 @@
+"""
+The module contains vectorized defuzzification methods.
+
+The functions follow the definitions of `skfuzzy.defuzz`, but take many aggregated membership
+functions sampled on a common universe (one per row of a 2D array) and defuzzify all of them
+with whole-array NumPy operations. The membership function is assumed to be linear between
+the samples, so the centroid and bisector are exact for the sampled function. Rows without
+any membership (no rule fired) give NaN instead of raising an error.
+"""
+from typing import Callable, Dict
+
+import numpy as np
+
+
+def _segments(x: np.ndarray, mfx: np.ndarray):
+    """Return the widths and the left and right heights of the segments between the samples."""
+    return np.diff(x), mfx[:, :-1], mfx[:, 1:]
+
+
+def _empty(mfx: np.ndarray) -> np.ndarray:
+    """Return the mask of the rows without any membership."""
+    return ~(mfx > 0).any(axis=1)
+
+
+def centroid(x: np.ndarray, mfx: np.ndarray) -> np.ndarray:
+    """
+    Defuzzify using the centroid (center of gravity) of the area.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        Universe, 1D array of length M.
+    mfx : np.ndarray
+        Membership functions, 2D array of shape (N, M).
+
+    Returns
+    -------
+    np.ndarray
+        Defuzzified values, 1D array of length N.
+    """
+    width, y1, y2 = _segments(x, mfx)
+    x1, x2 = x[:-1], x[1:]
+    area = (width * (y1 + y2) / 2).sum(axis=1)
+    moment = (width / 6 * (x1 * (2 * y1 + y2) + x2 * (y1 + 2 * y2))).sum(axis=1)
+    result = moment / np.fmax(area, np.finfo(float).eps)
+    result[_empty(mfx)] = np.nan
+    return result
+
+
+def bisector(x: np.ndarray, mfx: np.ndarray) -> np.ndarray:
+    """
+    Defuzzify using the bisector, the point dividing the area in two equal parts.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        Universe, 1D array of length M.
+    mfx : np.ndarray
+        Membership functions, 2D array of shape (N, M).
+
+    Returns
+    -------
+    np.ndarray
+        Defuzzified values, 1D array of length N.
+    """
+    width, y1, y2 = _segments(x, mfx)
+    cumulative = np.cumsum(width * (y1 + y2) / 2, axis=1)
+    half = cumulative[:, -1] / 2
+    rows = np.arange(len(mfx))
+    index = np.argmax(cumulative >= half[:, np.newaxis], axis=1)
+    before = np.where(index > 0, cumulative[rows, index - 1], 0.0)
+    # area left of the bisector inside the segment
+    subarea = half - before
+
+    left = y1[rows, index]
+    slope = (y2[rows, index] - left) / width[index]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        linear = (np.sqrt(left**2 + 2 * slope * subarea) - left) / slope
+        constant = subarea / left
+    result = x[index] + np.where(slope == 0, constant, linear)
+    result[_empty(mfx)] = np.nan
+    return result
+
+
+def _maximum(mfx: np.ndarray) -> np.ndarray:
+    """Return the mask of the samples where every membership function reaches its maximum."""
+    return mfx == mfx.max(axis=1, keepdims=True)
+
+
+def mom(x: np.ndarray, mfx: np.ndarray) -> np.ndarray:
+    """
+    Defuzzify using the mean of the maximum.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        Universe, 1D array of length M.
+    mfx : np.ndarray
+        Membership functions, 2D array of shape (N, M).
+
+    Returns
+    -------
+    np.ndarray
+        Defuzzified values, 1D array of length N.
+    """
+    maximum = _maximum(mfx)
+    result = (maximum * x).sum(axis=1) / maximum.sum(axis=1)
+    result[_empty(mfx)] = np.nan
+    return result
+
+
+def som(x: np.ndarray, mfx: np.ndarray) -> np.ndarray:
+    """
+    Defuzzify using the smallest of the maximum.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        Universe, 1D array of length M.
+    mfx : np.ndarray
+        Membership functions, 2D array of shape (N, M).
+
+    Returns
+    -------
+    np.ndarray
+        Defuzzified values, 1D array of length N.
+    """
+    result = x[np.argmax(_maximum(mfx), axis=1)].astype(float)
+    result[_empty(mfx)] = np.nan
+    return result
+
+
+def lom(x: np.ndarray, mfx: np.ndarray) -> np.ndarray:
+    """
+    Defuzzify using the largest of the maximum.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        Universe, 1D array of length M.
+    mfx : np.ndarray
+        Membership functions, 2D array of shape (N, M).
+
+    Returns
+    -------
+    np.ndarray
+        Defuzzified values, 1D array of length N.
+    """
+    result = x[len(x) - 1 - np.argmax(_maximum(mfx)[:, ::-1], axis=1)].astype(float)
+    result[_empty(mfx)] = np.nan
+    return result
+
+
+METHODS: Dict[str, Callable[[np.ndarray, np.ndarray], np.ndarray]] = {
+    "centroid": centroid,
+    "bisector": bisector,
+    "mom": mom,
+    "som": som,
+    "lom": lom,
+}
+
+
+def defuzz(x: np.ndarray, mfx: np.ndarray, method: str = "centroid") -> np.ndarray:
+    """
+    Defuzzify many membership functions with the given method.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        Universe, 1D array of length M.
+    mfx : np.ndarray
+        Membership functions, 2D array of shape (N, M).
+    method : str, optional
+        One of: centroid, bisector, mom (mean of maximum), som (smallest of maximum)
+        and lom (largest of maximum), by default centroid.
+
+    Returns
+    -------
+    np.ndarray
+        Defuzzified values, 1D array of length N.
+
+    Raises
+    ------
+    ValueError
+        If the method is unknown or the shapes don't match.
+    """
+    try:
+        function = METHODS[method.lower()]
+    except KeyError:
+        raise ValueError(
+            f"Unknown defuzzification method: {method}. Valid methods are: {', '.join(METHODS)}"
+        )
+    x = np.asarray(x, dtype=float)
+    mfx = np.atleast_2d(np.asarray(mfx, dtype=float))
+    if mfx.shape[1] != len(x):
+        raise ValueError("The membership functions must be sampled on the universe x")
+    return function(x, mfx)
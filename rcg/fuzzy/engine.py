@@ -1,6 +1,8 @@
+from typing import Mapping, Optional
+
 import skfuzzy as fuzz
 from rcg.fuzzy import categories
-from .rules import slope_rules, impervious_rules, catchment_rules
+from .rules import RulesSet, slope_rules, impervious_rules, catchment_rules
 
 from skfuzzy import control as ctrl
 from rcg.fuzzy.memberships import Memberships, membership
@@ -10,13 +12,35 @@ class FuzzyEngine:
     FuzzyEngine returns the result of calculating the slope, impervious, and catchment values.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        rule_sets: Optional[Mapping[str, RulesSet]] = None,
+        memberships: Optional[Memberships] = None,
+    ):
         """
         Initializes FuzzyEngine with the control systems and simulations for slope, impervious, and catchment.
+
+        Parameters
+        ----------
+        rule_sets : Mapping[str, RulesSet], optional
+            Rule sets with the slope, impervious and catchment keys, e.g. built from alternative
+            memberships. By default the rules of the rules module are used.
+        memberships : Memberships, optional
+            Memberships the rule sets were built from, used to label the inputs and to classify
+            the results. By default the module memberships.
         """
-        self.slope_simulation_ctrl = ctrl.ControlSystem(slope_rules)
-        self.impervious_simulation_ctrl = ctrl.ControlSystem(impervious_rules)
-        self.catchment_simulation_ctrl = ctrl.ControlSystem(catchment_rules)
+        self.memberships = membership if memberships is None else memberships
+        if rule_sets is None:
+            rules = {"slope": slope_rules, "impervious": impervious_rules, "catchment": catchment_rules}
+        else:
+            rules = {
+                output: list(vars(rule_sets[output]).values())
+                for output in ("slope", "impervious", "catchment")
+            }
+        self.rules = rules
+        self.slope_simulation_ctrl = ctrl.ControlSystem(rules["slope"])
+        self.impervious_simulation_ctrl = ctrl.ControlSystem(rules["impervious"])
+        self.catchment_simulation_ctrl = ctrl.ControlSystem(rules["catchment"])
 
         # compute
         self.slope_simulation = ctrl.ControlSystemSimulation(self.slope_simulation_ctrl)
@@ -36,46 +60,59 @@ class Prototype:
     Prototype is a class that calculates the slope, impervious, and catchment values based on given land form and
     land cover categories using fuzzy logic rules defined in rules.py.
     """
-    def __init__(self, land_form: categories.LandForm, land_cover: categories.LandCover):
+    def __init__(
+        self,
+        land_form: categories.LandFormType,
+        land_cover: categories.LandCoverType,
+        fuzzy_engine: Optional[FuzzyEngine] = None,
+    ):
         """
         Initializes a Prototype instance with the given land_form and land_cover.
 
         Parameters
         ----------
-        land_form : categories.LandForm
+        land_form : categories.LandFormType
             Land form category to be used for the fuzzy logic calculation.
-        land_cover : categories.LandCover
+        land_cover : categories.LandCoverType
             Land cover category to be used for the fuzzy logic calculation.
+        fuzzy_engine : FuzzyEngine, optional
+            Engine used for the calculation, by default the module engine.
         """
+        if fuzzy_engine is None:
+            fuzzy_engine = engine
+        member = fuzzy_engine.memberships
+        self.land_form = land_form
+        self.land_cover = land_cover
 
         # calculate
-        engine.slope_simulation.input[membership.land_form_type.label] = land_form
-        engine.slope_simulation.input[membership.land_cover_type.label] = land_cover
+        fuzzy_engine.slope_simulation.input[member.land_form_type.label] = land_form
+        fuzzy_engine.slope_simulation.input[member.land_cover_type.label] = land_cover
 
-        engine.impervious_simulation.input[membership.land_form_type.label] = land_form
-        engine.impervious_simulation.input[membership.land_cover_type.label] = land_cover
+        fuzzy_engine.impervious_simulation.input[member.land_form_type.label] = land_form
+        fuzzy_engine.impervious_simulation.input[member.land_cover_type.label] = land_cover
 
-        engine.catchment_simulation.input[membership.land_form_type.label] = land_form
-        engine.catchment_simulation.input[membership.land_cover_type.label] = land_cover
+        fuzzy_engine.catchment_simulation.input[member.land_form_type.label] = land_form
+        fuzzy_engine.catchment_simulation.input[member.land_cover_type.label] = land_cover
 
         # get slope result
-        engine.slope_simulation.compute()
-        self.slope_result = engine.slope_simulation.output[membership.slope.label]
+        fuzzy_engine.slope_simulation.compute()
+        self.slope_result = fuzzy_engine.slope_simulation.output[member.slope.label]
 
         # get impervious result
-        engine.impervious_simulation.compute()
-        self.impervious_result = engine.impervious_simulation.output[
-            membership.impervious.label
+        fuzzy_engine.impervious_simulation.compute()
+        self.impervious_result = fuzzy_engine.impervious_simulation.output[
+            member.impervious.label
         ]
 
         # get catchment result
-        engine.catchment_simulation.compute()
-        self.catchment_result = engine.catchment_simulation.output[
-            membership.catchment.label
+        fuzzy_engine.catchment_simulation.compute()
+        self.catchment_result = fuzzy_engine.catchment_simulation.output[
+            member.catchment.label
         ]
+        self.catchment_class = self.get_populate(self.catchment_result, member.catchment)
 
     @staticmethod
-    def get_populate(result: float, member: Memberships = membership.catchment):
+    def get_populate(result: float, member: Optional[ctrl.Consequent] = None):
         """
         Returns the linguistic variable of the given member category based on the result.
 
@@ -83,14 +120,18 @@ class Prototype:
         ----------
         result : float
             The result of the fuzzy logic calculation.
-        member : membership, optional
-            Membership category to be used, by default membership.catchment.
+        member : ctrl.Consequent, optional
+            Membership category to be used, by default membership.catchment. The catchment class
+            of a prototype, classified against the memberships of its engine, is kept in
+            `Prototype.catchment_class`.
 
         Returns
         -------
         str
             Linguistic variable of the member category.
         """
+        if member is None:
+            member = membership.catchment
         populate = {
             key: fuzz.interp_membership(member.universe, member[key].mf, result)
             for key in member.terms
@@ -0,0 +1,190 @@
+"""
+The module contains a precomputed table of the fuzzy results for every land form and land cover combination.
+
+The land form and land cover antecedents only take the integer values of the categories, so the whole
+fuzzy system collapses to 9 x 14 = 126 combinations. The table with those results is shipped with the
+package (lookup_table.csv) and can be read instantly, without building the control systems or running
+any simulation.
+"""
+import os
+from functools import lru_cache
+from typing import Dict, Iterable, Union
+
+import numpy as np
+import pandas as pd
+
+from rcg.fuzzy.categories import CatchmentType, LandFormType, LandCoverType
+
+TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "lookup_table.csv")
+INDEX = ["land_form", "land_cover"]
+COLUMNS = ["slope", "impervious", "catchment", "catchment_class"]
+
+
+def build_lookup_table() -> pd.DataFrame:
+    """
+    Compute the fuzzy results for all land form and land cover combinations with the fuzzy engine.
+
+    This is slow (every combination runs three control system simulations) and is only needed
+    to regenerate the shipped table after the rules or memberships have been changed.
+
+    Returns
+    -------
+    pd.DataFrame
+        Table indexed by (land_form, land_cover) with the slope, impervious and catchment results
+        and the catchment class (linguistic term of the catchment result).
+    """
+    from rcg.fuzzy.engine import Prototype
+
+    rows = []
+    for land_form in LandFormType:
+        for land_cover in LandCoverType:
+            prototype = Prototype(land_form=land_form, land_cover=land_cover)
+            rows.append(
+                {
+                    "land_form": land_form.name,
+                    "land_cover": land_cover.name,
+                    "slope": float(prototype.slope_result),
+                    "impervious": float(prototype.impervious_result),
+                    "catchment": float(prototype.catchment_result),
+                    "catchment_class": prototype.catchment_class,
+                }
+            )
+    return pd.DataFrame(rows, columns=INDEX + COLUMNS).set_index(INDEX)
+
+
+def save_lookup_table(path: str = TABLE_PATH) -> None:
+    """
+    Rebuild the lookup table and save it as a CSV file.
+
+    Parameters
+    ----------
+    path : str, optional
+        Destination of the CSV file, by default the table shipped with the package.
+    """
+    build_lookup_table().to_csv(path)
+
+
+@lru_cache(maxsize=None)
+def load_lookup_table(path: str = TABLE_PATH) -> pd.DataFrame:
+    """
+    Read the precomputed lookup table.
+
+    The table is read once and cached, so it must not be modified in place.
+
+    Parameters
+    ----------
+    path : str, optional
+        Path of the CSV file, by default the table shipped with the package.
+
+    Returns
+    -------
+    pd.DataFrame
+        Table indexed by (land_form, land_cover) with the columns: slope, impervious, catchment
+        and catchment_class.
+    """
+    table = pd.read_csv(path, float_precision="round_trip")
+    return table.set_index(INDEX)
+
+
+def lookup(land_form: str, land_cover: str) -> Dict[str, Union[float, str]]:
+    """
+    Return the precomputed fuzzy results for a single land form and land cover combination.
+
+    Parameters
+    ----------
+    land_form : str
+        Land form category name, one of LandFormType.names().
+    land_cover : str
+        Land cover category name, one of LandCoverType.names().
+
+    Returns
+    -------
+    Dict[str, Union[float, str]]
+        Dictionary with the slope, impervious, catchment and catchment_class values.
+
+    Raises
+    ------
+    KeyError
+        If the combination is not a valid pair of categories.
+    """
+    try:
+        return load_lookup_table().loc[(land_form, land_cover)].to_dict()
+    except KeyError:
+        raise KeyError(
+            f"Combination of land form: {land_form} and land cover: {land_cover} doesn't exist"
+        )
+
+
+@lru_cache(maxsize=None)
+def load_lookup_arrays(path: str = TABLE_PATH) -> Dict[str, np.ndarray]:
+    """
+    Return the lookup table as 2D arrays indexed by [land form code, land cover code].
+
+    Parameters
+    ----------
+    path : str, optional
+        Path of the CSV file, by default the table shipped with the package.
+
+    Returns
+    -------
+    Dict[str, np.ndarray]
+        Arrays of the slope, impervious and catchment results and the CatchmentType codes
+        of the catchment class.
+    """
+    table = load_lookup_table(path)
+    land_form = LandFormType.encode(table.index.get_level_values("land_form"))
+    land_cover = LandCoverType.encode(table.index.get_level_values("land_cover"))
+    shape = (LandFormType.codes().max() + 1, LandCoverType.codes().max() + 1)
+
+    arrays = {}
+    for column in ("slope", "impervious", "catchment"):
+        arrays[column] = np.full(shape, np.nan)
+        arrays[column][land_form, land_cover] = table[column].to_numpy()
+    arrays["catchment_class"] = np.zeros(shape, dtype=np.int64)
+    arrays["catchment_class"][land_form, land_cover] = CatchmentType.encode(
+        table["catchment_class"]
+    )
+    return arrays
+
+
+def lookup_codes(land_form: Iterable, land_cover: Iterable) -> pd.DataFrame:
+    """
+    Return the precomputed fuzzy results for whole columns of land forms and land covers.
+
+    The inputs are encoded in one pass and the results are gathered from the lookup arrays,
+    so the cost doesn't depend on the fuzzy engine at all.
+
+    Parameters
+    ----------
+    land_form : Iterable
+        Land form names or LandFormType codes.
+    land_cover : Iterable
+        Land cover names or LandCoverType codes, same length as land_form.
+
+    Returns
+    -------
+    pd.DataFrame
+        Table with the slope, impervious and catchment results and the catchment_class
+        as a pandas Categorical, one row per input row.
+
+    Raises
+    ------
+    ValueError
+        If any value is not a valid category or the inputs have different lengths.
+    """
+    land_form = LandFormType.encode(land_form)
+    land_cover = LandCoverType.encode(land_cover)
+    if land_form.shape != land_cover.shape:
+        raise ValueError("land_form and land_cover must have the same length")
+
+    arrays = load_lookup_arrays()
+    return pd.DataFrame(
+        {
+            "slope": arrays["slope"][land_form, land_cover],
+            "impervious": arrays["impervious"][land_form, land_cover],
+            "catchment": arrays["catchment"][land_form, land_cover],
+            "catchment_class": CatchmentType.decode(
+                arrays["catchment_class"][land_form, land_cover]
+            ),
+        }
+    )
@@ -1,6 +1,8 @@
 """
 The module contains a class with specified fuzzy set membership limits.
 """
+from typing import Sequence
+
 import numpy as np
 import skfuzzy as fuzz
 
@@ -31,6 +33,68 @@ class Memberships:
         self.impervious = ctrl.Consequent(np.arange(0, 101, 1), "impervious")
         self.catchment = ctrl.Consequent(np.arange(1, 101, 1), "catchment")
 
+    def get_variable(self, label: str):
+        """
+        Return the fuzzy variable with the given label.
+
+        Parameters
+        ----------
+        label : str
+            Label of the variable: land_form, land_cover, slope, impervious or catchment.
+
+        Returns
+        -------
+        Union[ctrl.Antecedent, ctrl.Consequent]
+            The fuzzy variable.
+
+        Raises
+        ------
+        KeyError
+            If there is no variable with the label.
+        """
+        variables = (
+            self.land_form_type,
+            self.land_cover_type,
+            self.slope,
+            self.impervious,
+            self.catchment,
+        )
+        for variable in variables:
+            if variable.label == label:
+                return variable
+        raise KeyError(f"Unknown fuzzy variable: {label}")
+
+    def set_limits(self, label: str, term: str, limits: Sequence[float]) -> None:
+        """
+        Replace the limits of the triangular membership function of a term.
+
+        The membership function is changed in place, so the rules built from the memberships
+        keep pointing to the term.
+
+        Parameters
+        ----------
+        label : str
+            Label of the variable, see `get_variable`.
+        term : str
+            Name of the term, e.g. urban_weakly_impervious.
+        limits : Sequence[float]
+            Three non-decreasing limits [a, b, c] of the triangle.
+
+        Raises
+        ------
+        KeyError
+            If the variable or the term doesn't exist.
+        ValueError
+            If the limits are not three non-decreasing numbers.
+        """
+        variable = self.get_variable(label)
+        if term not in variable.terms:
+            raise KeyError(f"Unknown term of {label}: {term}")
+        limits = np.asarray(limits, dtype=float)
+        if limits.shape != (3,) or not np.isfinite(limits).all() or (np.diff(limits) < 0).any():
+            raise ValueError(f"Limits of {label}.{term} must be three non-decreasing numbers")
+        variable[term].mf = fuzz.trimf(variable.universe, limits)
+
     def populate_land_use(self):
         """
         Populate land use type with membership functions.
@@ -206,9 +270,14 @@ class Memberships:
         )
 
 
+    def populate(self) -> None:
+        """Populate all variables with membership functions."""
+        self.populate_land_use()
+        self.populate_land_cover()
+        self.populate_slope()
+        self.populate_impervious()
+        self.populate_catchment()
+
+
 membership = Memberships()
-membership.populate_land_use()
-membership.populate_land_cover()
-membership.populate_slope()
-membership.populate_impervious()
-membership.populate_catchment()
+membership.populate()
@@ -0,0 +1,112 @@
+"""
+The module contains the evaluation of catchments with a mixed land cover.
+
+A catchment is described by its land form and a composition vector: the share of every land cover
+in its area, e.g. 40% forests, 35% suburban_weakly_impervious and 25% arable. The fuzzy results of
+every component are gathered from the lookup arrays for all catchments at once, the slope and
+impervious results are weighted by the shares and the catchment class covering the largest share
+of the area is returned as the dominant one.
+"""
+from typing import Iterable, Union
+
+import numpy as np
+import pandas as pd
+
+from rcg.fuzzy.categories import CatchmentType, LandCoverType, LandFormType
+from rcg.fuzzy.lookup import load_lookup_arrays
+
+
+def get_composition(composition: Union[pd.DataFrame, np.ndarray]) -> np.ndarray:
+    """
+    Validate the composition vectors and normalize them to fractions summing up to one.
+
+    Parameters
+    ----------
+    composition : Union[pd.DataFrame, np.ndarray]
+        Data frame with land cover names as columns (missing land covers count as zero)
+        or an array of shape (number of catchments, number of land covers) with columns
+        in the order of LandCoverType. The shares may be fractions, percentages or areas.
+
+    Returns
+    -------
+    np.ndarray
+        Array of fractions of shape (number of catchments, number of land covers).
+
+    Raises
+    ------
+    ValueError
+        If there is an unknown land cover column, a negative or missing share or a catchment
+        without any land cover.
+    """
+    if isinstance(composition, pd.DataFrame):
+        unknown = [column for column in composition.columns if column not in LandCoverType.names()]
+        if unknown:
+            raise ValueError(f"Unknown land covers: {', '.join(map(str, unknown))}")
+        composition = composition.reindex(columns=LandCoverType.names(), fill_value=0)
+    shares = np.asarray(composition, dtype=float)
+    if shares.ndim != 2 or shares.shape[1] != len(LandCoverType):
+        raise ValueError(
+            f"composition must have {len(LandCoverType)} columns, one for each land cover"
+        )
+
+    invalid = ~np.isfinite(shares).all(axis=1) | (shares < 0).any(axis=1)
+    total = shares.sum(axis=1)
+    invalid |= ~(total > 0)
+    if invalid.any():
+        rows = ", ".join(str(row) for row in np.flatnonzero(invalid)[:10])
+        raise ValueError(
+            f"{invalid.sum()} rows have an invalid composition (shares must be non-negative numbers "
+            f"and at least one must be greater than zero), rows: {rows}"
+        )
+    return shares / total[:, np.newaxis]
+
+
+def lookup_mixtures(
+    land_form: Iterable, composition: Union[pd.DataFrame, np.ndarray]
+) -> pd.DataFrame:
+    """
+    Return the area-weighted fuzzy results of catchments with mixed land covers.
+
+    Parameters
+    ----------
+    land_form : Iterable
+        Land form names or LandFormType codes, one per catchment.
+    composition : Union[pd.DataFrame, np.ndarray]
+        Share of every land cover in the catchments, see `get_composition`.
+
+    Returns
+    -------
+    pd.DataFrame
+        Table with the weighted slope, impervious and catchment results and the dominant
+        catchment_class as a pandas Categorical, one row per catchment (with the index of
+        `composition` if it is a data frame).
+
+    Raises
+    ------
+    ValueError
+        If any value is invalid or the inputs have different lengths.
+    """
+    land_form = LandFormType.encode(land_form)
+    fractions = get_composition(composition)
+    if land_form.shape[0] != fractions.shape[0]:
+        raise ValueError("land_form and composition must have the same length")
+
+    arrays = load_lookup_arrays()
+    # results of every land cover for the land form of each catchment, shape (catchments, land covers)
+    land_covers = LandCoverType.codes()
+    results = {
+        column: np.sum(arrays[column][:, land_covers][land_form] * fractions, axis=1)
+        for column in ("slope", "impervious", "catchment")
+    }
+
+    classes = arrays["catchment_class"][:, land_covers][land_form]
+    class_codes = CatchmentType.codes()
+    shares = np.stack(
+        [np.sum(fractions * (classes == code), axis=1) for code in class_codes], axis=1
+    )
+    dominant = class_codes[np.argmax(shares, axis=1)]
+
+    index = composition.index if isinstance(composition, pd.DataFrame) else None
+    return pd.DataFrame(
+        {**results, "catchment_class": CatchmentType.decode(dominant)}, index=index
+    )
@@ -0,0 +1,115 @@
+"""
+The module contains a zero-order Takagi-Sugeno surrogate of the Mamdani fuzzy system.
+
+Every consequent term is replaced by a singleton placed at the centroid of its membership function.
+The output is the average of the singletons of all rules weighted by their firing strengths,
+so the aggregation of the clipped membership functions and the centroid over the whole
+slope/impervious/catchment universe are not needed. The rules and memberships are the same
+as in the reference engine (rules.py and memberships.py), only the defuzzification differs;
+use `accuracy_report` to check the deviation for the inputs of interest.
+"""
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+import skfuzzy as fuzz
+
+from rcg.fuzzy.batch import BatchSystem, compile_rule_sets, get_inputs
+from rcg.fuzzy.categories import LandCoverType, LandFormType
+from rcg.fuzzy.memberships import membership
+
+
+class SugenoEngine:
+    """
+    SugenoEngine evaluates the zero-order Takagi-Sugeno surrogate of the slope, impervious
+    and catchment rule sets.
+
+    Attributes
+    ----------
+    systems : Dict[str, BatchSystem]
+        Compiled rule sets by output name.
+    singletons : Dict[str, np.ndarray]
+        Singleton (centroid of the membership function) of every consequent term by output name.
+    """
+
+    def __init__(self, systems: Optional[Dict[str, BatchSystem]] = None) -> None:
+        self.systems = compile_rule_sets() if systems is None else systems
+        self.singletons = {
+            output: np.array([fuzz.defuzz(system.universe, mf, "centroid") for mf in system.term_mfs])
+            for output, system in self.systems.items()
+        }
+
+    def compute(self, land_form: Iterable, land_cover: Iterable) -> pd.DataFrame:
+        """
+        Evaluate the surrogate for many inputs at once.
+
+        Parameters
+        ----------
+        land_form : Iterable
+            Land form names, LandFormType codes or real numbers.
+        land_cover : Iterable
+            Land cover names, LandCoverType codes or real numbers, same length as land_form.
+
+        Returns
+        -------
+        pd.DataFrame
+            Table with a column for every output (slope, impervious, catchment), one row per input.
+            The value is NaN where no rule fires.
+        """
+        inputs = get_inputs(land_form, land_cover)
+        results = {}
+        for output, system in self.systems.items():
+            firing = system.firing(inputs)
+            total = firing.sum(axis=1)
+            weighted = firing @ self.singletons[output][system.rule_terms]
+            with np.errstate(invalid="ignore", divide="ignore"):
+                results[output] = np.where(total > 0, weighted / total, np.nan)
+        return pd.DataFrame(results)
+
+
+def accuracy_report(
+    surrogate: Optional[SugenoEngine] = None,
+    land_form: Optional[Iterable] = None,
+    land_cover: Optional[Iterable] = None,
+) -> pd.DataFrame:
+    """
+    Compare the surrogate with the reference (scikit-fuzzy Mamdani) engine.
+
+    Parameters
+    ----------
+    surrogate : SugenoEngine, optional
+        Surrogate to be checked, by default a new SugenoEngine of the module rules.
+    land_form : Iterable, optional
+        Land form inputs (names, codes or real numbers). By default all land form and land cover
+        category combinations are compared.
+    land_cover : Iterable, optional
+        Land cover inputs, same length as land_form.
+
+    Returns
+    -------
+    pd.DataFrame
+        Table indexed by the output name with the max_abs_error, mean_abs_error and rmse columns.
+    """
+    from rcg.fuzzy.surface import evaluate
+
+    surrogate = SugenoEngine() if surrogate is None else surrogate
+    if land_form is None or land_cover is None:
+        grid = np.meshgrid(LandFormType.codes(), LandCoverType.codes(), indexing="ij")
+        land_form, land_cover = grid[0].ravel(), grid[1].ravel()
+
+    inputs = get_inputs(land_form, land_cover)
+    reference = evaluate(
+        inputs[membership.land_form_type.label], inputs[membership.land_cover_type.label]
+    )
+    result = surrogate.compute(
+        inputs[membership.land_form_type.label], inputs[membership.land_cover_type.label]
+    )
+    rows = {}
+    for output in result.columns:
+        error = np.abs(result[output].to_numpy() - reference[output])
+        rows[output] = {
+            "max_abs_error": float(error.max()),
+            "mean_abs_error": float(error.mean()),
+            "rmse": float(np.sqrt(np.mean(error**2))),
+        }
+    return pd.DataFrame.from_dict(rows, orient="index")
@@ -0,0 +1,337 @@
+"""
+The module contains response surfaces of the fuzzy system for continuous inputs.
+
+The land form and land cover antecedents are defined on integer universes, but the fuzzy system
+accepts any real input in between, e.g. a blend of two land covers. A response surface samples
+the slope, impervious and catchment outputs once on a dense grid over both antecedents (with
+the control systems evaluated on whole arrays) and answers continuous queries by bilinear
+interpolation, so the cost of a query doesn't depend on the fuzzy engine at all. The grid spans
+the category codes; outside of them no membership function reaches the edge of the universe
+(e.g. land form 0), so the inputs are clipped to the grid.
+
+The grid is cached on disk, keyed by the grid step and the fingerprint of the rules and memberships,
+so it is only rebuilt after the fuzzy system has been changed.
+
+The interpolation is exact at the grid nodes, in particular at the integer category codes. Between
+the nodes the error is measured at the centres of all grid cells when the surface is built and kept
+in `ResponseSurface.max_error`. With the default step of 0.1 the maximum absolute errors against
+live inference are 3.7 (slope [%]), 8.8 (impervious [%]) and 7.9 (catchment), with a step of 0.5
+they are 10.5, 13.7 and 24.5. The largest errors are located where the dominant rule changes
+and the output of the system is steep.
+"""
+import hashlib
+import os
+import tempfile
+from functools import lru_cache
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+from skfuzzy import control as ctrl
+
+from rcg.fuzzy.categories import LandCoverType, LandFormType
+from rcg.fuzzy.engine import FuzzyEngine, engine
+from rcg.fuzzy.memberships import membership
+
+CACHE_DIR = os.environ.get(
+    "RCG_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "rcg")
+)
+GRID_STEP = 0.1
+OUTPUTS = ["slope", "impervious", "catchment"]
+
+
+def get_fingerprint(fuzzy_engine: FuzzyEngine = engine) -> str:
+    """
+    Return a hash of the rules and memberships of the fuzzy engine.
+
+    Parameters
+    ----------
+    fuzzy_engine : FuzzyEngine, optional
+        Engine to be hashed, by default the module engine.
+
+    Returns
+    -------
+    str
+        Hex digest which changes whenever a rule, a term or a membership function changes.
+    """
+    digest = hashlib.sha256()
+    # the rules and the memberships are read directly, iterating the rules of a control system
+    # sorts its graph and is a hundred times slower
+    for output in OUTPUTS:
+        for rule in fuzzy_engine.rules[output]:
+            digest.update(str(rule).encode())
+    member = fuzzy_engine.memberships
+    for label in ("land_form", "land_cover", *OUTPUTS):
+        variable = member.get_variable(label)
+        digest.update(variable.label.encode())
+        digest.update(np.asarray(variable.universe, dtype=float).tobytes())
+        for term_label, term in variable.terms.items():
+            digest.update(term_label.encode())
+            digest.update(np.asarray(term.mf, dtype=float).tobytes())
+    return digest.hexdigest()
+
+
+def evaluate(
+    land_form: Iterable, land_cover: Iterable, fuzzy_engine: FuzzyEngine = engine
+) -> Dict[str, np.ndarray]:
+    """
+    Run live inference of the fuzzy system for arrays of continuous inputs.
+
+    Parameters
+    ----------
+    land_form : Iterable
+        Land form inputs, any real numbers (clipped to the antecedent universe).
+    land_cover : Iterable
+        Land cover inputs of the same shape as land_form.
+    fuzzy_engine : FuzzyEngine, optional
+        Engine whose control systems are evaluated, by default the module engine.
+
+    Returns
+    -------
+    Dict[str, np.ndarray]
+        Slope, impervious and catchment results, arrays of the shape of the inputs.
+    """
+    land_form = np.asarray(land_form, dtype=float)
+    land_cover = np.asarray(land_cover, dtype=float)
+    systems = {
+        "slope": fuzzy_engine.slope_simulation_ctrl,
+        "impervious": fuzzy_engine.impervious_simulation_ctrl,
+        "catchment": fuzzy_engine.catchment_simulation_ctrl,
+    }
+    results = {}
+    for output, system in systems.items():
+        # separate simulation, so the array inputs don't touch the state of the module engine
+        simulation = ctrl.ControlSystemSimulation(system, cache=False)
+        simulation.input[membership.land_form_type.label] = land_form
+        simulation.input[membership.land_cover_type.label] = land_cover
+        simulation.compute()
+        results[output] = np.asarray(simulation.output[output], dtype=float)
+
+    # the state of the simulations is kept in the shared rules and terms and the array run clears it,
+    # so the results cached by the engine simulations would be stale
+    fuzzy_engine.slope_simulation.reset()
+    fuzzy_engine.impervious_simulation.reset()
+    fuzzy_engine.catchment_simulation.reset()
+    return results
+
+
+def _get_axis(codes: np.ndarray, step: float) -> np.ndarray:
+    """Return grid points from the first to the last category code."""
+    start, stop = codes.min(), codes.max()
+    return np.linspace(start, stop, int(round((stop - start) / step)) + 1)
+
+
+class ResponseSurface:
+    """
+    ResponseSurface holds the fuzzy outputs sampled on a grid of land form and land cover inputs.
+
+    Attributes
+    ----------
+    land_form : np.ndarray
+        Grid points of the land form input.
+    land_cover : np.ndarray
+        Grid points of the land cover input.
+    values : Dict[str, np.ndarray]
+        Slope, impervious and catchment outputs, arrays of shape (len(land_form), len(land_cover)).
+    max_error : Dict[str, float]
+        Maximum absolute interpolation error of every output against live inference, measured
+        at the centres of the grid cells (NaN if not measured).
+    fingerprint : str
+        Fingerprint of the fuzzy system the surface was built from, see `get_fingerprint`.
+    """
+
+    def __init__(
+        self,
+        land_form: np.ndarray,
+        land_cover: np.ndarray,
+        values: Dict[str, np.ndarray],
+        max_error: Optional[Dict[str, float]] = None,
+        fingerprint: str = "",
+    ) -> None:
+        self.land_form = np.asarray(land_form, dtype=float)
+        self.land_cover = np.asarray(land_cover, dtype=float)
+        self.values = {output: np.asarray(values[output], dtype=float) for output in OUTPUTS}
+        self.max_error = max_error or {output: np.nan for output in OUTPUTS}
+        self.fingerprint = fingerprint
+
+    @classmethod
+    def build(
+        cls, step: float = GRID_STEP, validate: bool = True, fuzzy_engine: FuzzyEngine = engine
+    ) -> "ResponseSurface":
+        """
+        Sample the fuzzy outputs on a grid with the given step.
+
+        Parameters
+        ----------
+        step : float, optional
+            Distance between the grid points, by default 0.1. Steps dividing 1 keep the integer
+            category codes on the grid.
+        validate : bool, optional
+            Measure the interpolation error at the cell centres, by default True. This doubles
+            the build time.
+        fuzzy_engine : FuzzyEngine, optional
+            Engine to be sampled, by default the module engine.
+
+        Returns
+        -------
+        ResponseSurface
+            The sampled surface.
+        """
+        if step <= 0:
+            raise ValueError("step must be greater than zero")
+        land_form = _get_axis(LandFormType.codes(), step)
+        land_cover = _get_axis(LandCoverType.codes(), step)
+        grid = np.meshgrid(land_form, land_cover, indexing="ij")
+        surface = cls(
+            land_form,
+            land_cover,
+            evaluate(*grid, fuzzy_engine=fuzzy_engine),
+            fingerprint=get_fingerprint(fuzzy_engine),
+        )
+
+        if validate:
+            centres = np.meshgrid(
+                (land_form[:-1] + land_form[1:]) / 2,
+                (land_cover[:-1] + land_cover[1:]) / 2,
+                indexing="ij",
+            )
+            expected = evaluate(*centres, fuzzy_engine=fuzzy_engine)
+            interpolated = surface.interpolate(centres[0].ravel(), centres[1].ravel())
+            surface.max_error = {
+                output: float(
+                    np.abs(interpolated[output].to_numpy() - expected[output].ravel()).max()
+                )
+                for output in OUTPUTS
+            }
+        return surface
+
+    def interpolate(self, land_form: Iterable, land_cover: Iterable) -> pd.DataFrame:
+        """
+        Return the outputs for continuous inputs by bilinear interpolation of the grid.
+
+        The inputs are clipped to the grid, in the same way as the control systems clip
+        the inputs to the antecedent universes.
+
+        Parameters
+        ----------
+        land_form : Iterable
+            Land form inputs, real numbers.
+        land_cover : Iterable
+            Land cover inputs, real numbers, same length as land_form.
+
+        Returns
+        -------
+        pd.DataFrame
+            Table with the slope, impervious and catchment columns, one row per input.
+        """
+        x = np.clip(np.asarray(land_form, dtype=float).ravel(), self.land_form[0], self.land_form[-1])
+        y = np.clip(np.asarray(land_cover, dtype=float).ravel(), self.land_cover[0], self.land_cover[-1])
+        if x.shape != y.shape:
+            raise ValueError("land_form and land_cover must have the same length")
+
+        i = np.clip(np.searchsorted(self.land_form, x, side="right") - 1, 0, len(self.land_form) - 2)
+        j = np.clip(np.searchsorted(self.land_cover, y, side="right") - 1, 0, len(self.land_cover) - 2)
+        tx = (x - self.land_form[i]) / (self.land_form[i + 1] - self.land_form[i])
+        ty = (y - self.land_cover[j]) / (self.land_cover[j + 1] - self.land_cover[j])
+
+        results = {}
+        for output in OUTPUTS:
+            values = self.values[output]
+            results[output] = (
+                values[i, j] * (1 - tx) * (1 - ty)
+                + values[i + 1, j] * tx * (1 - ty)
+                + values[i, j + 1] * (1 - tx) * ty
+                + values[i + 1, j + 1] * tx * ty
+            )
+        return pd.DataFrame(results)
+
+    def save(self, path: str) -> None:
+        """
+        Save the surface as a NumPy .npz file.
+
+        The file is replaced at once, so a concurrent reader never sees a partial file.
+
+        Parameters
+        ----------
+        path : str
+            Destination of the file.
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        file = tempfile.NamedTemporaryFile("wb", dir=directory, suffix=".npz", delete=False)
+        try:
+            with file:
+                np.savez(
+                    file,
+                    land_form=self.land_form,
+                    land_cover=self.land_cover,
+                    max_error=np.array([self.max_error[output] for output in OUTPUTS]),
+                    fingerprint=np.array(self.fingerprint),
+                    **self.values,
+                )
+            os.replace(file.name, path)
+        except BaseException:
+            os.unlink(file.name)
+            raise
+
+    @classmethod
+    def load(cls, path: str) -> "ResponseSurface":
+        """
+        Load a surface saved with `save`.
+
+        Parameters
+        ----------
+        path : str
+            Path of the .npz file.
+
+        Returns
+        -------
+        ResponseSurface
+            The loaded surface.
+        """
+        with np.load(path) as data:
+            return cls(
+                data["land_form"],
+                data["land_cover"],
+                {output: data[output] for output in OUTPUTS},
+                dict(zip(OUTPUTS, data["max_error"].tolist())),
+                str(data["fingerprint"]),
+            )
+
+
+def get_response_surface(step: float = GRID_STEP, cache_dir: str = CACHE_DIR) -> ResponseSurface:
+    """
+    Return the response surface of the module engine, read from the disk cache if possible.
+
+    The surface is built and saved in `cache_dir` when there is no cached surface with the same
+    step and fingerprint of the fuzzy system. The result is also kept in memory, keyed by the
+    fingerprint too, so changes of the rules or memberships in the same process give a new surface.
+
+    Parameters
+    ----------
+    step : float, optional
+        Distance between the grid points, by default 0.1.
+    cache_dir : str, optional
+        Directory of the cached surfaces, by default ~/.cache/rcg or the RCG_CACHE_DIR
+        environment variable.
+
+    Returns
+    -------
+    ResponseSurface
+        The response surface.
+    """
+    return _get_response_surface(step, cache_dir, get_fingerprint())
+
+
+@lru_cache(maxsize=None)
+def _get_response_surface(step: float, cache_dir: str, fingerprint: str) -> ResponseSurface:
+    """Return the response surface of the module engine with the given fingerprint, see `get_response_surface`."""
+    path = os.path.join(cache_dir, f"surface_{step:g}_{fingerprint[:16]}.npz")
+    if os.path.exists(path):
+        surface = ResponseSurface.load(path)
+        if surface.fingerprint == fingerprint:
+            return surface
+
+    surface = ResponseSurface.build(step)
+    os.makedirs(cache_dir, exist_ok=True)
+    surface.save(path)
+    return surface
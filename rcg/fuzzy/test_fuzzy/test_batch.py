@@ -0,0 +1,86 @@
+import unittest
+
+import numpy as np
+
+from rcg.fuzzy.batch import BatchEngine, BatchSystem, compile_rule_set, compile_rule_sets
+from rcg.fuzzy.defuzz import METHODS
+from rcg.fuzzy.engine import Prototype, engine
+from rcg.fuzzy.lookup import load_lookup_table
+from rcg.fuzzy.rules import SlopeRule, slope_rules
+
+
+class TestBatchSystem(unittest.TestCase):
+    def setUp(self):
+        self.system = compile_rule_set(SlopeRule())
+
+    def test_compiled_rules(self):
+        self.assertEqual(len(self.system.rule_names), len(slope_rules))
+        self.assertEqual(self.system.rule_names[:4], ["rule1", "rule2", "rule3", "rule4"])
+        self.assertEqual(self.system.output, "slope")
+        self.assertEqual(set(self.system.inputs), {"land_form", "land_cover"})
+        self.assertEqual(self.system.term_mfs.shape, (len(self.system.terms), len(self.system.universe)))
+
+    def test_list_of_rules(self):
+        system = BatchSystem(slope_rules)
+        self.assertEqual(system.rule_names[-1], f"rule{len(slope_rules)}")
+
+    def test_firing_matches_scikit_fuzzy(self):
+        simulation = engine.slope_simulation
+        simulation.input["land_form"] = 4
+        simulation.input["land_cover"] = 7
+        simulation.compute()
+        firing = self.system.firing({"land_form": np.array([4.0]), "land_cover": np.array([7.0])})
+        activation = self.system.activation(firing)[0]
+        for index, label in enumerate(self.system.terms):
+            expected = membership_value(simulation, label)
+            if expected is None:
+                self.assertTrue(np.isnan(activation[index]))
+            else:
+                self.assertAlmostEqual(activation[index], expected)
+
+    def test_classify_matches_get_populate(self):
+        system = compile_rule_sets()["catchment"]
+        values = np.linspace(-5, 105, 111)
+        expected = [Prototype.get_populate(value) for value in values]
+        self.assertEqual(system.classify(values).tolist(), expected)
+
+    def test_missing_input(self):
+        with self.assertRaises(ValueError):
+            self.system.firing({"land_form": np.array([1.0])})
+
+    def test_all_rule_sets(self):
+        systems = compile_rule_sets()
+        self.assertEqual(list(systems), ["slope", "impervious", "catchment"])
+
+
+class TestBatchEngine(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.engine = BatchEngine()
+        cls.table = load_lookup_table().reset_index()
+
+    def test_centroid_matches_lookup_table(self):
+        result = self.engine.compute(self.table["land_form"], self.table["land_cover"], chunk_size=50)
+        for output in ("slope", "impervious", "catchment"):
+            np.testing.assert_allclose(result[output], self.table[output], atol=1e-9)
+
+    def test_methods(self):
+        for method in METHODS:
+            result = self.engine.compute([2.5, 8], [3.5, 12], method=method)
+            for output, system in self.engine.systems.items():
+                values = result[output]
+                self.assertTrue(((values >= system.universe[0]) & (values <= system.universe[-1])).all())
+
+    def test_resolution(self):
+        result = BatchEngine(resolution=1001).compute(["mountains"], ["forests"])
+        expected = self.table.set_index(["land_form", "land_cover"]).loc[("mountains", "forests")]
+        self.assertAlmostEqual(result["impervious"].iloc[0], expected["impervious"], places=6)
+
+    def test_invalid_method(self):
+        with self.assertRaises(ValueError):
+            self.engine.compute([1], [1], method="median")
+
+
+def membership_value(simulation, label):
+    for consequent in simulation.ctrl.consequents:
+        return consequent.terms[label].membership_value[simulation]
@@ -1,5 +1,10 @@
 import unittest
+import warnings
 from abc import ABC
+
+import numpy as np
+import pandas as pd
+
 from rcg.fuzzy.categories import (
     Categories,
     LandForm,
@@ -7,6 +12,11 @@ from rcg.fuzzy.categories import (
     Slope,
     Impervious,
     Catchments,
+    LandFormType,
+    LandCoverType,
+    SlopeType,
+    ImperviousType,
+    CatchmentType,
 )
 
 
@@ -292,5 +302,65 @@ class TestCatchments(unittest.TestCase):
         self.assertEqual(catchments.mountains, "mountains")
 
 
+class TestCategoryEnum(unittest.TestCase):
+    def test_names_match_categories(self):
+        self.assertEqual(LandFormType.names(), LandForm.get_all_categories())
+        self.assertEqual(LandCoverType.names(), LandCover.get_all_categories())
+        self.assertEqual(SlopeType.names(), Slope().get_all_categories())
+        self.assertEqual(ImperviousType.names(), Impervious().get_all_categories())
+        self.assertEqual(CatchmentType.names(), Catchments().get_all_categories())
+
+    def test_class_attributes_are_enum_members(self):
+        self.assertIs(LandForm.mountains, LandFormType.mountains)
+        self.assertIs(LandCover.marshes, LandCoverType.marshes)
+        self.assertEqual(LandCover.marshes, 14)
+
+    def test_encode_names(self):
+        codes = LandCoverType.encode(["rural", "forests", "rural"])
+        np.testing.assert_array_equal(codes, [10, 11, 10])
+        self.assertEqual(codes.dtype, np.int64)
+
+    def test_encode_categorical(self):
+        values = pd.Series(["mountains", "higher_hills"] * 3, dtype="category")
+        np.testing.assert_array_equal(LandFormType.encode(values), [8, 7] * 3)
+
+    def test_encode_codes(self):
+        np.testing.assert_array_equal(LandFormType.encode(np.array([1, 9])), [1, 9])
+
+    def test_encode_invalid_lists_all_values(self):
+        with self.assertRaises(ValueError) as error:
+            LandFormType.encode(["mountains", "invalid_1", "invalid_2", "invalid_1"])
+        self.assertIn("3 invalid", str(error.exception))
+        self.assertIn("'invalid_1'", str(error.exception))
+        self.assertIn("'invalid_2'", str(error.exception))
+
+    def test_encode_invalid_does_not_warn(self):
+        values = pd.Series(["mountains", "invalid", None], dtype="category")
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            with self.assertRaises(ValueError) as error:
+                LandFormType.encode(values)
+        self.assertIn("'invalid'", str(error.exception))
+
+    def test_encode_invalid_codes(self):
+        with self.assertRaises(ValueError):
+            LandFormType.encode([0, 10])
+
+    def test_decode(self):
+        decoded = CatchmentType.decode([1, 7, 3])
+        self.assertIsInstance(decoded, pd.Categorical)
+        self.assertEqual(list(decoded), ["urban", "mountains", "rural"])
+        self.assertEqual(list(decoded.categories), CatchmentType.names())
+
+    def test_decode_invalid(self):
+        with self.assertRaises(ValueError):
+            CatchmentType.decode([1, 8])
+
+    def test_round_trip(self):
+        names = np.random.default_rng(0).choice(LandCoverType.names(), 1000)
+        decoded = LandCoverType.decode(LandCoverType.encode(names))
+        np.testing.assert_array_equal(np.asarray(decoded), names)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,124 @@
+import json
+import os
+import tempfile
+import unittest
+
+from rcg.fuzzy.categories import LandCover, LandForm
+from rcg.fuzzy.config import EngineConfig, get_batch_engine, get_engine
+from rcg.fuzzy.engine import Prototype, engine
+from rcg.fuzzy.memberships import Memberships, membership
+
+CONFIG = {
+    "memberships": {"impervious": {"urban_moderately_impervious": [60, 75, 90]}},
+    "consequents": {"slope": {"rule1": "mountains"}},
+}
+
+
+class TestEngineConfig(unittest.TestCase):
+    def test_fingerprint(self):
+        config = EngineConfig.from_dict(CONFIG)
+        same = EngineConfig.from_dict(json.loads(json.dumps(config.to_dict())))
+        self.assertEqual(config, same)
+        self.assertEqual(hash(config), hash(same))
+        self.assertNotEqual(config, EngineConfig())
+        self.assertTrue(EngineConfig().is_default)
+        self.assertFalse(config.is_default)
+
+    def test_immutable(self):
+        config = EngineConfig.from_dict(CONFIG)
+        with self.assertRaises(TypeError):
+            config.memberships["impervious"]["urban_moderately_impervious"] = (0, 1, 2)
+
+    def test_errors(self):
+        with self.assertRaises(ValueError) as error:
+            EngineConfig.from_dict(
+                {
+                    "memberships": {
+                        "unknown": {},
+                        "impervious": {"unknown": [0, 1, 2], "urban_weakly_impervious": [3, 2, 1]},
+                    },
+                    "consequents": {"slope": {"rule5": "mountains", "rule1": "unknown"}},
+                }
+            )
+        message = str(error.exception)
+        self.assertIn("Unknown fuzzy variable: unknown", message)
+        self.assertIn("Unknown term of impervious: unknown", message)
+        self.assertIn("impervious.urban_weakly_impervious", message)
+        self.assertIn("Unknown rule: rule5", message)
+        self.assertIn("Unknown term of slope: unknown", message)
+
+    def test_unknown_section(self):
+        with self.assertRaises(ValueError):
+            EngineConfig.from_dict({"rules": {}})
+
+    def test_from_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "engine.json")
+            with open(path, "w") as file:
+                json.dump(CONFIG, file)
+            self.assertEqual(EngineConfig.from_file(path), EngineConfig.from_dict(CONFIG))
+
+    def test_build_memberships(self):
+        member = EngineConfig.from_dict(CONFIG).build_memberships()
+        term = member.impervious["urban_moderately_impervious"]
+        self.assertEqual(member.impervious.universe[term.mf.argmax()], 75)
+        default = membership.impervious["urban_moderately_impervious"]
+        self.assertEqual(membership.impervious.universe[default.mf.argmax()], 65)
+
+
+class TestSetLimits(unittest.TestCase):
+    def setUp(self):
+        self.member = Memberships()
+        self.member.populate()
+
+    def test_set_limits(self):
+        self.member.set_limits("slope", "mountains", [25, 35, 45])
+        term = self.member.slope["mountains"]
+        self.assertEqual(self.member.slope.universe[term.mf.argmax()], 35)
+
+    def test_invalid(self):
+        with self.assertRaises(KeyError):
+            self.member.set_limits("unknown", "mountains", [1, 2, 3])
+        with self.assertRaises(KeyError):
+            self.member.set_limits("slope", "unknown", [1, 2, 3])
+        with self.assertRaises(ValueError):
+            self.member.set_limits("slope", "mountains", [3, 2])
+
+
+class TestGetEngine(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.config = EngineConfig.from_dict(CONFIG)
+        cls.engine = get_engine(cls.config)
+
+    def test_cached(self):
+        self.assertIs(get_engine(EngineConfig.from_dict(CONFIG)), self.engine)
+        self.assertIs(get_engine(), engine)
+        self.assertIs(get_engine(EngineConfig()), engine)
+
+    def test_results(self):
+        land_form, land_cover = LandForm.mountains, LandCover.urban_weakly_impervious
+        configured = Prototype(land_form, land_cover, fuzzy_engine=self.engine)
+        default = Prototype(land_form, land_cover)
+        self.assertAlmostEqual(configured.impervious_result, 75)
+        self.assertAlmostEqual(default.impervious_result, 65)
+
+    def test_catchment_class(self):
+        config = EngineConfig({"catchment": {"urban": [0, 0, 30], "suburban": [0, 30, 45]}})
+        fuzzy_engine = get_engine(config)
+        prototype = Prototype(LandForm.flats_and_plateaus, LandCover.urban_weakly_impervious, fuzzy_engine=fuzzy_engine)
+        self.assertIsNot(fuzzy_engine.memberships, membership)
+        self.assertEqual(prototype.catchment_class, "urban")
+        self.assertEqual(Prototype.get_populate(prototype.catchment_result), "suburban")
+        default = Prototype(LandForm.flats_and_plateaus, LandCover.urban_weakly_impervious)
+        self.assertEqual(default.catchment_class, Prototype.get_populate(default.catchment_result))
+
+    def test_batch_engine(self):
+        batch_engine = get_batch_engine(self.config)
+        self.assertIs(get_batch_engine(EngineConfig.from_dict(CONFIG)), batch_engine)
+        result = batch_engine.compute(["mountains"], ["urban_weakly_impervious"])
+        self.assertAlmostEqual(result["impervious"].iloc[0], 75)
+        # rule1 fires for vegetated and rocky mountains on marshes and lowlands
+        result = batch_engine.compute(["marshes_and_lowlands"], ["mountains_rocky"])
+        default = get_batch_engine().compute(["marshes_and_lowlands"], ["mountains_rocky"])
+        self.assertGreater(result["slope"].iloc[0], default["slope"].iloc[0])
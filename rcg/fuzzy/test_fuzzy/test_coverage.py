@@ -0,0 +1,72 @@
+import unittest
+
+import numpy as np
+
+from rcg.fuzzy.batch import BatchSystem
+from rcg.fuzzy.categories import LandCoverType, LandFormType
+from rcg.fuzzy.coverage import RuleCoverage, coverage_report, get_coverage
+from rcg.fuzzy.rules import SlopeRule
+
+
+class TestRuleCoverage(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.coverage = get_coverage()
+
+    def test_matrix(self):
+        slope = self.coverage["slope"]
+        pairs = len(LandFormType) * len(LandCoverType)
+        self.assertEqual(slope.matrix.shape, (pairs, len(vars(SlopeRule()))))
+        self.assertEqual(slope.matrix.dtypes.unique().tolist(), [np.dtype(bool)])
+        # rule1: vegetated or rocky mountains on marshes and lowlands
+        covered = slope.matrix.index[slope.matrix["rule1"]]
+        self.assertEqual(
+            sorted(covered),
+            [("marshes_and_lowlands", "mountains_rocky"), ("marshes_and_lowlands", "mountains_vegetated")],
+        )
+
+    def test_all_pairs_covered(self):
+        for coverage in self.coverage.values():
+            self.assertEqual(len(coverage.uncovered()), 0)
+            self.assertEqual(coverage.unused_rules(), [])
+
+    def test_duplicated_and_conflicts(self):
+        slope = self.coverage["slope"]
+        pair = ("hills_and_outcrops_of_mountain_ranges", "mountains_vegetated")
+        self.assertIn(pair, slope.duplicated().index)
+        self.assertEqual(slope.table.loc[pair, "rules"], ("rule3", "rule4"))
+        self.assertIn(pair, slope.conflicts().index)
+        self.assertTrue(self.coverage["impervious"].conflicts().empty)
+
+    def test_table_matches_matrix(self):
+        for coverage in self.coverage.values():
+            np.testing.assert_array_equal(coverage.table["count"], coverage.matrix.sum(axis=1))
+            for pair, row in coverage.table.iterrows():
+                self.assertEqual(row["rules"], tuple(coverage.matrix.columns[coverage.matrix.loc[pair]]))
+
+    def test_lookup(self):
+        catchment = self.coverage["catchment"]
+        result = catchment.lookup(["mountains", "marshes_and_lowlands"], ["forests", "marshes"])
+        self.assertEqual(list(result.index), [("mountains", "forests"), ("marshes_and_lowlands", "marshes")])
+        codes = catchment.lookup(
+            LandFormType.encode(["mountains", "marshes_and_lowlands"]),
+            LandCoverType.encode(["forests", "marshes"]),
+        )
+        self.assertEqual(list(codes.index), list(result.index))
+        with self.assertRaises(ValueError):
+            catchment.lookup(["mountains"], ["forests", "marshes"])
+
+    def test_report(self):
+        report = coverage_report()
+        self.assertEqual(list(report.index), ["slope", "impervious", "catchment"])
+        self.assertTrue((report["pairs"] == report["covered"] + report["uncovered"]).all())
+        self.assertEqual(report.loc["slope", "conflicting"], len(self.coverage["slope"].conflicts()))
+
+    def test_cached(self):
+        self.assertIs(get_coverage(), self.coverage)
+
+    def test_uncovered_pair(self):
+        rules = vars(SlopeRule())
+        del rules["rule1"]
+        coverage = RuleCoverage(BatchSystem(rules))
+        self.assertIn(("marshes_and_lowlands", "mountains_rocky"), coverage.uncovered())
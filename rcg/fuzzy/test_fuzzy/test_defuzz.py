@@ -0,0 +1,39 @@
+import unittest
+
+import numpy as np
+import skfuzzy as fuzz
+
+from rcg.fuzzy.defuzz import METHODS, defuzz
+
+
+class TestDefuzz(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.x = np.arange(0, 30, 1.0)
+        self.mfx = rng.random((20, len(self.x)))
+        self.mfx[:, :5] = 0
+        self.mfx[0] = fuzz.trimf(self.x, [5, 10, 15])
+        self.mfx[1] = np.minimum(fuzz.trapmf(self.x, [2, 6, 12, 20]), 0.4)
+
+    def test_matches_scikit_fuzzy(self):
+        for method in METHODS:
+            expected = [fuzz.defuzz(self.x, row, method) for row in self.mfx]
+            np.testing.assert_allclose(defuzz(self.x, self.mfx, method), expected, err_msg=method)
+
+    def test_empty_membership(self):
+        mfx = np.vstack([np.zeros(len(self.x)), self.mfx[0]])
+        for method in METHODS:
+            result = defuzz(self.x, mfx, method)
+            self.assertTrue(np.isnan(result[0]))
+            self.assertAlmostEqual(result[1], 10)
+
+    def test_single_row(self):
+        self.assertEqual(defuzz(self.x, self.mfx[0], "lom").shape, (1,))
+
+    def test_invalid_method(self):
+        with self.assertRaises(ValueError):
+            defuzz(self.x, self.mfx, "median")
+
+    def test_invalid_shape(self):
+        with self.assertRaises(ValueError):
+            defuzz(self.x[:-1], self.mfx)
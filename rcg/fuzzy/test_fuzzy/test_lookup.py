@@ -0,0 +1,74 @@
+import unittest
+import pandas as pd
+from rcg.fuzzy import categories
+from rcg.fuzzy.engine import Prototype
+from rcg.fuzzy.lookup import load_lookup_table, lookup, lookup_codes
+
+
+class TestLookupTable(unittest.TestCase):
+    def setUp(self):
+        self.table = load_lookup_table()
+
+    def test_table_shape(self):
+        self.assertIsInstance(self.table, pd.DataFrame)
+        self.assertEqual(len(self.table), 126)
+        self.assertEqual(
+            list(self.table.columns),
+            ["slope", "impervious", "catchment", "catchment_class"],
+        )
+
+    def test_all_combinations(self):
+        for land_form in categories.LandForm.get_all_categories():
+            for land_cover in categories.LandCover.get_all_categories():
+                self.assertIn((land_form, land_cover), self.table.index)
+
+    def test_matches_prototype(self):
+        for land_form, land_cover in [
+            ("flats_and_plateaus", "rural"),
+            ("mountains", "urban_weakly_impervious"),
+            ("highest_mountains", "marshes"),
+        ]:
+            prototype = Prototype(
+                land_form=getattr(categories.LandForm, land_form),
+                land_cover=getattr(categories.LandCover, land_cover),
+            )
+            result = lookup(land_form, land_cover)
+            self.assertAlmostEqual(result["slope"], prototype.slope_result)
+            self.assertAlmostEqual(result["impervious"], prototype.impervious_result)
+            self.assertAlmostEqual(result["catchment"], prototype.catchment_result)
+            self.assertEqual(
+                result["catchment_class"],
+                Prototype.get_populate(prototype.catchment_result),
+            )
+
+    def test_lookup_invalid_combination(self):
+        with self.assertRaises(KeyError):
+            lookup("flats_and_plateaus", "invalid_land_cover")
+
+    def test_lookup_codes(self):
+        land_form = ["mountains", "flats_and_plateaus", "mountains"]
+        land_cover = ["rural", "arable", "urban_highly_impervious"]
+        result = lookup_codes(land_form, land_cover)
+        self.assertEqual(len(result), 3)
+        for row, key in enumerate(zip(land_form, land_cover)):
+            expected = self.table.loc[key]
+            self.assertEqual(result["slope"].iloc[row], expected["slope"])
+            self.assertEqual(result["impervious"].iloc[row], expected["impervious"])
+            self.assertEqual(result["catchment"].iloc[row], expected["catchment"])
+            self.assertEqual(result["catchment_class"].iloc[row], expected["catchment_class"])
+
+    def test_lookup_codes_accepts_codes(self):
+        by_name = lookup_codes(["mountains"], ["rural"])
+        by_code = lookup_codes(
+            [categories.LandFormType.mountains], [categories.LandCoverType.rural]
+        )
+        pd.testing.assert_frame_equal(by_name, by_code)
+
+    def test_lookup_codes_invalid(self):
+        with self.assertRaises(ValueError):
+            lookup_codes(["mountains", "invalid"], ["rural", "rural"])
+        with self.assertRaises(ValueError):
+            lookup_codes(["mountains"], ["rural", "rural"])
+
+    def tearDown(self) -> None:
+        del self.table
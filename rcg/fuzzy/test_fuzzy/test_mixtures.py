@@ -0,0 +1,69 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from rcg.fuzzy.categories import LandCoverType
+from rcg.fuzzy.lookup import lookup, lookup_codes
+from rcg.fuzzy.mixtures import get_composition, lookup_mixtures
+
+
+class TestMixtures(unittest.TestCase):
+    def setUp(self):
+        self.composition = pd.DataFrame(
+            {
+                "forests": [40, 0, 0.5],
+                "suburban_weakly_impervious": [35, 0, 0],
+                "arable": [25, 1, 0.5],
+            },
+            index=["a", "b", "c"],
+        )
+        self.land_form = ["flats_and_plateaus", "mountains", "hills_with_gentle_slopes"]
+
+    def test_weighted_results(self):
+        result = lookup_mixtures(self.land_form, self.composition)
+        self.assertEqual(list(result.index), ["a", "b", "c"])
+
+        expected = {"slope": 0, "impervious": 0, "catchment": 0}
+        for land_cover, share in [
+            ("forests", 0.40),
+            ("suburban_weakly_impervious", 0.35),
+            ("arable", 0.25),
+        ]:
+            values = lookup("flats_and_plateaus", land_cover)
+            for column in expected:
+                expected[column] += share * values[column]
+        for column, value in expected.items():
+            self.assertAlmostEqual(result.at["a", column], value)
+
+    def test_single_component_matches_lookup(self):
+        result = lookup_mixtures(self.land_form[1:2], self.composition.iloc[1:2])
+        single = lookup_codes(["mountains"], ["arable"])
+        for column in ("slope", "impervious", "catchment"):
+            self.assertAlmostEqual(result[column].iloc[0], single[column].iloc[0])
+        self.assertEqual(result["catchment_class"].iloc[0], single["catchment_class"].iloc[0])
+
+    def test_dominant_class(self):
+        result = lookup_mixtures(self.land_form[:1], self.composition.iloc[:1])
+        self.assertEqual(result["catchment_class"].iloc[0], lookup("flats_and_plateaus", "forests")["catchment_class"])
+
+    def test_array_input(self):
+        shares = np.zeros((2, len(LandCoverType)))
+        shares[:, LandCoverType.forests - 1] = 1
+        result = lookup_mixtures([1, 9], shares)
+        expected = lookup_codes([1, 9], ["forests", "forests"])
+        np.testing.assert_allclose(result["slope"], expected["slope"])
+
+    def test_normalization(self):
+        fractions = get_composition(self.composition)
+        np.testing.assert_allclose(fractions.sum(axis=1), 1)
+
+    def test_invalid_composition(self):
+        with self.assertRaises(ValueError):
+            get_composition(pd.DataFrame({"lava": [1]}))
+        with self.assertRaises(ValueError):
+            get_composition(pd.DataFrame({"forests": [0, -1]}))
+
+    def test_different_lengths(self):
+        with self.assertRaises(ValueError):
+            lookup_mixtures(self.land_form[:2], self.composition)
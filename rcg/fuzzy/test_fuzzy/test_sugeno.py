@@ -0,0 +1,44 @@
+import unittest
+
+import numpy as np
+
+from rcg.fuzzy.lookup import lookup_codes
+from rcg.fuzzy.sugeno import SugenoEngine, accuracy_report
+
+
+class TestSugenoEngine(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.surrogate = SugenoEngine()
+
+    def test_singletons(self):
+        for output, system in self.surrogate.systems.items():
+            singletons = self.surrogate.singletons[output]
+            self.assertEqual(len(singletons), len(system.terms))
+            self.assertTrue(((singletons >= system.universe[0]) & (singletons <= system.universe[-1])).all())
+
+    def test_compute_names_and_codes(self):
+        by_name = self.surrogate.compute(["mountains", "flats_and_plateaus"], ["forests", "rural"])
+        by_code = self.surrogate.compute([8, 2], [11, 10])
+        self.assertEqual(list(by_name.columns), ["slope", "impervious", "catchment"])
+        np.testing.assert_allclose(by_name.to_numpy(), by_code.to_numpy())
+
+    def test_close_to_reference_at_codes(self):
+        result = self.surrogate.compute(["mountains", "higher_hills"], ["forests", "urban_highly_impervious"])
+        expected = lookup_codes(["mountains", "higher_hills"], ["forests", "urban_highly_impervious"])
+        for output in ("impervious", "catchment"):
+            np.testing.assert_allclose(result[output], expected[output])
+
+    def test_no_rule_fires(self):
+        result = self.surrogate.compute([0.0], [0.0])
+        self.assertTrue(result.isna().all(axis=None))
+
+    def test_accuracy_report(self):
+        report = accuracy_report(self.surrogate)
+        self.assertEqual(list(report.index), ["slope", "impervious", "catchment"])
+        self.assertEqual(list(report.columns), ["max_abs_error", "mean_abs_error", "rmse"])
+        self.assertTrue((report["max_abs_error"] < 1).all())
+
+    def test_accuracy_report_continuous(self):
+        report = accuracy_report(self.surrogate, [2.5, 3.25], [4.5, 10.75])
+        self.assertTrue((report["max_abs_error"] >= report["mean_abs_error"]).all())
@@ -0,0 +1,111 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from rcg.fuzzy.categories import LandCover, LandCoverType, LandForm, LandFormType
+from rcg.fuzzy.engine import Prototype
+from rcg.fuzzy.lookup import load_lookup_table
+from rcg.fuzzy.surface import (
+    OUTPUTS,
+    ResponseSurface,
+    _get_response_surface,
+    evaluate,
+    get_fingerprint,
+    get_response_surface,
+)
+
+
+class TestResponseSurface(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.surface = ResponseSurface.build(step=0.5)
+
+    def test_grid(self):
+        self.assertEqual(self.surface.land_form[0], 1)
+        self.assertEqual(self.surface.land_form[-1], 9)
+        self.assertEqual(self.surface.land_cover[-1], 14)
+        for output in OUTPUTS:
+            self.assertEqual(
+                self.surface.values[output].shape,
+                (len(self.surface.land_form), len(self.surface.land_cover)),
+            )
+            self.assertGreaterEqual(self.surface.max_error[output], 0)
+
+    def test_matches_lookup_table_at_codes(self):
+        table = load_lookup_table().reset_index()
+        result = self.surface.interpolate(
+            LandFormType.encode(table["land_form"]), LandCoverType.encode(table["land_cover"])
+        )
+        for output in OUTPUTS:
+            np.testing.assert_allclose(result[output], table[output])
+
+    def test_matches_live_inference_at_nodes(self):
+        land_form, land_cover = np.array([2.5, 7.0]), np.array([3.5, 10.5])
+        result = self.surface.interpolate(land_form, land_cover)
+        expected = evaluate(land_form, land_cover)
+        for output in OUTPUTS:
+            np.testing.assert_allclose(result[output], expected[output])
+
+    def test_evaluate_keeps_engine_results(self):
+        first = Prototype(LandForm.mountains, LandCover.urban_weakly_impervious).impervious_result
+        Prototype(LandForm.flats_and_plateaus, LandCover.forests)
+        evaluate([2.5], [3.5])
+        second = Prototype(LandForm.mountains, LandCover.urban_weakly_impervious).impervious_result
+        self.assertEqual(first, second)
+
+    def test_interpolation_between_nodes(self):
+        result = self.surface.interpolate([2.25], [3.0])
+        lower = self.surface.interpolate([2.0], [3.0])
+        upper = self.surface.interpolate([2.5], [3.0])
+        for output in OUTPUTS:
+            self.assertAlmostEqual(
+                result[output].iloc[0], (lower[output].iloc[0] + upper[output].iloc[0]) / 2
+            )
+
+    def test_inputs_are_clipped(self):
+        result = self.surface.interpolate([0, 12], [0, 20])
+        expected = self.surface.interpolate([1, 9], [1, 14])
+        for output in OUTPUTS:
+            np.testing.assert_allclose(result[output], expected[output])
+
+    def test_save_and_load(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            path = os.path.join(tempdir, "surface.npz")
+            self.surface.save(path)
+            loaded = ResponseSurface.load(path)
+        self.assertEqual(loaded.fingerprint, self.surface.fingerprint)
+        self.assertEqual(loaded.max_error, self.surface.max_error)
+        for output in OUTPUTS:
+            np.testing.assert_array_equal(loaded.values[output], self.surface.values[output])
+
+    def test_failed_save_leaves_no_temporary_file(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            with patch("rcg.fuzzy.surface.np.savez", side_effect=OSError("disk full")):
+                with self.assertRaises(OSError):
+                    self.surface.save(os.path.join(tempdir, "surface.npz"))
+            self.assertEqual(os.listdir(tempdir), [])
+
+    def test_disk_cache(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            with patch.object(ResponseSurface, "build", return_value=self.surface) as build:
+                get_response_surface(0.5, tempdir)
+                _get_response_surface.cache_clear()
+                surface = get_response_surface(0.5, tempdir)
+            _get_response_surface.cache_clear()
+        build.assert_called_once()
+        self.assertEqual(surface.fingerprint, get_fingerprint())
+
+    def test_memory_cache_follows_fingerprint(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            with patch.object(ResponseSurface, "build", return_value=self.surface) as build:
+                get_response_surface(0.5, tempdir)
+                get_response_surface(0.5, tempdir)
+                self.assertEqual(build.call_count, 1)
+                with patch("rcg.fuzzy.surface.get_fingerprint", return_value="changed"):
+                    get_response_surface(0.5, tempdir)
+                self.assertEqual(build.call_count, 2)
+                self.assertIn("surface_0.5_changed.npz", os.listdir(tempdir))
+            _get_response_surface.cache_clear()
@@ -0,0 +1,63 @@
+import unittest
+
+import numpy as np
+
+from rcg.fuzzy.batch import BatchEngine
+from rcg.fuzzy.lookup import load_lookup_table
+from rcg.fuzzy.trace import STAGES, RuleTrace
+
+
+class TestRuleTrace(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.engine = BatchEngine()
+        cls.table = load_lookup_table().reset_index()
+        cls.trace = RuleTrace(keep_firing=True)
+        cls.results = cls.engine.compute(
+            cls.table["land_form"], cls.table["land_cover"], chunk_size=50, trace=cls.trace
+        )
+
+    def test_results_unchanged(self):
+        expected = self.engine.compute(self.table["land_form"], self.table["land_cover"])
+        np.testing.assert_allclose(self.results, expected)
+
+    def test_to_frame(self):
+        frame = self.trace.to_frame()
+        system = self.engine.systems["slope"]
+        slope = frame.loc["slope"]
+        self.assertEqual(list(slope.index), system.rule_names)
+        self.assertTrue((frame["inputs"] == len(self.table)).all())
+        self.assertTrue((frame["fired"] <= frame["inputs"]).all())
+        self.assertTrue((frame["max_firing"] <= 1).all())
+        self.assertTrue((frame["time"] >= 0).all())
+        for output in self.engine.systems:
+            self.assertAlmostEqual(frame.loc[output, "time_share"].sum(), 1)
+        self.assertEqual(slope.loc["rule1", "term"], system.terms[system.rule_terms[0]])
+
+    def test_fired_counts(self):
+        firing = self.trace.firing_frame("impervious")
+        self.assertEqual(firing.shape, (len(self.table), len(self.engine.systems["impervious"].rule_names)))
+        frame = self.trace.to_frame().loc["impervious"]
+        np.testing.assert_array_equal(frame["fired"], (firing > 0).sum())
+        np.testing.assert_allclose(frame["max_firing"], firing.max())
+
+    def test_output_times(self):
+        times = self.trace.output_times()
+        self.assertEqual(list(times.index), list(self.engine.systems))
+        self.assertEqual(list(times.columns), [*STAGES, "total"])
+        np.testing.assert_allclose(times["total"], times[STAGES].sum(axis=1))
+
+    def test_firing_frame_requires_keep_firing(self):
+        trace = RuleTrace()
+        self.engine.compute([1], [1], trace=trace)
+        with self.assertRaises(ValueError):
+            trace.firing_frame()
+
+    def test_empty(self):
+        self.assertTrue(RuleTrace().to_frame().empty)
+
+    def test_clear(self):
+        trace = RuleTrace()
+        self.engine.compute([1], [1], trace=trace)
+        trace.clear()
+        self.assertTrue(trace.to_frame().empty)
@@ -0,0 +1,191 @@
+"""
+The module contains the rule trace of the batch engine.
+
+A `RuleTrace` passed to `BatchEngine.compute` records, for every output and rule, how many inputs
+fired the rule, the mean and maximum firing strength, the consequent term the rule clips and the time
+spent evaluating the rule, and for every output the time spent in the firing, aggregation and
+defuzzification stages. The trace is only filled when it is passed, without it the engine runs
+its regular code path.
+
+Example::
+
+    trace = RuleTrace()
+    BatchEngine().compute(data["land_form"], data["land_cover"], trace=trace)
+    rules = trace.to_frame()
+    never_fired = rules[rules["fired"] == 0]
+"""
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+STAGES = ["firing", "aggregate", "defuzz"]
+
+
+class _OutputTrace:
+    """Accumulated statistics of the rules of one output."""
+
+    def __init__(self, rule_names: List[str], terms: List[str]) -> None:
+        self.rule_names = rule_names
+        self.terms = terms
+        self.inputs = 0
+        self.fired = np.zeros(len(rule_names), dtype=np.int64)
+        self.total = np.zeros(len(rule_names))
+        self.maximum = np.zeros(len(rule_names))
+        self.rule_times = np.zeros(len(rule_names))
+        self.stage_times = dict.fromkeys(STAGES, 0.0)
+        self.firing: List[np.ndarray] = []
+
+
+class RuleTrace:
+    """
+    RuleTrace records the rule firing and the evaluation time of the batch engine.
+
+    Attributes
+    ----------
+    keep_firing : bool
+        Whether the firing strengths of every input are kept, see `firing_frame`.
+    """
+
+    def __init__(self, keep_firing: bool = False) -> None:
+        """
+        Create an empty trace.
+
+        Parameters
+        ----------
+        keep_firing : bool, optional
+            Keep the firing strength of every rule for every input, by default False.
+            This needs memory proportional to the number of inputs times the number of rules.
+        """
+        self.keep_firing = keep_firing
+        self._outputs: Dict[str, _OutputTrace] = {}
+
+    def record(
+        self,
+        output: str,
+        rule_names: List[str],
+        terms: List[str],
+        firing: np.ndarray,
+        rule_times: np.ndarray,
+        stage_times: Dict[str, float],
+    ) -> None:
+        """
+        Add the firing strengths and times of one chunk of inputs.
+
+        Parameters
+        ----------
+        output : str
+            Name of the output, e.g. slope.
+        rule_names : List[str]
+            Names of the rules, in the order of the columns of `firing`.
+        terms : List[str]
+            Consequent term of every rule.
+        firing : np.ndarray
+            Firing strengths of shape (inputs, rules).
+        rule_times : np.ndarray
+            Time spent evaluating every rule [s].
+        stage_times : Dict[str, float]
+            Time spent in every stage [s], see STAGES.
+        """
+        trace = self._outputs.get(output)
+        if trace is None:
+            trace = self._outputs[output] = _OutputTrace(rule_names, terms)
+        trace.inputs += firing.shape[0]
+        trace.fired += (firing > 0).sum(axis=0)
+        trace.total += firing.sum(axis=0)
+        np.maximum(trace.maximum, firing.max(axis=0, initial=0), out=trace.maximum)
+        trace.rule_times += rule_times
+        for stage, seconds in stage_times.items():
+            trace.stage_times[stage] += seconds
+        if self.keep_firing:
+            trace.firing.append(firing.copy())
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Return the statistics of every rule.
+
+        Returns
+        -------
+        pd.DataFrame
+            Table indexed by output and rule with the columns: term (the consequent term clipped
+            by the rule), inputs, fired (number of inputs with a firing strength greater than zero),
+            mean_firing, max_firing, time (seconds spent evaluating the rule) and time_share
+            (fraction of the rule evaluation time of the output).
+        """
+        frames = []
+        for output, trace in self._outputs.items():
+            total_time = trace.rule_times.sum()
+            frames.append(
+                pd.DataFrame(
+                    {
+                        "output": output,
+                        "rule": trace.rule_names,
+                        "term": trace.terms,
+                        "inputs": trace.inputs,
+                        "fired": trace.fired,
+                        "mean_firing": trace.total / max(trace.inputs, 1),
+                        "max_firing": trace.maximum,
+                        "time": trace.rule_times,
+                        "time_share": trace.rule_times / total_time if total_time > 0 else 0.0,
+                    }
+                )
+            )
+        if not frames:
+            return pd.DataFrame(
+                columns=["term", "inputs", "fired", "mean_firing", "max_firing", "time", "time_share"],
+                index=pd.MultiIndex.from_arrays([[], []], names=["output", "rule"]),
+            )
+        return pd.concat(frames, ignore_index=True).set_index(["output", "rule"])
+
+    def output_times(self) -> pd.DataFrame:
+        """
+        Return the time spent in every stage of every output.
+
+        Returns
+        -------
+        pd.DataFrame
+            Table indexed by output with a column for every stage and the total, in seconds.
+        """
+        times = pd.DataFrame(
+            {output: trace.stage_times for output, trace in self._outputs.items()}, index=STAGES
+        ).T
+        times["total"] = times.sum(axis=1)
+        times.index.name = "output"
+        return times
+
+    def firing_frame(self, output: Optional[str] = None) -> pd.DataFrame:
+        """
+        Return the firing strength of every rule for every traced input.
+
+        Parameters
+        ----------
+        output : str, optional
+            Name of the output, by default all outputs.
+
+        Returns
+        -------
+        pd.DataFrame
+            Table with one row per input (in the order of the traced inputs) and a column for every
+            rule, with the output and rule column levels if all outputs are returned.
+
+        Raises
+        ------
+        ValueError
+            If the trace was created without keep_firing.
+        """
+        if not self.keep_firing:
+            raise ValueError("The firing strengths are only kept with keep_firing=True")
+        outputs = [output] if output is not None else list(self._outputs)
+        frames = {
+            name: pd.DataFrame(
+                np.concatenate(self._outputs[name].firing), columns=self._outputs[name].rule_names
+            )
+            for name in outputs
+        }
+        if output is not None:
+            return frames[output]
+        return pd.concat(frames, axis=1, names=["output", "rule"])
+
+    def clear(self) -> None:
+        """Remove all recorded data."""
+        self._outputs.clear()
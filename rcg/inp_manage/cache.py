@@ -0,0 +1,218 @@
+"""
+The module contains a content-addressed cache of parsed INP sections.
+
+swmmio parses a section of the INP file on its first access, so every `BuildCatchments(file_path)`
+parses the same sections again even if the file didn't change, which is common in scenario loops.
+`ParseCache` stores the parsed sections of a file as a pickle in a cache directory, keyed by the path,
+size, modification time and content hash of the file, and puts them back into a new
+`swmmio.Model` on the next open. A changed file gets a new key, so stale entries are never read;
+the least recently used entries are evicted when the directory exceeds its size limit.
+
+The cache is used by `BuildCatchments` when it is passed explicitly or when the RCG_PARSE_CACHE_DIR
+environment variable is set. It is a separate variable from RCG_CACHE_DIR of the response surfaces,
+so moving the surface cache doesn't turn on the unpickling of parsed sections.
+
+Example::
+
+    cache = ParseCache("/tmp/rcg-cache")
+    for scenario in scenarios:
+        model = BuildCatchments("model.inp", cache=cache)
+"""
+import hashlib
+import os
+import pickle
+import tempfile
+import warnings
+from typing import Optional, Sequence
+
+import swmmio
+
+from rcg.inp_manage.sections import load_inp_sections
+
+CACHE_DIR_VARIABLE = "RCG_PARSE_CACHE_DIR"
+MAX_CACHE_SIZE = 512 * 2**20
+# swmmio attributes of the sections used when subcatchments are built
+CACHED_SECTIONS = (
+    "subcatchments",
+    "subareas",
+    "infiltration",
+    "polygons",
+    "raingages",
+    "timeseries",
+    "coordinates",
+    "junctions",
+    "outfalls",
+    "storage",
+    "dividers",
+    "tags",
+)
+BLOCK_SIZE = 2**20
+
+
+class ParseCache:
+    """
+    ParseCache stores the parsed sections of INP files in a directory.
+
+    Attributes
+    ----------
+    directory : str
+        The cache directory, created on the first write.
+    max_size : int
+        Largest total size of the entries in bytes.
+    sections : Sequence[str]
+        swmmio attributes of the cached sections.
+    """
+
+    def __init__(
+        self, directory: str, max_size: int = MAX_CACHE_SIZE, sections: Sequence[str] = CACHED_SECTIONS
+    ) -> None:
+        self.directory = directory
+        self.max_size = max_size
+        self.sections = tuple(sections)
+
+    def get_key(self, file_path: str) -> str:
+        """
+        Return the key of the current content of a file.
+
+        Parameters
+        ----------
+        file_path : str
+            Path to the INP file.
+
+        Returns
+        -------
+        str
+            Hash of the absolute path, size, modification time and content of the file
+            (and of the cached sections).
+        """
+        stat = os.stat(file_path)
+        digest = hashlib.sha1()
+        digest.update(f"{os.path.abspath(file_path)}\0{stat.st_size}\0{stat.st_mtime_ns}\0".encode())
+        digest.update(",".join(self.sections).encode())
+        with open(file_path, "rb") as file:
+            for block in iter(lambda: file.read(BLOCK_SIZE), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def _get_entry_path(self, key: str) -> str:
+        """Return the path of the entry of a key."""
+        return os.path.join(self.directory, f"{key}.pkl")
+
+    def load(self, inp, key: str) -> bool:
+        """
+        Put the cached sections of an entry into the input data of a model.
+
+        Parameters
+        ----------
+        inp : swmmio.core.inp
+            Input data of the model, `swmmio.Model(...).inp`.
+        key : str
+            Key of the file, see `get_key`.
+
+        Returns
+        -------
+        bool
+            True if the entry was found, False if the sections must be parsed.
+        """
+        path = self._get_entry_path(key)
+        try:
+            with open(path, "rb") as file:
+                sections = pickle.load(file)
+        except FileNotFoundError:
+            return False
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            # a broken entry is parsed and written again
+            os.remove(path)
+            return False
+        for name, section in sections.items():
+            setattr(inp, name, section)
+        # the modification time of an entry is the time of its last use, see `evict`
+        os.utime(path)
+        return True
+
+    def store(self, inp, key: str) -> None:
+        """
+        Parse the cached sections of a model and write them to a new entry.
+
+        Parameters
+        ----------
+        inp : swmmio.core.inp
+            Input data of the model, `swmmio.Model(...).inp`.
+        key : str
+            Key of the file, see `get_key`.
+        """
+        # the sections read with `dataframe_from_inp` are parsed over a memory map of the file
+        load_inp_sections(inp, self.sections)
+        with warnings.catch_warnings():
+            # swmmio warns about every section missing from the file
+            warnings.simplefilter("ignore", UserWarning)
+            sections = {name: getattr(inp, name) for name in self.sections}
+        os.makedirs(self.directory, exist_ok=True)
+        file = tempfile.NamedTemporaryFile("wb", dir=self.directory, suffix=".tmp", delete=False)
+        try:
+            with file:
+                pickle.dump(sections, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(file.name, self._get_entry_path(key))
+        except BaseException:
+            os.unlink(file.name)
+            raise
+        self.evict()
+
+    def open(self, file_path: str) -> swmmio.Model:
+        """
+        Open a model with the sections loaded from the cache, parsing and caching them on a miss.
+
+        Parameters
+        ----------
+        file_path : str
+            Path to the INP file.
+
+        Returns
+        -------
+        swmmio.Model
+            The model with the cached sections already set.
+        """
+        key = self.get_key(file_path)
+        model = swmmio.Model(file_path)
+        if not self.load(model.inp, key):
+            self.store(model.inp, key)
+        return model
+
+    def evict(self) -> int:
+        """
+        Remove the least recently used entries until the cache fits into its size limit.
+
+        The most recently used entry is always kept.
+
+        Returns
+        -------
+        int
+            Number of removed entries.
+        """
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".pkl"):
+                stat = entry.stat()
+                entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+        entries.sort(reverse=True)
+        total = 0
+        removed = 0
+        for position, (_, size, path) in enumerate(entries):
+            total += size
+            if total > self.max_size and position > 0:
+                os.remove(path)
+                removed += 1
+        return removed
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        if os.path.isdir(self.directory):
+            for entry in os.scandir(self.directory):
+                if entry.name.endswith((".pkl", ".tmp")):
+                    os.remove(entry.path)
+
+
+def get_default_cache() -> Optional[ParseCache]:
+    """Return the cache in the RCG_PARSE_CACHE_DIR directory, None if the variable is not set."""
+    directory = os.environ.get(CACHE_DIR_VARIABLE)
+    return ParseCache(directory) if directory else None
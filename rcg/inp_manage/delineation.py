@@ -0,0 +1,632 @@
+"""
+The module contains the delineation of subcatchments from a digital elevation model.
+
+Every cell of the DEM drains to the neighbour with the steepest descent (D8). The flow directions are
+computed in tiles of rows, optionally in a pool of processes, and the flow paths are followed with
+pointer jumping: every step replaces the downstream cell of all cells by the downstream cell of their
+downstream cell, so the end of the longest path is found in a logarithmic number of whole-array steps.
+
+Cells without a lower neighbour (pits and flats) are connected to the cells they spill into. Adjacent
+pit cells form one depression, the depressions with their contributing cells are the nodes of a graph
+whose edges hold the lowest spill elevation between them, and a priority flood from the cells draining
+out of the grid (the border and the cells next to no data) over this much smaller graph links every
+depression to the basin it overflows into. The flow accumulation is summed level by level, from the
+cells farthest from the end of their path.
+
+The contributing area of every outlet (a node of [JUNCTIONS] or [OUTFALLS]) are the cells whose flow
+path reaches it before any other outlet. The land cover and land form of the areas are derived with
+`zonal_statistics` and the subcatchments are added to the model with the outlines of the areas.
+
+Example::
+
+    delineate_subcatchments("model.inp", "dem.npy", "land_cover.npy", origin=(x_min, y_max), cell_size=5)
+"""
+import heapq
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from scipy import ndimage
+
+from rcg.inp_manage.gis import Rings, get_width
+from rcg.inp_manage.inp import (
+    BuildCatchments,
+    compute_parameters,
+    get_section_records,
+    validate_subcatchments,
+)
+from rcg.inp_manage.parameters import HydrologicParameters
+from rcg.inp_manage.remap import RemapTable
+from rcg.inp_manage.stream import append_records, prepare_raingage
+from rcg.inp_manage.tags import get_rules_hash, get_tags
+from rcg.inp_manage.zonal import (
+    MEMORY_BUDGET,
+    Raster,
+    get_tile_rows,
+    iter_tiles,
+    open_raster,
+    zonal_statistics,
+)
+
+# row and column offsets of the eight neighbours and their distances in cells
+NEIGHBOURS = np.array([(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)])
+DISTANCES = np.hypot(NEIGHBOURS[:, 0], NEIGHBOURS[:, 1])
+
+
+def _get_index_dtype(size: int) -> type:
+    """Return the smallest integer type of the flat indices of a grid."""
+    return np.int32 if size < 2**31 else np.int64
+
+
+def flow_tile(dem: Raster, start: int, stop: int, nodata: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute the D8 flow directions of the rows from start to stop of the DEM.
+
+    Parameters
+    ----------
+    dem : Raster
+        Elevations [m].
+    start : int
+        First row of the tile.
+    stop : int
+        Row after the last row of the tile.
+    nodata : float, optional
+        Elevation of the cells without data.
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        Flat index of the downstream cell of every cell of the tile (the cell itself if it has no
+        lower neighbour) and the mask of the cells draining out of the grid: the border cells,
+        the cells next to no data and the cells without data.
+    """
+    dem = open_raster(dem)
+    rows, columns = dem.shape
+    halo_start, halo_stop = max(start - 1, 0), min(stop + 1, rows)
+    elevation = np.array(dem[halo_start:halo_stop], dtype=float)
+    if nodata is not None:
+        elevation[elevation == nodata] = np.nan
+    # rows and columns beyond the grid are no data
+    elevation = np.pad(
+        elevation, ((int(halo_start == start), int(halo_stop == stop)), (1, 1)), constant_values=np.nan
+    )
+    height = stop - start
+    centre = elevation[1 : height + 1, 1 : columns + 1]
+
+    steepest = np.zeros(centre.shape)
+    direction = np.full(centre.shape, -1, dtype=np.int8)
+    outside = np.isnan(centre)
+    for position, ((row, column), distance) in enumerate(zip(NEIGHBOURS, DISTANCES)):
+        neighbour = elevation[1 + row : height + 1 + row, 1 + column : columns + 1 + column]
+        outside |= np.isnan(neighbour)
+        drop = (centre - neighbour) / distance
+        steeper = drop > steepest
+        steepest[steeper] = drop[steeper]
+        direction[steeper] = position
+
+    dtype = _get_index_dtype(rows * columns)
+    row_index = np.arange(start, stop, dtype=dtype)[:, np.newaxis]
+    column_index = np.arange(columns, dtype=dtype)[np.newaxis, :]
+    offsets = (NEIGHBOURS[:, 0] * columns + NEIGHBOURS[:, 1]).astype(dtype)
+    cells = row_index * columns + column_index
+    receivers = np.where((direction >= 0) & ~outside, cells + offsets[direction], cells)
+    return receivers.ravel(), outside.ravel()
+
+
+def flow_directions(
+    dem: Raster,
+    nodata: Optional[float] = None,
+    memory_budget: int = MEMORY_BUDGET,
+    workers: Optional[int] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute the D8 flow directions of the whole DEM in tiles.
+
+    Parameters
+    ----------
+    dem : Raster
+        Elevations [m], array or path of a .npy file.
+    nodata : float, optional
+        Elevation of the cells without data.
+    memory_budget : int, optional
+        Memory available for the tiles of all workers together [bytes], by default 256 MiB.
+    workers : int, optional
+        Number of processes, with more than one worker the DEM must be a path of a .npy file.
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        Flat arrays of the downstream cells and of the cells draining out of the grid, see `flow_tile`.
+
+    Raises
+    ------
+    ValueError
+        If workers are used with an in-memory DEM.
+    """
+    rows, columns = open_raster(dem).shape
+    workers = workers or 1
+    if workers > 1 and not isinstance(dem, str):
+        raise ValueError("With more than one worker the DEM must be a path of a .npy file")
+    tiles = list(iter_tiles(rows, get_tile_rows(columns, memory_budget // workers)))
+    arguments = [(dem, start, stop, nodata) for start, stop in tiles]
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(flow_tile, *zip(*arguments)))
+    else:
+        results = [flow_tile(*argument) for argument in arguments]
+    receivers, outside = zip(*results)
+    return np.concatenate(receivers), np.concatenate(outside)
+
+
+def follow_paths(receivers: np.ndarray, depth: bool = False) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """
+    Find the end of the flow path of every cell by pointer jumping.
+
+    Parameters
+    ----------
+    receivers : np.ndarray
+        Flat index of the downstream cell of every cell, the cell itself at the end of a path.
+    depth : bool, optional
+        Also count the steps from every cell to the end of its path, by default False.
+
+    Returns
+    -------
+    Tuple[np.ndarray, Optional[np.ndarray]]
+        Flat index of the last cell of the path of every cell and the number of steps (or None).
+    """
+    roots = receivers.copy()
+    steps = (receivers != np.arange(len(receivers), dtype=receivers.dtype)).astype(np.int32) if depth else None
+    while True:
+        following = roots[roots]
+        if np.array_equal(following, roots):
+            return roots, steps
+        if depth:
+            steps += steps[roots]
+        roots = following
+
+
+def _get_spill_edges(
+    elevation: np.ndarray, roots: np.ndarray, pits: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Return the neighbouring cells of different basins next to a depression with their spill elevation."""
+    rows, columns = elevation.shape
+    flat_roots, flat_elevation = roots.ravel(), elevation.ravel()
+    first, second = [], []
+    for row, column in ((0, 1), (1, 0), (1, 1), (1, -1)):
+        top, left = slice(0, rows - row), slice(max(0, -column), columns - max(0, column))
+        bottom, right = slice(row, rows), slice(max(0, column), columns - max(0, -column))
+        differ = roots[top, left] != roots[bottom, right]
+        positions = np.flatnonzero(differ)
+        width = left.stop - left.start
+        cells = (positions // width) * columns + positions % width + left.start
+        first.append(cells)
+        second.append(cells + row * columns + column)
+    first, second = np.concatenate(first), np.concatenate(second)
+    near_pit = pits[flat_roots[first]] | pits[flat_roots[second]]
+    first, second = first[near_pit], second[near_pit]
+    spill = np.fmax(flat_elevation[first], flat_elevation[second])
+    # both directions of every edge
+    cells = np.concatenate((first, second))
+    neighbours = np.concatenate((second, first))
+    spill = np.concatenate((spill, spill))
+    return flat_roots[cells], flat_roots[neighbours], spill, cells, neighbours
+
+
+def resolve_depressions(
+    elevation: np.ndarray, receivers: np.ndarray, outside: np.ndarray
+) -> np.ndarray:
+    """
+    Route the pits and flats of the DEM to the basins they overflow into.
+
+    Parameters
+    ----------
+    elevation : np.ndarray
+        Elevations of the grid [m], NaN for no data.
+    receivers : np.ndarray
+        Flat index of the downstream cell of every cell, see `flow_directions`.
+    outside : np.ndarray
+        Flat mask of the cells draining out of the grid.
+
+    Returns
+    -------
+    np.ndarray
+        Downstream cells in which every path ends at a cell draining out of the grid. The last cell
+        of a depression drains to the cell across its lowest spill point, which need not be adjacent.
+    """
+    receivers = receivers.copy()
+    size = len(receivers)
+    pits = (receivers == np.arange(size, dtype=receivers.dtype)) & ~outside
+    if not pits.any():
+        return receivers
+
+    # adjacent pit cells have the same elevation, every flat drains to its first cell
+    flats, _ = ndimage.label(pits.reshape(elevation.shape), structure=np.ones((3, 3), dtype=bool))
+    flats = flats.ravel()
+    cells = np.flatnonzero(pits)
+    _, first = np.unique(flats[cells], return_index=True)
+    representative = cells[first]
+    receivers[cells] = representative[flats[cells] - 1]
+    pits = np.zeros(size, dtype=bool)
+    pits[representative] = True
+
+    roots, _ = follow_paths(receivers)
+    basin, neighbour, spill, cells, _ = _get_spill_edges(elevation, roots.reshape(elevation.shape), pits)
+    nodes, edges = np.unique(np.concatenate((basin, neighbour)), return_inverse=True)
+    source, target = edges[: len(basin)], edges[len(basin) :]
+    # the lowest spill of every pair of basins, grouped by the source basin
+    order = np.lexsort((spill, target, source))
+    source, target, spill, cells = source[order], target[order], spill[order], cells[order]
+    lowest = np.r_[True, (source[1:] != source[:-1]) | (target[1:] != target[:-1])]
+    source, target, spill, cells = source[lowest], target[lowest], spill[lowest], cells[lowest]
+    starts = np.searchsorted(source, np.arange(len(nodes) + 1)).tolist()
+    target, spill, cells = target.tolist(), spill.tolist(), cells.tolist()
+
+    # priority flood from the basins draining out of the grid
+    visited = np.zeros(len(nodes), dtype=bool)
+    links = np.full(len(nodes), -1, dtype=np.int64)
+    heap = [(-np.inf, node, -1) for node in np.flatnonzero(~pits[nodes]).tolist()]
+    heapq.heapify(heap)
+    while heap:
+        level, node, cell = heapq.heappop(heap)
+        if visited[node]:
+            continue
+        visited[node] = True
+        links[node] = cell
+        for edge in range(starts[node], starts[node + 1]):
+            if not visited[target[edge]]:
+                heapq.heappush(heap, (max(level, spill[edge]), target[edge], cells[edge]))
+
+    linked = pits[nodes] & (links >= 0)
+    receivers[nodes[linked]] = links[linked]
+    return receivers
+
+
+def flow_accumulation(receivers: np.ndarray) -> np.ndarray:
+    """
+    Count the cells draining through every cell, the cell itself included.
+
+    Parameters
+    ----------
+    receivers : np.ndarray
+        Flat index of the downstream cell of every cell.
+
+    Returns
+    -------
+    np.ndarray
+        Flat array of the number of upstream cells.
+    """
+    _, depth = follow_paths(receivers, depth=True)
+    order = np.argsort(depth, kind="stable")
+    bounds = np.searchsorted(depth[order], np.arange(depth.max(initial=0) + 2))
+    accumulation = np.ones(len(receivers), dtype=np.int64)
+    # the cells of a level only drain into the cells of the next lower level
+    for level in range(len(bounds) - 2, 0, -1):
+        cells = order[bounds[level] : bounds[level + 1]]
+        np.add.at(accumulation, receivers[cells], accumulation[cells])
+    return accumulation
+
+
+class FlowGrid:
+    """
+    FlowGrid holds the flow directions and the flow accumulation of a DEM.
+
+    Attributes
+    ----------
+    receivers : np.ndarray
+        Flat index of the downstream cell of every cell, the depressions resolved.
+    accumulation : np.ndarray
+        Number of cells draining through every cell, of the shape of the grid.
+    shape : Tuple[int, int]
+        Number of rows and columns of the grid.
+    origin : Tuple[float, float]
+        Coordinates of the top left corner of the grid.
+    cell_size : float
+        Size of a cell in the units of the coordinates.
+    """
+
+    def __init__(
+        self, receivers: np.ndarray, shape: Tuple[int, int], origin: Tuple[float, float], cell_size: float
+    ) -> None:
+        self.receivers = receivers
+        self.shape = tuple(shape)
+        self.origin = tuple(origin)
+        self.cell_size = cell_size
+        self.accumulation = flow_accumulation(receivers).reshape(self.shape)
+
+    @classmethod
+    def from_dem(
+        cls,
+        dem: Raster,
+        origin: Tuple[float, float],
+        cell_size: float,
+        nodata: Optional[float] = None,
+        memory_budget: int = MEMORY_BUDGET,
+        workers: Optional[int] = None,
+    ) -> "FlowGrid":
+        """
+        Compute the flow directions and the accumulation of a DEM.
+
+        Parameters
+        ----------
+        dem : Raster
+            Elevations [m], array or path of a .npy file.
+        origin : Tuple[float, float]
+            Coordinates of the top left corner of the grid.
+        cell_size : float
+            Size of a cell in the units of the coordinates.
+        nodata : float, optional
+            Elevation of the cells without data.
+        memory_budget : int, optional
+            Memory available for the flow direction tiles [bytes], by default 256 MiB.
+        workers : int, optional
+            Number of processes computing the flow directions, see `flow_directions`.
+
+        Returns
+        -------
+        FlowGrid
+            The flow grid of the DEM.
+        """
+        receivers, outside = flow_directions(dem, nodata, memory_budget, workers)
+        elevation = np.array(open_raster(dem), dtype=float)
+        if nodata is not None:
+            elevation[elevation == nodata] = np.nan
+        return cls(resolve_depressions(elevation, receivers, outside), elevation.shape, origin, cell_size)
+
+    def get_cells(self, x: Sequence[float], y: Sequence[float]) -> np.ndarray:
+        """
+        Return the flat index of the cells containing the points.
+
+        Raises
+        ------
+        ValueError
+            If any point is outside of the grid, all of them are listed.
+        """
+        rows = np.floor((self.origin[1] - np.asarray(y, dtype=float)) / self.cell_size).astype(np.int64)
+        columns = np.floor((np.asarray(x, dtype=float) - self.origin[0]) / self.cell_size).astype(np.int64)
+        invalid = (rows < 0) | (rows >= self.shape[0]) | (columns < 0) | (columns >= self.shape[1])
+        if invalid.any():
+            shown = ", ".join(map(str, np.flatnonzero(invalid)[:10]))
+            raise ValueError(f"{invalid.sum()} points are outside of the grid: {shown}")
+        return rows * self.shape[1] + columns
+
+    def snap(self, cells: np.ndarray, radius: int = 0) -> np.ndarray:
+        """
+        Move every cell to the cell with the highest flow accumulation within a radius.
+
+        Parameters
+        ----------
+        cells : np.ndarray
+            Flat indices of the cells, e.g. of the outlets.
+        radius : int, optional
+            Half of the side of the searched square [cells], by default 0 (no snapping).
+
+        Returns
+        -------
+        np.ndarray
+            Flat indices of the snapped cells.
+        """
+        cells = np.asarray(cells, dtype=np.int64)
+        if radius <= 0 or len(cells) == 0:
+            return cells
+        offsets = np.arange(-radius, radius + 1)
+        rows = np.clip(cells[:, np.newaxis] // self.shape[1] + np.repeat(offsets, len(offsets)), 0, self.shape[0] - 1)
+        columns = np.clip(cells[:, np.newaxis] % self.shape[1] + np.tile(offsets, len(offsets)), 0, self.shape[1] - 1)
+        candidates = rows * self.shape[1] + columns
+        best = np.argmax(self.accumulation.ravel()[candidates], axis=1)
+        return candidates[np.arange(len(cells)), best]
+
+    def delineate(self, outlets: np.ndarray) -> np.ndarray:
+        """
+        Label the contributing area of every outlet.
+
+        Parameters
+        ----------
+        outlets : np.ndarray
+            Flat indices of the outlet cells.
+
+        Returns
+        -------
+        np.ndarray
+            Array of the shape of the grid with the index of the outlet plus one in the cells whose
+            flow path reaches it before any other outlet and zero elsewhere.
+
+        Raises
+        ------
+        ValueError
+            If two outlets are in the same cell.
+        """
+        outlets = np.asarray(outlets, dtype=np.int64)
+        unique, counts = np.unique(outlets, return_counts=True)
+        if (counts > 1).any():
+            shared = np.flatnonzero(np.isin(outlets, unique[counts > 1]))
+            raise ValueError(f"Outlets in the same cell: {', '.join(map(str, shared[:10]))}")
+        receivers = self.receivers.copy()
+        receivers[outlets] = outlets
+        roots, _ = follow_paths(receivers)
+        labels = np.zeros(len(receivers), dtype=np.int32)
+        labels[outlets] = np.arange(1, len(outlets) + 1)
+        return labels[roots].reshape(self.shape)
+
+
+def get_outlines(labels: np.ndarray, origin: Tuple[float, float], cell_size: float) -> Rings:
+    """
+    Trace the exterior outline of every labelled area of a raster.
+
+    The outline follows the cell edges around the top left cell of the area, so only the part
+    connected to it is traced when an area is split. Vertices on straight runs are dropped.
+
+    Parameters
+    ----------
+    labels : np.ndarray
+        Label raster, zero outside of the areas.
+    origin : Tuple[float, float]
+        Coordinates of the top left corner of the grid.
+    cell_size : float
+        Size of a cell in the units of the coordinates.
+
+    Returns
+    -------
+    Rings
+        One exterior ring for every label from 1 to the largest label (feature = label - 1).
+    """
+    rows, columns = labels.shape
+    padded = np.pad(labels, 1)
+    inner = padded[1:-1, 1:-1]
+    vertices = columns + 1
+    # directed cell sides between vertex ids row * (columns + 1) + column, clockwise around the cells
+    sides = {
+        "top": ((0, 0), (0, 1), padded[:-2, 1:-1]),
+        "right": ((0, 1), (1, 1), padded[1:-1, 2:]),
+        "bottom": ((1, 1), (1, 0), padded[2:, 1:-1]),
+        "left": ((1, 0), (0, 0), padded[1:-1, :-2]),
+    }
+    label, cell, start, end = [], [], [], []
+    for (start_offset, end_offset, neighbour) in sides.values():
+        row, column = np.nonzero((inner > 0) & (inner != neighbour))
+        label.append(inner[row, column])
+        cell.append(row * columns + column)
+        start.append((row + start_offset[0]) * vertices + column + start_offset[1])
+        end.append((row + end_offset[0]) * vertices + column + end_offset[1])
+    label, cell, start, end = map(np.concatenate, (label, cell, start, end))
+    order = np.lexsort((start, label))
+    label, cell, start, end = label[order], cell[order], start[order], end[order]
+    bounds = np.searchsorted(label, np.arange(1, labels.max(initial=0) + 2))
+
+    rings, feature = [], []
+    for index in range(len(bounds) - 1):
+        lower, upper = bounds[index], bounds[index + 1]
+        if lower == upper:
+            continue
+        outgoing: Dict[int, List[Tuple[int, int]]] = {}
+        sides = zip(start[lower:upper].tolist(), end[lower:upper].tolist(), cell[lower:upper].tolist())
+        for side_start, side_end, side_cell in sides:
+            outgoing.setdefault(side_start, []).append((side_end, side_cell))
+        # the smallest vertex is the top left corner of the area, on its exterior outline
+        first = int(start[lower])
+        vertex, (following, current) = first, outgoing[first][0]
+        ring = [vertex]
+        while following != first:
+            ring.append(following)
+            options = outgoing[following]
+            # where two cells touch diagonally, turn around the same cell
+            following, current = next((option for option in options if option[1] == current), options[0])
+        ring = np.array(ring)
+        points = np.stack((ring % vertices, ring // vertices), axis=1)
+        turn = (np.diff(points, axis=0, prepend=points[-1:]) != np.diff(points, axis=0, append=points[:1])).any(axis=1)
+        points = points[turn]
+        rings.append(np.stack((origin[0] + points[:, 0] * cell_size, origin[1] - points[:, 1] * cell_size), axis=1))
+        feature.append(index)
+
+    lengths = [len(ring) for ring in rings]
+    offsets = np.concatenate(([0], np.cumsum(lengths, dtype=np.int64)))
+    coords = np.concatenate(rings) if rings else np.empty((0, 2))
+    return Rings(coords, offsets, feature, np.zeros(len(rings), dtype=bool), len(bounds) - 1)
+
+
+def delineate_subcatchments(
+    file_path: str,
+    dem: Raster,
+    land_cover: Raster,
+    origin: Tuple[float, float],
+    cell_size: float,
+    nodes: Optional[Sequence[str]] = None,
+    nodata: Optional[float] = None,
+    snap_radius: int = 0,
+    remap: Optional[Union[str, Mapping, RemapTable]] = None,
+    memory_budget: int = MEMORY_BUDGET,
+    workers: Optional[int] = None,
+    parameters: Optional[HydrologicParameters] = None,
+) -> List[str]:
+    """
+    Add the contributing areas of the nodes of a SWMM model as subcatchments.
+
+    Parameters
+    ----------
+    file_path : str
+        The path to the SWMM input file (INP) to which subcatchments will be added.
+    dem : Raster
+        Elevations [m], array or path of a .npy file, in the coordinate system of the model.
+    land_cover : Raster
+        Land cover codes of the same grid, see `zonal_statistics`.
+    origin : Tuple[float, float]
+        Coordinates of the top left corner of the grid.
+    cell_size : float
+        Size of a cell [m].
+    nodes : Sequence[str], optional
+        Names of the outlet nodes, by default all junctions and outfalls with coordinates.
+    nodata : float, optional
+        Elevation of the cells without data.
+    snap_radius : int, optional
+        Move every outlet to the cell with the highest flow accumulation within the radius [cells],
+        by default 0.
+    remap : Union[str, Mapping, RemapTable], optional
+        Table translating the land cover codes, see `get_remap_table`.
+    memory_budget : int, optional
+        Memory available for the tiles [bytes], by default 256 MiB.
+    workers : int, optional
+        Number of processes of the tiled stages, with more than one worker the rasters must be
+        paths of .npy files.
+    parameters : HydrologicParameters, optional
+        Subarea and infiltration parameter tables, by default the built-in ones.
+
+    Returns
+    -------
+    List[str]
+        Names of the added subcatchments, in the order of the nodes.
+
+    Raises
+    ------
+    ValueError
+        If a node is unknown or outside of the grid, two nodes are in the same cell or the land cover
+        of an area is unknown.
+    """
+    model = BuildCatchments(file_path, parameters)
+    inp = model.model.inp
+    candidates = inp.junctions.index.union(inp.outfalls.index)
+    coordinates = inp.coordinates[inp.coordinates.index.isin(candidates)]
+    if nodes is None:
+        nodes = coordinates.index.tolist()
+    unknown = [node for node in nodes if node not in coordinates.index]
+    if unknown:
+        raise ValueError(f"Unknown nodes or nodes without coordinates: {', '.join(map(str, unknown[:10]))}")
+    coordinates = coordinates.loc[list(nodes)]
+
+    grid = FlowGrid.from_dem(dem, origin, cell_size, nodata, memory_budget, workers)
+    outlets = grid.snap(grid.get_cells(coordinates["X"], coordinates["Y"]), snap_radius)
+    labels = grid.delineate(outlets)
+    with tempfile.TemporaryDirectory() as directory:
+        labels_raster = labels
+        if workers and workers > 1:
+            labels_raster = os.path.join(directory, "labels.npy")
+            np.save(labels_raster, labels)
+        zones = zonal_statistics(
+            land_cover, dem, labels_raster, cell_size, nodata, memory_budget, workers, remap
+        ).reindex(np.arange(1, len(nodes) + 1))
+
+    ids = model._get_new_subcatchment_ids(len(nodes))
+    index = pd.Index(ids, name="Name")
+    data = validate_subcatchments(
+        pd.DataFrame(
+            {
+                "area": zones["area"].to_numpy(),
+                "land_form": zones["land_form"].to_numpy(),
+                "land_cover": zones["land_cover"].to_numpy(),
+            },
+            index=index,
+        )
+    )
+    computed = compute_parameters(data, model.parameters, model.config)
+    outlines = get_outlines(labels, origin, cell_size)
+    computed["Width"] = np.round(get_width(data["area"].to_numpy() * 10_000, outlines.perimeters()), 2)
+
+    feature, coords = outlines.outlines()
+    polygons = pd.DataFrame({"X": coords[:, 0], "Y": coords[:, 1]}, index=pd.Index(index[feature], name="Name"))
+    raingage, created = prepare_raingage(model)
+    tags = get_tags(index, data["area"], data["land_form"], data["land_cover"], get_rules_hash(model.parameters, model.config))
+    outlets = np.asarray(nodes, dtype=object)
+    records = get_section_records(computed, raingage, outlets, polygons=polygons, tags=tags)
+    append_records(file_path, iter([records]), created)
+    return ids
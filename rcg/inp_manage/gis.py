@@ -0,0 +1,763 @@
+"""
+The module contains the ingestion of subcatchments from vector GIS files.
+
+The features are read from GeoJSON, GeoPackage or ESRI Shapefile files in chunks and kept as flat
+arrays of ring vertices, so the area, the perimeter and the outline of all polygons of a chunk are
+computed with whole-array operations. The Width of a subcatchment is its area divided by the flow
+length, estimated as the length of the rectangle with the same area and perimeter as the polygon
+(for a square it is the side, as for the generated square-shaped subcatchments). The fuzzy results
+and the SWMM parameters are computed for the whole chunk and the real vertices are written to
+[Polygons] with the other sections in one streaming pass.
+
+The coordinates must be in a projected coordinate system, by default in metres. Only the exterior
+ring of the largest part of a feature is written to [Polygons], as SWMM draws one outline per
+subcatchment, but the holes and all parts count into the area.
+
+Example::
+
+    ingest_features("model.inp", "parcels.shp", land_form_field="LFORM", land_cover_field="LCOVER")
+    ingest_features("model.inp", "parcels.gpkg", land_cover_field="CODE_18", remap="corine")
+"""
+import itertools
+import json
+import os
+import sqlite3
+import struct
+from typing import IO, Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from rcg.fuzzy.categories import LandCoverType, LandFormType
+from rcg.inp_manage.inp import (
+    BuildCatchments,
+    compute_parameters,
+    get_section_records,
+    validate_subcatchments,
+)
+from rcg.inp_manage.parameters import HydrologicParameters
+from rcg.inp_manage.remap import RemapTable, get_remap_table
+from rcg.inp_manage.stream import append_records, prepare_raingage
+from rcg.inp_manage.tags import get_rules_hash, get_tags
+
+# Size of the envelope of a GeoPackage geometry by the envelope indicator.
+GPKG_ENVELOPE_SIZE = {0: 0, 1: 32, 2: 48, 3: 48, 4: 64}
+SHAPEFILE_POLYGON_TYPES = (5, 15, 25)
+# Number of characters of a GeoJSON file read at once.
+JSON_BLOCK_SIZE = 2**20
+
+
+class Rings:
+    """
+    Rings holds the polygon rings of many features as flat arrays.
+
+    Attributes
+    ----------
+    coords : np.ndarray
+        Vertices of all rings, array of shape (vertices, 2).
+    offsets : np.ndarray
+        Index of the first vertex of every ring and the total number of vertices at the end.
+    feature : np.ndarray
+        Index of the feature every ring belongs to.
+    hole : np.ndarray
+        True for the interior rings (holes).
+    size : int
+        Number of features, including the features without any ring.
+    """
+
+    def __init__(
+        self,
+        coords: np.ndarray,
+        offsets: np.ndarray,
+        feature: np.ndarray,
+        hole: np.ndarray,
+        size: int,
+    ) -> None:
+        self.coords = np.asarray(coords, dtype=float).reshape(-1, 2)
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self.feature = np.asarray(feature, dtype=np.int64)
+        self.hole = np.asarray(hole, dtype=bool)
+        self.size = size
+        if (np.diff(self.offsets) < 3).any():
+            raise ValueError("Every ring must have at least three vertices")
+
+    @classmethod
+    def from_polygons(cls, features: Sequence[Sequence[Sequence]]) -> "Rings":
+        """
+        Create the rings from nested coordinate lists.
+
+        Parameters
+        ----------
+        features : Sequence[Sequence[Sequence]]
+            For every feature a list of polygons, every polygon a list of rings (the exterior ring
+            first, then the holes) and every ring a sequence of (x, y) vertices.
+
+        Returns
+        -------
+        Rings
+            The rings of all features.
+        """
+        rings, feature, hole = [], [], []
+        for index, polygons in enumerate(features):
+            for polygon in polygons:
+                for position, ring in enumerate(polygon):
+                    rings.append(np.asarray(ring, dtype=float)[:, :2])
+                    feature.append(index)
+                    hole.append(position > 0)
+        lengths = [len(ring) for ring in rings]
+        offsets = np.concatenate(([0], np.cumsum(lengths, dtype=np.int64)))
+        coords = np.concatenate(rings) if rings else np.empty((0, 2))
+        return cls(coords, offsets, feature, hole, len(features))
+
+    def _next_vertices(self) -> np.ndarray:
+        """Return the index of the next vertex of every vertex, wrapping around in every ring."""
+        following = np.arange(1, len(self.coords) + 1)
+        following[self.offsets[1:] - 1] = self.offsets[:-1]
+        return following
+
+    def _ring_sums(self, values: np.ndarray) -> np.ndarray:
+        """Sum the values of the vertices of every ring."""
+        if len(values) == 0:
+            return np.zeros(0)
+        return np.add.reduceat(values, self.offsets[:-1])
+
+    def signed_areas(self) -> np.ndarray:
+        """Return the signed area of every ring, positive for counterclockwise rings."""
+        x, y = self.coords[:, 0], self.coords[:, 1]
+        following = self._next_vertices()
+        return self._ring_sums(x * y[following] - x[following] * y) / 2
+
+    def areas(self) -> np.ndarray:
+        """Return the area of every feature, the exterior rings minus the holes."""
+        areas = np.abs(self.signed_areas())
+        return np.bincount(self.feature, weights=np.where(self.hole, -areas, areas), minlength=self.size)
+
+    def perimeters(self) -> np.ndarray:
+        """Return the length of the exterior rings of every feature."""
+        following = self._next_vertices()
+        lengths = self._ring_sums(np.hypot(*(self.coords[following] - self.coords).T))
+        return np.bincount(self.feature, weights=np.where(self.hole, 0, lengths), minlength=self.size)
+
+    def centroids(self) -> np.ndarray:
+        """Return the centroid of every feature, the exterior rings minus the holes, NaN without area."""
+        x, y = self.coords[:, 0], self.coords[:, 1]
+        following = self._next_vertices()
+        cross = x * y[following] - x[following] * y
+        signed = self._ring_sums(cross) / 2
+        with np.errstate(divide="ignore", invalid="ignore"):
+            centres = np.stack(
+                [self._ring_sums((values + values[following]) * cross) / (6 * signed) for values in (x, y)], axis=1
+            )
+            weights = np.where(self.hole, -np.abs(signed), np.abs(signed))
+            total = np.bincount(self.feature, weights=weights, minlength=self.size)
+            return np.stack(
+                [
+                    np.bincount(self.feature, weights=weights * centres[:, axis], minlength=self.size) / total
+                    for axis in (0, 1)
+                ],
+                axis=1,
+            )
+
+    def outlines(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return the vertices of the largest exterior ring of every feature.
+
+        The closing vertex (equal to the first one) is dropped.
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            Index of the feature of every vertex and the vertices, array of shape (vertices, 2).
+        """
+        areas = np.abs(self.signed_areas())
+        exterior = np.flatnonzero(~self.hole)
+        if len(exterior) == 0:
+            return np.zeros(0, dtype=np.int64), np.empty((0, 2))
+        # the largest exterior ring of every feature comes last in its feature group
+        order = exterior[np.lexsort((areas[exterior], self.feature[exterior]))]
+        last = np.r_[self.feature[order][1:] != self.feature[order][:-1], True]
+        rings = order[last]
+
+        starts, stops = self.offsets[rings], self.offsets[rings + 1]
+        closed = (self.coords[starts] == self.coords[stops - 1]).all(axis=1)
+        stops = stops - closed
+        lengths = stops - starts
+        vertices = np.repeat(starts - np.concatenate(([0], np.cumsum(lengths)[:-1])), lengths) + np.arange(
+            lengths.sum()
+        )
+        return np.repeat(self.feature[rings], lengths), self.coords[vertices]
+
+
+def get_width(area: np.ndarray, perimeter: np.ndarray) -> np.ndarray:
+    """
+    Return the width of subcatchments, the area divided by the flow length.
+
+    The flow length is the length of the rectangle with the same area and perimeter as
+    the subcatchment, or the side of the square with the same area if the polygon is more
+    compact than a square.
+
+    Parameters
+    ----------
+    area : np.ndarray
+        Areas of the polygons [m2].
+    perimeter : np.ndarray
+        Perimeters of the polygons [m].
+
+    Returns
+    -------
+    np.ndarray
+        Widths [m].
+    """
+    area = np.asarray(area, dtype=float)
+    perimeter = np.asarray(perimeter, dtype=float)
+    discriminant = np.clip(perimeter**2 - 16 * area, 0, None)
+    length = np.maximum((perimeter + np.sqrt(discriminant)) / 4, np.sqrt(area))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(length > 0, area / length, 0.0)
+
+
+def _gather(buffer: np.ndarray, offsets: np.ndarray, dtype: str, count: int = 1) -> np.ndarray:
+    """Read `count` values of the dtype at every byte offset of the buffer."""
+    size = np.dtype(dtype).itemsize * count
+    data = buffer[np.asarray(offsets, dtype=np.int64)[:, np.newaxis] + np.arange(size)]
+    return np.ascontiguousarray(data).view(dtype).reshape(len(offsets), count)
+
+
+def _segments(counts: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the owner and the position within the owner of every element of consecutive segments."""
+    owner = np.repeat(np.arange(len(counts)), counts)
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    return owner, np.arange(counts.sum()) - starts[owner]
+
+
+def _read_dbf(path: str, encoding: str) -> Tuple[np.memmap, Dict[str, Tuple[str, str]]]:
+    """Return the memory-mapped records of a dBASE file and the field types by field name."""
+    with open(path, "rb") as file:
+        header = file.read(32)
+        count, header_length, record_length = struct.unpack("<IHH", header[4:12])
+        descriptors = file.read(header_length - 32)
+    fields = [("deleted", "S1")]
+    types = {}
+    for start in range(0, len(descriptors) - 1, 32):
+        descriptor = descriptors[start : start + 32]
+        if descriptor[0] == 0x0D:
+            break
+        name = descriptor[:11].split(b"\x00")[0].decode(encoding)
+        fields.append((name, f"S{descriptor[16]}"))
+        types[name] = descriptor[11:12].decode("ascii")
+    dtype = np.dtype(fields)
+    if dtype.itemsize != record_length:
+        raise ValueError(f"Invalid dBASE file: {path}")
+    records = np.memmap(path, dtype=dtype, mode="r", offset=header_length, shape=(count,))
+    return records, types
+
+
+def _decode_dbf(records: np.ndarray, types: Dict[str, str], encoding: str) -> pd.DataFrame:
+    """Decode the fixed-width dBASE records into a data frame."""
+    data = {}
+    for name, kind in types.items():
+        values = pd.Series(np.char.strip(records[name])).str.decode(encoding, errors="replace")
+        if kind in "NF":
+            values = pd.to_numeric(values, errors="coerce")
+        data[name] = values.to_numpy()
+    return pd.DataFrame(data)
+
+
+def iter_shapefile(path: str, chunk_size: int = 10_000) -> Iterator[Tuple[pd.DataFrame, Rings]]:
+    """
+    Read the polygons and attributes of an ESRI Shapefile in chunks.
+
+    The .shp, .shx and .dbf files are memory-mapped and the records of a whole chunk are decoded
+    with array operations.
+
+    Parameters
+    ----------
+    path : str
+        Path of the .shp file, the .shx and .dbf files must be next to it.
+    chunk_size : int, optional
+        Maximum number of features in a chunk, by default 10 000.
+
+    Yields
+    ------
+    Tuple[pd.DataFrame, Rings]
+        Attributes and rings of the features of the chunk.
+
+    Raises
+    ------
+    ValueError
+        If the file doesn't contain polygons.
+    """
+    base = os.path.splitext(path)[0]
+    encoding = "utf-8"
+    if os.path.exists(base + ".cpg"):
+        with open(base + ".cpg", "r") as file:
+            encoding = file.read().strip() or encoding
+
+    shp = np.memmap(path, dtype=np.uint8, mode="r")
+    shape_type = int(np.frombuffer(shp[32:36].tobytes(), dtype="<i4")[0])
+    if shape_type not in SHAPEFILE_POLYGON_TYPES:
+        raise ValueError(f"The shapefile must contain polygons, got shape type {shape_type}")
+    index = np.memmap(base + ".shx", dtype=">i4", mode="r", offset=100).reshape(-1, 2)
+    records, types = _read_dbf(base + ".dbf", encoding)
+
+    for start in range(0, len(index), chunk_size):
+        # byte offset of the content of every record, after the 8-byte record header
+        content = index[start : start + chunk_size, 0].astype(np.int64) * 2 + 8
+        kind = _gather(shp, content, "<i4").ravel()
+        polygon = kind != 0
+        parts = np.where(polygon, _gather(shp, content + 36, "<i4").ravel(), 0)
+        points = np.where(polygon, _gather(shp, content + 40, "<i4").ravel(), 0)
+
+        part_owner, part_position = _segments(parts)
+        part_starts = _gather(shp, content[part_owner] + 44 + 4 * part_position, "<i4").ravel()
+        point_owner, point_position = _segments(points)
+        coords = _gather(
+            shp, content[point_owner] + 44 + 4 * parts[point_owner] + 16 * point_position, "<f8", 2
+        )
+
+        first_point = np.concatenate(([0], np.cumsum(points)[:-1]))
+        offsets = np.concatenate((first_point[part_owner] + part_starts, [points.sum()]))
+        rings = Rings(coords, offsets, part_owner, np.zeros(len(part_owner), dtype=bool), len(kind))
+        # exterior rings are clockwise, holes counterclockwise
+        rings.hole = rings.signed_areas() > 0
+
+        attributes = _decode_dbf(records[start : start + chunk_size], types, encoding)
+        yield attributes, rings
+
+
+def _parse_wkb(data: bytes, offset: int = 0) -> Tuple[List[List[np.ndarray]], int]:
+    """Parse a WKB polygon or multipolygon into a list of polygons, return them and the end offset."""
+    order = "<" if data[offset] == 1 else ">"
+    geometry_type = struct.unpack_from(f"{order}I", data, offset + 1)[0]
+    offset += 5
+    # ISO (+1000 Z, +2000 M, +3000 ZM) and EWKB (high bits) variants with Z/M coordinates
+    iso = (geometry_type & 0x0FFFFFFF) // 1000
+    dimensions = 2
+    if geometry_type & 0x80000000 or iso in (1, 3):
+        dimensions += 1
+    if geometry_type & 0x40000000 or iso in (2, 3):
+        dimensions += 1
+    if geometry_type & 0x20000000:
+        offset += 4
+    geometry_type = (geometry_type & 0x0FFFFFFF) % 1000
+
+    if geometry_type == 3:
+        count = struct.unpack_from(f"{order}I", data, offset)[0]
+        offset += 4
+        rings = []
+        for _ in range(count):
+            points = struct.unpack_from(f"{order}I", data, offset)[0]
+            offset += 4
+            ring = np.frombuffer(data, dtype=f"{order}f8", count=points * dimensions, offset=offset)
+            rings.append(ring.reshape(points, dimensions)[:, :2])
+            offset += 8 * points * dimensions
+        return [rings], offset
+    if geometry_type == 6:
+        count = struct.unpack_from(f"{order}I", data, offset)[0]
+        offset += 4
+        polygons = []
+        for _ in range(count):
+            polygon, offset = _parse_wkb(data, offset)
+            polygons.extend(polygon)
+        return polygons, offset
+    raise ValueError(f"Unsupported geometry type: {geometry_type}, only polygons are supported")
+
+
+def _parse_gpkg_geometry(blob: Optional[bytes]) -> List[List[np.ndarray]]:
+    """Parse a GeoPackage geometry blob into a list of polygons."""
+    if blob is None:
+        return []
+    blob = bytes(blob)
+    if blob[:2] != b"GP":
+        raise ValueError("Invalid GeoPackage geometry")
+    flags = blob[3]
+    if flags & 0b10000:
+        return []
+    return _parse_wkb(blob, 8 + GPKG_ENVELOPE_SIZE[(flags >> 1) & 0b111])[0]
+
+
+def iter_geopackage(
+    path: str, layer: Optional[str] = None, chunk_size: int = 10_000
+) -> Iterator[Tuple[pd.DataFrame, Rings]]:
+    """
+    Read the polygons and attributes of a GeoPackage layer in chunks.
+
+    Parameters
+    ----------
+    path : str
+        Path of the .gpkg file.
+    layer : str, optional
+        Name of the layer, by default the first features layer.
+    chunk_size : int, optional
+        Maximum number of features in a chunk, by default 10 000.
+
+    Yields
+    ------
+    Tuple[pd.DataFrame, Rings]
+        Attributes and rings of the features of the chunk.
+    """
+    connection = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    try:
+        query = "SELECT table_name, column_name FROM gpkg_geometry_columns"
+        columns = dict(connection.execute(query).fetchall())
+        if not columns:
+            raise ValueError(f"No features layer in {path}")
+        layer = layer or next(iter(columns))
+        if layer not in columns:
+            raise ValueError(f"Unknown layer: {layer}")
+        geometry = columns[layer]
+
+        cursor = connection.execute(f'SELECT * FROM "{layer}"')
+        names = [description[0] for description in cursor.description]
+        position = names.index(geometry)
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                break
+            attributes = pd.DataFrame(rows, columns=names).drop(columns=geometry)
+            rings = Rings.from_polygons([_parse_gpkg_geometry(row[position]) for row in rows])
+            yield attributes, rings
+    finally:
+        connection.close()
+
+
+def _get_geojson_polygons(geometry: Optional[dict]) -> List[list]:
+    """Return the polygons of a GeoJSON geometry."""
+    if not geometry:
+        return []
+    if geometry["type"] == "Polygon":
+        return [geometry["coordinates"]]
+    if geometry["type"] == "MultiPolygon":
+        return geometry["coordinates"]
+    raise ValueError(f"Unsupported geometry type: {geometry['type']}, only polygons are supported")
+
+
+class _JsonReader:
+    """Reader of consecutive JSON values from a text file, keeping only the unread part of a block in memory."""
+
+    def __init__(self, file: IO[str]) -> None:
+        self.file = file
+        self.buffer = ""
+        self.position = 0
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        """Append the next block of the file to the unread part of the buffer, False at the end of the file."""
+        block = self.file.read(JSON_BLOCK_SIZE)
+        if not block:
+            return False
+        self.buffer = self.buffer[self.position :] + block
+        self.position = 0
+        return True
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character, empty at the end of the file."""
+        while True:
+            while self.position < len(self.buffer) and self.buffer[self.position].isspace():
+                self.position += 1
+            if self.position < len(self.buffer):
+                return self.buffer[self.position]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        """Consume the next character, which must be `char`."""
+        if self.peek() != char:
+            raise ValueError(f"Invalid GeoJSON: expected '{char}', got '{self.peek()}'")
+        self.position += 1
+
+    def skip(self, char: str) -> None:
+        """Consume the next character if it is `char`."""
+        if self.peek() == char:
+            self.position += 1
+
+    def read_value(self) -> Any:
+        """Decode the next value, reading more blocks until it is complete."""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.position)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # a value at the end of the buffer (e.g. a number) may continue in the next block
+            if end < len(self.buffer) or not self._fill():
+                self.position = end
+                return value
+
+
+def _iter_geojson_features(file: IO[str]) -> Iterator[dict]:
+    """Yield the features of a GeoJSON feature collection one by one."""
+    reader = _JsonReader(file)
+    reader.expect("{")
+    while reader.peek() != "}":
+        key = reader.read_value()
+        reader.expect(":")
+        if key != "features":
+            reader.read_value()
+            reader.skip(",")
+            continue
+        reader.expect("[")
+        while reader.peek() != "]":
+            yield reader.read_value()
+            reader.skip(",")
+        return
+    raise ValueError("Invalid GeoJSON: the feature collection has no features")
+
+
+def iter_geojson(path: str, chunk_size: int = 10_000) -> Iterator[Tuple[pd.DataFrame, Rings]]:
+    """
+    Read the polygons and attributes of a GeoJSON feature collection in chunks.
+
+    The features are decoded one by one from blocks of the file, so only a single chunk
+    is kept in memory.
+
+    Parameters
+    ----------
+    path : str
+        Path of the .geojson or .json file.
+    chunk_size : int, optional
+        Maximum number of features in a chunk, by default 10 000.
+
+    Yields
+    ------
+    Tuple[pd.DataFrame, Rings]
+        Attributes and rings of the features of the chunk.
+    """
+    with open(path, "r", encoding="utf-8") as file:
+        features = _iter_geojson_features(file)
+        while True:
+            chunk = list(itertools.islice(features, chunk_size))
+            if not chunk:
+                return
+            attributes = pd.DataFrame([feature.get("properties") or {} for feature in chunk])
+            rings = Rings.from_polygons([_get_geojson_polygons(feature.get("geometry")) for feature in chunk])
+            yield attributes, rings
+
+
+def iter_features(
+    path: str, layer: Optional[str] = None, chunk_size: int = 10_000
+) -> Iterator[Tuple[pd.DataFrame, Rings]]:
+    """
+    Read the polygons and attributes of a vector file in chunks, the format is chosen by the extension.
+
+    Parameters
+    ----------
+    path : str
+        Path of a .shp, .gpkg, .geojson or .json file.
+    layer : str, optional
+        Name of the GeoPackage layer, by default the first one.
+    chunk_size : int, optional
+        Maximum number of features in a chunk, by default 10 000.
+
+    Yields
+    ------
+    Tuple[pd.DataFrame, Rings]
+        Attributes and rings of the features of the chunk.
+
+    Raises
+    ------
+    ValueError
+        If the format is not supported.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be greater than zero")
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".shp":
+        return iter_shapefile(path, chunk_size)
+    if extension == ".gpkg":
+        return iter_geopackage(path, layer, chunk_size)
+    if extension in (".geojson", ".json"):
+        return iter_geojson(path, chunk_size)
+    raise ValueError(f"Unsupported vector file: {path}, supported are .shp, .gpkg, .geojson and .json")
+
+
+def _get_categories(values: pd.Series, category) -> pd.Series:
+    """Replace the category codes by the names, other values are left for the validation."""
+    codes = pd.to_numeric(values, errors="coerce")
+    valid = codes.isin(category.codes())
+    names = values.astype(object).copy()
+    names[valid] = np.asarray(category.decode(codes[valid].astype(np.int64)), dtype=object)
+    return names
+
+
+def get_feature_records(
+    attributes: pd.DataFrame,
+    rings: Rings,
+    ids: Sequence[str],
+    raingage: Union[str, Sequence[str]],
+    outlet: Optional[Union[str, Sequence[str]]],
+    land_form_field: str = "land_form",
+    land_cover_field: str = "land_cover",
+    parameters: Optional[HydrologicParameters] = None,
+    scale: float = 1.0,
+    remap: Optional[RemapTable] = None,
+) -> Dict[str, pd.DataFrame]:
+    """
+    Compute the INP section rows of the subcatchments of a chunk of features.
+
+    Parameters
+    ----------
+    attributes : pd.DataFrame
+        Attributes of the features.
+    rings : Rings
+        Polygons of the features.
+    ids : Sequence[str]
+        Names of the new subcatchments, one for every feature.
+    raingage : Union[str, Sequence[str]]
+        Name of the raingage of the subcatchments, or one name per feature.
+    outlet : Union[str, Sequence[str]], optional
+        Name of the outlet node, or one name per feature. If None, every subcatchment is its own outlet.
+    land_form_field : str, optional
+        Attribute with the land form names or codes, by default land_form.
+    land_cover_field : str, optional
+        Attribute with the land cover names or codes, by default land_cover.
+    parameters : HydrologicParameters, optional
+        Subarea and infiltration parameter tables, by default the built-in ones.
+    scale : float, optional
+        Length of a coordinate unit in metres, by default 1.
+    remap : RemapTable, optional
+        Table translating the land cover attribute codes, the land cover with the largest share
+        of a mix is used.
+
+    Returns
+    -------
+    Dict[str, pd.DataFrame]
+        New rows of the [SUBCATCHMENTS], [SUBAREAS], [INFILTRATION], [Polygons] and [TAGS] sections.
+
+    Raises
+    ------
+    ValueError
+        If an attribute is missing or any feature is invalid (every invalid feature is reported).
+    """
+    missing = [field for field in (land_form_field, land_cover_field) if field not in attributes]
+    if missing:
+        raise ValueError(f"Missing attributes: {', '.join(missing)}")
+
+    land_cover = attributes[land_cover_field]
+    if remap is not None:
+        land_cover = pd.Series(remap.remap(land_cover), index=land_cover.index)
+
+    area = rings.areas() * scale**2
+    index = pd.Index(ids, name="Name")
+    data = validate_subcatchments(
+        pd.DataFrame(
+            {
+                "area": area / 10_000,
+                "land_form": _get_categories(attributes[land_form_field], LandFormType).to_numpy(),
+                "land_cover": _get_categories(land_cover, LandCoverType).to_numpy(),
+            },
+            index=index,
+        )
+    )
+    computed = compute_parameters(data, parameters)
+    computed["Width"] = np.round(get_width(area, rings.perimeters() * scale), 2)
+
+    feature, coords = rings.outlines()
+    polygons = pd.DataFrame(
+        {"X": coords[:, 0], "Y": coords[:, 1]}, index=pd.Index(index[feature], name="Name")
+    )
+    tags = get_tags(index, data["area"], data["land_form"], data["land_cover"], get_rules_hash(parameters))
+    return get_section_records(computed, raingage, outlet, polygons=polygons, tags=tags)
+
+
+def ingest_features(
+    file_path: str,
+    vector_path: str,
+    land_form_field: str = "land_form",
+    land_cover_field: str = "land_cover",
+    name_field: Optional[str] = None,
+    layer: Optional[str] = None,
+    chunk_size: int = 10_000,
+    parameters: Optional[HydrologicParameters] = None,
+    scale: float = 1.0,
+    remap: Optional[Union[str, Mapping, RemapTable]] = None,
+    outlets: str = "last",
+    max_distance: Optional[float] = None,
+    node_types: Optional[Sequence[str]] = None,
+    raingages: str = "first",
+) -> int:
+    """
+    Add subcatchments with the real polygons of the features of a vector file to a SWMM model.
+
+    The features are read and processed in chunks and the section rows are appended to the file
+    with `append_inp_sections`. If any feature is invalid, the file is left unchanged.
+
+    Parameters
+    ----------
+    file_path : str
+        The path to the SWMM input file (INP) to which subcatchments will be added.
+    vector_path : str
+        Path of a .shp, .gpkg, .geojson or .json file with polygon features.
+    land_form_field : str, optional
+        Attribute with the land form names or codes, by default land_form.
+    land_cover_field : str, optional
+        Attribute with the land cover names or codes, by default land_cover.
+    name_field : str, optional
+        Attribute with the names of the subcatchments. By default new names are generated.
+    layer : str, optional
+        Name of the GeoPackage layer, by default the first one.
+    chunk_size : int, optional
+        Maximum number of features processed at once, by default 10 000.
+    parameters : HydrologicParameters, optional
+        Subarea and infiltration parameter tables, by default the built-in ones.
+    scale : float, optional
+        Length of a coordinate unit in metres, by default 1.
+    remap : Union[str, Mapping, RemapTable], optional
+        Table translating the land cover attribute codes (e.g. corine), see `get_remap_table`.
+    outlets : str, optional
+        Outlet rule, "last" or "nearest" (to the centroid of the feature), see `BuildCatchments.get_outlets`.
+    max_distance : float, optional
+        Largest distance to the nearest node in coordinate units, see `BuildCatchments.get_outlets`.
+    node_types : Sequence[str], optional
+        Eligible node types of the nearest rule, see `OutletIndex.query`.
+    raingages : str, optional
+        Raingage rule, "first" or "nearest" (to the centroid of the feature), see `BuildCatchments.get_raingages`.
+
+    Returns
+    -------
+    int
+        Number of added subcatchments.
+
+    Raises
+    ------
+    ValueError
+        If any feature is invalid, a land cover code is missing from the remap table (all missing
+        codes of the chunk are listed) or a name is already used in the model.
+    """
+    remap = get_remap_table(remap)
+    model = BuildCatchments(file_path, parameters)
+    _, created = prepare_raingage(model)
+    new_ids = model.iter_new_subcatchment_ids()
+    existing = set(model.model.inp.subcatchments.index)
+
+    def records() -> Iterator[Dict[str, pd.DataFrame]]:
+        for attributes, rings in iter_features(vector_path, layer, chunk_size):
+            if name_field is None:
+                ids = list(itertools.islice(new_ids, len(attributes)))
+            else:
+                ids = attributes[name_field].astype(str).tolist()
+                if len(set(ids)) != len(ids):
+                    raise ValueError(f"The names in the {name_field} attribute must be unique")
+                used = existing.intersection(ids)
+                if used:
+                    raise ValueError(f"Names already used: {', '.join(sorted(used)[:10])}")
+                existing.update(ids)
+            centroids = rings.centroids()
+            outlet = model.get_outlets(ids, centroids, outlets, max_distance, node_types)
+            raingage = model.get_raingages(centroids, raingages)
+            yield get_feature_records(
+                attributes,
+                rings,
+                ids,
+                raingage,
+                outlet,
+                land_form_field,
+                land_cover_field,
+                model.parameters,
+                scale,
+                remap,
+            )
+
+    return append_records(file_path, records(), created)
@@ -1,12 +1,33 @@
+import itertools
 import math
-from typing import List, Optional, Tuple
+import warnings
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 import pandas as pd
 import swmmio
 
 from rcg.fuzzy.engine import Prototype
-from rcg.fuzzy.categories import LandForm, LandCover
+from rcg.fuzzy.categories import (
+    CatchmentType,
+    LandForm,
+    LandCover,
+    LandFormType,
+    LandCoverType,
+)
+from rcg.fuzzy.config import EngineConfig, get_batch_engine, get_engine
+from rcg.fuzzy.lookup import lookup_codes
+from rcg.inp_manage.cache import CACHED_SECTIONS, ParseCache, get_default_cache
+from rcg.inp_manage.layout import LAYOUTS, Extent, get_extent, layout_polygons
+from rcg.inp_manage.outlets import OUTLET_RULES, OutletIndex
+from rcg.inp_manage.raingages import RAINGAGE_RULES, RaingageIndex
+from rcg.inp_manage.parameters import (
+    INFILTRATION_COLUMNS,
+    HydrologicParameters,
+    default_parameters,
+)
+from rcg.inp_manage.sections import load_inp_sections, replace_inp_sections
+from rcg.inp_manage.tags import SUBCATCHMENT_TAG, get_rules_hash, get_stale, get_tags, parse_tags
 from swmmio.utils.modify_model import replace_inp_section
 
 desired_width = 500
@@ -14,6 +35,307 @@ pd.set_option("display.width", desired_width)
 np.set_printoptions(linewidth=desired_width)
 pd.set_option("display.max_columns", 15)
 
+SUBCATCHMENTS_COLUMNS = ["Area", "PercImperv", "Width", "PercSlope", "CurbLength"]
+SUBAREAS_COLUMNS = ["N-Imperv", "N-Perv", "S-Imperv", "S-Perv", "PctZero", "RouteTo"]
+# sections with the rows of a subcatchment, indexed by its name, by the swmmio attribute
+SUBCATCHMENT_SECTIONS = {
+    "[SUBAREAS]": "subareas",
+    "[INFILTRATION]": "infiltration",
+    "[Polygons]": "polygons",
+    "[COVERAGES]": "coverages",
+    "[LOADINGS]": "loadings",
+    "[GROUNDWATER]": "groundwater",
+    "[LID_USAGE]": "lid_usage",
+}
+
+
+def get_subarea_values(
+    populate_key: str, parameters: Optional[HydrologicParameters] = None
+) -> dict:
+    """
+    Return the [SUBAREAS] values mapped to the given catchment class.
+
+    Parameters
+    ----------
+    populate_key : str
+        Catchment class, the linguistic variable of Prototype.catchment_class.
+    parameters : HydrologicParameters, optional
+        Parameter tables to use, by default the built-in ones.
+
+    Returns
+    -------
+    dict
+        Manning's coefficients, depression storage [mm] and PctZero for the subarea.
+    """
+    parameters = default_parameters if parameters is None else parameters
+    values = parameters.get_subareas([populate_key]).iloc[0].to_dict()
+    values["RouteTo"] = "OUTLET"
+    return values
+
+
+def validate_subcatchments(data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Validate all rows of a subcatchments table at once.
+
+    The area may be given as a string with a decimal comma and the category names may use
+    spaces instead of underscores. Every invalid row is reported, not only the first one.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        Table with the columns: area, land_form and land_cover.
+
+    Returns
+    -------
+    pd.DataFrame
+        Copy of the table with the area converted to float and the category names normalized.
+
+    Raises
+    ------
+    ValueError
+        If any of the columns is missing or any row has an invalid value.
+    """
+    missing = [column for column in ("area", "land_form", "land_cover") if column not in data]
+    if missing:
+        raise ValueError(f"Missing columns: {', '.join(missing)}")
+
+    result = pd.DataFrame(index=data.index)
+    area = data["area"].astype(str).str.strip().str.replace(",", ".", regex=False)
+    result["area"] = pd.to_numeric(area, errors="coerce")
+    for column in ("land_form", "land_cover"):
+        result[column] = data[column].astype(str).str.strip().str.replace(" ", "_", regex=False)
+
+    errors = []
+    invalid_area = result["area"].isna() | (result["area"] <= 0)
+    invalid_land_form = ~result["land_form"].isin(LandForm.get_all_categories())
+    invalid_land_cover = ~result["land_cover"].isin(LandCover.get_all_categories())
+    for row in result.index[invalid_area | invalid_land_form | invalid_land_cover]:
+        messages = []
+        if invalid_area[row]:
+            messages.append(f"area must be a number greater than zero, got '{data.at[row, 'area']}'")
+        if invalid_land_form[row]:
+            messages.append(f"invalid land form '{data.at[row, 'land_form']}'")
+        if invalid_land_cover[row]:
+            messages.append(f"invalid land cover '{data.at[row, 'land_cover']}'")
+        errors.append(f"Row {row}: {', '.join(messages)}")
+    if errors:
+        raise ValueError("\n".join(errors))
+    return result
+
+
+def get_fuzzy_results(
+    land_form: pd.Series, land_cover: pd.Series, config: Optional[EngineConfig] = None
+) -> pd.DataFrame:
+    """
+    Return the fuzzy results of whole columns of land forms and land covers.
+
+    Without a configuration the results are gathered from the precomputed lookup table. With one,
+    they are computed by the batch engine of the configuration and the catchment classes are taken
+    from its catchment memberships, so they follow the live rules.
+
+    Parameters
+    ----------
+    land_form : pd.Series
+        Land form names or LandFormType codes.
+    land_cover : pd.Series
+        Land cover names or LandCoverType codes, same length as land_form.
+    config : EngineConfig, optional
+        Configuration of the fuzzy engine, see `rcg.fuzzy.config.get_batch_engine`.
+
+    Returns
+    -------
+    pd.DataFrame
+        Table with the slope, impervious and catchment results and the catchment_class
+        as a pandas Categorical, one row per input row.
+
+    Raises
+    ------
+    ValueError
+        If any value is not a valid category or the inputs have different lengths.
+    """
+    if config is None:
+        return lookup_codes(land_form, land_cover)
+    land_form = LandFormType.encode(land_form)
+    land_cover = LandCoverType.encode(land_cover)
+    if land_form.shape != land_cover.shape:
+        raise ValueError("land_form and land_cover must have the same length")
+
+    batch_engine = get_batch_engine(config)
+    results = batch_engine.compute(land_form, land_cover)
+    terms = batch_engine.systems["catchment"].classify(results["catchment"].to_numpy())
+    results["catchment_class"] = CatchmentType.decode(CatchmentType.encode(terms))
+    return results[["slope", "impervious", "catchment", "catchment_class"]]
+
+
+def compute_parameters(
+    data: pd.DataFrame,
+    parameters: Optional[HydrologicParameters] = None,
+    config: Optional[EngineConfig] = None,
+) -> pd.DataFrame:
+    """
+    Compute every derived SWMM parameter of the subcatchments without touching any INP file.
+
+    The categories are encoded in one pass, the fuzzy results are gathered from the precomputed
+    lookup table and the subarea and infiltration parameters are joined by the catchment class
+    and the land cover, so the whole computation is vectorized. The values are rounded the same
+    way as when they are written to the model.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        Table with the columns: area [ha], land_form and land_cover (names or codes).
+    parameters : HydrologicParameters, optional
+        Subarea and infiltration parameter tables, by default the built-in ones.
+    config : EngineConfig, optional
+        Configuration of the fuzzy engine, e.g. a regional variant. If given, the fuzzy results
+        are computed by its batch engine instead of read from the lookup table, see
+        `get_fuzzy_results`.
+
+    Returns
+    -------
+    pd.DataFrame
+        Table with the same index as `data` and the columns: Area, PercImperv, Width, PercSlope,
+        CurbLength, N-Imperv, N-Perv, S-Imperv, S-Perv, PctZero, RouteTo, Suction, Ksat, IMD,
+        Param4, Param5 and catchment_class.
+
+    Raises
+    ------
+    ValueError
+        If any of the columns is missing, any area is not a number greater than zero
+        or any category is invalid.
+    """
+    missing = [column for column in ("area", "land_form", "land_cover") if column not in data]
+    if missing:
+        raise ValueError(f"Missing columns: {', '.join(missing)}")
+
+    area = pd.to_numeric(data["area"], errors="coerce").to_numpy(dtype=float)
+    invalid = ~(area > 0)
+    if invalid.any():
+        rows = ", ".join(str(row) for row in data.index[invalid][:10])
+        raise ValueError(
+            f"{invalid.sum()} rows have an invalid area (must be a number greater than zero), rows: {rows}"
+        )
+
+    parameters = default_parameters if parameters is None else parameters
+    results = get_fuzzy_results(data["land_form"], data["land_cover"], config)
+    subareas = parameters.get_subareas(results["catchment_class"])
+    infiltration = parameters.get_infiltration(data["land_cover"])
+
+    computed = pd.DataFrame(
+        data={
+            "Area": area,
+            "PercImperv": results["impervious"].round(2).to_numpy(),
+            "Width": np.round(np.sqrt(area * 10_000), 2),
+            "PercSlope": results["slope"].round(2).to_numpy(),
+            "CurbLength": 0,
+            **{column: subareas[column].to_numpy() for column in subareas},
+            "RouteTo": "OUTLET",
+            **{column: infiltration[column].to_numpy() for column in infiltration},
+            "catchment_class": results["catchment_class"].to_numpy(),
+        },
+        index=data.index,
+    )
+    return computed
+
+
+def get_square_coords(
+    subcatchment_ids: List[str], area: np.ndarray, origin: Tuple[float, float] = (0, 0)
+) -> pd.DataFrame:
+    """
+    Compute the coordinates of square-shaped subcatchments stacked downwards from the origin.
+
+    Every square starts at the last vertex of the previous one, so the last vertex of the result
+    is the origin of the next batch.
+
+    Parameters
+    ----------
+    subcatchment_ids : List[str]
+        IDs of the subcatchments.
+    area : np.ndarray
+        Areas of the subcatchments [ha].
+    origin : Tuple[float, float], optional
+        Top left corner of the first square, by default (0, 0).
+
+    Returns
+    -------
+    pd.DataFrame
+        Four vertices for every subcatchment, indexed by the subcatchment ID.
+    """
+    base_x, base_y = origin
+    side_length = np.sqrt(np.asarray(area, dtype=float) * 10_000)
+    top = base_y - np.concatenate(([0], np.cumsum(side_length)[:-1]))
+    x = np.column_stack(
+        [np.full_like(top, base_x), base_x + side_length, base_x + side_length, np.full_like(top, base_x)]
+    )
+    y = np.column_stack([top, top, top - side_length, top - side_length])
+    coords = pd.DataFrame(
+        data={"X": x.ravel(), "Y": y.ravel()},
+        index=pd.Index(np.repeat(subcatchment_ids, 4), name="Name"),
+    )
+    return coords
+
+
+def get_section_records(
+    parameters: pd.DataFrame,
+    raingage: Union[str, Sequence[str]],
+    outlet: Optional[Union[str, Sequence[str]]],
+    origin: Tuple[float, float] = (0, 0),
+    polygons: Optional[pd.DataFrame] = None,
+    tags: Optional[pd.DataFrame] = None,
+) -> Dict[str, pd.DataFrame]:
+    """
+    Split the computed parameters of new subcatchments into the rows of the INP sections.
+
+    Parameters
+    ----------
+    parameters : pd.DataFrame
+        Result of `compute_parameters`, indexed by the new subcatchment IDs.
+    raingage : Union[str, Sequence[str]]
+        Name of the raingage of the subcatchments, or one name per subcatchment.
+    outlet : Union[str, Sequence[str]], optional
+        Name of the outlet node, or one name per subcatchment. If None, every subcatchment
+        is its own outlet.
+    origin : Tuple[float, float], optional
+        Top left corner of the first square-shaped polygon, by default (0, 0).
+    polygons : pd.DataFrame, optional
+        Vertices (X and Y columns) of the subcatchments, indexed by the subcatchment ID.
+        By default square-shaped polygons are generated from the origin.
+    tags : pd.DataFrame, optional
+        Provenance tags of the subcatchments, see `get_tags`, written to [TAGS] if given.
+
+    Returns
+    -------
+    Dict[str, pd.DataFrame]
+        New rows of the [SUBCATCHMENTS], [SUBAREAS], [INFILTRATION] and [Polygons] sections
+        (and [TAGS]).
+    """
+    ids = parameters.index
+    if polygons is None:
+        polygons = get_square_coords(ids, parameters["Area"].to_numpy(), origin)
+    subcatchments = pd.DataFrame(
+        data={"Raingage": raingage, "Outlet": ids if outlet is None else outlet},
+        index=ids,
+    ).join(parameters[SUBCATCHMENTS_COLUMNS])
+    records = {
+        "[SUBCATCHMENTS]": subcatchments,
+        "[SUBAREAS]": parameters[SUBAREAS_COLUMNS],
+        "[INFILTRATION]": parameters[INFILTRATION_COLUMNS].rename_axis("Subcatchment"),
+        "[Polygons]": polygons,
+    }
+    if tags is not None:
+        records["[TAGS]"] = tags
+    return records
+
+
+def _update_rows(frame: pd.DataFrame, rows: pd.DataFrame) -> pd.DataFrame:
+    """Replace the columns of the rows of the frame aligned by the index, appending the missing rows."""
+    updated = frame.index.isin(rows.index)
+    frame = frame.copy()
+    for column in rows.columns:
+        # where upcasts the column if needed, e.g. integer to float
+        frame[column] = frame[column].where(~updated, rows[column].reindex(frame.index))
+    return pd.concat([frame, rows[~rows.index.isin(frame.index)].rename_axis(frame.index.name)])
+
 
 class BuildCatchments:
     """
@@ -21,7 +343,9 @@ class BuildCatchments:
 
     This class uses the `swmmio` library to load and manipulate SWMM models. It provides
     methods to generate new subcatchment IDs, add new subcatchments, and manage the
-    subcatchments in the model.
+    subcatchments in the model. The parsed sections are loaded from a `ParseCache` if one is
+    passed or the RCG_PARSE_CACHE_DIR environment variable is set, otherwise they are parsed over
+    a memory map of the file, see `load_inp_sections`.
 
     Attributes
     ----------
@@ -29,11 +353,65 @@ class BuildCatchments:
         The file path of the SWMM input file.
     model : swmmio.Model
         The SWMM model object loaded from the input file.
+    parameters : HydrologicParameters
+        Subarea and infiltration parameter tables used for the new subcatchments.
+    config : EngineConfig, optional
+        Configuration of the fuzzy engine used for the new subcatchments, by default the
+        precomputed lookup table of the default rules.
     """
 
-    def __init__(self, file_path: str) -> None:
+    def __init__(
+        self,
+        file_path: str,
+        parameters: Optional[HydrologicParameters] = None,
+        cache: Optional[ParseCache] = None,
+        config: Optional[EngineConfig] = None,
+    ) -> None:
         self.file = file_path
-        self.model = swmmio.Model(self.file)
+        cache = get_default_cache() if cache is None else cache
+        if cache is None:
+            self.model = swmmio.Model(self.file)
+            load_inp_sections(self.model.inp, CACHED_SECTIONS)
+        else:
+            self.model = cache.open(self.file)
+        self.parameters = default_parameters if parameters is None else parameters
+        self.config = config
+        self._outlet_index: Optional[OutletIndex] = None
+        self._raingage_index: Optional[RaingageIndex] = None
+
+    def iter_new_subcatchment_ids(self) -> Iterator[str]:
+        """
+        Yield unique subcatchment IDs, following the same 'S' + number scheme
+        as `_get_new_subcatchment_id`, for as long as they are requested.
+
+        Yields
+        ------
+        str
+            Unique subcatchment ID which doesn't exist in the model.
+        """
+        existing = set(self.model.inp.subcatchments.index)
+        number = len(self.model.inp.subcatchments) + 1
+        while True:
+            name = f"S{number}"
+            if name not in existing:
+                yield name
+            number += 1
+
+    def _get_new_subcatchment_ids(self, count: int) -> List[str]:
+        """
+        Generate `count` unique subcatchment IDs, see `iter_new_subcatchment_ids`.
+
+        Parameters
+        ----------
+        count : int
+            Number of IDs to generate.
+
+        Returns
+        -------
+        List[str]
+            Unique subcatchment IDs which don't exist in the model.
+        """
+        return list(itertools.islice(self.iter_new_subcatchment_ids(), count))
 
     def _get_new_subcatchment_id(self, counter: int = 1) -> str:
         """
@@ -156,8 +534,9 @@ class BuildCatchments:
         land_form = self._get_land_form()
         land_cover = self._get_land_cover()
         prototype_result = Prototype(
-            land_form=getattr(LandForm, land_form),
-            land_cover=getattr(LandCover, land_cover),
+            land_form=LandFormType[land_form],
+            land_cover=LandCoverType[land_cover],
+            fuzzy_engine=get_engine(self.config),
         )
         return area, prototype_result
 
@@ -264,6 +643,49 @@ class BuildCatchments:
             self._add_raingage()
         return self.model.inp.raingages.index[0]
 
+    def get_raingage_index(self) -> RaingageIndex:
+        """Return the KD-tree index of the raingages of the model, built on the first call."""
+        if self._raingage_index is None:
+            self._raingage_index = RaingageIndex.from_model(
+                self.model.inp.path, self.model.inp.raingages.index
+            )
+        return self._raingage_index
+
+    def get_raingages(
+        self, centroids: np.ndarray, raingages: str = "first"
+    ) -> Union[str, np.ndarray]:
+        """
+        Return the raingages of new subcatchments.
+
+        Parameters
+        ----------
+        centroids : np.ndarray
+            Centroids of the subcatchments, array of shape (subcatchments, 2).
+        raingages : str, optional
+            "first" assigns all subcatchments to the raingage of `_get_raingage`, "nearest" assigns
+            every subcatchment to the raingage with the nearest [SYMBOLS] coordinates (the Thiessen
+            polygon of the centroid), by default "first". Subcatchments which can't be assigned
+            get the raingage of `_get_raingage`.
+
+        Returns
+        -------
+        Union[str, np.ndarray]
+            The common raingage or the raingage of every subcatchment.
+
+        Raises
+        ------
+        ValueError
+            If the rule is unknown.
+        """
+        if raingages not in RAINGAGE_RULES:
+            raise ValueError(f"Unknown raingage rule: {raingages}, valid are: {', '.join(RAINGAGE_RULES)}")
+        default = self._get_raingage()
+        if raingages == "first":
+            return default
+        nearest = self.get_raingage_index().query(centroids)
+        nearest[pd.isna(nearest)] = default
+        return nearest
+
     def _get_outlet(self, subcatchment_id: str) -> Optional[str]:
         """
         Get the name of the first junction in the SWMM model's input data.
@@ -282,6 +704,59 @@ class BuildCatchments:
                 return self.model.inp.junctions.index[-1]
         return subcatchment_id
 
+    def get_outlet_index(self) -> OutletIndex:
+        """Return the KD-tree index of the nodes of the model, built on the first call."""
+        if self._outlet_index is None:
+            self._outlet_index = OutletIndex.from_model(self.model.inp)
+        return self._outlet_index
+
+    def get_outlets(
+        self,
+        subcatchment_ids: Sequence[str],
+        centroids: np.ndarray,
+        outlets: str = "last",
+        max_distance: Optional[float] = None,
+        node_types: Optional[Sequence[str]] = None,
+    ) -> Union[Optional[str], np.ndarray]:
+        """
+        Return the outlets of new subcatchments.
+
+        Parameters
+        ----------
+        subcatchment_ids : Sequence[str]
+            IDs of the subcatchments.
+        centroids : np.ndarray
+            Centroids of the subcatchments, array of shape (subcatchments, 2).
+        outlets : str, optional
+            "last" connects all subcatchments to the outlet of `_get_outlet`, "nearest" connects
+            every subcatchment to the nearest eligible node, by default "last".
+        max_distance : float, optional
+            Largest distance to the nearest node, subcatchments without a node in range get
+            the outlet of `_get_outlet`. By default unlimited.
+        node_types : Sequence[str], optional
+            Eligible node types, see `OutletIndex.query`.
+
+        Returns
+        -------
+        Union[Optional[str], np.ndarray]
+            The common outlet (None if every subcatchment is its own outlet) or the outlet
+            of every subcatchment.
+
+        Raises
+        ------
+        ValueError
+            If the rule or a node type is unknown.
+        """
+        if outlets not in OUTLET_RULES:
+            raise ValueError(f"Unknown outlet rule: {outlets}, valid are: {', '.join(OUTLET_RULES)}")
+        default = self._get_outlet(None)
+        if outlets == "last":
+            return default
+        nearest = self.get_outlet_index().query(centroids, max_distance, node_types)
+        missing = pd.isna(nearest)
+        nearest[missing] = default if default is not None else np.asarray(subcatchment_ids, dtype=object)[missing]
+        return nearest
+
     def _add_subcatchment(
         self, subcatchment_id: str, catchment_values: Tuple[float, Prototype]
     ) -> None:
@@ -340,35 +815,9 @@ class BuildCatchments:
         -------
         None
         """
-        map_mannings = {
-            "urban": (0.013, 0.15),
-            "suburban": (0.013, 0.24),
-            "rural": (0.013, 0.41),
-            "forests": (0.40, 0.80),
-            "meadows": (0.15, 0.41),
-            "arable": (0.06, 0.17),
-            "mountains": (0.013, 0.05),
-        }
-        map_depression = {
-            "urban": (0.05, 0.20, 50),
-            "suburban": (0.05, 0.20, 40),
-            "rural": (0.05, 0.20, 35),
-            "forests": (0.05, 0.30, 5),
-            "meadows": (0.05, 0.20, 10),
-            "arable": (0.05, 0.20, 10),
-            "mountains": (0.05, 0.20, 10),
-        }
-
-        populate_key = Prototype.get_populate(prototype.catchment_result)
-
-        self.model.inp.subareas.loc[subcatchment_id] = {
-            "N-Imperv": map_mannings[populate_key][0],
-            "N-Perv": map_mannings[populate_key][1],
-            "S-Imperv": map_depression[populate_key][0] * 25.4,
-            "S-Perv": map_depression[populate_key][1] * 25.4,
-            "PctZero": map_depression[populate_key][2],
-            "RouteTo": "OUTLET",
-        }
+        self.model.inp.subareas.loc[subcatchment_id] = get_subarea_values(
+            prototype.catchment_class, self.parameters
+        )
         replace_inp_section(self.model.inp.path, "[SUBAREAS]", self.model.inp.subareas)
 
     def _add_coords(self, subcatchment_id: str, area: float) -> None:
@@ -424,7 +873,9 @@ class BuildCatchments:
         except KeyError:
             raise KeyError(f"Subcatchment with name: {name} doesn't exist")
 
-    def _add_infiltration(self, subcatchment_id: str) -> None:
+    def _add_infiltration(
+        self, subcatchment_id: str, land_cover: Optional[str] = None
+    ) -> None:
         """
         Adds infiltration parameters for a given subcatchment to the model's input data.
 
@@ -432,19 +883,17 @@ class BuildCatchments:
         ----------
         subcatchment_id : str
             The name (ID) of the subcatchment.
+        land_cover : str, optional
+            Land cover of the subcatchment. If not given, the default infiltration parameters are used.
 
         Returns
         -------
         None
         """
-        infiltration_parameters = {
-            "Suction": 3.5,
-            "Ksat": 0.5,
-            "IMD": 0.25,
-            "Param4": 7,
-            "Param5": 0,
-        }
-        self.model.inp.infiltration.loc[subcatchment_id] = infiltration_parameters
+        infiltration = self.parameters.get_infiltration(
+            None if land_cover is None else [land_cover]
+        )
+        self.model.inp.infiltration.loc[subcatchment_id] = infiltration.iloc[0].to_dict()
         self.model.inp.infiltration.index.names = ["Subcatchment"]
         replace_inp_section(
             self.model.inp.path, "[INFILTRATION]", self.model.inp.infiltration
@@ -463,7 +912,381 @@ class BuildCatchments:
         self._add_subcatchment(subcatchment_id, catchment_values)
         self._add_subarea(subcatchment_id, catchment_values[1])
         self._add_coords(subcatchment_id, catchment_values[0])
-        self._add_infiltration(subcatchment_id)
+        self._add_infiltration(subcatchment_id, catchment_values[1].land_cover.name)
+
+    def add_subcatchments(
+        self,
+        data: pd.DataFrame,
+        outlets: str = "last",
+        max_distance: Optional[float] = None,
+        node_types: Optional[Sequence[str]] = None,
+        raingages: str = "first",
+        layout: str = "cascade",
+        aspect_ratio: float = 1.0,
+        gap: float = 0.0,
+    ) -> List[str]:
+        """
+        Adds many subcatchments to the project in one bulk operation.
+
+        All rows are validated first, the parameters are computed with `compute_parameters`
+        and the [SUBCATCHMENTS], [SUBAREAS], [INFILTRATION] and [Polygons] sections
+        (and [RAINGAGES]/[TIMESERIES] if they had to be created) are written in a single file write.
+
+        Parameters
+        ----------
+        data : pd.DataFrame
+            Table with the columns: area [ha], land_form and land_cover.
+        outlets : str, optional
+            Outlet rule, "last" or "nearest" (to the centroid of the polygon), see `get_outlets`.
+        max_distance : float, optional
+            Largest distance to the nearest node, see `get_outlets`.
+        node_types : Sequence[str], optional
+            Eligible node types of the nearest rule, see `OutletIndex.query`.
+        raingages : str, optional
+            Raingage rule, "first" or "nearest" (to the centroid of the polygon), see `get_raingages`.
+        layout : str, optional
+            Layout of the polygons, "cascade", "grid" or "shelf", see `get_polygons`.
+        aspect_ratio : float, optional
+            Width divided by the height of the polygons of the packed layouts, by default 1.
+        gap : float, optional
+            Distance between the polygons of the packed layouts, by default 0.
+
+        Returns
+        -------
+        List[str]
+            IDs of the added subcatchments, in the order of the rows.
+
+        Raises
+        ------
+        ValueError
+            If any row is invalid, see `validate_subcatchments`.
+        """
+        ids, sections = self._add_sections(
+            data, outlets, max_distance, node_types, raingages, layout, aspect_ratio, gap
+        )
+        self._write_sections(sections)
+        return ids
+
+    def _add_sections(
+        self,
+        data: pd.DataFrame,
+        outlets: str = "last",
+        max_distance: Optional[float] = None,
+        node_types: Optional[Sequence[str]] = None,
+        raingages: str = "first",
+        layout: str = "cascade",
+        aspect_ratio: float = 1.0,
+        gap: float = 0.0,
+    ) -> Tuple[List[str], Dict[str, pd.DataFrame]]:
+        """Add the subcatchments to the model in memory and return their IDs and the changed sections."""
+        data = validate_subcatchments(data)
+        if data.empty:
+            return [], {}
+
+        new_raingage = len(self.model.inp.raingages) == 0
+        new_timeseries = new_raingage and len(self.model.inp.timeseries) == 0
+        self._get_raingage()
+
+        ids = self._get_new_subcatchment_ids(len(data))
+        parameters = compute_parameters(data, self.parameters, self.config)
+        parameters.index = pd.Index(ids, name="Name")
+        polygons = self.get_polygons(ids, parameters["Area"].to_numpy(), layout, aspect_ratio, gap)
+        centroids = polygons.groupby(level=0, sort=False).mean().loc[ids].to_numpy()
+        outlet = self.get_outlets(ids, centroids, outlets, max_distance, node_types)
+        raingage = self.get_raingages(centroids, raingages)
+
+        rules_hash = get_rules_hash(self.parameters, self.config)
+        tags = get_tags(parameters.index, data["area"], data["land_form"], data["land_cover"], rules_hash)
+        records = get_section_records(parameters, raingage, outlet, polygons=polygons, tags=tags)
+
+        self.model.inp.subcatchments = pd.concat(
+            [self.model.inp.subcatchments, records["[SUBCATCHMENTS]"]]
+        )
+        self.model.inp.subareas = pd.concat(
+            [self.model.inp.subareas, records["[SUBAREAS]"]]
+        )
+        self.model.inp.infiltration = pd.concat(
+            [self.model.inp.infiltration, records["[INFILTRATION]"]]
+        )
+        self.model.inp.polygons = pd.concat(
+            [self.model.inp.polygons, records["[Polygons]"]]
+        )
+        self._set_tags(tags)
+
+        sections = {
+            "[SUBCATCHMENTS]": self.model.inp.subcatchments,
+            "[SUBAREAS]": self.model.inp.subareas,
+            "[INFILTRATION]": self.model.inp.infiltration,
+            "[Polygons]": self.model.inp.polygons,
+            "[TAGS]": self.model.inp.tags,
+        }
+        if new_raingage:
+            sections["[RAINGAGES]"] = self.model.inp.raingages
+        if new_timeseries:
+            sections["[TIMESERIES]"] = self.model.inp.timeseries
+        return ids, sections
+
+    def _write_sections(self, sections: Dict[str, pd.DataFrame]) -> None:
+        """Write the changed sections in a single file write, nothing if no section changed."""
+        if sections:
+            replace_inp_sections(self.model.inp.path, sections)
+
+    def _check_names(self, names: Sequence[str]) -> pd.Index:
+        """
+        Return the names as an index, checking that all of them are subcatchments of the model.
+
+        Raises
+        ------
+        KeyError
+            If any name is not a subcatchment of the model (all unknown names are listed).
+        """
+        names = pd.Index(names)
+        unknown = names[~names.isin(self.model.inp.subcatchments.index)]
+        if len(unknown) != 0:
+            raise KeyError(f"Subcatchments don't exist: {', '.join(map(str, unknown.unique()[:10]))}")
+        return names
+
+    def update_subcatchments(self, data: pd.DataFrame) -> List[str]:
+        """
+        Recompute the parameters of existing subcatchments in one bulk operation.
+
+        The rows are aligned by the subcatchment name and the parameters are computed with
+        `compute_parameters` and the current hydrologic parameter tables, so the whole model can be
+        regenerated after a change of the rules. The [SUBCATCHMENTS], [SUBAREAS] and [INFILTRATION]
+        rows and the provenance tags are replaced in a single file write. The raingage, the outlet and the polygon are kept,
+        as well as the width of the subcatchments whose area didn't change (it may come from
+        a real polygon, see `get_width`).
+
+        Parameters
+        ----------
+        data : pd.DataFrame
+            Table indexed by the subcatchment name with the columns: area [ha], land_form and land_cover.
+
+        Returns
+        -------
+        List[str]
+            Names of the updated subcatchments.
+
+        Raises
+        ------
+        KeyError
+            If any name is not a subcatchment of the model.
+        ValueError
+            If any row is invalid, see `validate_subcatchments`, or a name is repeated.
+        """
+        names, sections = self._update_sections(data, self.config)
+        self._write_sections(sections)
+        return names
+
+    def _update_sections(
+        self, data: pd.DataFrame, config: Optional[EngineConfig]
+    ) -> Tuple[List[str], Dict[str, pd.DataFrame]]:
+        """
+        Update the subcatchments in memory with the fuzzy results of the configuration and return
+        their names and the changed sections, see `update_subcatchments`.
+        """
+        names = self._check_names(data.index)
+        if names.has_duplicates:
+            raise ValueError(f"Repeated subcatchments: {', '.join(map(str, names[names.duplicated()].unique()[:10]))}")
+        data = validate_subcatchments(data)
+        if data.empty:
+            return [], {}
+
+        parameters = compute_parameters(data, self.parameters, config)
+        previous = self.model.inp.subcatchments.loc[names]
+        same_area = np.isclose(previous["Area"].to_numpy(dtype=float), parameters["Area"].to_numpy())
+        parameters.loc[same_area, "Width"] = previous["Width"].to_numpy()[same_area]
+
+        self.model.inp.subcatchments = _update_rows(
+            self.model.inp.subcatchments, parameters[SUBCATCHMENTS_COLUMNS]
+        )
+        self.model.inp.subareas = _update_rows(self.model.inp.subareas, parameters[SUBAREAS_COLUMNS])
+        self.model.inp.infiltration = _update_rows(
+            self.model.inp.infiltration, parameters[INFILTRATION_COLUMNS]
+        )
+        rules_hash = get_rules_hash(self.parameters, self.config)
+        self._set_tags(get_tags(names, data["area"], data["land_form"], data["land_cover"], rules_hash))
+        sections = {
+            "[SUBCATCHMENTS]": self.model.inp.subcatchments,
+            "[SUBAREAS]": self.model.inp.subareas,
+            "[INFILTRATION]": self.model.inp.infiltration,
+            "[TAGS]": self.model.inp.tags,
+        }
+        return list(names), sections
+
+    def _get_tags(self) -> pd.DataFrame:
+        """Return the [TAGS] section, empty if the model has none."""
+        with warnings.catch_warnings():
+            # swmmio warns about every section missing from the file
+            warnings.simplefilter("ignore", UserWarning)
+            return self.model.inp.tags
+
+    def _set_tags(self, tags: pd.DataFrame) -> None:
+        """Replace the tags of the subcatchments of `tags` (an object has a single tag) and add the new ones."""
+        existing = self._get_tags()
+        replaced = (existing.index == SUBCATCHMENT_TAG) & existing["Name"].isin(tags["Name"])
+        self.model.inp.tags = pd.concat([existing[~replaced], tags])
+
+    def rescore(self) -> List[str]:
+        """
+        Recompute the subcatchments whose provenance tags are stale.
+
+        A subcatchment is stale if the rule set (the fuzzy rules and memberships, the lookup table and
+        the hydrologic parameter tables) or its area changed since it was written, see `rcg.inp_manage.tags`.
+        All stale subcatchments are recomputed at once like with `update_subcatchments`, but always by
+        the batch engine of the live rules instead of the lookup table, the rest of the model
+        and subcatchments without a provenance tag are left as they are.
+
+        Returns
+        -------
+        List[str]
+            Names of the recomputed subcatchments.
+        """
+        tags = parse_tags(self._get_tags())
+        stale = get_stale(tags, self.model.inp.subcatchments, get_rules_hash(self.parameters, self.config))
+        if stale.empty:
+            return []
+        names, sections = self._update_sections(stale, EngineConfig() if self.config is None else self.config)
+        self._write_sections(sections)
+        return names
+
+    def remove_subcatchments(self, names: Sequence[str]) -> int:
+        """
+        Remove subcatchments and all their rows from the model in one bulk operation.
+
+        The rows of the subcatchments are dropped from [SUBCATCHMENTS], the sections of
+        SUBCATCHMENT_SECTIONS and [TAGS] and every changed section is written in a single file write.
+
+        Parameters
+        ----------
+        names : Sequence[str]
+            Names of the subcatchments.
+
+        Returns
+        -------
+        int
+            Number of removed subcatchments.
+
+        Raises
+        ------
+        KeyError
+            If any name is not a subcatchment of the model.
+        ValueError
+            If a subcatchment which is kept drains to a removed one.
+        """
+        count, sections = self._remove_sections(names)
+        self._write_sections(sections)
+        return count
+
+    def _remove_sections(self, names: Sequence[str]) -> Tuple[int, Dict[str, pd.DataFrame]]:
+        """Remove the subcatchments from the model in memory and return their number and the changed sections."""
+        names = self._check_names(names).unique()
+        if len(names) == 0:
+            return 0, {}
+        subcatchments = self.model.inp.subcatchments
+        removed = subcatchments.index.isin(names)
+        draining = subcatchments.index[~removed & subcatchments["Outlet"].isin(names)]
+        if len(draining) != 0:
+            raise ValueError(
+                f"Subcatchments drain to the removed ones: {', '.join(map(str, draining[:10]))}"
+            )
+
+        self.model.inp.subcatchments = subcatchments[~removed]
+        sections = {"[SUBCATCHMENTS]": self.model.inp.subcatchments}
+        with warnings.catch_warnings():
+            # swmmio warns about every section missing from the file
+            warnings.simplefilter("ignore", UserWarning)
+            for header, attribute in SUBCATCHMENT_SECTIONS.items():
+                frame = getattr(self.model.inp, attribute)
+                dropped = frame.index.isin(names)
+                if dropped.any():
+                    setattr(self.model.inp, attribute, frame[~dropped])
+                    sections[header] = getattr(self.model.inp, attribute)
+        tags = self._get_tags()
+        dropped = (tags.index == SUBCATCHMENT_TAG) & tags["Name"].isin(names)
+        if dropped.any():
+            self.model.inp.tags = tags[~dropped]
+            sections["[TAGS]"] = self.model.inp.tags
+        return len(names), sections
+
+    def _get_coords_origin(self) -> Tuple[float, float]:
+        """
+        Return the point the next square-shaped subcatchment starts at, the last polygon vertex
+        in the model or (0, 0) if there are no polygons.
+
+        Returns
+        -------
+        Tuple[float, float]
+            X and Y coordinates of the origin.
+        """
+        if len(self.model.inp.polygons) == 0:
+            return 0, 0
+        return self.model.inp.polygons["X"].iloc[-1], self.model.inp.polygons["Y"].iloc[-1]
+
+    def _get_square_coords(self, subcatchment_ids: List[str], area: np.ndarray) -> pd.DataFrame:
+        """
+        Compute the coordinates of square-shaped subcatchments, placed one after another
+        in the same way as consecutive `_add_coords` calls do.
+
+        Parameters
+        ----------
+        subcatchment_ids : List[str]
+            IDs of the subcatchments.
+        area : np.ndarray
+            Areas of the subcatchments [ha].
+
+        Returns
+        -------
+        pd.DataFrame
+            Four vertices for every subcatchment, indexed by the subcatchment ID.
+        """
+        return get_square_coords(subcatchment_ids, area, self._get_coords_origin())
+
+    def get_extent(self) -> Optional[Extent]:
+        """Return the bounding box of the polygons and nodes of the model, None if it is empty."""
+        return get_extent(self.model.inp.polygons, self.model.inp.coordinates)
+
+    def get_polygons(
+        self,
+        subcatchment_ids: List[str],
+        area: np.ndarray,
+        layout: str = "cascade",
+        aspect_ratio: float = 1.0,
+        gap: float = 0.0,
+    ) -> pd.DataFrame:
+        """
+        Compute the polygons of a batch of new subcatchments.
+
+        Parameters
+        ----------
+        subcatchment_ids : List[str]
+            IDs of the subcatchments.
+        area : np.ndarray
+            Areas of the subcatchments [ha].
+        layout : str, optional
+            "cascade" stacks squares from the last polygon vertex like `_add_coords`, "grid" and
+            "shelf" pack rectangles next to the extent of the model, see `layout_polygons`.
+            By default "cascade".
+        aspect_ratio : float, optional
+            Width divided by the height of the rectangles of the packed layouts, by default 1.
+        gap : float, optional
+            Distance between the rectangles of the packed layouts, by default 0.
+
+        Returns
+        -------
+        pd.DataFrame
+            Four vertices for every subcatchment, indexed by the subcatchment ID.
+
+        Raises
+        ------
+        ValueError
+            If the layout is unknown or the aspect ratio is not positive.
+        """
+        if layout not in LAYOUTS:
+            raise ValueError(f"Unknown layout: {layout}, valid are: {', '.join(LAYOUTS)}")
+        if layout == "cascade":
+            return self._get_square_coords(subcatchment_ids, area)
+        return layout_polygons(subcatchment_ids, area, self.get_extent(), layout, aspect_ratio, gap)
 
     def add_subcatchment_form_gui(
         self, area: float, land_form: str, land_cover: str
@@ -477,12 +1300,12 @@ class BuildCatchments:
         """
         subcatchment_id = self._get_new_subcatchment_id()
         prototype_result = Prototype(
-            land_form=getattr(LandForm, land_form),
-            land_cover=getattr(LandCover, land_cover),
+            land_form=LandFormType[land_form],
+            land_cover=LandCoverType[land_cover],
+            fuzzy_engine=get_engine(self.config),
         )
         catchment_values = (area, prototype_result)
         self._add_subcatchment(subcatchment_id, catchment_values)
         self._add_subarea(subcatchment_id, catchment_values[1])
         self._add_coords(subcatchment_id, area)
-        self._add_infiltration(subcatchment_id)
-        self._add_infiltration(subcatchment_id)
+        self._add_infiltration(subcatchment_id, land_cover)
@@ -0,0 +1,232 @@
+"""
+The module contains the layout of the polygons of synthetic subcatchments.
+
+Subcatchments added without a geometry get rectangular polygons of their area. The "cascade" layout
+of `get_square_coords` stacks the squares one under another from the last polygon vertex of the
+model, so consecutive batches drift away diagonally. The packed layouts place a whole batch in a
+compact block to the right of the extent of the model instead, without overlapping the model or each
+other:
+
+- "grid" puts every rectangle in a cell of the size of the largest one, row by row,
+- "shelf" sorts the rectangles by height and fills rows (shelves) of the width of a square block.
+
+The offsets of all rectangles are computed with array operations, the shelf packing only loops
+over the shelves.
+
+Example::
+
+    extent = get_extent(model.inp.polygons, model.inp.coordinates)
+    polygons = layout_polygons(ids, area, extent, layout="shelf", gap=10)
+"""
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+Extent = Tuple[float, float, float, float]
+
+
+def get_rectangle_sizes(area: np.ndarray, aspect_ratio: float = 1.0) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute the sides of rectangles of the given areas.
+
+    Parameters
+    ----------
+    area : np.ndarray
+        Areas of the rectangles [ha].
+    aspect_ratio : float, optional
+        Width divided by the height, by default 1 (squares).
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        Widths and heights of the rectangles [m].
+
+    Raises
+    ------
+    ValueError
+        If the aspect ratio is not positive.
+    """
+    if not aspect_ratio > 0:
+        raise ValueError(f"The aspect ratio must be positive, got {aspect_ratio}")
+    area = np.asarray(area, dtype=float) * 10_000
+    width = np.sqrt(area * aspect_ratio)
+    return width, area / np.where(width > 0, width, 1)
+
+
+def pack_grid(widths: np.ndarray, heights: np.ndarray, gap: float = 0.0) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Place the rectangles in the cells of a regular grid, row by row in the input order.
+
+    The cells have the size of the largest rectangle and the number of columns makes the block
+    roughly square.
+
+    Parameters
+    ----------
+    widths : np.ndarray
+        Widths of the rectangles.
+    heights : np.ndarray
+        Heights of the rectangles.
+    gap : float, optional
+        Distance between the cells, by default 0.
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        Offsets of the top left corners from the top left corner of the block, to the right
+        and downwards.
+    """
+    count = len(widths)
+    cell_width = np.max(widths, initial=0) + gap
+    cell_height = np.max(heights, initial=0) + gap
+    columns = max(1, int(np.ceil(np.sqrt(count * cell_height / cell_width)))) if cell_width > 0 else 1
+    rows, column = np.divmod(np.arange(count), columns)
+    return column * cell_width, rows * cell_height
+
+
+def pack_shelves(
+    widths: np.ndarray, heights: np.ndarray, gap: float = 0.0, max_width: Optional[float] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Place the rectangles on shelves, the tallest first (next fit decreasing height).
+
+    Every shelf is filled from the left until the next rectangle doesn't fit into the block width,
+    its height is the height of its first (tallest) rectangle.
+
+    Parameters
+    ----------
+    widths : np.ndarray
+        Widths of the rectangles.
+    heights : np.ndarray
+        Heights of the rectangles.
+    gap : float, optional
+        Distance between the rectangles, by default 0.
+    max_width : float, optional
+        Width of the block, by default the side of a square of the total area (or the widest
+        rectangle if it is wider).
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        Offsets of the top left corners from the top left corner of the block, to the right
+        and downwards.
+    """
+    widths = np.asarray(widths, dtype=float)
+    heights = np.asarray(heights, dtype=float)
+    count = len(widths)
+    x = np.zeros(count)
+    y = np.zeros(count)
+    if count == 0:
+        return x, y
+    order = np.argsort(-heights, kind="stable")
+    spans = widths[order] + gap
+    if max_width is None:
+        max_width = np.sqrt(np.sum(spans * (heights[order] + gap)))
+    max_width = max(max_width, spans.max())
+
+    # the end of the span of every rectangle measured from the first one
+    ends = np.cumsum(spans)
+    starts = [0]
+    while starts[-1] < count:
+        start = starts[-1]
+        offset = ends[start - 1] if start else 0.0
+        # at least one rectangle per shelf, also if rounding makes the widest one not fit
+        stop = np.searchsorted(ends, offset + max_width * (1 + 1e-12), side="right")
+        starts.append(max(stop, start + 1))
+    starts = np.asarray(starts)
+    sizes = np.diff(starts)
+    shelf = np.repeat(np.arange(len(sizes)), sizes)
+    shelf_offsets = np.concatenate(([0.0], ends))[starts[:-1]]
+    shelf_heights = heights[order][starts[:-1]] + gap
+    shelf_tops = np.concatenate(([0.0], np.cumsum(shelf_heights)[:-1]))
+
+    x[order] = ends - spans - shelf_offsets[shelf]
+    y[order] = shelf_tops[shelf]
+    return x, y
+
+
+PACKINGS: Dict[str, Callable[..., Tuple[np.ndarray, np.ndarray]]] = {"grid": pack_grid, "shelf": pack_shelves}
+LAYOUTS = ("cascade",) + tuple(PACKINGS)
+
+
+def get_extent(*coordinates: pd.DataFrame) -> Optional[Extent]:
+    """
+    Return the bounding box of the X and Y columns of the tables.
+
+    Parameters
+    ----------
+    *coordinates : pd.DataFrame
+        Tables with the X and Y columns, e.g. [Polygons] and [COORDINATES].
+
+    Returns
+    -------
+    Extent, optional
+        Minimum X, minimum Y, maximum X and maximum Y, None if there are no coordinates.
+    """
+    points = [table[["X", "Y"]].to_numpy(dtype=float) for table in coordinates if len(table) != 0]
+    if not points:
+        return None
+    points = np.concatenate(points)
+    points = points[np.isfinite(points).all(axis=1)]
+    if len(points) == 0:
+        return None
+    (min_x, min_y), (max_x, max_y) = points.min(axis=0), points.max(axis=0)
+    return min_x, min_y, max_x, max_y
+
+
+def layout_polygons(
+    subcatchment_ids: Sequence[str],
+    area: np.ndarray,
+    extent: Optional[Extent] = None,
+    layout: str = "shelf",
+    aspect_ratio: float = 1.0,
+    gap: float = 0.0,
+) -> pd.DataFrame:
+    """
+    Compute the polygons of a batch of rectangular subcatchments packed next to the model extent.
+
+    The block starts at the top of the extent, `gap` to the right of it, or at (0, 0) if the
+    extent is None.
+
+    Parameters
+    ----------
+    subcatchment_ids : Sequence[str]
+        IDs of the subcatchments.
+    area : np.ndarray
+        Areas of the subcatchments [ha].
+    extent : Extent, optional
+        Bounding box the block is placed next to, see `get_extent`.
+    layout : str, optional
+        Packing, "grid" or "shelf", by default "shelf".
+    aspect_ratio : float, optional
+        Width divided by the height of the rectangles, by default 1 (squares).
+    gap : float, optional
+        Distance between the rectangles and from the extent, by default 0.
+
+    Returns
+    -------
+    pd.DataFrame
+        Four vertices for every subcatchment (clockwise from the top left corner), indexed
+        by the subcatchment ID.
+
+    Raises
+    ------
+    ValueError
+        If the layout is unknown or the aspect ratio is not positive.
+    """
+    if layout not in PACKINGS:
+        raise ValueError(f"Unknown layout: {layout}, valid are: {', '.join(PACKINGS)}")
+    widths, heights = get_rectangle_sizes(area, aspect_ratio)
+    offset_x, offset_y = PACKINGS[layout](widths, heights, gap)
+    if extent is None:
+        base_x, base_y = 0.0, 0.0
+    else:
+        base_x, base_y = extent[2] + gap, extent[3]
+    left = base_x + offset_x
+    top = base_y - offset_y
+    x = np.column_stack([left, left + widths, left + widths, left])
+    y = np.column_stack([top, top, top - heights, top - heights])
+    return pd.DataFrame(
+        data={"X": x.ravel(), "Y": y.ravel()},
+        index=pd.Index(np.repeat(np.asarray(subcatchment_ids, dtype=object), 4), name="Name"),
+    )
@@ -0,0 +1,128 @@
+"""
+The module contains the assignment of the outlets of new subcatchments to the nearest nodes.
+
+By default every new subcatchment drains to the last outfall (or the last junction) of the model,
+wherever it is. With the nearest assignment the centroid of every subcatchment is connected to the
+closest node of [COORDINATES] of the eligible types instead. A KD-tree is built once per model and
+node type, and all centroids of a chunk are queried at once, optionally within a maximum distance;
+subcatchments without a node in range keep the default outlet.
+
+Example::
+
+    index = OutletIndex.from_model(model.model.inp)
+    outlets = index.query(centroids, max_distance=500, node_types=["junction"])
+"""
+import warnings
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from scipy.spatial import KDTree
+
+# node types by the name of the swmmio section
+NODE_TYPES = {"junction": "junctions", "outfall": "outfalls", "storage": "storage", "divider": "dividers"}
+DEFAULT_NODE_TYPES = ("junction", "outfall")
+OUTLET_RULES = ("last", "nearest")
+
+
+class OutletIndex:
+    """
+    OutletIndex holds a KD-tree of the nodes of every type.
+
+    Attributes
+    ----------
+    names : Dict[str, np.ndarray]
+        Names of the nodes by node type.
+    trees : Dict[str, KDTree]
+        KD-tree of the coordinates of the nodes by node type.
+    """
+
+    def __init__(self, nodes: pd.DataFrame) -> None:
+        """
+        Build the KD-trees.
+
+        Parameters
+        ----------
+        nodes : pd.DataFrame
+            Table indexed by the node name with the columns: X, Y and type (see NODE_TYPES).
+        """
+        self.names: Dict[str, np.ndarray] = {}
+        self.trees: Dict[str, KDTree] = {}
+        for node_type, group in nodes.groupby("type", sort=False):
+            self.names[node_type] = group.index.to_numpy(dtype=object)
+            self.trees[node_type] = KDTree(group[["X", "Y"]].to_numpy(dtype=float))
+
+    @classmethod
+    def from_model(cls, inp) -> "OutletIndex":
+        """
+        Build the index of the nodes of a model.
+
+        Parameters
+        ----------
+        inp : swmmio.core.inp
+            Input data of the model, `swmmio.Model(...).inp`.
+
+        Returns
+        -------
+        OutletIndex
+            Index of the junctions, outfalls, storage units and dividers with coordinates.
+        """
+        coordinates = inp.coordinates
+        types = pd.Series(dtype=object)
+        with warnings.catch_warnings():
+            # swmmio warns about every node section missing from the file
+            warnings.simplefilter("ignore", UserWarning)
+            for node_type, section in NODE_TYPES.items():
+                index = getattr(inp, section).index
+                types = pd.concat([types, pd.Series(node_type, index=index, dtype=object)])
+        nodes = coordinates.join(types.rename("type"), how="inner")
+        return cls(nodes[["X", "Y", "type"]])
+
+    def query(
+        self,
+        points: np.ndarray,
+        max_distance: Optional[float] = None,
+        node_types: Optional[Sequence[str]] = None,
+    ) -> np.ndarray:
+        """
+        Return the nearest eligible node of every point.
+
+        Parameters
+        ----------
+        points : np.ndarray
+            Coordinates of the points, array of shape (points, 2).
+        max_distance : float, optional
+            Largest distance to a node, by default unlimited.
+        node_types : Sequence[str], optional
+            Eligible node types, see NODE_TYPES, by default junctions and outfalls.
+
+        Returns
+        -------
+        np.ndarray
+            Name of the nearest node of every point, None if there is no node in range
+            or the point is not finite.
+
+        Raises
+        ------
+        ValueError
+            If a node type is unknown.
+        """
+        node_types = DEFAULT_NODE_TYPES if node_types is None else node_types
+        unknown = [node_type for node_type in node_types if node_type not in NODE_TYPES]
+        if unknown:
+            raise ValueError(f"Unknown node types: {', '.join(unknown)}, valid are: {', '.join(NODE_TYPES)}")
+
+        points = np.asarray(points, dtype=float).reshape(-1, 2)
+        finite = np.isfinite(points).all(axis=1)
+        bound = np.inf if max_distance is None else max_distance
+        result = np.full(len(points), None, dtype=object)
+        best = np.full(len(points), np.inf)
+        for node_type in node_types:
+            if node_type not in self.trees:
+                continue
+            distance, position = self.trees[node_type].query(points[finite], distance_upper_bound=bound)
+            closer = distance < best[finite]
+            rows = np.flatnonzero(finite)[closer]
+            best[rows] = distance[closer]
+            result[rows] = self.names[node_type][position[closer]]
+        return result
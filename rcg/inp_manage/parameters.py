@@ -0,0 +1,285 @@
+"""
+The module contains the hydrologic parameter tables used for new subcatchments.
+
+The subarea parameters (Manning's coefficients, depression storage and PctZero) are defined per
+catchment class and the infiltration parameters per land cover. The tables can be loaded from
+a JSON file, are validated once and are kept as arrays, so the parameters of any number of
+subcatchments are gathered with a single indexing operation.
+
+Example of a configuration file (every section and entry is optional, missing values
+fall back to the defaults)::
+
+    {
+        "subareas": {
+            "urban": {"N-Imperv": 0.015, "N-Perv": 0.15, "S-Imperv": 1.5, "S-Perv": 5.0, "PctZero": 50}
+        },
+        "infiltration": {
+            "default": {"Suction": 3.5, "Ksat": 0.5, "IMD": 0.25, "Param4": 7, "Param5": 0},
+            "forests": {"Ksat": 1.2}
+        }
+    }
+"""
+import json
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from rcg.fuzzy.categories import CatchmentType, LandCoverType
+
+# Manning's coefficients (N-Imperv, N-Perv) for each catchment class.
+MAP_MANNINGS = {
+    "urban": (0.013, 0.15),
+    "suburban": (0.013, 0.24),
+    "rural": (0.013, 0.41),
+    "forests": (0.40, 0.80),
+    "meadows": (0.15, 0.41),
+    "arable": (0.06, 0.17),
+    "mountains": (0.013, 0.05),
+}
+# Depression storage (S-Imperv, S-Perv) [in] and PctZero [%] for each catchment class.
+MAP_DEPRESSION = {
+    "urban": (0.05, 0.20, 50),
+    "suburban": (0.05, 0.20, 40),
+    "rural": (0.05, 0.20, 35),
+    "forests": (0.05, 0.30, 5),
+    "meadows": (0.05, 0.20, 10),
+    "arable": (0.05, 0.20, 10),
+    "mountains": (0.05, 0.20, 10),
+}
+# Green-Ampt infiltration parameters used for every new subcatchment.
+INFILTRATION_PARAMETERS = {
+    "Suction": 3.5,
+    "Ksat": 0.5,
+    "IMD": 0.25,
+    "Param4": 7,
+    "Param5": 0,
+}
+
+SUBAREA_PARAMETERS = ["N-Imperv", "N-Perv", "S-Imperv", "S-Perv", "PctZero"]
+INFILTRATION_COLUMNS = list(INFILTRATION_PARAMETERS)
+
+
+class HydrologicParameters:
+    """
+    HydrologicParameters holds the subarea parameters per catchment class and the infiltration
+    parameters per land cover.
+
+    Attributes
+    ----------
+    subareas : np.ndarray
+        Array of shape (number of catchment classes, 5) with the N-Imperv, N-Perv, S-Imperv [mm],
+        S-Perv [mm] and PctZero values, rows in the order of CatchmentType.
+    infiltration : np.ndarray
+        Array of shape (number of land covers, 5) with the infiltration parameters,
+        rows in the order of LandCoverType.
+    default_infiltration : np.ndarray
+        Array of shape (5,) with the infiltration parameters used when the land cover is unknown.
+    """
+
+    def __init__(
+        self, subareas: np.ndarray, infiltration: np.ndarray, default_infiltration: Optional[np.ndarray] = None
+    ) -> None:
+        self.subareas = np.array(subareas, dtype=float)
+        self.infiltration = np.array(infiltration, dtype=float)
+        if default_infiltration is None:
+            default_infiltration = [INFILTRATION_PARAMETERS[key] for key in INFILTRATION_COLUMNS]
+        self.default_infiltration = np.array(default_infiltration, dtype=float)
+        errors = self._validate_arrays()
+        if errors:
+            raise ValueError("\n".join(errors))
+        self.subareas.setflags(write=False)
+        self.infiltration.setflags(write=False)
+        self.default_infiltration.setflags(write=False)
+
+    def _validate_arrays(self) -> List[str]:
+        """Return the list of problems found in the parameter arrays."""
+        errors = []
+        expected = {
+            "subareas": (self.subareas, (len(CatchmentType), len(SUBAREA_PARAMETERS))),
+            "infiltration": (self.infiltration, (len(LandCoverType), len(INFILTRATION_COLUMNS))),
+            "default_infiltration": (self.default_infiltration, (len(INFILTRATION_COLUMNS),)),
+        }
+        for name, (array, shape) in expected.items():
+            if array.shape != shape:
+                errors.append(f"{name} must have the shape {shape}, got {array.shape}")
+            elif not np.isfinite(array).all() or (array < 0).any():
+                errors.append(f"{name} must contain finite, non-negative numbers")
+        if not errors and (self.subareas[:, SUBAREA_PARAMETERS.index("PctZero")] > 100).any():
+            errors.append("PctZero must be between 0 and 100")
+        return errors
+
+    @classmethod
+    def default(cls) -> "HydrologicParameters":
+        """Return the default parameter tables (MAP_MANNINGS, MAP_DEPRESSION, INFILTRATION_PARAMETERS)."""
+        return cls.from_dict({})
+
+    @classmethod
+    def from_dict(cls, config: dict) -> "HydrologicParameters":
+        """
+        Build the parameter tables from a configuration dictionary.
+
+        Missing catchment classes, land covers and parameters fall back to the defaults.
+
+        Parameters
+        ----------
+        config : dict
+            Dictionary with the optional "subareas" (per catchment class) and "infiltration"
+            (per land cover, with an optional "default" entry for all land covers) sections.
+
+        Returns
+        -------
+        HydrologicParameters
+            Validated parameter tables.
+
+        Raises
+        ------
+        ValueError
+            If the configuration contains unknown sections, classes, land covers or parameters,
+            or any value is invalid. All problems are reported at once.
+        """
+        errors = []
+        unknown = set(config) - {"subareas", "infiltration"}
+        if unknown:
+            errors.append(f"Unknown sections: {', '.join(sorted(unknown))}")
+
+        subareas = {
+            name: {
+                "N-Imperv": MAP_MANNINGS[name][0],
+                "N-Perv": MAP_MANNINGS[name][1],
+                "S-Imperv": MAP_DEPRESSION[name][0] * 25.4,
+                "S-Perv": MAP_DEPRESSION[name][1] * 25.4,
+                "PctZero": MAP_DEPRESSION[name][2],
+            }
+            for name in CatchmentType.names()
+        }
+        for name, values in config.get("subareas", {}).items():
+            if name not in subareas:
+                errors.append(f"Unknown catchment class: {name}")
+                continue
+            errors.extend(cls._update(subareas[name], values, f"subareas.{name}"))
+
+        infiltration_config = dict(config.get("infiltration", {}))
+        default_infiltration = dict(INFILTRATION_PARAMETERS)
+        errors.extend(
+            cls._update(default_infiltration, infiltration_config.pop("default", {}), "infiltration.default")
+        )
+        infiltration = {name: dict(default_infiltration) for name in LandCoverType.names()}
+        for name, values in infiltration_config.items():
+            if name not in infiltration:
+                errors.append(f"Unknown land cover: {name}")
+                continue
+            errors.extend(cls._update(infiltration[name], values, f"infiltration.{name}"))
+
+        if errors:
+            raise ValueError("\n".join(errors))
+        return cls(
+            subareas=[[subareas[name][key] for key in SUBAREA_PARAMETERS] for name in CatchmentType.names()],
+            infiltration=[
+                [infiltration[name][key] for key in INFILTRATION_COLUMNS] for name in LandCoverType.names()
+            ],
+            default_infiltration=[default_infiltration[key] for key in INFILTRATION_COLUMNS],
+        )
+
+    @staticmethod
+    def _update(target: Dict[str, float], values: dict, path: str) -> List[str]:
+        """Update the target parameters with the given values and return the list of problems."""
+        if not isinstance(values, dict):
+            return [f"{path} must be a mapping of parameter names to values"]
+        errors = []
+        for key, value in values.items():
+            if key not in target:
+                errors.append(f"Unknown parameter {path}.{key}")
+            elif isinstance(value, bool) or not isinstance(value, (int, float)):
+                errors.append(f"{path}.{key} must be a number, got {value!r}")
+            else:
+                target[key] = value
+        return errors
+
+    @classmethod
+    def from_file(cls, path: str) -> "HydrologicParameters":
+        """
+        Load the parameter tables from a JSON configuration file, see `from_dict`.
+
+        Parameters
+        ----------
+        path : str
+            Path to the JSON file.
+
+        Returns
+        -------
+        HydrologicParameters
+            Validated parameter tables.
+        """
+        with open(path) as file:
+            return cls.from_dict(json.load(file))
+
+    def to_dict(self) -> dict:
+        """Return the full parameter tables as a configuration dictionary."""
+        return {
+            "subareas": {
+                name: dict(zip(SUBAREA_PARAMETERS, row.tolist()))
+                for name, row in zip(CatchmentType.names(), self.subareas)
+            },
+            "infiltration": {
+                "default": dict(zip(INFILTRATION_COLUMNS, self.default_infiltration.tolist())),
+                **{
+                    name: dict(zip(INFILTRATION_COLUMNS, row.tolist()))
+                    for name, row in zip(LandCoverType.names(), self.infiltration)
+                },
+            },
+        }
+
+    def save(self, path: str) -> None:
+        """
+        Save the full parameter tables as a JSON configuration file.
+
+        Parameters
+        ----------
+        path : str
+            Destination of the JSON file.
+        """
+        with open(path, "w") as file:
+            json.dump(self.to_dict(), file, indent=4)
+
+    def get_subareas(self, catchment_class: Iterable) -> pd.DataFrame:
+        """
+        Return the subarea parameters of many subcatchments in one join.
+
+        Parameters
+        ----------
+        catchment_class : Iterable
+            Catchment class names or CatchmentType codes.
+
+        Returns
+        -------
+        pd.DataFrame
+            Table with the N-Imperv, N-Perv, S-Imperv, S-Perv and PctZero columns, one row per input.
+        """
+        position = np.searchsorted(CatchmentType.codes(), CatchmentType.encode(catchment_class))
+        return pd.DataFrame(self.subareas[position], columns=SUBAREA_PARAMETERS)
+
+    def get_infiltration(self, land_cover: Optional[Iterable] = None, size: int = 1) -> pd.DataFrame:
+        """
+        Return the infiltration parameters of many subcatchments in one join.
+
+        Parameters
+        ----------
+        land_cover : Iterable, optional
+            Land cover names or LandCoverType codes. If not given, the default parameters
+            (set for all land covers in the configuration) are returned `size` times.
+        size : int, optional
+            Number of rows returned when no land cover is given, by default 1.
+
+        Returns
+        -------
+        pd.DataFrame
+            Table with the infiltration parameter columns, one row per input.
+        """
+        if land_cover is None:
+            return pd.DataFrame(np.tile(self.default_infiltration, (size, 1)), columns=INFILTRATION_COLUMNS)
+        position = np.searchsorted(LandCoverType.codes(), LandCoverType.encode(land_cover))
+        return pd.DataFrame(self.infiltration[position], columns=INFILTRATION_COLUMNS)
+
+
+default_parameters = HydrologicParameters.default()
@@ -0,0 +1,119 @@
+"""
+The module contains the assignment of new subcatchments to the nearest raingage.
+
+By default every new subcatchment gets the first raingage of the model. In models with many gages
+the centroid of every subcatchment can be assigned to the closest gage of [SYMBOLS] instead, which
+is the gage of the Thiessen polygon the centroid lies in. A KD-tree of the gage coordinates is built
+once per model and all centroids of a chunk are queried at once; subcatchments which can't be
+assigned (no gage has coordinates or the centroid is not finite) keep the first raingage.
+
+Example::
+
+    index = RaingageIndex.from_model(model.model.inp.path, model.model.inp.raingages.index)
+    raingages = index.query(centroids)
+"""
+from typing import Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from scipy.spatial import KDTree
+
+from rcg.inp_manage.sections import read_inp_section
+
+RAINGAGE_RULES = ("first", "nearest")
+
+
+def read_symbols(inp_path: str) -> pd.DataFrame:
+    """
+    Read the coordinates of the raingages from the [SYMBOLS] section of an INP file.
+
+    swmmio doesn't split the [SYMBOLS] section into columns, so the section is parsed here.
+
+    Parameters
+    ----------
+    inp_path : str
+        Path to the INP file.
+
+    Returns
+    -------
+    pd.DataFrame
+        Table indexed by the raingage name (Name) with the columns X and Y.
+    """
+    rows = [values[:3] for values in read_inp_section(inp_path, "[SYMBOLS]") if len(values) >= 3]
+    symbols = pd.DataFrame(rows, columns=["Name", "X", "Y"]).set_index("Name")
+    return symbols.astype(float)
+
+
+class RaingageIndex:
+    """
+    RaingageIndex holds a KD-tree of the raingage coordinates.
+
+    Attributes
+    ----------
+    names : np.ndarray
+        Names of the raingages.
+    tree : KDTree, optional
+        KD-tree of the coordinates of the raingages, None if there are no raingages.
+    """
+
+    def __init__(self, symbols: pd.DataFrame) -> None:
+        """
+        Build the KD-tree.
+
+        Parameters
+        ----------
+        symbols : pd.DataFrame
+            Table indexed by the raingage name with the columns X and Y.
+        """
+        self.names = symbols.index.to_numpy(dtype=object)
+        self.tree: Optional[KDTree] = None
+        if len(symbols) != 0:
+            self.tree = KDTree(symbols[["X", "Y"]].to_numpy(dtype=float))
+
+    @classmethod
+    def from_model(cls, inp_path: str, raingages: Optional[Sequence[str]] = None) -> "RaingageIndex":
+        """
+        Build the index of the raingages of a model.
+
+        Parameters
+        ----------
+        inp_path : str
+            Path to the INP file.
+        raingages : Sequence[str], optional
+            Names of the raingages of the [RAINGAGES] section, symbols of other names are skipped.
+            By default all symbols are used.
+
+        Returns
+        -------
+        RaingageIndex
+            Index of the raingages with coordinates.
+        """
+        symbols = read_symbols(inp_path)
+        symbols = symbols[~symbols.index.duplicated()]
+        if raingages is not None:
+            symbols = symbols[symbols.index.isin(raingages)]
+        return cls(symbols)
+
+    def query(self, points: np.ndarray) -> np.ndarray:
+        """
+        Return the nearest raingage of every point.
+
+        Parameters
+        ----------
+        points : np.ndarray
+            Coordinates of the points, array of shape (points, 2).
+
+        Returns
+        -------
+        np.ndarray
+            Name of the nearest raingage of every point, None if there are no raingages
+            or the point is not finite.
+        """
+        points = np.asarray(points, dtype=float).reshape(-1, 2)
+        result = np.full(len(points), None, dtype=object)
+        if self.tree is None:
+            return result
+        finite = np.isfinite(points).all(axis=1)
+        _, position = self.tree.query(points[finite])
+        result[finite] = self.names[position]
+        return result
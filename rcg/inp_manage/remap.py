@@ -0,0 +1,410 @@
+"""
+The module contains the remapping of land cover classification codes to the LandCoverType codes.
+
+Input data usually follow a standard classification (CORINE Land Cover, Urban Atlas or a national
+scheme) rather than the land covers of the RCG. A remap table assigns every source code a land cover
+name (or code) or a mix of land covers with shares, e.g. a complex cultivation pattern split between
+arable land and meadows. The table is compiled into NumPy arrays indexed by the source code, so raster
+tiles and attribute columns are translated in one indexing step.
+
+Codes missing from the table are not reported one by one: `RemapTable.unmapped` counts every distinct
+unmapped code and `remap` with errors="raise" lists all of them in one message. The built-in CORINE
+and Urban Atlas tables leave the water classes unmapped, as there is no matching land cover.
+
+Example of a table file in JSON (a mix is given as shares of land covers)::
+
+    {
+        "111": "urban_highly_impervious",
+        "243": {"arable": 0.5, "meadows": 0.25, "forests": 0.25}
+    }
+
+or in CSV with the columns code, land_cover and an optional share.
+
+Example::
+
+    table = get_remap_table("corine")
+    table.unmapped(codes)
+    land_cover = table.remap(codes, errors="ignore")
+"""
+import json
+import os
+from functools import lru_cache
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from rcg.fuzzy.categories import LandCoverType
+
+Target = Union[str, int, Mapping[Union[str, int], float]]
+
+CORINE = {
+    111: "urban_highly_impervious",
+    112: "urban_weakly_impervious",
+    121: "urban_highly_impervious",
+    122: "urban_highly_impervious",
+    123: "urban_highly_impervious",
+    124: "urban_moderately_impervious",
+    131: "permeable_areas",
+    132: "permeable_areas",
+    133: "permeable_areas",
+    141: "meadows",
+    142: "meadows",
+    211: "arable",
+    212: "arable",
+    213: "marshes",
+    221: "arable",
+    222: "arable",
+    223: "arable",
+    231: "meadows",
+    241: "arable",
+    242: "rural",
+    243: {"arable": 0.5, "meadows": 0.25, "forests": 0.25},
+    244: "forests",
+    311: "forests",
+    312: "forests",
+    313: "forests",
+    321: "meadows",
+    322: "meadows",
+    323: "permeable_terrain_on_plains",
+    324: "forests",
+    331: "permeable_areas",
+    332: "mountains_rocky",
+    333: "mountains_vegetated",
+    334: "permeable_terrain_on_plains",
+    335: "mountains_rocky",
+    411: "marshes",
+    412: "marshes",
+    421: "marshes",
+    422: "marshes",
+    423: "marshes",
+}
+URBAN_ATLAS = {
+    11100: "urban_highly_impervious",
+    11210: "urban_moderately_impervious",
+    11220: "urban_weakly_impervious",
+    11230: "suburban_highly_impervious",
+    11240: "suburban_weakly_impervious",
+    11300: "rural",
+    12100: "urban_highly_impervious",
+    12210: "urban_highly_impervious",
+    12220: "urban_highly_impervious",
+    12230: "urban_moderately_impervious",
+    12300: "urban_highly_impervious",
+    12400: "urban_moderately_impervious",
+    13100: "permeable_areas",
+    13300: "permeable_areas",
+    13400: "meadows",
+    14100: "meadows",
+    14200: "meadows",
+    21000: "arable",
+    22000: "arable",
+    23000: "meadows",
+    24000: "rural",
+    25000: "arable",
+    31000: "forests",
+    32000: "meadows",
+    33000: "permeable_areas",
+    40000: "marshes",
+}
+TABLES = {"corine": CORINE, "urban_atlas": URBAN_ATLAS}
+
+
+class RemapTable:
+    """
+    RemapTable translates source classification codes into LandCoverType codes and mixes.
+
+    Attributes
+    ----------
+    name : str
+        Name of the table used in the messages.
+    mapping : Dict[int, Dict[str, float]]
+        Shares of the land covers (summing up to one) by source code.
+    codes : np.ndarray
+        Sorted source codes of the table.
+    mapped : np.ndarray
+        Boolean array indexed by the source code, True for the codes of the table.
+    targets : np.ndarray
+        LandCoverType code with the largest share indexed by the source code, 0 for unmapped codes.
+    shares : np.ndarray
+        Shares of every land cover (columns in the order of LandCoverType) indexed by the source code,
+        zero for unmapped codes.
+    """
+
+    def __init__(self, mapping: Mapping[Union[int, str], Target], name: str = "remap") -> None:
+        """
+        Validate and compile the table.
+
+        Parameters
+        ----------
+        mapping : Mapping[Union[int, str], Target]
+            Land cover name or code, or a mapping of land covers to their shares, by source code.
+            Source codes are non-negative integers (or strings of them).
+        name : str, optional
+            Name of the table, by default remap.
+
+        Raises
+        ------
+        ValueError
+            If any source code, land cover or share is invalid, all errors are listed in the message.
+        """
+        self.name = name
+        self.mapping, errors = self._validate(mapping)
+        if errors:
+            raise ValueError(f"Invalid {name} table:\n" + "\n".join(errors))
+
+        size = max(self.mapping, default=0) + 1
+        self.mapped = np.zeros(size, dtype=bool)
+        self.shares = np.zeros((size, len(LandCoverType)))
+        positions = {name: position for position, name in enumerate(LandCoverType.names())}
+        for code, shares in self.mapping.items():
+            self.mapped[code] = True
+            for land_cover, share in shares.items():
+                self.shares[code, positions[land_cover]] = share
+        self.targets = np.where(self.mapped, LandCoverType.codes()[np.argmax(self.shares, axis=1)], 0)
+        self.codes = np.flatnonzero(self.mapped)
+        self._compact = np.cumsum(self.mapped) - 1
+
+    @staticmethod
+    def _validate(mapping: Mapping[Union[int, str], Target]) -> tuple:
+        """Return the shares by integer source code and the messages of all invalid entries."""
+        result, errors = {}, []
+        for source, target in mapping.items():
+            try:
+                code = int(source)
+            except (TypeError, ValueError):
+                code = -1
+            if code < 0 or str(code) != str(source).strip():
+                errors.append(f"Invalid source code: {source}")
+            elif code in result:
+                errors.append(f"Duplicated source code: {source}")
+            else:
+                shares, error = RemapTable._validate_target(source, target)
+                if error is None:
+                    result[code] = shares
+                else:
+                    errors.append(error)
+        return result, errors
+
+    @staticmethod
+    def _validate_target(source: Union[int, str], target: Target) -> Tuple[Optional[Dict[str, float]], Optional[str]]:
+        """Return the normalized shares by land cover name of a source code, or the message if they are invalid."""
+        target = target if isinstance(target, Mapping) else {target: 1.0}
+        try:
+            names = LandCoverType.decode(LandCoverType.encode(list(target)))
+        except ValueError:
+            return None, f"Unknown land cover of code {source}: {', '.join(map(str, target))}"
+        try:
+            shares = np.asarray(list(target.values()), dtype=float)
+        except (TypeError, ValueError):
+            shares = np.array([np.nan])
+        if not np.isfinite(shares).all() or (shares < 0).any() or not shares.sum() > 0:
+            return None, f"Shares of code {source} must be non-negative numbers with a positive sum"
+        shares = pd.Series(shares / shares.sum(), index=np.asarray(names, dtype=object))
+        return shares.groupby(level=0, sort=False).sum().to_dict(), None
+
+    @classmethod
+    def from_file(cls, path: str) -> "RemapTable":
+        """
+        Load a table from a JSON or CSV file, see the module documentation.
+
+        Parameters
+        ----------
+        path : str
+            Path of a .json file or a .csv file with the columns code, land_cover and an optional share.
+
+        Returns
+        -------
+        RemapTable
+            The validated table named after the file.
+
+        Raises
+        ------
+        ValueError
+            If the format is unsupported, a column is missing or any entry is invalid.
+        """
+        name, extension = os.path.splitext(os.path.basename(path))
+        if extension.lower() == ".json":
+            with open(path, "r") as file:
+                return cls(json.load(file), name)
+        if extension.lower() != ".csv":
+            raise ValueError(f"Unsupported remap table: {path}, supported are .json and .csv")
+
+        table = pd.read_csv(path, dtype={"code": str})
+        missing = [column for column in ("code", "land_cover") if column not in table]
+        if missing:
+            raise ValueError(f"Missing columns: {', '.join(missing)}")
+        # a code with a single land cover doesn't need a share
+        table["share"] = table["share"].fillna(1.0) if "share" in table else 1.0
+        mapping = {
+            code: dict(zip(group["land_cover"], group["share"]))
+            for code, group in table.groupby("code", sort=False)
+        }
+        return cls(mapping, name)
+
+    def to_dict(self) -> Dict[str, Target]:
+        """Return the table as a dictionary which can be saved as JSON."""
+        return {
+            str(code): next(iter(shares)) if len(shares) == 1 else dict(shares)
+            for code, shares in self.mapping.items()
+        }
+
+    def _positions(self, values: Union[Iterable, np.ndarray]) -> tuple:
+        """Return the source codes as indices of the compiled arrays and the mask of the mapped ones."""
+        values = values if isinstance(values, (np.ndarray, pd.Series, pd.Index)) else np.asarray(list(values))
+        if np.issubdtype(values.dtype, np.integer):
+            codes = np.asarray(values, dtype=np.int64)
+        else:
+            numeric = np.asarray(pd.to_numeric(pd.Series(np.ravel(values)), errors="coerce"), dtype=float)
+            numeric = numeric.reshape(np.shape(values))
+            integral = np.isfinite(numeric) & (numeric == np.floor(numeric))
+            codes = np.where(integral, numeric, -1).astype(np.int64)
+        valid = (codes >= 0) & (codes < len(self.mapped))
+        positions = np.where(valid, codes, 0)
+        return positions, valid & self.mapped[positions]
+
+    def index(self, values: Union[Iterable, np.ndarray]) -> np.ndarray:
+        """
+        Return the positions of the source codes in `codes`.
+
+        Parameters
+        ----------
+        values : Union[Iterable, np.ndarray]
+            Source codes of any shape.
+
+        Returns
+        -------
+        np.ndarray
+            Array of int64 positions of the shape of values, -1 for unmapped values.
+        """
+        positions, mapped = self._positions(values)
+        return np.where(mapped, self._compact[positions], -1)
+
+    def unmapped(self, values: Union[Iterable, np.ndarray], chunk_size: int = 10_000_000) -> pd.Series:
+        """
+        Count every distinct value which is not a code of the table.
+
+        Parameters
+        ----------
+        values : Union[Iterable, np.ndarray]
+            Source codes, e.g. an attribute column or a (memory-mapped) raster.
+        chunk_size : int, optional
+            Number of values processed at once, by default 10 000 000.
+
+        Returns
+        -------
+        pd.Series
+            Number of occurrences by unmapped value, the most frequent first, empty if all are mapped.
+        """
+        values = values if isinstance(values, (np.ndarray, pd.Series, pd.Index)) else np.asarray(list(values))
+        flat = values.reshape(-1) if isinstance(values, np.ndarray) else np.asarray(values)
+        counts: List[pd.Series] = []
+        for start in range(0, len(flat), chunk_size):
+            chunk = flat[start : start + chunk_size]
+            _, mapped = self._positions(chunk)
+            if not mapped.all():
+                counts.append(pd.Series(chunk[~mapped]).value_counts(dropna=False))
+        if not counts:
+            return pd.Series([], dtype=np.int64, name="count")
+        result = pd.concat(counts).groupby(level=0, dropna=False).sum().sort_values(ascending=False, kind="stable")
+        return result.rename("count")
+
+    def _raise_unmapped(self, values: Union[Iterable, np.ndarray]) -> None:
+        """Raise a ValueError listing all distinct unmapped values and their counts."""
+        counts = self.unmapped(values)
+        shown = ", ".join(f"'{value}' ({count})" for value, count in counts.iloc[:10].items())
+        if len(counts) > 10:
+            shown += f" and {len(counts) - 10} more"
+        raise ValueError(f"{counts.sum()} values with codes missing from the {self.name} table: {shown}")
+
+    def remap(self, values: Union[Iterable, np.ndarray], errors: str = "raise") -> np.ndarray:
+        """
+        Translate source codes into the LandCoverType codes with the largest share.
+
+        Parameters
+        ----------
+        values : Union[Iterable, np.ndarray]
+            Source codes of any shape.
+        errors : str, optional
+            If "raise", unmapped values raise a ValueError listing all of them, if "ignore"
+            they are translated into 0, by default "raise".
+
+        Returns
+        -------
+        np.ndarray
+            Array of int64 LandCoverType codes of the shape of values.
+
+        Raises
+        ------
+        ValueError
+            If errors is "raise" and any value is not a code of the table.
+        """
+        positions, mapped = self._positions(values)
+        if errors == "raise" and not mapped.all():
+            self._raise_unmapped(values)
+        return np.where(mapped, self.targets[positions], 0)
+
+    def fractions(self, values: Union[Iterable, np.ndarray], errors: str = "raise") -> np.ndarray:
+        """
+        Translate source codes into the shares of every land cover.
+
+        Parameters
+        ----------
+        values : Union[Iterable, np.ndarray]
+            Source codes of any shape.
+        errors : str, optional
+            If "raise", unmapped values raise a ValueError listing all of them, if "ignore"
+            their shares are zero, by default "raise".
+
+        Returns
+        -------
+        np.ndarray
+            Array of the shape of values with a last axis of the shares in the order of LandCoverType,
+            usable as a composition in `lookup_mixtures`.
+
+        Raises
+        ------
+        ValueError
+            If errors is "raise" and any value is not a code of the table.
+        """
+        positions, mapped = self._positions(values)
+        if errors == "raise" and not mapped.all():
+            self._raise_unmapped(values)
+        return np.where(mapped[..., np.newaxis], self.shares[positions], 0.0)
+
+
+@lru_cache(maxsize=None)
+def _get_builtin_table(name: str) -> RemapTable:
+    """Return the compiled built-in table."""
+    return RemapTable(TABLES[name], name)
+
+
+def get_remap_table(table: Optional[Union[str, Mapping, RemapTable]]) -> Optional[RemapTable]:
+    """
+    Return a compiled remap table.
+
+    Parameters
+    ----------
+    table : Union[str, Mapping, RemapTable], optional
+        Name of a built-in table (corine or urban_atlas), path of a table file, a mapping
+        of source codes to land covers or a compiled table.
+
+    Returns
+    -------
+    RemapTable, optional
+        The compiled table, None if table is None.
+
+    Raises
+    ------
+    ValueError
+        If the name is neither a built-in table nor an existing file or the table is invalid.
+    """
+    if table is None or isinstance(table, RemapTable):
+        return table
+    if isinstance(table, Mapping):
+        return RemapTable(table)
+    if table in TABLES:
+        return _get_builtin_table(table)
+    if os.path.isfile(table):
+        return RemapTable.from_file(table)
+    raise ValueError(f"Unknown remap table: {table}, built-in tables are: {', '.join(TABLES)}")
@@ -0,0 +1,414 @@
+"""
+The module contains helpers for reading and writing several sections of an INP file at once.
+
+`InpScanner` finds the byte offsets of all sections with a single search over a memory map of the
+file, so neither the boundaries nor the record counts of the sections require decoding the file,
+and `InpScanner.read_frame` decodes only the bytes of the section it reads into the same data frame
+as `swmmio.utils.dataframes.dataframe_from_inp`, which reads the whole file (twice) for every
+section. `load_inp_sections` uses it to parse the sections of a model used when subcatchments are
+built.
+
+`swmmio.utils.modify_model.replace_inp_section` re-reads, re-parses and rewrites the whole file for
+every section it replaces. The helpers below rewrite any number of sections in a single pass over
+the file and a single write, copying the unchanged byte ranges as they are, `read_inp_section` reads
+the rows of a section swmmio doesn't parse, and `append_inp_sections` appends a stream of rows to
+sections with the memory use bounded by a single batch of rows.
+"""
+import io
+import mmap
+import os
+import re
+import shutil
+import tempfile
+from contextlib import contextmanager
+from typing import IO, BinaryIO, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from swmmio.defs import INFILTRATION_COLS, INP_OBJECTS
+from swmmio.version_control.utils import write_inp_section
+
+SECTION_HEADER = re.compile(rb"^[ \t]*\[([A-Za-z0-9_]+)\][^\n]*\n?", re.MULTILINE)
+RECORD = re.compile(rb"^[ \t]*[^;\s]", re.MULTILINE)
+COMMENT = re.compile(rb";[^\n]*")
+WHITESPACE = b" \t\r\n\x0b\x0c"
+BLOCK_SIZE = 2**20
+# swmmio attributes of the sections parsed with `dataframe_from_inp`, by the attribute name
+SECTION_ATTRIBUTES = {
+    "subcatchments": "[SUBCATCHMENTS]",
+    "subareas": "[SUBAREAS]",
+    "infiltration": "[INFILTRATION]",
+    "polygons": "[POLYGONS]",
+    "raingages": "[RAINGAGES]",
+    "coordinates": "[COORDINATES]",
+    "junctions": "[JUNCTIONS]",
+    "outfalls": "[OUTFALLS]",
+    "storage": "[STORAGE]",
+    "dividers": "[DIVIDERS]",
+    "tags": "[TAGS]",
+}
+
+
+def format_header(header: str) -> str:
+    """Return the upper case header of a section with brackets, e.g. "[POLYGONS]" for "Polygons"."""
+    return f"[{header.strip().strip('[]').upper()}]"
+
+
+class InpScanner:
+    """
+    InpScanner finds the sections of an INP file over a memory map of the file.
+
+    The scanner keeps the file open, use it as a context manager or call `close`.
+
+    Attributes
+    ----------
+    path : str
+        Path to the INP file.
+    size : int
+        Size of the file in bytes.
+    spans : List[Tuple[str, int, int, int]]
+        Upper case header, offset of the header line, offset of the first row and offset
+        of the end of every section, in the order of the file.
+    """
+
+    def __init__(self, inp_path: str) -> None:
+        self.path = inp_path
+        self._file = open(inp_path, "rb")
+        if os.fstat(self._file.fileno()).st_size:
+            self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            # an empty file can't be mapped
+            self._data = b""
+        self.size = len(self._data)
+        matches = list(SECTION_HEADER.finditer(self._data))
+        ends = [match.start() for match in matches[1:]] + [self.size]
+        self.spans: List[Tuple[str, int, int, int]] = [
+            (f"[{match.group(1).decode().upper()}]", match.start(), match.end(), end)
+            for match, end in zip(matches, ends)
+        ]
+        self._sections: Dict[str, Tuple[int, int, int]] = {}
+        for header, start, body, end in self.spans:
+            # swmmio reads the first of repeated sections
+            self._sections.setdefault(header, (start, body, end))
+
+    def __enter__(self) -> "InpScanner":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __contains__(self, header: str) -> bool:
+        return format_header(header) in self._sections
+
+    def close(self) -> None:
+        """Unmap and close the file."""
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+        self._file.close()
+
+    def get_span(self, header: str) -> Optional[Tuple[int, int, int]]:
+        """Return the offsets of the header line, first row and end of a section, None if it doesn't exist."""
+        return self._sections.get(format_header(header))
+
+    def get_bytes(self, header: str) -> bytes:
+        """Return the rows of a section as bytes (without the header line), empty if it doesn't exist."""
+        span = self.get_span(header)
+        return b"" if span is None else self._data[span[1] : span[2]]
+
+    def count_records(self, header: str) -> int:
+        """
+        Count the rows of a section without decoding it.
+
+        Parameters
+        ----------
+        header : str
+            Section header, e.g. "[SUBCATCHMENTS]".
+
+        Returns
+        -------
+        int
+            Number of lines which aren't blank or comments, 0 if the section doesn't exist.
+        """
+        span = self.get_span(header)
+        return 0 if span is None else len(RECORD.findall(self._data, span[1], span[2]))
+
+    def read_rows(self, header: str) -> List[List[str]]:
+        """Return the values of the rows of a section, see `read_inp_section`."""
+        text = COMMENT.sub(b"", self.get_bytes(header)).decode()
+        return [values for values in (line.split() for line in text.splitlines()) if values]
+
+    def get_columns(self, header: str) -> Optional[List[str]]:
+        """
+        Return the columns of a section, as defined by swmmio.
+
+        Parameters
+        ----------
+        header : str
+            Section header, e.g. "[SUBCATCHMENTS]".
+
+        Returns
+        -------
+        List[str], optional
+            Column names, the columns of [INFILTRATION] depend on the INFILTRATION option
+            (HORTON by default), None for the sections swmmio doesn't parse into columns.
+        """
+        name = format_header(header)[1:-1]
+        if name == "INFILTRATION":
+            options = (values for values in self.read_rows("[OPTIONS]") if len(values) > 1)
+            option = next((values[1] for values in options if values[0] == "INFILTRATION"), "HORTON")
+            return list(INFILTRATION_COLS.get(option.upper(), INFILTRATION_COLS["HORTON"]))
+        if name not in INP_OBJECTS or INP_OBJECTS[name]["columns"][0] == "blob":
+            return None
+        return list(INP_OBJECTS[name]["columns"])
+
+    def read_frame(self, header: str) -> pd.DataFrame:
+        """
+        Read a section into the same data frame as `swmmio.utils.dataframes.dataframe_from_inp`.
+
+        Only the bytes of the section are decoded.
+
+        Parameters
+        ----------
+        header : str
+            Section header, e.g. "[SUBCATCHMENTS]".
+
+        Returns
+        -------
+        pd.DataFrame
+            Rows of the section indexed by the first column, an empty data frame
+            if the section doesn't exist.
+        """
+        span = self.get_span(header)
+        if span is None:
+            return pd.DataFrame()
+        columns = self.get_columns(header)
+        start = span[0] if columns is None else span[1]
+        data = COMMENT.sub(b"", self._data[start : span[2]]).replace(b'""', b" ")
+        if columns is None:
+            # sections swmmio doesn't parse are read as a single column named after the header
+            return pd.read_csv(io.BytesIO(data))
+        n_tokens = count_tokens(data) or len(columns)
+        names = columns[:n_tokens] + [f"col{index}" for index in range(len(columns), n_tokens)]
+        return pd.read_csv(
+            io.BytesIO(data), header=None, sep=r"\s+", index_col=0, names=names
+        ).rename(index=str)
+
+    def copy_to(self, file: BinaryIO, start: int, end: int) -> None:
+        """Write the bytes of the file between two offsets to another file, block by block."""
+        for offset in range(start, end, BLOCK_SIZE):
+            file.write(self._data[offset : min(offset + BLOCK_SIZE, end)])
+
+    def is_line_start(self, offset: int) -> bool:
+        """Return True if the offset is at the start of the file or right after a newline."""
+        return offset == 0 or self._data[offset - 1] == ord("\n")
+
+    def get_rows_end(self, header: str) -> int:
+        """Return the offset after the last row of a section, before its trailing blank lines."""
+        _, body, end = self.get_span(header)
+        stop = end
+        while stop > body and self._data[stop - 1] in WHITESPACE:
+            stop -= 1
+        if stop == body:
+            return body
+        newline = self._data.find(b"\n", stop, end)
+        return end if newline < 0 else newline + 1
+
+
+def count_tokens(data: bytes) -> int:
+    """Return the largest number of whitespace separated values in a line of the data."""
+    values = np.frombuffer(data, dtype=np.uint8)
+    if not len(values):
+        return 0
+    space = np.isin(values, np.frombuffer(WHITESPACE, dtype=np.uint8))
+    starts = np.flatnonzero(~space & np.concatenate(([True], space[:-1])))
+    if not len(starts):
+        return 0
+    lines = np.searchsorted(np.flatnonzero(values == ord("\n")), starts)
+    return int(np.bincount(lines).max())
+
+
+def load_inp_sections(inp, names: Sequence[str]) -> Dict[str, pd.DataFrame]:
+    """
+    Parse sections of a model over a memory map of its file and set them on the model.
+
+    Parameters
+    ----------
+    inp : swmmio.core.inp
+        Input data of the model, `swmmio.Model(...).inp`.
+    names : Sequence[str]
+        swmmio attributes of the sections, the ones not in `SECTION_ATTRIBUTES`
+        (e.g. timeseries) are left to be parsed by swmmio on their first use.
+
+    Returns
+    -------
+    Dict[str, pd.DataFrame]
+        The parsed sections by the attribute name.
+    """
+    sections = {}
+    with InpScanner(inp.path) as scanner:
+        for name in names:
+            if name in SECTION_ATTRIBUTES:
+                sections[name] = scanner.read_frame(SECTION_ATTRIBUTES[name])
+    for name, section in sections.items():
+        setattr(inp, name, section)
+    return sections
+
+
+def replace_inp_sections(inp_path: str, new_sections: Dict[str, pd.DataFrame]) -> None:
+    """
+    Overwrite several sections of an INP file with the given data frames in a single write.
+
+    Sections which don't exist in the file are appended at the end of it. All other bytes
+    of the file are copied unchanged. If writing fails, the file is left unchanged.
+
+    Parameters
+    ----------
+    inp_path : str
+        Path to the INP file to be changed.
+    new_sections : Dict[str, pd.DataFrame]
+        Mapping of the section header (e.g. "[SUBCATCHMENTS]") to the data of the whole section.
+    """
+    pending = {format_header(header): (header, data) for header, data in new_sections.items()}
+    with _replace_file(inp_path) as new_file, InpScanner(inp_path) as scanner:
+        position = 0
+        for key, start, _, end in scanner.spans:
+            if key in pending:
+                scanner.copy_to(new_file, position, start)
+                header, data = pending.pop(key)
+                _write_text(new_file, header, data, pad_top=False)
+                position = end
+        scanner.copy_to(new_file, position, scanner.size)
+
+        for key, (header, data) in pending.items():
+            _write_text(new_file, header, data)
+
+
+@contextmanager
+def _replace_file(inp_path: str) -> Iterator[BinaryIO]:
+    """
+    Yield a temporary file next to the INP file, which replaces it if the block succeeds.
+
+    If the block or the replacement fails, the temporary file is removed and the INP file is left unchanged.
+    """
+    directory = os.path.dirname(os.path.abspath(inp_path))
+    new_file = tempfile.NamedTemporaryFile("wb", dir=directory, suffix=".inp", delete=False)
+    try:
+        with new_file:
+            yield new_file
+        shutil.copymode(inp_path, new_file.name)
+        os.replace(new_file.name, inp_path)
+    except BaseException:
+        os.unlink(new_file.name)
+        raise
+
+
+def _write_text(file: BinaryIO, header: str, data: pd.DataFrame, pad_top: bool = True) -> None:
+    """Write a section with `write_inp_section` to a binary file."""
+    text = io.StringIO()
+    write_inp_section(text, None, header, data, pad_top=pad_top)
+    file.write(text.getvalue().encode())
+
+
+def read_inp_section(inp_path: str, header: str) -> List[List[str]]:
+    """
+    Read the rows of a section of an INP file as lists of whitespace separated values.
+
+    Comments (everything after ";") and blank lines are skipped, so sections which swmmio doesn't
+    parse into columns, e.g. [SYMBOLS], can be read too. Only the bytes of the section are decoded.
+
+    Parameters
+    ----------
+    inp_path : str
+        Path to the INP file.
+    header : str
+        Section header, e.g. "[SYMBOLS]".
+
+    Returns
+    -------
+    List[List[str]]
+        Values of every row, empty if the section doesn't exist.
+    """
+    with InpScanner(inp_path) as scanner:
+        return scanner.read_rows(header)
+
+
+def _write_rows(file: IO[str], data: pd.DataFrame) -> None:
+    """Write the rows of a section data frame (index first) as whitespace separated values."""
+    file.write(data.to_csv(sep=" ", header=False, na_rep=""))
+
+
+def append_inp_sections(inp_path: str, records: Iterable[Dict[str, pd.DataFrame]]) -> int:
+    """
+    Append a stream of rows to sections of an INP file.
+
+    Every item of `records` maps section headers to data frames with new rows of these sections.
+    The rows are spooled to temporary files as they arrive, so only one item is kept in memory,
+    and then inserted at the end of their sections in a single pass over the file and a single
+    write. Sections which don't exist in the file are appended at the end of it. If consuming
+    the stream fails, the file is left unchanged.
+
+    Parameters
+    ----------
+    inp_path : str
+        Path to the INP file to be changed.
+    records : Iterable[Dict[str, pd.DataFrame]]
+        Batches of new rows, keyed by the section header (e.g. "[SUBCATCHMENTS]").
+
+    Returns
+    -------
+    int
+        Number of consumed items of `records`.
+    """
+    directory = os.path.dirname(os.path.abspath(inp_path))
+    spools: Dict[str, IO[str]] = {}
+    try:
+        count = 0
+        for count, batch in enumerate(records, start=1):
+            for header, data in batch.items():
+                if header not in spools:
+                    spools[header] = tempfile.TemporaryFile("w+", dir=directory)
+                _write_rows(spools[header], data)
+        if not spools:
+            return count
+
+        with _replace_file(inp_path) as new_file, InpScanner(inp_path) as scanner:
+            _insert_spools(scanner, spools, new_file)
+    finally:
+        for spool in spools.values():
+            spool.close()
+    return count
+
+
+def _insert_spools(scanner: InpScanner, spools: Dict[str, IO[str]], file: BinaryIO) -> None:
+    """
+    Copy the scanned file to the binary file with the spooled rows inserted at the end of their sections.
+
+    The copied spools are removed from `spools`, the rows of the sections which don't exist in the file
+    are appended at the end of it.
+    """
+    headers = {format_header(header): header for header in spools}
+    position = 0
+    for key, _, _, _ in scanner.spans:
+        if key in headers:
+            # the new rows go before the trailing blank lines of the section
+            end = scanner.get_rows_end(key)
+            scanner.copy_to(file, position, end)
+            if not scanner.is_line_start(end):
+                file.write(b"\n")
+            _copy_spool(spools.pop(headers.pop(key)), file)
+            position = end
+    scanner.copy_to(file, position, scanner.size)
+    if position < scanner.size and not scanner.is_line_start(scanner.size):
+        file.write(b"\n")
+
+    for header in list(spools):
+        file.write(f"\n{header}\n".encode())
+        _copy_spool(spools.pop(header), file)
+
+
+def _copy_spool(spool: IO[str], file: BinaryIO) -> None:
+    """Copy the spooled rows to the binary file and close the spool."""
+    spool.seek(0)
+    for block in iter(lambda: spool.read(BLOCK_SIZE), ""):
+        file.write(block.encode())
+    spool.close()
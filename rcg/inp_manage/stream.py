@@ -0,0 +1,317 @@
+"""
+The module contains generators for adding subcatchments from inputs too large to be kept in memory.
+
+The input rows are pulled lazily and processed in chunks: every chunk is validated, the fuzzy results
+and SWMM parameters are computed for the whole chunk at once and the rows of the INP sections are
+yielded, so the peak memory is bounded by the chunk size and not by the number of rows.
+
+Example::
+
+    rows = pd.read_csv("parcels.csv", chunksize=50_000)
+    stream_subcatchments("model.inp", rows)
+"""
+import itertools
+from typing import Dict, Iterable, Iterator, Mapping, Optional, Tuple
+
+import pandas as pd
+
+from rcg.fuzzy.lookup import lookup_codes
+from rcg.inp_manage.inp import (
+    BuildCatchments,
+    compute_parameters,
+    get_section_records,
+    validate_subcatchments,
+)
+from rcg.inp_manage.layout import LAYOUTS, Extent, get_extent, layout_polygons
+from rcg.inp_manage.parameters import HydrologicParameters
+from rcg.inp_manage.sections import append_inp_sections
+from rcg.inp_manage.tags import get_rules_hash, get_tags
+
+ROW_COLUMNS = ["area", "land_form", "land_cover"]
+
+
+def iter_chunks(rows: Iterable, chunk_size: int = 10_000) -> Iterator[pd.DataFrame]:
+    """
+    Group the input rows into data frames of at most `chunk_size` rows.
+
+    The chunks are indexed by the position of the row in the whole input, so the rows reported
+    by the validation can be found in the source.
+
+    Parameters
+    ----------
+    rows : Iterable
+        Rows as mappings with the area, land_form and land_cover keys, as sequences of these
+        three values or as data frames with these columns (e.g. `pd.read_csv(..., chunksize=...)`).
+    chunk_size : int, optional
+        Maximum number of rows in a chunk, by default 10 000.
+
+    Yields
+    ------
+    pd.DataFrame
+        Chunk of rows with the area, land_form and land_cover columns.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be greater than zero")
+
+    offset = 0
+    buffer = []
+
+    def flush() -> pd.DataFrame:
+        nonlocal offset
+        chunk = pd.DataFrame(buffer, columns=ROW_COLUMNS)
+        chunk.index = pd.RangeIndex(offset, offset + len(chunk))
+        offset += len(chunk)
+        buffer.clear()
+        return chunk
+
+    for row in rows:
+        if isinstance(row, pd.DataFrame):
+            if buffer:
+                yield flush()
+            for start in range(0, len(row), chunk_size):
+                chunk = row.iloc[start : start + chunk_size]
+                chunk = chunk.set_axis(pd.RangeIndex(offset, offset + len(chunk)))
+                offset += len(chunk)
+                yield chunk
+            continue
+        if isinstance(row, Mapping):
+            buffer.append({column: row.get(column) for column in ROW_COLUMNS})
+        else:
+            buffer.append(dict(zip(ROW_COLUMNS, row)))
+        if len(buffer) == chunk_size:
+            yield flush()
+    if buffer:
+        yield flush()
+
+
+def iter_prototypes(rows: Iterable, chunk_size: int = 10_000) -> Iterator[pd.DataFrame]:
+    """
+    Yield the fuzzy results of the input rows, computed for a whole chunk at once.
+
+    This is the streaming counterpart of creating a `Prototype` for every row.
+
+    Parameters
+    ----------
+    rows : Iterable
+        Input rows, see `iter_chunks`.
+    chunk_size : int, optional
+        Maximum number of rows in a chunk, by default 10 000.
+
+    Yields
+    ------
+    pd.DataFrame
+        Chunk with the area, land_form and land_cover columns and the slope, impervious,
+        catchment and catchment_class results.
+
+    Raises
+    ------
+    ValueError
+        If any row of a chunk is invalid, see `validate_subcatchments`.
+    """
+    for chunk in iter_chunks(rows, chunk_size):
+        data = validate_subcatchments(chunk)
+        results = lookup_codes(data["land_form"], data["land_cover"])
+        yield data.join(results.set_axis(data.index))
+
+
+def iter_subcatchment_records(
+    rows: Iterable,
+    ids: Iterator[str],
+    raingage: str,
+    outlet: Optional[str],
+    origin: Tuple[float, float] = (0, 0),
+    parameters: Optional[HydrologicParameters] = None,
+    chunk_size: int = 10_000,
+    layout: str = "cascade",
+    extent: Optional[Extent] = None,
+    aspect_ratio: float = 1.0,
+    gap: float = 0.0,
+) -> Iterator[Dict[str, pd.DataFrame]]:
+    """
+    Yield ready-to-write INP section rows of new subcatchments, one chunk at a time.
+
+    Parameters
+    ----------
+    rows : Iterable
+        Input rows, see `iter_chunks`.
+    ids : Iterator[str]
+        Source of the new subcatchment IDs, e.g. `BuildCatchments.iter_new_subcatchment_ids()`.
+    raingage : str
+        Name of the raingage of the subcatchments.
+    outlet : str, optional
+        Name of the outlet node. If None, every subcatchment is its own outlet.
+    origin : Tuple[float, float], optional
+        Top left corner of the first square-shaped polygon, by default (0, 0).
+    parameters : HydrologicParameters, optional
+        Subarea and infiltration parameter tables, by default the built-in ones.
+    chunk_size : int, optional
+        Maximum number of rows in a chunk, by default 10 000.
+    layout : str, optional
+        "cascade" stacks squares from the origin, "grid" and "shelf" pack the rectangles of every
+        chunk next to the extent, see `layout_polygons`. By default "cascade".
+    extent : Extent, optional
+        Bounding box of the model the first chunk of a packed layout is placed next to,
+        the following chunks are placed next to the previous ones.
+    aspect_ratio : float, optional
+        Width divided by the height of the rectangles of the packed layouts, by default 1.
+    gap : float, optional
+        Distance between the rectangles of the packed layouts, by default 0.
+
+    Yields
+    ------
+    Dict[str, pd.DataFrame]
+        New rows of the [SUBCATCHMENTS], [SUBAREAS], [INFILTRATION], [Polygons] and [TAGS] sections.
+
+    Raises
+    ------
+    ValueError
+        If any row of a chunk is invalid, see `validate_subcatchments`, or the layout is unknown.
+    """
+    if layout not in LAYOUTS:
+        raise ValueError(f"Unknown layout: {layout}, valid are: {', '.join(LAYOUTS)}")
+    rules_hash = get_rules_hash(parameters)
+    for chunk in iter_chunks(rows, chunk_size):
+        data = validate_subcatchments(chunk)
+        computed = compute_parameters(data, parameters)
+        computed.index = pd.Index(list(itertools.islice(ids, len(computed))), name="Name")
+        tags = get_tags(computed.index, data["area"], data["land_form"], data["land_cover"], rules_hash)
+        polygons = None
+        if layout != "cascade":
+            polygons = layout_polygons(
+                computed.index, computed["Area"].to_numpy(), extent, layout, aspect_ratio, gap
+            )
+            bounds = get_extent(polygons)
+            extent = bounds if extent is None else (
+                min(extent[0], bounds[0]),
+                min(extent[1], bounds[1]),
+                max(extent[2], bounds[2]),
+                max(extent[3], bounds[3]),
+            )
+        records = get_section_records(computed, raingage, outlet, origin, polygons, tags)
+        polygons = records["[Polygons]"]
+        origin = polygons["X"].iloc[-1], polygons["Y"].iloc[-1]
+        yield records
+
+
+def prepare_raingage(model: BuildCatchments) -> Tuple[str, Dict[str, pd.DataFrame]]:
+    """
+    Return the raingage of new subcatchments, created in the model if there is none.
+
+    Parameters
+    ----------
+    model : BuildCatchments
+        Model the subcatchments are added to.
+
+    Returns
+    -------
+    Tuple[str, Dict[str, pd.DataFrame]]
+        Name of the raingage and the [RAINGAGES] and [TIMESERIES] sections which had to be
+        created and must be written with the subcatchments.
+    """
+    new_raingage = len(model.model.inp.raingages) == 0
+    new_timeseries = new_raingage and len(model.model.inp.timeseries) == 0
+    raingage = model._get_raingage()
+    created = {}
+    if new_raingage:
+        created["[RAINGAGES]"] = model.model.inp.raingages
+    if new_timeseries:
+        created["[TIMESERIES]"] = model.model.inp.timeseries
+    return raingage, created
+
+
+def append_records(
+    file_path: str,
+    records: Iterator[Dict[str, pd.DataFrame]],
+    created: Optional[Dict[str, pd.DataFrame]] = None,
+) -> int:
+    """
+    Append a stream of section rows of new subcatchments to the INP file.
+
+    Nothing is written if the stream is empty. If the stream fails, the file is left unchanged.
+
+    Parameters
+    ----------
+    file_path : str
+        The path to the SWMM input file (INP).
+    records : Iterator[Dict[str, pd.DataFrame]]
+        Section rows, see `iter_subcatchment_records`.
+    created : Dict[str, pd.DataFrame], optional
+        Sections created for the new subcatchments, see `prepare_raingage`.
+
+    Returns
+    -------
+    int
+        Number of added subcatchments.
+    """
+    first = next(records, None)
+    if first is None:
+        return 0
+    added = 0
+
+    def count(records: Iterable[Dict[str, pd.DataFrame]]) -> Iterator[Dict[str, pd.DataFrame]]:
+        nonlocal added
+        for record in records:
+            added += len(record["[SUBCATCHMENTS]"])
+            yield record
+
+    stream = count(itertools.chain([first], records))
+    if created:
+        stream = itertools.chain([created], stream)
+    append_inp_sections(file_path, stream)
+    return added
+
+
+def stream_subcatchments(
+    file_path: str,
+    rows: Iterable,
+    chunk_size: int = 10_000,
+    parameters: Optional[HydrologicParameters] = None,
+    layout: str = "cascade",
+    aspect_ratio: float = 1.0,
+    gap: float = 0.0,
+) -> int:
+    """
+    Add subcatchments from a stream of rows to an existing SWMM model.
+
+    The rows are consumed chunk by chunk and the section rows are appended to the file with
+    `append_inp_sections`, so the input is never materialized as a whole. If any row is invalid,
+    the file is left unchanged.
+
+    Parameters
+    ----------
+    file_path : str
+        The path to the SWMM input file (INP) to which subcatchments will be added.
+    rows : Iterable
+        Input rows, see `iter_chunks`.
+    chunk_size : int, optional
+        Maximum number of rows processed at once, by default 10 000.
+    parameters : HydrologicParameters, optional
+        Subarea and infiltration parameter tables, by default the built-in ones.
+    layout : str, optional
+        Layout of the polygons, "cascade", "grid" or "shelf", see `iter_subcatchment_records`.
+    aspect_ratio : float, optional
+        Width divided by the height of the polygons of the packed layouts, by default 1.
+    gap : float, optional
+        Distance between the polygons of the packed layouts, by default 0.
+
+    Returns
+    -------
+    int
+        Number of added subcatchments.
+    """
+    model = BuildCatchments(file_path, parameters)
+    raingage, created = prepare_raingage(model)
+    records = iter_subcatchment_records(
+        rows,
+        ids=model.iter_new_subcatchment_ids(),
+        raingage=raingage,
+        outlet=model._get_outlet(None),
+        origin=model._get_coords_origin(),
+        parameters=model.parameters,
+        chunk_size=chunk_size,
+        layout=layout,
+        extent=model.get_extent(),
+        aspect_ratio=aspect_ratio,
+        gap=gap,
+    )
+    return append_records(file_path, records, created)
@@ -0,0 +1,212 @@
+"""
+The module contains the incremental regeneration of subcatchments from a changing input table.
+
+A sidecar manifest (CSV next to the INP file) maps the key of every input row to the name of its
+subcatchment and the hash of its inputs (see `get_input_hashes`). On the next run the input table is
+diffed against the manifest and only the changes are applied to the model:
+
+- rows with a new key are added like with `BuildCatchments.add_subcatchments`,
+- rows with a changed hash are recomputed like with `BuildCatchments.update_subcatchments`,
+- keys missing from the table are removed like with `BuildCatchments.remove_subcatchments`.
+
+All changes are applied to the parsed sections in memory and the changed sections are written
+in a single file write, so the fuzzy computation depends on the number of changed rows and the model
+is rewritten once per refresh. If any change fails, neither the model nor the manifest is written.
+
+Example::
+
+    changes = sync_subcatchments("model.inp", pd.read_csv("catchments.csv"), key="id")
+"""
+import os
+import tempfile
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from rcg.inp_manage.inp import BuildCatchments, validate_subcatchments
+from rcg.inp_manage.layout import LAYOUTS
+from rcg.inp_manage.outlets import OUTLET_RULES
+from rcg.inp_manage.parameters import HydrologicParameters
+from rcg.inp_manage.raingages import RAINGAGE_RULES
+from rcg.inp_manage.tags import get_input_hashes
+
+MANIFEST_COLUMNS = ["key", "name", "input_hash"]
+# options of the new subcatchments, see `BuildCatchments.add_subcatchments`
+ADD_OPTIONS = ("outlets", "max_distance", "node_types", "raingages", "layout", "aspect_ratio", "gap")
+
+
+def get_manifest_path(file_path: str) -> str:
+    """Return the default path of the manifest of an INP file, e.g. model.manifest.csv for model.inp."""
+    return f"{os.path.splitext(file_path)[0]}.manifest.csv"
+
+
+def read_manifest(path: str) -> pd.DataFrame:
+    """
+    Read a manifest.
+
+    Parameters
+    ----------
+    path : str
+        Path to the manifest CSV file.
+
+    Returns
+    -------
+    pd.DataFrame
+        Table indexed by the key (as a string) with the columns name and input_hash,
+        empty if the file doesn't exist.
+    """
+    if not os.path.exists(path):
+        return pd.DataFrame(columns=MANIFEST_COLUMNS[1:], index=pd.Index([], name="key"), dtype=object)
+    manifest = pd.read_csv(path, dtype=str, keep_default_na=False)
+    missing = [column for column in MANIFEST_COLUMNS if column not in manifest]
+    if missing:
+        raise ValueError(f"Invalid manifest {path}, missing columns: {', '.join(missing)}")
+    return manifest.set_index("key")[MANIFEST_COLUMNS[1:]]
+
+
+def write_manifest(path: str, manifest: pd.DataFrame) -> None:
+    """
+    Write a manifest, replacing the file at once so an interrupted write keeps the previous one.
+
+    Parameters
+    ----------
+    path : str
+        Path to the manifest CSV file.
+    manifest : pd.DataFrame
+        Table indexed by the key with the columns name and input_hash.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    file = tempfile.NamedTemporaryFile("w", dir=directory, suffix=".csv", delete=False, newline="")
+    try:
+        with file:
+            manifest.rename_axis("key").reset_index()[MANIFEST_COLUMNS].to_csv(file, index=False)
+        os.replace(file.name, path)
+    except BaseException:
+        os.unlink(file.name)
+        raise
+
+
+def diff_manifest(manifest: pd.DataFrame, keys: pd.Index, hashes: np.ndarray) -> Dict[str, pd.Index]:
+    """
+    Compare the input rows with the manifest.
+
+    Parameters
+    ----------
+    manifest : pd.DataFrame
+        Result of `read_manifest`.
+    keys : pd.Index
+        Keys of the input rows (strings).
+    hashes : np.ndarray
+        Input hashes of the rows.
+
+    Returns
+    -------
+    Dict[str, pd.Index]
+        Keys of the inserted and updated input rows and of the deleted manifest rows.
+    """
+    known = keys.isin(manifest.index)
+    previous = manifest["input_hash"].reindex(keys[known]).to_numpy()
+    return {
+        "inserted": keys[~known],
+        "updated": keys[known][previous != np.asarray(hashes)[known]],
+        "deleted": manifest.index[~manifest.index.isin(keys)],
+    }
+
+
+def validate_options(options: Dict[str, object]) -> None:
+    """
+    Validate the options of the new subcatchments before the model is changed.
+
+    Parameters
+    ----------
+    options : Dict[str, object]
+        Options passed to `BuildCatchments.add_subcatchments`.
+
+    Raises
+    ------
+    ValueError
+        If an option, the outlet rule, the raingage rule or the layout is unknown.
+    """
+    unknown = sorted(set(options) - set(ADD_OPTIONS))
+    if unknown:
+        raise ValueError(f"Unknown options: {', '.join(unknown)}, valid are: {', '.join(ADD_OPTIONS)}")
+    for option, name, valid in (
+        ("outlets", "outlet rule", OUTLET_RULES),
+        ("raingages", "raingage rule", RAINGAGE_RULES),
+        ("layout", "layout", LAYOUTS),
+    ):
+        if option in options and options[option] not in valid:
+            raise ValueError(f"Unknown {name}: {options[option]}, valid are: {', '.join(valid)}")
+
+
+def sync_subcatchments(
+    file_path: str,
+    data: pd.DataFrame,
+    key: str = "id",
+    manifest_path: Optional[str] = None,
+    parameters: Optional[HydrologicParameters] = None,
+    **options,
+) -> Dict[str, List[str]]:
+    """
+    Apply the changes of an input table since the last run to the subcatchments of a model.
+
+    Parameters
+    ----------
+    file_path : str
+        The path to the SWMM input file (INP).
+    data : pd.DataFrame
+        Table with the key column and the columns: area [ha], land_form and land_cover.
+    key : str, optional
+        Column identifying the rows between runs, by default id.
+    manifest_path : str, optional
+        Path to the manifest, by default next to the INP file, see `get_manifest_path`.
+    parameters : HydrologicParameters, optional
+        Subarea and infiltration parameter tables, by default the built-in ones.
+    **options
+        Options of the new subcatchments passed to `BuildCatchments.add_subcatchments`,
+        e.g. outlets, raingages or layout.
+
+    Returns
+    -------
+    Dict[str, List[str]]
+        Names of the inserted, updated and deleted subcatchments.
+
+    Raises
+    ------
+    ValueError
+        If the key column is missing, a key is repeated, any row is invalid (see `validate_subcatchments`),
+        an option is invalid (see `validate_options`) or a kept subcatchment drains to a deleted one.
+        The model and the manifest are left unchanged.
+    """
+    validate_options(options)
+    if key not in data:
+        raise ValueError(f"Missing columns: {key}")
+    keys = pd.Index(data[key].astype(str), name="key")
+    if keys.has_duplicates:
+        raise ValueError(f"Repeated keys: {', '.join(keys[keys.duplicated()].unique()[:10])}")
+    rows = validate_subcatchments(data.set_axis(keys))
+    hashes = get_input_hashes(rows["area"], rows["land_form"], rows["land_cover"])
+
+    manifest_path = get_manifest_path(file_path) if manifest_path is None else manifest_path
+    manifest = read_manifest(manifest_path)
+    model = BuildCatchments(file_path, parameters)
+    # subcatchments removed from the model by hand are added again
+    manifest = manifest[manifest["name"].isin(model.model.inp.subcatchments.index)]
+    changes = diff_manifest(manifest, keys, hashes)
+
+    deleted = manifest.loc[changes["deleted"], "name"].tolist()
+    # the later changes see the sections changed by the earlier ones, the latest frame of a section is written
+    _, sections = model._remove_sections(deleted)
+    updated, changed = model._update_sections(
+        rows.loc[changes["updated"]].set_axis(manifest.loc[changes["updated"], "name"].to_numpy()), model.config
+    )
+    sections.update(changed)
+    inserted, added = model._add_sections(rows.loc[changes["inserted"]].reset_index(drop=True), **options)
+    sections.update(added)
+    model._write_sections(sections)
+
+    names = manifest["name"].reindex(keys)
+    names[changes["inserted"]] = inserted
+    write_manifest(manifest_path, pd.DataFrame({"name": names.to_numpy(), "input_hash": hashes}, index=keys))
+    return {"inserted": inserted, "updated": updated, "deleted": deleted}
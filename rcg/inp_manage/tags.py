@@ -0,0 +1,197 @@
+"""
+The module contains the provenance tags of generated subcatchments.
+
+Every subcatchment written by rcg gets a [TAGS] row ("Subcatch <name> <tag>") recording the source
+land form and land cover codes, a hash of the rule set and a hash of the inputs::
+
+    rcg:<land form code>:<land cover code>:<rules hash>:<input hash>
+
+The rule set hash covers the fingerprint of the live rules and memberships (of the engine configuration,
+if one is used), the fuzzy lookup table and the hydrologic parameter tables, the input hash covers the area
+and the categories. A subcatchment is stale when the current rule set or its current area gives
+a different hash, and only the stale subcatchments are recomputed by `BuildCatchments.rescore`. The stale
+subcatchments are recomputed by the batch engine of the live rules, not from the lookup table, so an edit
+of the rules or memberships is picked up even before the table is regenerated with `save_lookup_table`.
+
+Example::
+
+    names = BuildCatchments("model.inp").rescore()
+"""
+import hashlib
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from rcg.fuzzy.categories import LandCoverType, LandFormType
+from rcg.fuzzy.config import EngineConfig, get_engine
+from rcg.fuzzy.lookup import load_lookup_arrays
+from rcg.fuzzy.surface import get_fingerprint
+from rcg.inp_manage.parameters import HydrologicParameters, default_parameters
+
+TAG_PREFIX = "rcg"
+TAG_COLUMNS = ["land_form", "land_cover", "rules_hash", "input_hash"]
+# element type of the subcatchments in the [TAGS] section
+SUBCATCHMENT_TAG = "Subcatch"
+# decimals of the area taken into the input hash, so it survives writing and reading the INP file
+AREA_DECIMALS = 4
+
+
+def get_rules_hash(
+    parameters: Optional[HydrologicParameters] = None, config: Optional[EngineConfig] = None
+) -> str:
+    """
+    Return the hash of the rule set: the fuzzy rules and memberships, the fuzzy lookup table
+    and the hydrologic parameter tables.
+
+    Parameters
+    ----------
+    parameters : HydrologicParameters, optional
+        Subarea and infiltration parameter tables, by default the built-in ones.
+    config : EngineConfig, optional
+        Configuration of the fuzzy engine. By default the module rules and memberships, which
+        the lookup table is computed from, so the table is hashed too.
+
+    Returns
+    -------
+    str
+        Eight hexadecimal digits.
+    """
+    parameters = default_parameters if parameters is None else parameters
+    digest = hashlib.sha1()
+    digest.update(get_fingerprint(get_engine(config)).encode())
+    if config is None:
+        arrays = load_lookup_arrays()
+        for name in sorted(arrays):
+            digest.update(np.ascontiguousarray(arrays[name], dtype=float).tobytes())
+    digest.update(np.ascontiguousarray(parameters.subareas).tobytes())
+    digest.update(np.ascontiguousarray(parameters.infiltration).tobytes())
+    return digest.hexdigest()[:8]
+
+
+def get_input_hashes(area: np.ndarray, land_form: np.ndarray, land_cover: np.ndarray) -> np.ndarray:
+    """
+    Return the hashes of the inputs of the subcatchments, computed for all rows at once.
+
+    Parameters
+    ----------
+    area : np.ndarray
+        Areas of the subcatchments [ha].
+    land_form : np.ndarray
+        Land form names or LandFormType codes.
+    land_cover : np.ndarray
+        Land cover names or LandCoverType codes.
+
+    Returns
+    -------
+    np.ndarray
+        Eight hexadecimal digits per subcatchment.
+    """
+    inputs = pd.DataFrame(
+        {
+            "area": np.round(np.asarray(area, dtype=float), AREA_DECIMALS),
+            "land_form": LandFormType.encode(land_form),
+            "land_cover": LandCoverType.encode(land_cover),
+        }
+    )
+    hashes = pd.util.hash_pandas_object(inputs, index=False).to_numpy() & 0xFFFFFFFF
+    return np.char.mod("%08x", hashes.astype(np.int64))
+
+
+def get_tags(
+    names: pd.Index,
+    area: np.ndarray,
+    land_form: np.ndarray,
+    land_cover: np.ndarray,
+    rules_hash: str,
+) -> pd.DataFrame:
+    """
+    Return the [TAGS] rows of new subcatchments.
+
+    Parameters
+    ----------
+    names : pd.Index
+        Names of the subcatchments.
+    area : np.ndarray
+        Areas of the subcatchments [ha].
+    land_form : np.ndarray
+        Land form names or LandFormType codes.
+    land_cover : np.ndarray
+        Land cover names or LandCoverType codes.
+    rules_hash : str
+        Hash of the rule set, see `get_rules_hash`.
+
+    Returns
+    -------
+    pd.DataFrame
+        Table indexed by the element type (ElementType) with the columns Name and Tag,
+        like `swmmio.Model(...).inp.tags`.
+    """
+    land_form = LandFormType.encode(land_form)
+    land_cover = LandCoverType.encode(land_cover)
+    hashes = get_input_hashes(area, land_form, land_cover)
+    tags = pd.Series(land_form.astype(str), dtype=object)
+    tags = f"{TAG_PREFIX}:" + tags + ":" + land_cover.astype(str) + f":{rules_hash}:" + hashes
+    return pd.DataFrame(
+        {"Name": np.asarray(names, dtype=object), "Tag": tags.to_numpy()},
+        index=pd.Index([SUBCATCHMENT_TAG] * len(names), name="ElementType"),
+    )
+
+
+def parse_tags(tags: pd.DataFrame) -> pd.DataFrame:
+    """
+    Parse the provenance tags of the subcatchments, other tags are skipped.
+
+    Parameters
+    ----------
+    tags : pd.DataFrame
+        The [TAGS] section, `swmmio.Model(...).inp.tags`.
+
+    Returns
+    -------
+    pd.DataFrame
+        Table indexed by the subcatchment name with the columns: land_form and land_cover
+        (codes), rules_hash and input_hash. The last tag of a subcatchment wins.
+    """
+    tag = tags["Tag"].astype(str)
+    subcatchments = (tags.index == SUBCATCHMENT_TAG) & tag.str.startswith(f"{TAG_PREFIX}:").to_numpy()
+    parts = tag[subcatchments].str.split(":", n=len(TAG_COLUMNS), expand=True)
+    parsed = parts.reindex(columns=range(1, len(TAG_COLUMNS) + 1)).set_axis(TAG_COLUMNS, axis=1)
+    parsed.index = pd.Index(tags["Name"][subcatchments], name="Name")
+    codes = parsed[["land_form", "land_cover"]].apply(pd.to_numeric, errors="coerce")
+    valid = codes.notna().all(axis=1) & parsed.notna().all(axis=1)
+    parsed = parsed[valid].astype({"land_form": np.int64, "land_cover": np.int64})
+    return parsed[~parsed.index.duplicated(keep="last")]
+
+
+def get_stale(tags: pd.DataFrame, subcatchments: pd.DataFrame, rules_hash: str) -> pd.DataFrame:
+    """
+    Return the tagged subcatchments whose rule set or inputs changed.
+
+    Parameters
+    ----------
+    tags : pd.DataFrame
+        Result of `parse_tags`.
+    subcatchments : pd.DataFrame
+        The [SUBCATCHMENTS] section with the current areas.
+    rules_hash : str
+        Hash of the current rule set, see `get_rules_hash`.
+
+    Returns
+    -------
+    pd.DataFrame
+        Table indexed by the subcatchment name with the columns area (current), land_form
+        and land_cover (names), ready for `BuildCatchments.update_subcatchments`.
+    """
+    tags = tags[tags.index.isin(subcatchments.index)]
+    area = subcatchments.loc[tags.index, "Area"].to_numpy(dtype=float)
+    hashes = get_input_hashes(area, tags["land_form"], tags["land_cover"])
+    stale = (tags["rules_hash"].to_numpy() != rules_hash) | (tags["input_hash"].to_numpy() != hashes)
+    return pd.DataFrame(
+        {
+            "area": area[stale],
+            "land_form": np.asarray(LandFormType.decode(tags["land_form"].to_numpy()[stale]), object),
+            "land_cover": np.asarray(LandCoverType.decode(tags["land_cover"].to_numpy()[stale]), object),
+        },
+        index=tags.index[stale],
+    )
@@ -0,0 +1,20 @@
+import os
+import tempfile
+
+import pytest
+from swmmio import Model
+
+
+@pytest.fixture
+def tempdir():
+    with tempfile.TemporaryDirectory() as directory:
+        yield directory
+
+
+@pytest.fixture
+def inp_path(tempdir):
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    model = Model(os.path.join(current_dir, "test_file.inp"))
+    path = os.path.join(tempdir, f"{model.inp.name}.inp")
+    model.inp.save(path)
+    return path
@@ -0,0 +1,85 @@
+import os
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+from swmmio import Model
+
+from rcg.inp_manage.cache import CACHE_DIR_VARIABLE, ParseCache, get_default_cache
+from rcg.inp_manage.inp import BuildCatchments
+
+
+@pytest.fixture
+def cache(tempdir):
+    return ParseCache(os.path.join(tempdir, "cache"))
+
+
+def get_entries(cache):
+    return sorted(entry.name for entry in os.scandir(cache.directory))
+
+
+def test_hit(inp_path, cache):
+    parsed = Model(inp_path).inp.subcatchments
+    cache.open(inp_path)
+    assert len(get_entries(cache)) == 1
+    with patch("rcg.inp_manage.cache.ParseCache.store") as store:
+        model = cache.open(inp_path)
+    store.assert_not_called()
+    pd.testing.assert_frame_equal(model.inp._subcatchments_df, parsed)
+
+
+def test_changed_file_is_parsed_again(inp_path, cache):
+    model = BuildCatchments(inp_path, cache=cache)
+    data = pd.DataFrame({"area": [1.0], "land_form": ["mountains"], "land_cover": ["forests"]})
+    ids = model.add_subcatchments(data)
+    assert ids[0] in BuildCatchments(inp_path, cache=cache).model.inp.subcatchments.index
+    assert len(get_entries(cache)) == 2
+
+
+def test_key(inp_path, cache):
+    key = cache.get_key(inp_path)
+    assert cache.get_key(inp_path) == key
+    os.utime(inp_path, ns=(0, 0))
+    assert cache.get_key(inp_path) != key
+
+
+def test_evict(inp_path, cache, tempdir):
+    paths = []
+    for index in range(3):
+        path = os.path.join(tempdir, f"model{index}.inp")
+        Model(inp_path).inp.save(path)
+        cache.open(path)
+        paths.append(path)
+    entries = [os.path.join(cache.directory, f"{cache.get_key(path)}.pkl") for path in paths]
+    # the entry of paths[1] is the least recently used one
+    for entry, used in zip(entries, (3, 1, 2)):
+        os.utime(entry, ns=(used * 10**9, used * 10**9))
+    cache.max_size = int(max(os.path.getsize(entry) for entry in entries) * 2.5)
+    assert cache.evict() == 1
+    assert get_entries(cache) == sorted(os.path.basename(entries[index]) for index in (0, 2))
+    cache.clear()
+    assert get_entries(cache) == []
+
+
+def test_broken_entry(inp_path, cache):
+    cache.open(inp_path)
+    with open(os.path.join(cache.directory, get_entries(cache)[0]), "wb") as file:
+        file.write(b"broken")
+    assert len(cache.open(inp_path).inp.subcatchments) == len(Model(inp_path).inp.subcatchments)
+
+
+def test_default_cache(tempdir):
+    with patch.dict(os.environ, {CACHE_DIR_VARIABLE: tempdir}):
+        assert get_default_cache().directory == tempdir
+    with patch.dict(os.environ, clear=True):
+        assert get_default_cache() is None
+    # the directory of the response surfaces doesn't turn on the parse cache
+    with patch.dict(os.environ, {"RCG_CACHE_DIR": tempdir}, clear=True):
+        assert get_default_cache() is None
+
+
+def test_failed_store_leaves_no_temporary_file(inp_path, cache):
+    with patch("rcg.inp_manage.cache.pickle.dump", side_effect=OSError("disk full")):
+        with pytest.raises(OSError):
+            cache.open(inp_path)
+    assert get_entries(cache) == []
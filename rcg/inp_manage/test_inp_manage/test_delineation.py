@@ -0,0 +1,125 @@
+import os
+
+import numpy as np
+import pytest
+from swmmio import Model
+
+from rcg.inp_manage.delineation import (
+    FlowGrid,
+    delineate_subcatchments,
+    flow_accumulation,
+    flow_directions,
+    follow_paths,
+    get_outlines,
+    resolve_depressions,
+)
+
+# valley draining to the bottom row with a pit at row 4, column 2
+ROWS, COLUMNS = np.mgrid[0:12, 0:11]
+DEM = (20 - ROWS) * 1.0 + np.abs(COLUMNS - 5) * 0.5
+DEM[4, 2] = 5
+ORIGIN = (0, 120)
+
+
+@pytest.fixture
+def grid():
+    return FlowGrid.from_dem(DEM, ORIGIN, 10)
+
+
+class TestFlowDirections:
+    def test_tiles(self, tempdir):
+        receivers, outside = flow_directions(DEM)
+        tiled, tiled_outside = flow_directions(DEM, memory_budget=2 * DEM.shape[1] * 96)
+        np.testing.assert_array_equal(tiled, receivers)
+        np.testing.assert_array_equal(tiled_outside, outside)
+
+        path = os.path.join(tempdir, "dem.npy")
+        np.save(path, DEM)
+        pooled, _ = flow_directions(path, memory_budget=4 * DEM.shape[1] * 96, workers=2)
+        np.testing.assert_array_equal(pooled, receivers)
+
+    def test_steepest_descent(self):
+        receivers, outside = flow_directions(DEM)
+        cells = np.arange(DEM.size).reshape(DEM.shape)
+        assert receivers[cells[3, 3]] == cells[4, 2]
+        assert receivers[cells[6, 5]] == cells[7, 5]
+        assert outside.reshape(DEM.shape)[0].all() and not outside[cells[4, 2]]
+
+    def test_nodata(self):
+        dem = DEM.copy()
+        dem[6, 6] = -9999
+        receivers, outside = flow_directions(dem, nodata=-9999)
+        assert outside.reshape(DEM.shape)[5:8, 5:8].all()
+
+
+class TestDepressions:
+    def test_paths_end_outside(self):
+        receivers, outside = flow_directions(DEM)
+        assert (follow_paths(receivers)[0] == np.ravel_multi_index((4, 2), DEM.shape)).sum() > 1
+        roots, _ = follow_paths(resolve_depressions(DEM, receivers, outside))
+        assert outside[roots].all()
+
+    def test_flat(self):
+        dem = DEM.copy()
+        dem[3:6, 2:4] = 5
+        receivers, outside = flow_directions(dem)
+        roots, _ = follow_paths(resolve_depressions(dem, receivers, outside))
+        assert outside[roots].all()
+
+
+class TestFlowGrid:
+    def test_accumulation(self, grid):
+        assert grid.accumulation.sum() == flow_accumulation(grid.receivers).sum()
+        # the valley collects everything but the border and the cells draining to the sides
+        assert grid.accumulation[11, 5] == 79
+        _, depth = follow_paths(grid.receivers, depth=True)
+        assert grid.accumulation.sum() == depth.sum() + DEM.size
+
+    def test_delineate(self, grid):
+        outlets = grid.get_cells([55, 55], [5, 45])
+        labels = grid.delineate(outlets)
+        assert np.bincount(labels.ravel()).tolist() == [DEM.size - 79, 79 - 46, 46]
+        assert grid.accumulation.ravel()[outlets].tolist() == [79, 46]
+
+    def test_snap(self, grid):
+        cells = grid.get_cells([35], [5])
+        assert grid.snap(cells, radius=2).tolist() == [np.ravel_multi_index((11, 5), DEM.shape)]
+
+    def test_invalid_outlets(self, grid):
+        with pytest.raises(ValueError, match="same cell"):
+            grid.delineate(grid.get_cells([55, 56], [5, 5]))
+        with pytest.raises(ValueError, match="outside of the grid"):
+            grid.get_cells([55, 200], [5, 5])
+
+
+def test_outlines():
+    labels = np.zeros((4, 5), dtype=np.int32)
+    labels[0:3, 0:2] = 1
+    labels[1, 2:4] = 2
+    labels[2, 3] = 2
+    rings = get_outlines(labels, (0, 40), 10)
+    np.testing.assert_allclose(rings.areas(), [600, 300])
+    np.testing.assert_allclose(rings.perimeters(), [100, 80])
+    assert rings.coords[: rings.offsets[1]].tolist() == [
+        [0, 40],
+        [20, 40],
+        [20, 10],
+        [0, 10],
+    ]
+
+
+def test_delineate_subcatchments(inp_path):
+    model = Model(inp_path)
+    x, y = model.inp.coordinates.loc["O4"]
+    # cone around the outfall on a 2 m grid
+    origin = (777150.0, 592620.0)
+    rows, columns = np.mgrid[0:40, 0:40]
+    dem = 100 + 0.1 * np.hypot(origin[0] + (columns + 0.5) * 2 - x, origin[1] - (rows + 0.5) * 2 - y)
+    land_cover = np.full(dem.shape, 11)
+
+    names = delineate_subcatchments(inp_path, dem, land_cover, origin, 2, nodes=["O4", "J3"])
+    subcatchments = Model(inp_path).inp.subcatchments.loc[names]
+    assert subcatchments["Outlet"].tolist() == ["O4", "J3"]
+    assert subcatchments["Area"].sum() == pytest.approx(38 * 38 * 4 / 10_000, abs=0.01)
+    assert (subcatchments["Area"] > 0).all()
+    assert len(Model(inp_path).inp.polygons.loc[names[0]]) >= 4
@@ -0,0 +1,274 @@
+import json
+import os
+import sqlite3
+import struct
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+from swmmio import Model
+
+from rcg.inp_manage.gis import Rings, _parse_wkb, get_width, ingest_features, iter_features
+from rcg.inp_manage.inp import compute_parameters
+
+# square 100 x 100 m with a 20 x 20 m hole, L-shaped polygon and a two-part feature
+FEATURES = [
+    [[[(0, 0), (100, 0), (100, 100), (0, 100), (0, 0)], [(40, 40), (40, 60), (60, 60), (60, 40), (40, 40)]]],
+    [[[(200, 0), (400, 0), (400, 100), (300, 100), (300, 200), (200, 200), (200, 0)]]],
+    [
+        [[(500, 0), (510, 0), (510, 10), (500, 10), (500, 0)]],
+        [[(600, 0), (700, 0), (700, 50), (600, 50), (600, 0)]],
+    ],
+]
+AREAS = [9_600, 30_000, 5_100]
+ATTRIBUTES = pd.DataFrame(
+    {
+        "name": ["A", "B", "C"],
+        "land_form": ["flats_and_plateaus", "mountains", "higher_hills"],
+        "land_cover": [11, 5, 10],
+    }
+)
+
+
+def orient(ring, clockwise):
+    ring = np.asarray(ring, dtype=float)
+    area = np.sum(ring[:-1, 0] * ring[1:, 1] - ring[1:, 0] * ring[:-1, 1])
+    return ring[::-1] if (area < 0) != clockwise else ring
+
+
+def write_geojson(path):
+    features = [
+        {
+            "type": "Feature",
+            "properties": ATTRIBUTES.iloc[i].to_dict(),
+            "geometry": {
+                "type": "MultiPolygon",
+                "coordinates": [[list(map(list, ring)) for ring in polygon] for polygon in polygons],
+            },
+        }
+        for i, polygons in enumerate(FEATURES)
+    ]
+    with open(path, "w") as file:
+        json.dump({"type": "FeatureCollection", "features": features}, file, default=int)
+
+
+def write_shapefile(path):
+    base = os.path.splitext(path)[0]
+    records = []
+    for polygons in FEATURES:
+        rings = [orient(ring, clockwise=position == 0) for polygon in polygons for position, ring in enumerate(polygon)]
+        parts = np.cumsum([0] + [len(ring) for ring in rings[:-1]])
+        points = np.concatenate(rings)
+        content = struct.pack("<i4d2i", 5, *points.min(axis=0), *points.max(axis=0), len(rings), len(points))
+        content += np.asarray(parts, dtype="<i4").tobytes() + points.astype("<f8").tobytes()
+        records.append(content)
+
+    offset = 50
+    shp, shx = b"", b""
+    for number, content in enumerate(records, start=1):
+        shp += struct.pack(">2i", number, len(content) // 2) + content
+        shx += struct.pack(">2i", offset, len(content) // 2)
+        offset += 4 + len(content) // 2
+    header = struct.pack(">7i", 9994, 0, 0, 0, 0, 0, 0) + struct.pack("<2i4d4d", 1000, 5, 0, 0, 0, 0, 0, 0, 0, 0)
+    with open(base + ".shp", "wb") as file:
+        file.write(header[:24] + struct.pack(">i", 50 + len(shp) // 2) + header[28:] + shp)
+    with open(base + ".shx", "wb") as file:
+        file.write(header[:24] + struct.pack(">i", 50 + len(shx) // 2) + header[28:] + shx)
+
+    fields = [("name", b"C", 10), ("land_form", b"C", 50), ("land_cover", b"N", 4)]
+    record_length = 1 + sum(length for _, _, length in fields)
+    header_length = 32 + 32 * len(fields) + 1
+    dbf = struct.pack("<B3BIHH20x", 3, 124, 1, 1, len(ATTRIBUTES), header_length, record_length)
+    for name, kind, length in fields:
+        dbf += struct.pack("<11sc4xBB14x", name.encode(), kind, length, 0)
+    dbf += b"\x0D"
+    for _, row in ATTRIBUTES.iterrows():
+        dbf += b" " + b"".join(
+            str(row[name]).ljust(length).encode() if kind == b"C" else str(row[name]).rjust(length).encode()
+            for name, kind, length in fields
+        )
+    with open(base + ".dbf", "wb") as file:
+        file.write(dbf + b"\x1A")
+
+
+def write_geopackage(path):
+    connection = sqlite3.connect(path)
+    connection.execute("CREATE TABLE gpkg_geometry_columns (table_name TEXT, column_name TEXT)")
+    connection.execute("INSERT INTO gpkg_geometry_columns VALUES ('parcels', 'geom')")
+    connection.execute(
+        "CREATE TABLE parcels (fid INTEGER PRIMARY KEY, geom BLOB, name TEXT, land_form TEXT, land_cover INTEGER)"
+    )
+    for i, polygons in enumerate(FEATURES):
+        wkb = struct.pack("<BII", 1, 6, len(polygons))
+        for polygon in polygons:
+            wkb += struct.pack("<BII", 1, 3, len(polygon))
+            for ring in polygon:
+                wkb += struct.pack("<I", len(ring)) + np.asarray(ring, dtype="<f8").tobytes()
+        # little-endian header with an XY envelope
+        blob = b"GP" + bytes([0, 0b011]) + struct.pack("<i4d", 0, 0, 0, 0, 0) + wkb
+        row = ATTRIBUTES.iloc[i]
+        connection.execute(
+            "INSERT INTO parcels VALUES (?, ?, ?, ?, ?)",
+            (i + 1, blob, row["name"], row["land_form"], int(row["land_cover"])),
+        )
+    connection.commit()
+    connection.close()
+
+
+WRITERS = {".geojson": write_geojson, ".shp": write_shapefile, ".gpkg": write_geopackage}
+
+
+@pytest.mark.parametrize(
+    "geometry_type, extra",
+    [
+        (3, 0),
+        (1003, 1),  # ISO Z
+        (2003, 1),  # ISO M
+        (3003, 2),  # ISO ZM
+        (0x80000003, 1),  # EWKB Z
+        (0x40000003, 1),  # EWKB M
+        (0xC0000003, 2),  # EWKB ZM
+    ],
+)
+def test_parse_wkb_dimensions(geometry_type, extra):
+    polygon = FEATURES[0][0]
+    wkb = struct.pack("<BII", 1, geometry_type, len(polygon))
+    for ring in polygon:
+        points = np.column_stack([np.asarray(ring, dtype=float)] + [np.full(len(ring), 7.0)] * extra)
+        wkb += struct.pack("<I", len(ring)) + points.astype("<f8").tobytes()
+    polygons, offset = _parse_wkb(wkb)
+    assert offset == len(wkb)
+    for parsed, ring in zip(polygons[0], polygon):
+        np.testing.assert_array_equal(parsed, ring)
+
+
+class TestRings:
+    def test_measures(self):
+        rings = Rings.from_polygons(FEATURES)
+        np.testing.assert_allclose(rings.areas(), AREAS)
+        np.testing.assert_allclose(rings.perimeters(), [400, 800, 340])
+
+    def test_outlines(self):
+        feature, coords = Rings.from_polygons(FEATURES).outlines()
+        assert feature.tolist() == [0] * 4 + [1] * 6 + [2] * 4
+        assert coords[10].tolist() == [600, 0]
+
+    def test_width(self):
+        np.testing.assert_allclose(get_width([10_000, 5_000], [400, 300]), [100, 50])
+
+
+def test_geojson_read_in_blocks(tempdir):
+    path = os.path.join(tempdir, "parcels.geojson")
+    write_geojson(path)
+    with open(path) as file:
+        collection = json.load(file)
+    with open(path, "w") as file:
+        json.dump({"type": "FeatureCollection", "count": 1234567, "bbox": [0, 0, 700, 200], **collection}, file)
+    expected = list(iter_features(path, chunk_size=2))
+    with patch("rcg.inp_manage.gis.JSON_BLOCK_SIZE", 7):
+        chunks = list(iter_features(path, chunk_size=2))
+    assert len(chunks) == len(expected) == 2
+    for (attributes, rings), (expected_attributes, expected_rings) in zip(chunks, expected):
+        pd.testing.assert_frame_equal(attributes, expected_attributes)
+        np.testing.assert_array_equal(rings.coords, expected_rings.coords)
+
+    with open(path, "w") as file:
+        json.dump({"type": "FeatureCollection"}, file)
+    with pytest.raises(ValueError, match="no features"):
+        list(iter_features(path))
+
+
+@pytest.mark.parametrize("extension", list(WRITERS))
+class TestIterFeatures:
+    def test_formats(self, tempdir, extension):
+        path = os.path.join(tempdir, f"parcels{extension}")
+        WRITERS[extension](path)
+        chunks = list(iter_features(path, chunk_size=2))
+        assert [len(attributes) for attributes, _ in chunks] == [2, 1]
+        attributes = pd.concat([attributes for attributes, _ in chunks], ignore_index=True)
+        assert attributes["name"].tolist() == ["A", "B", "C"]
+        assert pd.to_numeric(attributes["land_cover"]).tolist() == [11, 5, 10]
+        areas = np.concatenate([rings.areas() for _, rings in chunks])
+        np.testing.assert_allclose(areas, AREAS)
+
+    def test_ingest(self, inp_path, tempdir, extension):
+        path = os.path.join(tempdir, f"parcels{extension}")
+        WRITERS[extension](path)
+        assert ingest_features(inp_path, path, name_field="name", chunk_size=2) == 3
+
+        model = Model(inp_path)
+        subcatchments = model.inp.subcatchments.loc[["A", "B", "C"]]
+        np.testing.assert_allclose(subcatchments["Area"], np.array(AREAS) / 10_000)
+        np.testing.assert_allclose(subcatchments["Width"], np.round(get_width(AREAS, [400, 800, 340]), 2))
+        assert len(model.inp.polygons.loc["B"]) == 6
+        assert model.inp.infiltration.loc["A"].notna().all()
+
+
+class TestIngestFeatures:
+    def test_generated_names(self, inp_path, tempdir):
+        path = os.path.join(tempdir, "parcels.geojson")
+        write_geojson(path)
+        before = set(Model(inp_path).inp.subcatchments.index)
+        assert ingest_features(inp_path, path) == 3
+        assert len(set(Model(inp_path).inp.subcatchments.index) - before) == 3
+
+    def test_invalid_features_leave_file_unchanged(self, inp_path, tempdir):
+        path = os.path.join(tempdir, "parcels.geojson")
+        write_geojson(path)
+        with open(path) as file:
+            collection = json.load(file)
+        collection["features"][2]["properties"]["land_cover"] = 99
+        with open(path, "w") as file:
+            json.dump(collection, file)
+        with open(inp_path) as file:
+            before = file.read()
+        with pytest.raises(ValueError, match="Row C"):
+            ingest_features(inp_path, path, name_field="name")
+        with open(inp_path) as file:
+            assert file.read() == before
+
+    def test_used_names(self, inp_path, tempdir):
+        path = os.path.join(tempdir, "parcels.geojson")
+        write_geojson(path)
+        ingest_features(inp_path, path, name_field="name")
+        with pytest.raises(ValueError, match="already used"):
+            ingest_features(inp_path, path, name_field="name")
+
+    def test_remap(self, inp_path, tempdir):
+        path = os.path.join(tempdir, "parcels.geojson")
+        write_geojson(path)
+        with pytest.raises(ValueError, match="'5' \\(1\\), '10' \\(1\\), '11' \\(1\\)"):
+            ingest_features(inp_path, path, name_field="name", remap="corine")
+        remap = {11: "forests", 5: "arable", 10: {"meadows": 3, "rural": 1}}
+        assert ingest_features(inp_path, path, name_field="name", remap=remap) == 3
+        expected = compute_parameters(
+            pd.DataFrame(
+                {
+                    "area": [0.96, 0.51],
+                    "land_form": ["flats_and_plateaus", "higher_hills"],
+                    "land_cover": ["forests", "meadows"],
+                },
+                index=["A", "C"],
+            )
+        )
+        subcatchments = Model(inp_path).inp.subcatchments.loc[["A", "C"]]
+        np.testing.assert_allclose(subcatchments["PercImperv"], expected["PercImperv"])
+
+    def test_nearest_outlets(self, inp_path, tempdir):
+        path = os.path.join(tempdir, "parcels.geojson")
+        write_geojson(path)
+        ingest_features(inp_path, path, name_field="name", outlets="nearest", node_types=["junction"])
+        outlets = Model(inp_path).inp.subcatchments.loc[["A", "B", "C"], "Outlet"]
+        # the features lie far south-west of the nodes, J3 is the closest junction
+        assert outlets.tolist() == ["J3", "J3", "J3"]
+
+    def test_missing_attribute(self, inp_path, tempdir):
+        path = os.path.join(tempdir, "parcels.geojson")
+        write_geojson(path)
+        with pytest.raises(ValueError, match="Missing attributes"):
+            ingest_features(inp_path, path, land_cover_field="cover")
+
+    def test_unsupported_format(self, inp_path):
+        with pytest.raises(ValueError, match="Unsupported"):
+            ingest_features(inp_path, "parcels.kml")
@@ -3,13 +3,21 @@ import pytest
 import tempfile
 import unittest.mock
 import math
+import numpy as np
 import pandas as pd
 
 from unittest.mock import patch
 from swmmio import Model
-from rcg.inp_manage.inp import BuildCatchments
+from rcg.inp_manage.inp import (
+    BuildCatchments,
+    compute_parameters,
+    get_subarea_values,
+    validate_subcatchments,
+)
+from rcg.fuzzy.config import EngineConfig, get_engine
 from rcg.fuzzy.engine import Prototype
-from rcg.fuzzy.categories import LandForm, LandCover
+from rcg.inp_manage.parameters import INFILTRATION_PARAMETERS, HydrologicParameters
+from rcg.fuzzy.categories import LandForm, LandCover, LandFormType, LandCoverType
 
 
 class TestBuildCatchments:
@@ -296,3 +304,248 @@ class TestBuildCatchments:
         )
         expected_polygons.set_index("Name", inplace=True)
         pd.testing.assert_frame_equal(test_model.model.inp.polygons, expected_polygons)
+
+
+class TestBulkSubcatchments:
+    @pytest.fixture
+    def data(self):
+        return pd.DataFrame(
+            {
+                "area": [1.0, "2,5", 4],
+                "land_form": ["mountains", "flats_and_plateaus", "higher hills"],
+                "land_cover": ["urban_weakly_impervious", "rural", "forests"],
+            }
+        )
+
+    def test_validate_subcatchments(self, data):
+        result = validate_subcatchments(data)
+        assert list(result["area"]) == [1.0, 2.5, 4.0]
+        assert result["land_form"].iloc[2] == "higher_hills"
+
+    def test_validate_subcatchments_reports_all_rows(self, data):
+        data.loc[0, "area"] = "abc"
+        data.loc[2, "land_cover"] = "invalid_land_cover"
+        with pytest.raises(ValueError) as error:
+            validate_subcatchments(data)
+        assert "Row 0" in str(error.value)
+        assert "Row 2" in str(error.value)
+        assert "Row 1" not in str(error.value)
+
+    def test_validate_subcatchments_missing_column(self, data):
+        with pytest.raises(ValueError):
+            validate_subcatchments(data.drop(columns="land_form"))
+
+    def test_add_subcatchments(self, inp_path, data):
+        test_model = BuildCatchments(inp_path)
+        initial_count = len(test_model.model.inp.subcatchments)
+
+        ids = test_model.add_subcatchments(data)
+
+        assert len(ids) == 3
+        assert len(set(ids)) == 3
+        saved = Model(inp_path)
+        assert len(saved.inp.subcatchments) == initial_count + 3
+        for subcatchment_id in ids:
+            assert subcatchment_id in saved.inp.subareas.index
+            assert subcatchment_id in saved.inp.infiltration.index
+            assert len(saved.inp.polygons.loc[subcatchment_id]) == 4
+
+        prototype = Prototype(LandForm.mountains, LandCover.urban_weakly_impervious)
+        row = saved.inp.subcatchments.loc[ids[0]]
+        assert row["PercImperv"] == pytest.approx(round(prototype.impervious_result, 2))
+        assert row["PercSlope"] == pytest.approx(round(prototype.slope_result, 2))
+        assert row["Width"] == pytest.approx(100.0)
+        assert saved.inp.subareas.loc[ids[0], "PctZero"] == pytest.approx(
+            get_subarea_values(Prototype.get_populate(prototype.catchment_result))["PctZero"]
+        )
+
+    def test_add_subcatchment_uses_land_cover_infiltration(self, inp_path):
+        parameters = HydrologicParameters.from_dict({"infiltration": {"forests": {"Ksat": 9.9}}})
+        model = BuildCatchments(inp_path, parameters)
+        values = (1.0, Prototype(LandFormType.mountains, LandCoverType.forests))
+        with patch.object(model, "_get_subcatchment_values", return_value=values):
+            model.add_subcatchment()
+        infiltration = Model(inp_path).inp.infiltration.iloc[-1]
+        expected = parameters.get_infiltration(["forests"]).iloc[0]
+        assert infiltration[expected.index].tolist() == pytest.approx(expected.tolist())
+        assert infiltration["Ksat"] == 9.9
+
+    def test_add_subcatchments_matches_single_coords(self, inp_path, data):
+        bulk_model = BuildCatchments(inp_path)
+        ids = bulk_model._get_new_subcatchment_ids(3)
+        area = validate_subcatchments(data)["area"].to_numpy()
+        bulk_coords = bulk_model._get_square_coords(ids, area)
+
+        single_model = BuildCatchments(inp_path)
+        initial_count = len(single_model.model.inp.polygons)
+        for subcatchment_id, value in zip(ids, area):
+            single_model._add_coords(subcatchment_id, value)
+        single_coords = single_model.model.inp.polygons.iloc[initial_count:]
+
+        np.testing.assert_allclose(bulk_coords.to_numpy(), single_coords.to_numpy())
+        assert list(bulk_coords.index) == list(single_coords.index)
+
+    def test_add_subcatchments_invalid_rows_leave_file_unchanged(self, inp_path, data):
+        data.loc[1, "land_form"] = "invalid_land_form"
+        with open(inp_path) as file:
+            before = file.read()
+        with pytest.raises(ValueError):
+            BuildCatchments(inp_path).add_subcatchments(data)
+        with open(inp_path) as file:
+            assert file.read() == before
+
+
+class TestUpdateSubcatchments:
+    @pytest.fixture
+    def inp_path(self, inp_path):
+        with open(inp_path) as file:
+            text = file.read()
+        with open(inp_path, "w") as file:
+            file.write(text.replace("[TAGS]\n", "[TAGS]\nSubcatch  S2  rcg\nNode  J1  kept\n", 1))
+        return inp_path
+
+    @pytest.fixture
+    def data(self):
+        return pd.DataFrame(
+            {
+                "area": [17.0, 5.0],
+                "land_form": ["mountains", "flats_and_plateaus"],
+                "land_cover": ["urban_weakly_impervious", "forests"],
+            },
+            index=["S2", "S4"],
+        )
+
+    def test_update_subcatchments(self, inp_path, data):
+        assert BuildCatchments(inp_path).update_subcatchments(data) == ["S2", "S4"]
+        expected = compute_parameters(data)
+        saved = Model(inp_path).inp
+        for section, columns in (
+            (saved.subcatchments, ["Area", "PercImperv", "PercSlope"]),
+            (saved.subareas, ["N-Imperv", "PctZero"]),
+            (saved.infiltration, list(INFILTRATION_PARAMETERS)),
+        ):
+            np.testing.assert_allclose(
+                section.loc[["S2", "S4"], columns].to_numpy(dtype=float),
+                expected[columns].to_numpy(dtype=float),
+            )
+        # the width of S2 is kept as its area didn't change
+        assert saved.subcatchments["Width"].tolist()[1:4] == pytest.approx(
+            [412.31, 346.41, expected.at["S4", "Width"]], abs=0.01
+        )
+        assert saved.subcatchments.loc["S2", "Outlet"] == "J1"
+        assert len(saved.subcatchments) == len(Model(inp_path).inp.subcatchments)
+
+    def test_update_unknown_names(self, inp_path, data):
+        with open(inp_path) as file:
+            before = file.read()
+        with pytest.raises(KeyError, match="X1, X2"):
+            BuildCatchments(inp_path).update_subcatchments(data.set_axis(["X1", "X2"]))
+        with pytest.raises(ValueError, match="Repeated"):
+            BuildCatchments(inp_path).update_subcatchments(data.set_axis(["S2", "S2"]))
+        with open(inp_path) as file:
+            assert file.read() == before
+
+    def test_remove_subcatchments(self, inp_path):
+        polygons = Model(inp_path).inp.polygons
+        assert BuildCatchments(inp_path).remove_subcatchments(["S2", "S3", "S2"]) == 2
+        saved = Model(inp_path).inp
+        for section in (saved.subcatchments, saved.subareas, saved.infiltration):
+            assert not section.index.isin(["S2", "S3"]).any()
+        pd.testing.assert_frame_equal(saved.polygons, polygons[~polygons.index.isin(["S2", "S3"])])
+        assert saved.tags["Name"].tolist() == ["J1"]
+
+    def test_remove_keeps_routing(self, inp_path):
+        model = BuildCatchments(inp_path)
+        model.model.inp.subcatchments.loc["S4", "Outlet"] = "S3"
+        with pytest.raises(ValueError, match="drain to the removed ones: S4"):
+            model.remove_subcatchments(["S3"])
+        with pytest.raises(KeyError, match="X1"):
+            model.remove_subcatchments(["X1"])
+
+
+class TestComputeParameters:
+    @pytest.fixture
+    def data(self):
+        return pd.DataFrame(
+            {
+                "area": [1.0, 2.5, 4.0],
+                "land_form": ["mountains", "flats_and_plateaus", "higher_hills"],
+                "land_cover": ["urban_weakly_impervious", "rural", "forests"],
+            },
+            index=["a", "b", "c"],
+        )
+
+    def test_columns_and_index(self, data):
+        parameters = compute_parameters(data)
+        assert list(parameters.index) == ["a", "b", "c"]
+        for column in [
+            "Area",
+            "PercImperv",
+            "PercSlope",
+            "Width",
+            "N-Imperv",
+            "N-Perv",
+            "S-Imperv",
+            "S-Perv",
+            "PctZero",
+            "Suction",
+            "Ksat",
+            "IMD",
+            "Param4",
+            "Param5",
+        ]:
+            assert column in parameters.columns
+
+    def test_matches_prototype(self, data):
+        parameters = compute_parameters(data)
+        for row, values in data.iterrows():
+            prototype = Prototype(
+                getattr(LandForm, values["land_form"]),
+                getattr(LandCover, values["land_cover"]),
+            )
+            populate_key = Prototype.get_populate(prototype.catchment_result)
+            result = parameters.loc[row]
+            assert result["PercImperv"] == pytest.approx(round(prototype.impervious_result, 2))
+            assert result["PercSlope"] == pytest.approx(round(prototype.slope_result, 2))
+            assert result["Width"] == pytest.approx(round(math.sqrt(values["area"] * 10_000), 2))
+            for key, value in get_subarea_values(populate_key).items():
+                assert result[key] == pytest.approx(value)
+            for key, value in INFILTRATION_PARAMETERS.items():
+                assert result[key] == pytest.approx(value)
+
+    def test_accepts_codes(self, data):
+        codes = data.assign(
+            land_form=LandFormType.encode(data["land_form"]),
+            land_cover=LandCoverType.encode(data["land_cover"]),
+        )
+        pd.testing.assert_frame_equal(compute_parameters(data), compute_parameters(codes))
+
+    def test_invalid_area(self, data):
+        data.loc["b", "area"] = -1
+        with pytest.raises(ValueError) as error:
+            compute_parameters(data)
+        assert "b" in str(error.value)
+
+    def test_invalid_category(self, data):
+        data.loc["c", "land_cover"] = "invalid_land_cover"
+        with pytest.raises(ValueError):
+            compute_parameters(data)
+
+    def test_default_config(self, data):
+        pd.testing.assert_frame_equal(compute_parameters(data, config=EngineConfig()), compute_parameters(data))
+
+    def test_config_matches_prototype(self, data):
+        config = EngineConfig({"catchment": {"urban": [0, 0, 30], "suburban": [0, 30, 45]}})
+        data.loc["a", "land_form"] = "flats_and_plateaus"
+        parameters = compute_parameters(data, config=config)
+        assert parameters.loc["a", "catchment_class"] == "urban"
+        for row, values in data.iterrows():
+            prototype = Prototype(
+                getattr(LandForm, values["land_form"]),
+                getattr(LandCover, values["land_cover"]),
+                fuzzy_engine=get_engine(config),
+            )
+            result = parameters.loc[row]
+            assert result["catchment_class"] == prototype.catchment_class
+            assert result["PercImperv"] == pytest.approx(round(prototype.impervious_result, 2))
+            assert result["PercSlope"] == pytest.approx(round(prototype.slope_result, 2))
@@ -0,0 +1,80 @@
+import numpy as np
+import pandas as pd
+import pytest
+from swmmio import Model
+
+from rcg.inp_manage.inp import BuildCatchments
+from rcg.inp_manage.layout import get_extent, get_rectangle_sizes, layout_polygons, pack_grid, pack_shelves
+from rcg.inp_manage.stream import stream_subcatchments
+
+AREA = np.random.default_rng(0).uniform(0.1, 5, 200)
+
+
+def get_boxes(polygons):
+    vertices = polygons[["X", "Y"]].to_numpy().reshape(-1, 4, 2)
+    return np.column_stack([vertices.min(axis=1), vertices.max(axis=1)])
+
+
+def assert_disjoint(boxes):
+    min_x, min_y, max_x, max_y = (boxes[:, [i]] for i in range(4))
+    overlap = (min_x < max_x.T - 1e-6) & (min_x.T < max_x - 1e-6) & (min_y < max_y.T - 1e-6) & (min_y.T < max_y - 1e-6)
+    np.fill_diagonal(overlap, False)
+    assert not overlap.any()
+
+
+def test_rectangle_sizes():
+    widths, heights = get_rectangle_sizes(np.array([1.0, 4.0]), aspect_ratio=4)
+    np.testing.assert_allclose(widths, [200, 400])
+    np.testing.assert_allclose(heights, [50, 100])
+    with pytest.raises(ValueError, match="aspect ratio"):
+        get_rectangle_sizes(np.array([1.0]), aspect_ratio=0)
+
+
+@pytest.mark.parametrize("pack", [pack_grid, pack_shelves])
+def test_packing_is_compact(pack):
+    widths, heights = get_rectangle_sizes(AREA, aspect_ratio=1.5)
+    x, y = pack(widths, heights, gap=5)
+    boxes = np.column_stack([x, -y - heights, x + widths, -y])
+    assert_disjoint(boxes)
+    block = (boxes[:, 2].max() - boxes[:, 0].min()) * (boxes[:, 3].max() - boxes[:, 1].min())
+    assert block < 2.5 * np.sum(widths * heights)
+
+
+def test_shelves():
+    x, y = pack_shelves(np.array([10, 30, 20, 20.0]), np.array([10, 30, 20, 20.0]), max_width=50)
+    assert x.tolist() == [20, 0, 30, 0]
+    assert y.tolist() == [30, 0, 0, 30]
+
+
+def test_layout_polygons():
+    polygons = layout_polygons(["A", "B"], np.array([1.0, 1.0]), extent=(0, 0, 50, 80), layout="grid", gap=10)
+    assert polygons.index.tolist() == ["A"] * 4 + ["B"] * 4
+    assert polygons.loc["A"].to_numpy().tolist() == [[60, 80], [160, 80], [160, -20], [60, -20]]
+    assert get_extent(polygons) == (60, -20, 270, 80)
+    with pytest.raises(ValueError, match="Unknown layout"):
+        layout_polygons(["A"], np.array([1.0]), layout="cascade")
+
+
+def test_add_subcatchments(inp_path):
+    model = BuildCatchments(inp_path)
+    extent = model.get_extent()
+    data = pd.DataFrame({"area": AREA[:20], "land_form": ["mountains"] * 20, "land_cover": ["forests"] * 20})
+    ids = model.add_subcatchments(data, layout="shelf", gap=1)
+    polygons = Model(inp_path).inp.polygons.loc[ids]
+    boxes = get_boxes(polygons)
+    assert_disjoint(boxes)
+    assert boxes[:, 0].min() > extent[2]
+    np.testing.assert_allclose((boxes[:, 2] - boxes[:, 0]) * (boxes[:, 3] - boxes[:, 1]), AREA[:20] * 10_000)
+    with pytest.raises(ValueError, match="Unknown layout"):
+        model.add_subcatchments(data, layout="spiral")
+
+
+def test_stream_chunks_do_not_overlap(inp_path):
+    rows = [{"area": area, "land_form": "mountains", "land_cover": "forests"} for area in AREA[:30]]
+    extent = BuildCatchments(inp_path).get_extent()
+    stream_subcatchments(inp_path, rows, chunk_size=7, layout="grid")
+    model = Model(inp_path)
+    new = model.inp.subcatchments.index[-30:]
+    boxes = get_boxes(model.inp.polygons.loc[new])
+    assert_disjoint(boxes)
+    assert boxes[:, 0].min() >= extent[2]
@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+import pytest
+from swmmio import Model
+
+from rcg.inp_manage.inp import BuildCatchments
+from rcg.inp_manage.outlets import OutletIndex
+
+NODES = pd.DataFrame(
+    {"X": [0, 100, 200, 50], "Y": [0, 0, 0, 100], "type": ["junction", "junction", "outfall", "storage"]},
+    index=["J1", "J2", "O1", "S1"],
+)
+
+
+class TestOutletIndex:
+    def test_nearest(self):
+        index = OutletIndex(NODES)
+        assert index.query([[10, 5], [160, -20], [55, 90]]).tolist() == ["J1", "O1", "J2"]
+
+    def test_node_types(self):
+        index = OutletIndex(NODES)
+        assert index.query([[190, 5], [55, 90]], node_types=["outfall", "storage"]).tolist() == ["O1", "S1"]
+        with pytest.raises(ValueError, match="Unknown node types: pump"):
+            index.query([[0, 0]], node_types=["pump"])
+
+    def test_max_distance(self):
+        index = OutletIndex(NODES)
+        assert index.query([[10, 5], [500, 500], [np.nan, 0]], max_distance=20).tolist() == ["J1", None, None]
+
+    def test_from_model(self, inp_path):
+        index = OutletIndex.from_model(Model(inp_path).inp)
+        assert {node_type: names.tolist() for node_type, names in index.names.items()} == {
+            "junction": ["J1", "J3"],
+            "outfall": ["O4"],
+        }
+
+
+class TestGetOutlets:
+    def test_last(self, inp_path):
+        model = BuildCatchments(inp_path)
+        assert model.get_outlets(["S1"], [[0, 0]]) == "O4"
+
+    def test_nearest(self, inp_path):
+        model = BuildCatchments(inp_path)
+        x, y = model.model.inp.coordinates.loc["J1"]
+        outlets = model.get_outlets(["S1", "S2"], [[x + 1, y], [0, 0]], "nearest", max_distance=10)
+        assert outlets.tolist() == ["J1", "O4"]
+        assert model.get_outlet_index() is model.get_outlet_index()
+
+    def test_unknown_rule(self, inp_path):
+        with pytest.raises(ValueError, match="Unknown outlet rule"):
+            BuildCatchments(inp_path).get_outlets(["S1"], [[0, 0]], "closest")
+
+    def test_add_subcatchments(self, inp_path):
+        model = BuildCatchments(inp_path)
+        data = pd.DataFrame({"area": [1.0, 2.0], "land_form": ["mountains"] * 2, "land_cover": ["forests"] * 2})
+        ids = model.add_subcatchments(data, outlets="nearest", node_types=["junction"])
+        outlets = Model(inp_path).inp.subcatchments.loc[ids, "Outlet"]
+        assert set(outlets) <= {"J1", "J3"}
@@ -0,0 +1,128 @@
+import json
+import os
+import tempfile
+
+import pandas as pd
+import pytest
+
+from rcg.fuzzy.categories import CatchmentType, LandCoverType
+from rcg.inp_manage.inp import compute_parameters, get_subarea_values
+from rcg.inp_manage.parameters import (
+    INFILTRATION_PARAMETERS,
+    MAP_DEPRESSION,
+    MAP_MANNINGS,
+    HydrologicParameters,
+    default_parameters,
+)
+
+
+class TestHydrologicParameters:
+    def test_default_matches_maps(self):
+        subareas = default_parameters.get_subareas(CatchmentType.names())
+        for row, name in enumerate(CatchmentType.names()):
+            assert subareas.at[row, "N-Imperv"] == MAP_MANNINGS[name][0]
+            assert subareas.at[row, "N-Perv"] == MAP_MANNINGS[name][1]
+            assert subareas.at[row, "S-Imperv"] == MAP_DEPRESSION[name][0] * 25.4
+            assert subareas.at[row, "S-Perv"] == MAP_DEPRESSION[name][1] * 25.4
+            assert subareas.at[row, "PctZero"] == MAP_DEPRESSION[name][2]
+
+        infiltration = default_parameters.get_infiltration(LandCoverType.names())
+        for key, value in INFILTRATION_PARAMETERS.items():
+            assert (infiltration[key] == value).all()
+
+    def test_partial_config(self):
+        parameters = HydrologicParameters.from_dict(
+            {
+                "subareas": {"urban": {"N-Perv": 0.2}},
+                "infiltration": {"default": {"Suction": 4.0}, "forests": {"Ksat": 1.2}},
+            }
+        )
+        subareas = parameters.get_subareas(["urban", "rural"])
+        assert subareas["N-Perv"].tolist() == [0.2, MAP_MANNINGS["rural"][1]]
+        assert subareas.at[0, "N-Imperv"] == MAP_MANNINGS["urban"][0]
+
+        infiltration = parameters.get_infiltration(["forests", "marshes"])
+        assert infiltration["Ksat"].tolist() == [1.2, INFILTRATION_PARAMETERS["Ksat"]]
+        assert infiltration["Suction"].tolist() == [4.0, 4.0]
+
+    def test_default_infiltration_without_land_cover(self):
+        parameters = HydrologicParameters.from_dict(
+            {"infiltration": {"default": {"Suction": 4.0}, "permeable_areas": {"Ksat": 9.9}}}
+        )
+        infiltration = parameters.get_infiltration(size=2)
+        assert infiltration["Ksat"].tolist() == [INFILTRATION_PARAMETERS["Ksat"]] * 2
+        assert infiltration["Suction"].tolist() == [4.0, 4.0]
+        assert parameters.get_infiltration(["permeable_areas"]).at[0, "Ksat"] == 9.9
+
+    def test_accepts_codes(self):
+        by_name = default_parameters.get_subareas(["forests", "urban"])
+        by_code = default_parameters.get_subareas([CatchmentType.forests, CatchmentType.urban])
+        pd.testing.assert_frame_equal(by_name, by_code)
+
+    def test_invalid_config_reports_all_errors(self):
+        with pytest.raises(ValueError) as error:
+            HydrologicParameters.from_dict(
+                {
+                    "subareas": {"city": {"N-Perv": 0.2}, "urban": {"N-Perv": "high"}},
+                    "infiltration": {"forests": {"Porosity": 0.4}},
+                    "options": {},
+                }
+            )
+        message = str(error.value)
+        assert "Unknown catchment class: city" in message
+        assert "subareas.urban.N-Perv must be a number" in message
+        assert "Unknown parameter infiltration.forests.Porosity" in message
+        assert "Unknown sections: options" in message
+
+    def test_negative_value(self):
+        with pytest.raises(ValueError, match="non-negative"):
+            HydrologicParameters.from_dict({"subareas": {"urban": {"N-Perv": -0.1}}})
+
+    def test_pct_zero_above_100(self):
+        with pytest.raises(ValueError, match="PctZero"):
+            HydrologicParameters.from_dict({"subareas": {"urban": {"PctZero": 120}}})
+
+    def test_arrays_are_read_only(self):
+        with pytest.raises(ValueError):
+            default_parameters.subareas[0, 0] = 1
+
+    def test_file_round_trip(self):
+        parameters = HydrologicParameters.from_dict(
+            {"infiltration": {"default": {"Ksat": 0.7}, "forests": {"Ksat": 1.2}}}
+        )
+        with tempfile.TemporaryDirectory() as tempdir:
+            path = os.path.join(tempdir, "parameters.json")
+            parameters.save(path)
+            with open(path) as file:
+                assert json.load(file)["infiltration"]["forests"]["Ksat"] == 1.2
+            loaded = HydrologicParameters.from_file(path)
+        assert (loaded.subareas == parameters.subareas).all()
+        assert (loaded.infiltration == parameters.infiltration).all()
+        assert (loaded.default_infiltration == parameters.default_infiltration).all()
+
+    def test_compute_parameters_uses_tables(self):
+        parameters = HydrologicParameters.from_dict(
+            {
+                "subareas": {"forests": {"N-Perv": 0.9}},
+                "infiltration": {"forests": {"Ksat": 1.2}},
+            }
+        )
+        data = pd.DataFrame(
+            {
+                "area": [1.0, 2.0],
+                "land_form": ["flats_and_plateaus", "flats_and_plateaus"],
+                "land_cover": ["forests", "marshes"],
+            }
+        )
+        default = compute_parameters(data)
+        custom = compute_parameters(data, parameters)
+
+        assert custom["Ksat"].tolist() == [1.2, INFILTRATION_PARAMETERS["Ksat"]]
+        forests = custom["catchment_class"] == "forests"
+        assert (custom.loc[forests, "N-Perv"] == 0.9).all()
+        assert (custom.loc[~forests, "N-Perv"] == default.loc[~forests, "N-Perv"]).all()
+
+    def test_get_subarea_values_with_tables(self):
+        parameters = HydrologicParameters.from_dict({"subareas": {"urban": {"PctZero": 60}}})
+        assert get_subarea_values("urban", parameters)["PctZero"] == 60
+        assert get_subarea_values("urban")["PctZero"] == MAP_DEPRESSION["urban"][2]
@@ -0,0 +1,95 @@
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+from swmmio import Model
+
+from rcg.inp_manage.gis import ingest_features
+from rcg.inp_manage.inp import BuildCatchments
+from rcg.inp_manage.raingages import RaingageIndex, read_symbols
+
+SYMBOLS = pd.DataFrame({"X": [0, 100, 0], "Y": [0, 0, 100]}, index=pd.Index(["RG1", "RG2", "RG3"], name="Name"))
+GAGES = {"RG_west": (0, 0), "RG_east": (700, 0)}
+
+
+@pytest.fixture
+def multi_gage_path(tempdir):
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    with open(os.path.join(current_dir, "test_file.inp")) as file:
+        text = file.read()
+    gage = "Raingage2        INTENSITY 0:01     1.0      TIMESERIES test_series     \n"
+    symbol = "Raingage2        777181.540         592591.318        \n"
+    for name, (x, y) in GAGES.items():
+        text = text.replace(gage, gage + gage.replace("Raingage2", name.ljust(9)), 1)
+        text = text.replace(symbol, symbol + f"{name:<16} {x:<18} {y:<18}\n", 1)
+    # a symbol of a gage which is not in [RAINGAGES]
+    text = text.replace(symbol, symbol + "RG_removed       350                0\n", 1)
+    path = os.path.join(tempdir, "multi.inp")
+    with open(path, "w") as file:
+        file.write(text)
+    return path
+
+
+def test_read_symbols(inp_path):
+    symbols = read_symbols(inp_path)
+    assert symbols.index.tolist() == ["Raingage2"]
+    assert symbols.loc["Raingage2"].tolist() == [777181.540, 592591.318]
+
+
+class TestRaingageIndex:
+    def test_nearest(self):
+        index = RaingageIndex(SYMBOLS)
+        assert index.query([[10, 5], [60, 10], [20, 90]]).tolist() == ["RG1", "RG2", "RG3"]
+
+    def test_missing(self):
+        assert RaingageIndex(SYMBOLS).query([[np.nan, 0]]).tolist() == [None]
+        assert RaingageIndex(SYMBOLS.iloc[:0]).query([[0, 0]]).tolist() == [None]
+
+    def test_from_model(self, multi_gage_path):
+        index = RaingageIndex.from_model(multi_gage_path, Model(multi_gage_path).inp.raingages.index)
+        assert sorted(index.names) == ["RG_east", "RG_west", "Raingage2"]
+
+
+class TestGetRaingages:
+    def test_first(self, multi_gage_path):
+        model = BuildCatchments(multi_gage_path)
+        assert model.get_raingages([[0, 0]]) == "Raingage2"
+
+    def test_nearest(self, multi_gage_path):
+        model = BuildCatchments(multi_gage_path)
+        raingages = model.get_raingages([[330, 0], [380, 0], [np.nan, 0]], "nearest")
+        assert raingages.tolist() == ["RG_west", "RG_east", "Raingage2"]
+        assert model.get_raingage_index() is model.get_raingage_index()
+
+    def test_unknown_rule(self, inp_path):
+        with pytest.raises(ValueError, match="Unknown raingage rule"):
+            BuildCatchments(inp_path).get_raingages([[0, 0]], "thiessen")
+
+    def test_add_subcatchments(self, multi_gage_path):
+        model = BuildCatchments(multi_gage_path)
+        data = pd.DataFrame({"area": [1.0, 2.0], "land_form": ["mountains"] * 2, "land_cover": ["forests"] * 2})
+        ids = model.add_subcatchments(data, raingages="nearest")
+        raingages = Model(multi_gage_path).inp.subcatchments.loc[ids, "Raingage"]
+        assert set(raingages) <= set(GAGES) | {"Raingage2"}
+
+    def test_ingest_features(self, multi_gage_path, tempdir):
+        path = os.path.join(tempdir, "parcels.geojson")
+        squares = [(0, 0), (250, 50), (600, 0)]
+        features = [
+            {
+                "type": "Feature",
+                "properties": {"name": name, "land_form": "mountains", "land_cover": "forests"},
+                "geometry": {
+                    "type": "Polygon",
+                    "coordinates": [[(x, y), (x + 50, y), (x + 50, y + 50), (x, y + 50), (x, y)]],
+                },
+            }
+            for name, (x, y) in zip("ABC", squares)
+        ]
+        with open(path, "w") as file:
+            json.dump({"type": "FeatureCollection", "features": features}, file)
+        ingest_features(multi_gage_path, path, name_field="name", raingages="nearest")
+        raingages = Model(multi_gage_path).inp.subcatchments.loc[["A", "B", "C"], "Raingage"]
+        assert raingages.tolist() == ["RG_west", "RG_west", "RG_east"]
@@ -0,0 +1,71 @@
+import json
+import os
+
+import numpy as np
+import pytest
+
+from rcg.fuzzy.categories import LandCoverType
+from rcg.inp_manage.remap import CORINE, RemapTable, get_remap_table
+
+CODES = np.array([[111, 243, 511], [999, 312, 511]])
+
+
+@pytest.fixture
+def table():
+    return get_remap_table("corine")
+
+
+class TestRemapTable:
+    def test_remap(self, table):
+        codes = table.remap(CODES, errors="ignore")
+        assert codes.shape == CODES.shape
+        assert codes.tolist() == [
+            [LandCoverType.urban_highly_impervious, LandCoverType.arable, 0],
+            [0, LandCoverType.forests, 0],
+        ]
+
+    def test_fractions(self, table):
+        fractions = table.fractions(["243", "111"])
+        assert fractions.shape == (2, len(LandCoverType))
+        np.testing.assert_allclose(fractions.sum(axis=1), 1)
+        assert fractions[0, LandCoverType.names().index("meadows")] == 0.25
+
+    def test_unmapped(self, table):
+        counts = table.unmapped(CODES.astype(np.uint16), chunk_size=4)
+        assert counts.to_dict() == {511: 2, 999: 1}
+        assert table.unmapped(["111", "abc"]).index.tolist() == ["abc"]
+
+    def test_unmapped_raise_lists_all_codes(self, table):
+        with pytest.raises(ValueError, match=r"3 values .* corine table: '511' \(2\), '999' \(1\)"):
+            table.remap(CODES)
+
+    def test_index(self, table):
+        index = table.index(CODES)
+        assert table.codes[index[index >= 0]].tolist() == [111, 243, 312]
+        assert (index < 0).sum() == 3
+
+    def test_invalid_entries(self):
+        with pytest.raises(ValueError) as error:
+            RemapTable({"x": "arable", 1: "parking", 2: {"arable": -1}})
+        assert str(error.value).count("\n") == 3
+
+    def test_files(self, table, tempdir):
+        path = os.path.join(tempdir, "regional.json")
+        with open(path, "w") as file:
+            json.dump(table.to_dict(), file)
+        loaded = get_remap_table(path)
+        assert loaded.name == "regional"
+        np.testing.assert_array_equal(loaded.shares, table.shares)
+
+        path = os.path.join(tempdir, "regional.csv")
+        with open(path, "w") as file:
+            file.write("code,land_cover,share\n1,arable,3\n1,meadows,1\n2,forests,\n")
+        loaded = get_remap_table(path)
+        assert loaded.mapping[1] == {"arable": 0.75, "meadows": 0.25}
+        assert loaded.remap([2]).tolist() == [LandCoverType.forests]
+
+    def test_builtin_tables_are_valid(self):
+        assert len(get_remap_table("corine").codes) == len(CORINE)
+        assert get_remap_table("corine") is get_remap_table("corine")
+        with pytest.raises(ValueError, match="Unknown remap table"):
+            get_remap_table("clc")
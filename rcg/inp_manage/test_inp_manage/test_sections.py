@@ -0,0 +1,155 @@
+import os
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+from swmmio import Model
+from swmmio.utils.dataframes import dataframe_from_inp
+
+from rcg.inp_manage.sections import (
+    SECTION_ATTRIBUTES,
+    InpScanner,
+    append_inp_sections,
+    load_inp_sections,
+    read_inp_section,
+    replace_inp_sections,
+)
+
+
+class TestReplaceInpSections:
+    def test_replace_several_sections(self, inp_path):
+        model = Model(inp_path)
+        subcatchments = model.inp.subcatchments.iloc[:2]
+        infiltration = model.inp.infiltration.iloc[:2]
+
+        replace_inp_sections(
+            inp_path,
+            {"[SUBCATCHMENTS]": subcatchments, "[INFILTRATION]": infiltration},
+        )
+
+        saved = Model(inp_path)
+        assert list(saved.inp.subcatchments.index) == list(subcatchments.index)
+        assert list(saved.inp.infiltration.index) == list(infiltration.index)
+        pd.testing.assert_frame_equal(saved.inp.junctions, model.inp.junctions)
+        pd.testing.assert_frame_equal(saved.inp.subareas, model.inp.subareas)
+
+    def test_missing_section_is_appended(self, inp_path):
+        with open(inp_path) as file:
+            lines = [line for line in file if "[DWF]" not in line]
+        with open(inp_path, "w") as file:
+            file.writelines(lines)
+        dwf = pd.DataFrame(
+            {"Parameter": ["FLOW"], "AverageValue": [0.1], "TimePatterns": [""]},
+            index=pd.Index(["J1"], name="Node"),
+        )
+
+        replace_inp_sections(inp_path, {"[DWF]": dwf})
+
+        with open(inp_path) as file:
+            assert "[DWF]" in file.read()
+
+    def test_failed_write_leaves_no_temporary_file(self, inp_path):
+        with open(inp_path) as file:
+            before = file.read()
+        files = os.listdir(os.path.dirname(inp_path))
+        subcatchments = Model(inp_path).inp.subcatchments
+        with patch("rcg.inp_manage.sections._write_text", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                replace_inp_sections(inp_path, {"[SUBCATCHMENTS]": subcatchments})
+        assert os.listdir(os.path.dirname(inp_path)) == files
+        with open(inp_path) as file:
+            assert file.read() == before
+
+
+class TestAppendInpSections:
+    def test_append_stream(self, inp_path):
+        model = Model(inp_path)
+        rows = model.inp.subareas.iloc[:1]
+        batches = (
+            {"[SUBAREAS]": rows.set_axis(pd.Index([f"new{i}"], name="Name"))} for i in range(3)
+        )
+
+        assert append_inp_sections(inp_path, batches) == 3
+
+        saved = Model(inp_path)
+        assert list(saved.inp.subareas.index[-3:]) == ["new0", "new1", "new2"]
+        assert len(saved.inp.subareas) == len(model.inp.subareas) + 3
+        pd.testing.assert_frame_equal(saved.inp.subcatchments, model.inp.subcatchments)
+        pd.testing.assert_frame_equal(saved.inp.infiltration, model.inp.infiltration)
+
+    def test_failed_stream_leaves_file_unchanged(self, inp_path):
+        with open(inp_path) as file:
+            before = file.read()
+        model = Model(inp_path)
+
+        def batches():
+            yield {"[SUBAREAS]": model.inp.subareas.iloc[:1]}
+            raise ValueError("invalid row")
+
+        with pytest.raises(ValueError):
+            append_inp_sections(inp_path, batches())
+        with open(inp_path) as file:
+            assert file.read() == before
+
+    def test_failed_write_leaves_no_temporary_file(self, inp_path):
+        files = os.listdir(os.path.dirname(inp_path))
+        rows = Model(inp_path).inp.subareas.iloc[:1]
+        with patch("rcg.inp_manage.sections._copy_spool", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                append_inp_sections(inp_path, [{"[SUBAREAS]": rows}])
+        assert os.listdir(os.path.dirname(inp_path)) == files
+
+
+class TestInpScanner:
+    def test_frames_match_swmmio(self, inp_path):
+        with InpScanner(inp_path) as scanner:
+            for header, _, _, _ in scanner.spans:
+                pd.testing.assert_frame_equal(scanner.read_frame(header), dataframe_from_inp(inp_path, header))
+            assert scanner.read_frame("[STORAGE]").empty
+
+    def test_count_records(self, inp_path):
+        model = Model(inp_path)
+        with InpScanner(inp_path) as scanner:
+            assert scanner.count_records("[SUBCATCHMENTS]") == len(model.inp.subcatchments)
+            assert scanner.count_records("Polygons") == len(model.inp.polygons)
+            assert scanner.count_records("[STORAGE]") == 0
+            assert "[subareas]" in scanner and "[STORAGE]" not in scanner
+
+    def test_infiltration_columns_follow_options(self, inp_path):
+        with open(inp_path) as file:
+            text = file.read()
+        with open(inp_path, "w") as file:
+            file.write(text.replace("MODIFIED_GREEN_AMPT", "CURVE_NUMBER", 1))
+        with InpScanner(inp_path) as scanner:
+            assert scanner.get_columns("[INFILTRATION]")[:2] == ["Subcatchment", "CurveNum"]
+            pd.testing.assert_frame_equal(
+                scanner.read_frame("[INFILTRATION]"), dataframe_from_inp(inp_path, "[INFILTRATION]")
+            )
+
+    def test_read_inp_section(self, inp_path):
+        with open(inp_path, "a") as file:
+            file.write("\n[LABELS]\n;;X Y Label\n1.0   2.0 L1 ; comment\n\n3 4 L2")
+        assert read_inp_section(inp_path, "[LABELS]") == [["1.0", "2.0", "L1"], ["3", "4", "L2"]]
+        assert read_inp_section(inp_path, "[STORAGE]") == []
+
+    def test_empty_file(self, inp_path):
+        open(inp_path, "w").close()
+        with InpScanner(inp_path) as scanner:
+            assert scanner.spans == [] and scanner.read_frame("[SUBCATCHMENTS]").empty
+
+    def test_load_inp_sections(self, inp_path):
+        model = Model(inp_path)
+        sections = load_inp_sections(model.inp, ["subcatchments", "polygons", "timeseries"])
+        assert list(sections) == ["subcatchments", "polygons"]
+        assert model.inp._timeseries_df is None
+        for name in SECTION_ATTRIBUTES:
+            pd.testing.assert_frame_equal(
+                load_inp_sections(model.inp, [name])[name], getattr(Model(inp_path).inp, name)
+            )
+
+    def test_append_to_last_section_without_newline(self, inp_path):
+        with open(inp_path, "a") as file:
+            file.write("\n[LABELS]\n1 2 L1")
+        rows = pd.DataFrame({"Y": [4], "Label": ["L2"]}, index=pd.Index([3], name="X"))
+        append_inp_sections(inp_path, [{"[LABELS]": rows}])
+        assert read_inp_section(inp_path, "[LABELS]") == [["1", "2", "L1"], ["3", "4", "L2"]]
@@ -0,0 +1,96 @@
+import os
+import tempfile
+
+import pandas as pd
+import pytest
+from swmmio import Model
+
+from rcg.inp_manage.inp import BuildCatchments, get_square_coords
+from rcg.inp_manage.stream import (
+    iter_chunks,
+    iter_prototypes,
+    iter_subcatchment_records,
+    stream_subcatchments,
+)
+
+
+@pytest.fixture
+def rows():
+    return [
+        {"area": 1.0 + i % 3, "land_form": "flats_and_plateaus", "land_cover": ["forests", "rural"][i % 2]}
+        for i in range(7)
+    ]
+
+
+class TestIterChunks:
+    def test_chunk_size(self, rows):
+        chunks = list(iter_chunks(iter(rows), chunk_size=3))
+        assert [len(chunk) for chunk in chunks] == [3, 3, 1]
+        assert list(chunks[-1].index) == [6]
+
+    def test_sequences_and_frames(self, rows):
+        frame = pd.DataFrame(rows[:5])
+        chunks = list(iter_chunks([frame, (2.0, "mountains", "urban_highly_impervious")], chunk_size=2))
+        assert [len(chunk) for chunk in chunks] == [2, 2, 1, 1]
+        assert chunks[-1].iloc[0].tolist() == [2.0, "mountains", "urban_highly_impervious"]
+        assert list(pd.concat(chunks).index) == list(range(6))
+
+    def test_invalid_chunk_size(self, rows):
+        with pytest.raises(ValueError):
+            list(iter_chunks(rows, chunk_size=0))
+
+
+class TestIterPrototypes:
+    def test_results(self, rows):
+        results = pd.concat(iter_prototypes(iter(rows), chunk_size=4))
+        assert len(results) == len(rows)
+        assert {"slope", "impervious", "catchment", "catchment_class"} <= set(results.columns)
+
+    def test_invalid_row_position(self, rows):
+        rows[5]["land_cover"] = "lava"
+        with pytest.raises(ValueError, match="Row 5"):
+            list(iter_prototypes(iter(rows), chunk_size=4))
+
+
+class TestStreamSubcatchments:
+    def test_records_continue_between_chunks(self, rows):
+        records = list(
+            iter_subcatchment_records(
+                rows, ids=iter(f"N{i}" for i in range(100)), raingage="RG", outlet=None, chunk_size=3
+            )
+        )
+        assert len(records) == 3
+
+        subcatchments = pd.concat(record["[SUBCATCHMENTS]"] for record in records)
+        assert list(subcatchments.index) == [f"N{i}" for i in range(7)]
+        assert list(subcatchments["Outlet"]) == list(subcatchments.index)
+
+        polygons = pd.concat(record["[Polygons]"] for record in records)
+        expected = get_square_coords(list(subcatchments.index), subcatchments["Area"].to_numpy())
+        pd.testing.assert_frame_equal(polygons, expected)
+
+    def test_matches_bulk(self, inp_path, rows):
+        with tempfile.TemporaryDirectory() as tempdir:
+            bulk_path = os.path.join(tempdir, "bulk.inp")
+            Model(inp_path).inp.save(bulk_path)
+            BuildCatchments(bulk_path).add_subcatchments(pd.DataFrame(rows))
+            bulk = Model(bulk_path)
+
+            assert stream_subcatchments(inp_path, iter(rows), chunk_size=3) == len(rows)
+            streamed = Model(inp_path)
+            for section in ("subcatchments", "subareas", "infiltration", "polygons"):
+                pd.testing.assert_frame_equal(
+                    getattr(streamed.inp, section), getattr(bulk.inp, section), check_dtype=False
+                )
+
+    def test_invalid_rows_leave_file_unchanged(self, inp_path, rows):
+        rows[6]["area"] = -1
+        with open(inp_path) as file:
+            before = file.read()
+        with pytest.raises(ValueError, match="Row 6"):
+            stream_subcatchments(inp_path, iter(rows), chunk_size=3)
+        with open(inp_path) as file:
+            assert file.read() == before
+
+    def test_empty_stream(self, inp_path):
+        assert stream_subcatchments(inp_path, iter([])) == 0
@@ -0,0 +1,104 @@
+import os
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+from swmmio import Model
+
+from rcg.inp_manage.inp import BuildCatchments
+from rcg.inp_manage.sync import get_manifest_path, read_manifest, sync_subcatchments, write_manifest
+
+DATA = pd.DataFrame(
+    {
+        "id": [101, 102, 103],
+        "area": [1.5, 2.0, 3.25],
+        "land_form": ["mountains", "higher_hills", "flats_and_plateaus"],
+        "land_cover": ["forests", "rural", "urban_highly_impervious"],
+    }
+)
+
+
+def test_first_run_inserts_everything(inp_path):
+    changes = sync_subcatchments(inp_path, DATA)
+    assert len(changes["inserted"]) == 3 and changes["updated"] == [] and changes["deleted"] == []
+    manifest = read_manifest(get_manifest_path(inp_path))
+    assert manifest.index.tolist() == ["101", "102", "103"]
+    assert manifest["name"].tolist() == changes["inserted"]
+    assert set(changes["inserted"]) <= set(Model(inp_path).inp.subcatchments.index)
+    assert sync_subcatchments(inp_path, DATA) == {"inserted": [], "updated": [], "deleted": []}
+
+
+def test_applies_only_changes(inp_path):
+    names = sync_subcatchments(inp_path, DATA)["inserted"]
+    subcatchments = Model(inp_path).inp.subcatchments
+    before, count = subcatchments.loc[names[0]], len(subcatchments)
+    data = DATA.copy()
+    data.loc[1, "land_cover"] = "forests"
+    data = pd.concat(
+        [data.drop(index=2), pd.DataFrame([{"id": 104, "area": 1, "land_form": "mountains", "land_cover": "arable"}])]
+    )
+
+    changes = sync_subcatchments(inp_path, data)
+    assert changes["updated"] == [names[1]]
+    assert changes["deleted"] == [names[2]]
+    assert len(changes["inserted"]) == 1
+
+    subcatchments = Model(inp_path).inp.subcatchments
+    assert len(subcatchments) == count
+    assert subcatchments.loc[changes["inserted"][0], "Area"] == 1
+    pd.testing.assert_series_equal(subcatchments.loc[names[0]], before)
+    manifest = read_manifest(get_manifest_path(inp_path))
+    assert manifest["name"].tolist() == [names[0], names[1], changes["inserted"][0]]
+
+
+def test_subcatchment_removed_by_hand_is_added_again(inp_path):
+    names = sync_subcatchments(inp_path, DATA)["inserted"]
+    BuildCatchments(inp_path).remove_subcatchments([names[0]])
+    changes = sync_subcatchments(inp_path, DATA)
+    assert len(changes["inserted"]) == 1 and changes["deleted"] == []
+
+
+def test_invalid_rows_leave_model_unchanged(inp_path):
+    sync_subcatchments(inp_path, DATA)
+    with open(inp_path) as file:
+        before = file.read()
+    data = DATA.copy()
+    data.loc[0, "land_form"] = "invalid"
+    with pytest.raises(ValueError, match="Row 101"):
+        sync_subcatchments(inp_path, data)
+    with pytest.raises(ValueError, match="Repeated keys: 101"):
+        sync_subcatchments(inp_path, pd.concat([DATA, DATA.iloc[:1]]))
+    with open(inp_path) as file:
+        assert file.read() == before
+
+
+def test_failing_change_leaves_model_and_manifest_unchanged(inp_path):
+    sync_subcatchments(inp_path, DATA)
+    manifest_path = get_manifest_path(inp_path)
+    with open(inp_path) as file:
+        before = file.read()
+    manifest = read_manifest(manifest_path)
+    data = pd.concat(
+        [DATA.drop(index=0), pd.DataFrame([{"id": 104, "area": 1, "land_form": "mountains", "land_cover": "arable"}])]
+    )
+    with pytest.raises(ValueError, match="Unknown layout: bogus"):
+        sync_subcatchments(inp_path, data, layout="bogus")
+    with pytest.raises(ValueError, match="Unknown options: outlet"):
+        sync_subcatchments(inp_path, data, outlet="nearest")
+    # the new subcatchment fails after the deleted one was removed and the changed one was updated
+    data.loc[1, "land_cover"] = "forests"
+    with patch.object(BuildCatchments, "get_polygons", side_effect=ValueError("no room")):
+        with pytest.raises(ValueError, match="no room"):
+            sync_subcatchments(inp_path, data)
+    with open(inp_path) as file:
+        assert file.read() == before
+    pd.testing.assert_frame_equal(read_manifest(manifest_path), manifest)
+
+
+def test_failed_manifest_write_leaves_no_temporary_file(tempdir):
+    path = os.path.join(tempdir, "model.manifest.csv")
+    manifest = pd.DataFrame({"name": ["S1"], "input_hash": ["0000abcd"]}, index=pd.Index(["101"], name="key"))
+    with patch.object(pd.DataFrame, "to_csv", side_effect=OSError("disk full")):
+        with pytest.raises(OSError):
+            write_manifest(path, manifest)
+    assert os.listdir(tempdir) == []
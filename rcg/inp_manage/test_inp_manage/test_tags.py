@@ -0,0 +1,107 @@
+import pandas as pd
+import pytest
+from swmmio import Model
+
+from rcg.fuzzy.config import get_batch_engine
+from rcg.fuzzy.memberships import membership
+from rcg.inp_manage.inp import BuildCatchments
+from rcg.inp_manage.parameters import HydrologicParameters
+from rcg.inp_manage.stream import stream_subcatchments
+from rcg.inp_manage.tags import get_rules_hash, get_stale, get_tags, parse_tags
+
+DATA = pd.DataFrame(
+    {
+        "area": [1.5, 2.0, 3.25],
+        "land_form": ["mountains", "higher_hills", "flats_and_plateaus"],
+        "land_cover": ["forests", "rural", "urban_highly_impervious"],
+    }
+)
+
+
+def test_rules_hash():
+    assert get_rules_hash() == get_rules_hash(HydrologicParameters.default())
+    changed = HydrologicParameters.from_dict({"infiltration": {"forests": {"Suction": 10}}})
+    assert get_rules_hash(changed) != get_rules_hash()
+
+
+def test_parse_tags():
+    tags = get_tags(pd.Index(["A", "B"]), [1.0, 2.0], ["mountains", "higher_hills"], [11, 10], "0000abcd")
+    assert tags["Tag"].iloc[0].startswith("rcg:8:11:0000abcd:")
+    other = pd.DataFrame(
+        {"Name": ["J1", "C", "D"], "Tag": ["rcg:1:1:a:b", "manual", "rcg:x:1:a:b"]},
+        index=pd.Index(["Node", "Subcatch", "Subcatch"], name="ElementType"),
+    )
+    parsed = parse_tags(pd.concat([tags, other]))
+    assert parsed.index.tolist() == ["A", "B"]
+    assert parsed[["land_form", "land_cover"]].to_numpy().tolist() == [[8, 11], [7, 10]]
+
+
+def test_get_stale():
+    tags = parse_tags(get_tags(pd.Index(["A", "B"]), [1.0, 2.0], ["mountains"] * 2, ["forests"] * 2, "0000abcd"))
+    subcatchments = pd.DataFrame({"Area": [1.0, 2.5]}, index=["A", "B"])
+    assert get_stale(tags, subcatchments, "0000abcd").to_dict("index") == {
+        "B": {"area": 2.5, "land_form": "mountains", "land_cover": "forests"}
+    }
+    assert get_stale(tags, subcatchments, "ffff0000").index.tolist() == ["A", "B"]
+
+
+class TestRescore:
+    def test_add_subcatchments_writes_tags(self, inp_path):
+        ids = BuildCatchments(inp_path).add_subcatchments(DATA)
+        tags = parse_tags(Model(inp_path).inp.tags)
+        assert tags.index.tolist() == ids
+        assert (tags["rules_hash"] == get_rules_hash()).all()
+        assert BuildCatchments(inp_path).rescore() == []
+
+    def test_rescore_after_rule_change(self, inp_path):
+        ids = BuildCatchments(inp_path).add_subcatchments(DATA)
+        before = Model(inp_path).inp.subcatchments
+        parameters = HydrologicParameters.from_dict({"infiltration": {"default": {"Suction": 10}}})
+        # the subcatchments of the original model have no tags and are left as they are
+        assert BuildCatchments(inp_path, parameters).rescore() == ids
+        saved = Model(inp_path).inp
+        assert (saved.infiltration.loc[ids, "Suction"] == 10).all()
+        assert (saved.infiltration.drop(ids)["Suction"] != 10).all()
+        pd.testing.assert_frame_equal(saved.subcatchments, before, check_dtype=False)
+        assert BuildCatchments(inp_path, parameters).rescore() == []
+
+    def test_rescore_after_membership_change(self, inp_path):
+        ids = BuildCatchments(inp_path).add_subcatchments(DATA)
+        before = Model(inp_path).inp.subcatchments.loc[ids, "PercImperv"]
+        rules_hash = get_rules_hash()
+        membership.set_limits("impervious", "urban_highly_impervious", [60, 70, 80])
+        try:
+            assert get_rules_hash() != rules_hash
+            # the lookup table wasn't regenerated, the stale rows are recomputed from the live rules
+            assert BuildCatchments(inp_path).rescore() == ids
+            after = Model(inp_path).inp.subcatchments.loc[ids, "PercImperv"]
+            assert after[ids[2]] < before[ids[2]]
+            expected = get_batch_engine().compute(["flats_and_plateaus"], ["urban_highly_impervious"])
+            assert after[ids[2]] == pytest.approx(round(expected["impervious"].iloc[0], 2))
+            assert BuildCatchments(inp_path).rescore() == []
+        finally:
+            membership.set_limits("impervious", "urban_highly_impervious", [75, 85, 100])
+        assert get_rules_hash() == rules_hash
+
+    def test_rescore_changed_area(self, inp_path):
+        ids = BuildCatchments(inp_path).add_subcatchments(DATA)
+        model = BuildCatchments(inp_path)
+        model.model.inp.subcatchments.loc[ids[1], "Area"] = 8.0
+        assert model.rescore() == [ids[1]]
+        saved = Model(inp_path).inp
+        assert saved.subcatchments.loc[ids[1], "Area"] == 8.0
+        assert parse_tags(saved.tags).loc[ids[1], "input_hash"] == get_tags(
+            pd.Index([ids[1]]), [8.0], ["higher_hills"], ["rural"], get_rules_hash()
+        )["Tag"].iloc[0].split(":")[-1]
+        assert BuildCatchments(inp_path).rescore() == []
+
+    def test_stream_writes_tags(self, inp_path):
+        stream_subcatchments(inp_path, DATA.to_dict("records"), chunk_size=2)
+        model = BuildCatchments(inp_path)
+        assert len(parse_tags(model.model.inp.tags)) == len(DATA)
+        assert model.rescore() == []
+
+    def test_remove_drops_tags(self, inp_path):
+        ids = BuildCatchments(inp_path).add_subcatchments(DATA)
+        BuildCatchments(inp_path).remove_subcatchments(ids[:2])
+        assert parse_tags(Model(inp_path).inp.tags).index.tolist() == ids[2:]
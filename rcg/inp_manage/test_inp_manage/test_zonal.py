@@ -0,0 +1,119 @@
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from rcg.fuzzy.categories import LandCoverType
+from rcg.inp_manage.gis import Rings
+from rcg.inp_manage.zonal import get_land_form, get_tile_rows, rasterize, zonal_statistics, zonal_tile
+
+# square 100 x 100 m with a 20 x 20 m hole and an L-shaped polygon on a 10 m grid
+FEATURES = [
+    [[[(0, 0), (100, 0), (100, 100), (0, 100), (0, 0)], [(40, 40), (40, 60), (60, 60), (60, 40), (40, 40)]]],
+    [[[(200, 0), (400, 0), (400, 100), (300, 100), (300, 200), (200, 200), (200, 0)]]],
+]
+SHAPE = (20, 40)
+ORIGIN = (0, 200)
+
+
+@pytest.fixture
+def labels():
+    return rasterize(Rings.from_polygons(FEATURES), SHAPE, ORIGIN, 10)
+
+
+@pytest.fixture
+def land_cover():
+    return np.random.default_rng(0).integers(0, 16, SHAPE)
+
+
+@pytest.fixture
+def dem():
+    rows, columns = np.mgrid[0 : SHAPE[0], 0 : SHAPE[1]]
+    # 2 m per 10 m cell across the columns and 1 m along the rows
+    return columns * 2.0 + rows * 1.0
+
+
+class TestRasterize:
+    def test_areas(self, labels):
+        assert np.bincount(labels.ravel()).tolist() == [404, 96, 300]
+
+    def test_hole(self, labels):
+        assert (labels[14:16, 4:6] == 0).all()
+
+
+class TestZonalStatistics:
+    def test_statistics(self, land_cover, dem, labels):
+        zones = zonal_statistics(land_cover, dem, labels, 10)
+        assert zones.index.tolist() == [1, 2]
+        np.testing.assert_allclose(zones["area"], [0.96, 3.0])
+        np.testing.assert_allclose(zones["mean_slope"], 100 * np.hypot(0.2, 0.1))
+        np.testing.assert_allclose(zones["relief"], [9 * 2 + 9, 19 * 2 + 19])
+        assert zones["land_form"].tolist() == get_land_form([100 * np.hypot(0.2, 0.1)] * 2).tolist()
+
+    def test_land_cover(self, land_cover, dem, labels):
+        zones = zonal_statistics(land_cover, dem, labels, 10)
+        fractions = zones[LandCoverType.names()]
+        np.testing.assert_allclose(fractions.sum(axis=1), 1)
+
+        valid = (labels == 2) & (land_cover >= 1) & (land_cover <= 14)
+        counts = pd.Series(land_cover[valid]).value_counts()
+        forests = LandCoverType.forests.value
+        assert fractions.loc[2, "forests"] == pytest.approx(counts[forests] / valid.sum())
+        assert zones.loc[2, "land_cover"] == LandCoverType(counts.idxmax()).name
+
+    def test_tiles(self, land_cover, dem, labels):
+        assert get_tile_rows(SHAPE[1], 3 * SHAPE[1] * 96) == 3
+        expected = zonal_statistics(land_cover, dem, labels, 10)
+        tiled = zonal_statistics(land_cover, dem, labels, 10, memory_budget=3 * SHAPE[1] * 96)
+        pd.testing.assert_frame_equal(tiled, expected)
+
+    def test_tile_sums_are_compact(self, land_cover, dem, labels):
+        labels = np.where(labels > 0, labels + 10**7, 0)
+        partial = zonal_tile(land_cover, dem, labels, 0, SHAPE[0], 10)
+        assert partial["zones"].tolist() == [10**7 + 1, 10**7 + 2]
+        assert partial["counts"].shape == (2, len(LandCoverType))
+        zones = zonal_statistics(land_cover, dem, labels, 10, memory_budget=3 * SHAPE[1] * 96)
+        assert zones.index.tolist() == [10**7 + 1, 10**7 + 2]
+        assert zones["area"].tolist() == pytest.approx([0.96, 3.0])
+
+    def test_nodata(self, land_cover, dem, labels):
+        dem[labels == 1] = -9999
+        zones = zonal_statistics(land_cover, dem, labels, 10, nodata=-9999)
+        assert np.isnan(zones.loc[1, "mean_slope"])
+        assert np.isnan(zones.loc[1, "relief"])
+        assert pd.isna(zones.loc[1, "land_form"])
+        assert zones.loc[2, "relief"] == 57
+
+    def test_remap(self, dem, labels):
+        # CORINE complex cultivation patterns (243) split into arable, meadows and forests
+        land_cover = np.where(labels == 1, 243, 311)
+        zones = zonal_statistics(land_cover, dem, labels, 10, remap="corine")
+        assert zones.loc[1, ["arable", "meadows", "forests"]].tolist() == [0.5, 0.25, 0.25]
+        assert zones.loc[1, "land_cover"] == "arable"
+        assert zones.loc[2, "forests"] == 1
+
+    def test_workers(self, land_cover, dem, labels):
+        expected = zonal_statistics(land_cover, dem, labels, 10)
+        with tempfile.TemporaryDirectory() as directory:
+            paths = []
+            for name, raster in [("land_cover", land_cover), ("dem", dem), ("labels", labels)]:
+                paths.append(os.path.join(directory, f"{name}.npy"))
+                np.save(paths[-1], raster)
+            zones = zonal_statistics(*paths, 10, memory_budget=2 * 3 * SHAPE[1] * 96, workers=2)
+        pd.testing.assert_frame_equal(zones, expected)
+
+    def test_workers_need_paths(self, land_cover, dem, labels):
+        with pytest.raises(ValueError, match="paths"):
+            zonal_statistics(land_cover, dem, labels, 10, workers=2)
+
+    def test_shapes(self, land_cover, dem, labels):
+        with pytest.raises(ValueError, match="same shape"):
+            zonal_statistics(land_cover, dem[1:], labels, 10)
+
+    def test_empty_raster(self, land_cover, dem, labels):
+        zones = zonal_statistics(np.zeros((0, 5)), np.zeros((0, 5)), np.zeros((0, 5)), 10)
+        expected = zonal_statistics(land_cover, dem, np.zeros_like(labels), 10)
+        assert zones.empty
+        pd.testing.assert_frame_equal(zones, expected)
@@ -0,0 +1,370 @@
+"""
+The module contains the zonal statistics stage deriving the fuzzy inputs from rasters.
+
+A land cover raster (LandCoverType codes) and a digital elevation model are aggregated over zones,
+the subcatchments, given as a label raster (0 outside of the subcatchments) or as polygons rasterized
+onto the grid. For every zone the fraction of every land cover, the dominant land cover, the mean slope
+and the relief are computed and the mean slope is mapped to the land form whose slope term has the
+highest membership, so the result feeds `add_subcatchments` or `lookup_mixtures` directly. Rasters
+of another classification (e.g. CORINE) are translated on the fly with a remap table.
+
+The rasters are read in tiles of rows (with a one-row halo for the slope of the DEM) and every tile is
+reduced to sums of the zones present in it (compacted with `np.unique`, so the partial sums are never
+larger than the tile), so the memory needed by a tile depends on the tile size and not on the size of
+the grid or on the number of zones. The rasters may be NumPy arrays or .npy files, which are memory-mapped; with
+files the tiles can be processed in a pool of processes, each within its share of the memory budget.
+
+Example::
+
+    labels = rasterize(rings, shape=dem.shape, origin=(x_min, y_max), cell_size=10)
+    zones = zonal_statistics("land_cover.npy", "dem.npy", labels, cell_size=10)
+    BuildCatchments("model.inp").add_subcatchments(zones[["area", "land_form", "land_cover"]])
+"""
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, Mapping, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from rcg.fuzzy.categories import LandCoverType, LandFormType
+from rcg.fuzzy.memberships import membership
+from rcg.inp_manage.gis import Rings
+from rcg.inp_manage.remap import RemapTable, get_remap_table
+
+Raster = Union[str, np.ndarray]
+
+MEMORY_BUDGET = 256 * 2**20
+# estimated peak memory of a tile cell: the DEM with the gradients and the slope (float64),
+# the labels (int64) and the temporary arrays of the aggregation
+BYTES_PER_CELL = 96
+LAND_COVER_TABLE = RemapTable({member.value: member.name for member in LandCoverType}, "land_cover")
+
+
+def open_raster(raster: Raster) -> np.ndarray:
+    """Return the raster as an array, memory-mapped if it is a path of a .npy file."""
+    if isinstance(raster, str):
+        return np.load(raster, mmap_mode="r")
+    return np.asarray(raster)
+
+
+def rasterize(
+    rings: Rings,
+    shape: Tuple[int, int],
+    origin: Tuple[float, float],
+    cell_size: float,
+) -> np.ndarray:
+    """
+    Rasterize polygons into a label raster.
+
+    A cell belongs to a polygon if its centre lies inside it (even-odd rule, so holes are excluded).
+    All edges are intersected with the rows of cell centres at once and the spans between pairs
+    of crossings are filled.
+
+    Parameters
+    ----------
+    rings : Rings
+        Polygons of the zones, see `rcg.inp_manage.gis.iter_features`.
+    shape : Tuple[int, int]
+        Number of rows and columns of the grid.
+    origin : Tuple[float, float]
+        Coordinates of the top left corner of the grid.
+    cell_size : float
+        Size of a cell in the units of the coordinates.
+
+    Returns
+    -------
+    np.ndarray
+        Array of the shape of the grid with the index of the feature plus one in every cell
+        and zero outside of all polygons.
+    """
+    rows, columns = shape
+    x0, y0 = origin
+    labels = np.zeros(shape, dtype=np.int32)
+    if len(rings.coords) == 0:
+        return labels
+
+    following = np.arange(1, len(rings.coords) + 1)
+    following[rings.offsets[1:] - 1] = rings.offsets[:-1]
+    ring_of_vertex = np.repeat(np.arange(len(rings.feature)), np.diff(rings.offsets))
+    (xa, ya), (xb, yb) = rings.coords.T, rings.coords[following].T
+
+    # rows whose centre y lies in [min(ya, yb), max(ya, yb)), the centre of row r is y0 - (r + 0.5) * cell_size
+    first = np.floor((y0 - np.maximum(ya, yb)) / cell_size - 0.5).astype(np.int64) + 1
+    last = np.floor((y0 - np.minimum(ya, yb)) / cell_size - 0.5).astype(np.int64)
+    first, last = np.clip(first, 0, rows), np.clip(last, -1, rows - 1)
+    counts = np.clip(last - first + 1, 0, None)
+
+    edge = np.repeat(np.arange(len(xa)), counts)
+    row = np.repeat(first, counts) + np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    y = y0 - (row + 0.5) * cell_size
+    x = xa[edge] + (y - ya[edge]) * (xb[edge] - xa[edge]) / (yb[edge] - ya[edge])
+    feature = rings.feature[ring_of_vertex[edge]]
+
+    order = np.lexsort((x, row, feature))
+    feature, row, x = feature[order], row[order], x[order]
+    group_start = np.r_[True, (feature[1:] != feature[:-1]) | (row[1:] != row[:-1])]
+    position = np.arange(len(x)) - np.maximum.accumulate(np.where(group_start, np.arange(len(x)), 0))
+    left = np.flatnonzero(position % 2 == 0)
+    left = left[left + 1 < len(x)]
+
+    # cells with the centre in [x_left, x_right)
+    start = np.clip(np.ceil((x[left] - x0) / cell_size - 0.5).astype(np.int64), 0, columns)
+    stop = np.clip(np.ceil((x[left + 1] - x0) / cell_size - 0.5).astype(np.int64), 0, columns)
+    lengths = np.clip(stop - start, 0, None)
+    span = np.repeat(np.arange(len(left)), lengths)
+    column = np.repeat(start, lengths) + np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    labels[row[left][span], column] = feature[left][span] + 1
+    return labels
+
+
+def get_tile_rows(columns: int, memory_budget: int = MEMORY_BUDGET) -> int:
+    """
+    Return the number of raster rows processed at once within the memory budget.
+
+    Parameters
+    ----------
+    columns : int
+        Number of columns of the rasters.
+    memory_budget : int, optional
+        Memory available for a tile [bytes], by default 256 MiB.
+
+    Returns
+    -------
+    int
+        Number of rows of a tile, at least one.
+    """
+    return max(1, int(memory_budget // (max(columns, 1) * BYTES_PER_CELL)))
+
+
+def iter_tiles(rows: int, tile_rows: int) -> Iterator[Tuple[int, int]]:
+    """Yield the first and the stop row of every tile."""
+    for start in range(0, rows, tile_rows):
+        yield start, min(start + tile_rows, rows)
+
+
+def zonal_tile(
+    land_cover: Raster,
+    dem: Raster,
+    labels: Raster,
+    start: int,
+    stop: int,
+    cell_size: float,
+    nodata: Optional[float] = None,
+    remap: Optional[RemapTable] = None,
+) -> Dict[str, np.ndarray]:
+    """
+    Aggregate the rows from start to stop of the rasters by zone.
+
+    Parameters
+    ----------
+    land_cover : Raster
+        LandCoverType codes, other values are ignored.
+    dem : Raster
+        Elevations [m].
+    labels : Raster
+        Zone of every cell, zero outside of the zones.
+    start : int
+        First row of the tile.
+    stop : int
+        Row after the last row of the tile.
+    cell_size : float
+        Size of a cell [m].
+    nodata : float, optional
+        Elevation of the cells without data.
+    remap : RemapTable, optional
+        Table translating the land cover raster codes, by default the raster holds LandCoverType codes.
+
+    Returns
+    -------
+    Dict[str, np.ndarray]
+        Partial sums of the zones present in the tile: the sorted zone labels, counts of every land
+        cover (zones x land covers, mixes of the remap table count with their shares), cells,
+        slope_sum, slope_cells, minimum and maximum elevation.
+    """
+    land_cover, dem, labels = open_raster(land_cover), open_raster(dem), open_raster(labels)
+    halo_start, halo_stop = max(start - 1, 0), min(stop + 1, dem.shape[0])
+    elevation = np.array(dem[halo_start:halo_stop], dtype=float)
+    if nodata is not None:
+        elevation[elevation == nodata] = np.nan
+    if min(elevation.shape) > 1:
+        gradient_y, gradient_x = np.gradient(elevation, cell_size)
+        slope = 100 * np.hypot(gradient_x, gradient_y)
+    else:
+        slope = np.full(elevation.shape, np.nan)
+    inner = slice(start - halo_start, start - halo_start + stop - start)
+    elevation, slope = elevation[inner].ravel(), slope[inner].ravel()
+
+    zone = np.asarray(labels[start:stop], dtype=np.int64).ravel()
+    inside = zone > 0
+    # the sums are indexed by the position of the zone among the zones of the tile
+    zones, position = np.unique(zone[inside], return_inverse=True)
+    size = len(zones)
+    elevation, slope = elevation[inside], slope[inside]
+
+    # cells are counted by the source code and the counts are split into the land covers by the shares
+    remap = remap or LAND_COVER_TABLE
+    classes = remap.index(np.asarray(land_cover[start:stop]).ravel()[inside])
+    covered = classes >= 0
+    sources = len(remap.codes)
+    counts = np.bincount(position[covered] * sources + classes[covered], minlength=size * sources)
+    counts = counts.reshape(size, sources) @ remap.shares[remap.codes]
+
+    sloped = np.isfinite(slope)
+    measured = np.isfinite(elevation)
+    minimum = np.full(size, np.inf)
+    maximum = np.full(size, -np.inf)
+    np.minimum.at(minimum, position[measured], elevation[measured])
+    np.maximum.at(maximum, position[measured], elevation[measured])
+    return {
+        "zones": zones,
+        "counts": counts,
+        "cells": np.bincount(position, minlength=size),
+        "slope_sum": np.bincount(position[sloped], weights=slope[sloped], minlength=size),
+        "slope_cells": np.bincount(position[sloped], minlength=size),
+        "minimum": minimum,
+        "maximum": maximum,
+    }
+
+
+def _combine(total: Optional[Dict[str, np.ndarray]], partial: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """Add the partial sums of a tile to the total, both indexed by their sorted zone labels."""
+    if total is None:
+        return partial
+    zones = np.union1d(total["zones"], partial["zones"])
+    fills = {"minimum": np.inf, "maximum": -np.inf}
+    result = {"zones": zones}
+    for key, value in total.items():
+        if key == "zones":
+            continue
+        combined = np.full((len(zones),) + value.shape[1:], fills.get(key, 0), dtype=np.result_type(value, partial[key]))
+        for sums in (total, partial):
+            position = np.searchsorted(zones, sums["zones"])
+            if key == "minimum":
+                combined[position] = np.minimum(combined[position], sums[key])
+            elif key == "maximum":
+                combined[position] = np.maximum(combined[position], sums[key])
+            else:
+                combined[position] += sums[key]
+        result[key] = combined
+    return result
+
+
+def get_land_form(slope: np.ndarray) -> pd.Categorical:
+    """
+    Map mean slopes to the land forms whose slope terms have the highest membership.
+
+    Parameters
+    ----------
+    slope : np.ndarray
+        Mean slopes [%].
+
+    Returns
+    -------
+    pd.Categorical
+        Land form names, NaN where the slope is NaN.
+    """
+    slope = np.asarray(slope, dtype=float)
+    universe = membership.slope.universe
+    degrees = np.stack(
+        [np.interp(slope, universe, membership.slope[name].mf) for name in LandFormType.names()]
+    )
+    land_form = LandFormType.decode(LandFormType.codes()[np.argmax(degrees, axis=0)])
+    return _mask(land_form, np.isnan(slope))
+
+
+def _mask(values: pd.Categorical, missing: np.ndarray) -> pd.Categorical:
+    """Set the values to NaN where missing is True."""
+    values = values.copy()
+    values[missing] = np.nan
+    return values
+
+
+def zonal_statistics(
+    land_cover: Raster,
+    dem: Raster,
+    labels: Raster,
+    cell_size: float,
+    nodata: Optional[float] = None,
+    memory_budget: int = MEMORY_BUDGET,
+    workers: Optional[int] = None,
+    remap: Optional[Union[str, Mapping, RemapTable]] = None,
+) -> pd.DataFrame:
+    """
+    Derive the land cover and land form of every zone from a land cover raster and a DEM.
+
+    Parameters
+    ----------
+    land_cover : Raster
+        LandCoverType codes (or source codes of the remap table), array or path of a .npy file.
+        Other values are ignored, see `RemapTable.unmapped` for their diagnostics.
+    dem : Raster
+        Elevations [m], array or path of a .npy file with the same shape.
+    labels : Raster
+        Zone of every cell (e.g. from `rasterize`), zero outside of the zones, array or path
+        of a .npy file with the same shape.
+    cell_size : float
+        Size of a cell [m].
+    nodata : float, optional
+        Elevation of the cells without data.
+    memory_budget : int, optional
+        Memory available for the tiles of all workers together [bytes], by default 256 MiB.
+    workers : int, optional
+        Number of processes. With more than one worker the rasters must be paths of .npy files,
+        by default the tiles are processed in this process.
+    remap : Union[str, Mapping, RemapTable], optional
+        Table translating the land cover raster codes, see `get_remap_table`. A mix of land covers
+        adds its shares of the cells to the fractions.
+
+    Returns
+    -------
+    pd.DataFrame
+        Table indexed by the zone label with the columns: area [ha], land_form (from the mean
+        slope), land_cover (dominant), mean_slope [%], relief [m] and the fraction of every land
+        cover (columns named by LandCoverType). Zones without any cell are left out.
+
+    Raises
+    ------
+    ValueError
+        If the rasters have different shapes or workers are used with in-memory rasters.
+    """
+    shapes = {open_raster(raster).shape for raster in (land_cover, dem, labels)}
+    if len(shapes) != 1:
+        raise ValueError("The rasters must have the same shape")
+    rows, columns = shapes.pop()
+    workers = workers or 1
+    if workers > 1 and not all(isinstance(raster, str) for raster in (land_cover, dem, labels)):
+        raise ValueError("With more than one worker the rasters must be paths of .npy files")
+
+    tiles = list(iter_tiles(rows, get_tile_rows(columns, memory_budget // workers)))
+    remap = get_remap_table(remap)
+    arguments = [(land_cover, dem, labels, start, stop, cell_size, nodata, remap) for start, stop in tiles]
+    total = None
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for partial in executor.map(zonal_tile, *zip(*arguments)):
+                total = _combine(total, partial)
+    else:
+        for argument in arguments:
+            total = _combine(total, zonal_tile(*argument))
+    if total is None:
+        # a raster without rows has no tiles, its empty sums give the empty table like a raster without zones
+        total = zonal_tile(land_cover, dem, labels, 0, 0, cell_size, nodata, remap)
+
+    counts = total["counts"]
+    classified = counts.sum(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        fractions = counts / classified[:, np.newaxis]
+        mean_slope = total["slope_sum"] / total["slope_cells"]
+    dominant = LandCoverType.decode(LandCoverType.codes()[np.argmax(counts, axis=1)])
+
+    result = pd.DataFrame(
+        {
+            "area": total["cells"] * cell_size**2 / 10_000,
+            "land_form": get_land_form(mean_slope),
+            "land_cover": _mask(dominant, classified == 0),
+            "mean_slope": mean_slope,
+            "relief": np.where(np.isfinite(total["minimum"]), total["maximum"] - total["minimum"], np.nan),
+        },
+        index=pd.Index(total["zones"], name="zone"),
+    )
+    return result.join(pd.DataFrame(fractions, index=result.index, columns=LandCoverType.names()))
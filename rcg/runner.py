@@ -6,6 +6,8 @@ and the updated model will be saved.
 
 Usage:
     python3 runner.py file_path
+    python3 runner.py rescore file_path
+    python3 runner.py sync file_path table_path [key]
 
 Example:
     python3 runner.py example.inp
@@ -13,12 +15,24 @@ Example:
 Arguments:
     file_path: The path to the SWMM input file (INP) to which subcatchments will be added.
 
+The rescore command recomputes the subcatchments whose provenance tags are stale after a change
+of the rules, the memberships or the parameter tables, see `rcg.inp_manage.tags`. The sync command
+applies the changes of a CSV table of subcatchments since the last run, see `rcg.inp_manage.sync`.
+
 Functions:
     add_multiple_subcatchments: A recursive function that adds subcatchments to the model.
+    rescore_subcatchments: Recompute the subcatchments with stale provenance tags.
+    sync_table: Apply the changes of a CSV table of subcatchments.
 """
 
 import sys
+from typing import Dict, List, Optional
+
+import pandas as pd
+
 from rcg.inp_manage.inp import BuildCatchments
+from rcg.inp_manage.parameters import HydrologicParameters
+from rcg.inp_manage.sync import sync_subcatchments
 
 
 def generate_subcatchment(file_path: str, area: float, land_form: str, land_cover: str):
@@ -39,6 +53,78 @@ def generate_subcatchment(file_path: str, area: float, land_form: str, land_cove
     model = BuildCatchments(file_path)
     model.add_subcatchment_form_gui(area, land_form, land_cover)
 
+def generate_subcatchments(
+    file_path: str, data: pd.DataFrame, parameters_path: Optional[str] = None
+) -> List[str]:
+    """
+    Adds many subcatchments to an existing SWMM model in one bulk operation.
+
+    Parameters
+    ----------
+    file_path : str
+        The path to the SWMM input file (INP) to which subcatchments will be added.
+    data : pd.DataFrame
+        Table with the columns: area [ha], land_form and land_cover.
+    parameters_path : str, optional
+        Path to a JSON file with the hydrologic parameter tables, by default the built-in ones are used.
+
+    Returns
+    -------
+    List[str]
+        IDs of the added subcatchments.
+    """
+    parameters = None if parameters_path is None else HydrologicParameters.from_file(parameters_path)
+    model = BuildCatchments(file_path, parameters)
+    return model.add_subcatchments(data)
+
+
+def rescore_subcatchments(file_path: str, parameters_path: Optional[str] = None) -> List[str]:
+    """
+    Recompute the subcatchments of an existing SWMM model whose provenance tags are stale.
+
+    Parameters
+    ----------
+    file_path : str
+        The path to the SWMM input file (INP).
+    parameters_path : str, optional
+        Path to a JSON file with the hydrologic parameter tables, by default the built-in ones are used.
+
+    Returns
+    -------
+    List[str]
+        Names of the recomputed subcatchments.
+    """
+    parameters = None if parameters_path is None else HydrologicParameters.from_file(parameters_path)
+    return BuildCatchments(file_path, parameters).rescore()
+
+
+def sync_table(
+    file_path: str, table_path: str, key: str = "id", parameters_path: Optional[str] = None
+) -> Dict[str, List[str]]:
+    """
+    Apply the changes of a CSV table of subcatchments since the last run to an existing SWMM model.
+
+    Parameters
+    ----------
+    file_path : str
+        The path to the SWMM input file (INP).
+    table_path : str
+        Path to a CSV file with the key column and the columns: area [ha], land_form and land_cover.
+    key : str, optional
+        Column identifying the rows between runs, by default id.
+    parameters_path : str, optional
+        Path to a JSON file with the hydrologic parameter tables, by default the built-in ones are used.
+
+    Returns
+    -------
+    Dict[str, List[str]]
+        Names of the inserted, updated and deleted subcatchments.
+    """
+    parameters = None if parameters_path is None else HydrologicParameters.from_file(parameters_path)
+    data = pd.read_csv(table_path, dtype={key: str})
+    return sync_subcatchments(file_path, data, key, parameters=parameters)
+
+
 def add_multiple_subcatchments(model):
     """
     Add multiple subcatchments to the given model recursively. The function calls itself
@@ -64,5 +150,12 @@ def add_multiple_subcatchments(model):
 # When this script is run as the main module, create a BuildCatchments instance using
 # the provided file path, and then add multiple subcatchments to the model.
 if __name__ == "__main__":
-    user_model = BuildCatchments(file_path=sys.argv[1])
-    add_multiple_subcatchments(user_model)
+    if sys.argv[1] == "rescore":
+        names = rescore_subcatchments(*sys.argv[2:4])
+        print(f"Recomputed {len(names)} subcatchments.")
+    elif sys.argv[1] == "sync":
+        changes = sync_table(*sys.argv[2:5])
+        print(", ".join(f"{len(names)} {change}" for change, names in changes.items()))
+    else:
+        user_model = BuildCatchments(file_path=sys.argv[1])
+        add_multiple_subcatchments(user_model)
@@ -20,9 +20,11 @@ setup(
     long_description_content_type="text/markdown",
     long_description=long_description,
     packages=find_packages(),
+    package_data={"rcg.fuzzy": ["lookup_table.csv"]},
     install_requires=[
         "scikit-fuzzy",
         "numpy",
+        "scipy",
         "pandas",
         "swmmio",
         "pyswmm",